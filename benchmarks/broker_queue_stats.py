@@ -0,0 +1,188 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark broker queue depth polling against fake Redis and AMQP transports.
+
+Every fake broker call sleeps for ``--rtt-ms`` to stand in for a network round trip. Redis is
+measured with one ``LLEN`` round trip per key (a client without pipelines) and with the single
+pipelined round trip. AMQP is measured with a fresh channel per queue (each channel open costs a
+round trip) and with the single reused channel.
+
+Example::
+
+    python -m benchmarks.broker_queue_stats --queues 1000 --rtt-ms 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Self
+
+from celery_root.core.engine.brokers import queue_stats
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+_PRIORITY_STEPS = (0, 3, 6, 9)
+
+
+def _round_trip(rtt: float) -> None:
+    time.sleep(rtt)
+
+
+class _RedisClient:
+    def __init__(self, depths: dict[str, int], rtt: float) -> None:
+        self.depths = depths
+        self.rtt = rtt
+        self.round_trips = 0
+
+    def llen(self, key: str) -> int:
+        self.round_trips += 1
+        _round_trip(self.rtt)
+        return self.depths.get(key, 0)
+
+    def delete(self, *keys: str) -> int:
+        return sum(1 for key in keys if self.depths.pop(key, None) is not None)
+
+    def scan_iter(self, match: str) -> list[str]:
+        _ = match
+        return []
+
+
+class _Pipeline:
+    def __init__(self, client: _PipelinedRedisClient) -> None:
+        self._client = client
+        self._keys: list[str] = []
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc: BaseException | None,
+        _tb: TracebackType | None,
+    ) -> None:
+        return None
+
+    def llen(self, key: str) -> None:
+        self._keys.append(key)
+
+    def execute(self) -> list[int]:
+        self._client.round_trips += 1
+        _round_trip(self._client.rtt)
+        return [self._client.depths.get(key, 0) for key in self._keys]
+
+
+class _PipelinedRedisClient(_RedisClient):
+    def pipeline(self, *, transaction: bool) -> _Pipeline:
+        _ = transaction
+        return _Pipeline(self)
+
+
+class _AmqpChannel:
+    def __init__(self, rtt: float) -> None:
+        self.rtt = rtt
+
+    def queue_declare(self, *, queue: str, passive: bool) -> SimpleNamespace:
+        _ = passive
+        _round_trip(self.rtt)
+        return SimpleNamespace(message_count=len(queue), consumer_count=1)
+
+    def queue_purge(self, *, queue: str) -> int:
+        _ = queue
+        return 0
+
+    def close(self) -> None:
+        _round_trip(self.rtt)
+
+
+class _Transport:
+    def __init__(self, driver_type: str) -> None:
+        self.driver_type: str | None = driver_type
+
+
+class _AmqpConnection:
+    def __init__(self, rtt: float) -> None:
+        self.transport: _Transport | None = _Transport("amqp")
+        self.default_channel: object | None = None
+        self.rtt = rtt
+        self.channels = 0
+
+    def channel(self) -> _AmqpChannel:
+        self.channels += 1
+        _round_trip(self.rtt)
+        return _AmqpChannel(self.rtt)
+
+
+class _RedisConnection:
+    def __init__(self, client: _RedisClient) -> None:
+        self.transport: _Transport | None = _Transport("redis")
+        self.default_channel: object | None = SimpleNamespace(client=client, priority_steps=_PRIORITY_STEPS)
+
+    def channel(self) -> _AmqpChannel:  # pragma: no cover - the Redis path never opens a channel
+        raise NotImplementedError
+
+
+def _channel_per_queue(connection: _AmqpConnection, names: list[str]) -> None:
+    for name in names:
+        channel = connection.channel()
+        channel.queue_declare(queue=name, passive=True)
+        channel.close()
+
+
+def _timed(label: str, call: Callable[[], object], round_trips: Callable[[], int]) -> None:
+    began = time.perf_counter()
+    call()
+    elapsed_ms = (time.perf_counter() - began) * 1000
+    print(f"{label:<28} {elapsed_ms:>10.1f} {round_trips():>12,}")  # noqa: T201
+
+
+def run(queues: int, rtt_ms: float) -> None:
+    """Print wall time and broker round trips for each polling strategy."""
+    rtt = rtt_ms / 1000
+    names = [f"queue-{index:04d}" for index in range(queues)]
+    depths = {name: index for index, name in enumerate(names)}
+    depths.update({f"{name}\x06\x16{step}": 1 for name in names for step in _PRIORITY_STEPS if step})
+    print(f"{queues} queues, {rtt_ms} ms per round trip")  # noqa: T201
+    print(f"{'strategy':<28} {'ms':>10} {'round trips':>12}")  # noqa: T201
+
+    plain = _RedisClient(depths, rtt)
+    _timed(
+        "redis llen per key",
+        lambda: queue_stats(names, connection=_RedisConnection(plain)),
+        lambda: plain.round_trips,
+    )
+    pipelined = _PipelinedRedisClient(depths, rtt)
+    _timed(
+        "redis pipelined",
+        lambda: queue_stats(names, connection=_RedisConnection(pipelined)),
+        lambda: pipelined.round_trips,
+    )
+    fresh = _AmqpConnection(rtt)
+    _timed("amqp channel per queue", lambda: _channel_per_queue(fresh, names), lambda: fresh.channels * 2 + queues)
+    pooled = _AmqpConnection(rtt)
+    _timed(
+        "amqp reused channel",
+        lambda: queue_stats(names, connection=pooled),
+        lambda: pooled.channels * 2 + queues,
+    )
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queues", type=int, default=1000, help="Queues per broker.")
+    parser.add_argument("--rtt-ms", type=float, default=0.2, help="Simulated broker round trip in milliseconds.")
+    args = parser.parse_args()
+    run(args.queues, args.rtt_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark web requests per second with pooled vs per-call DB RPC connections.
+
+Starts a DB manager on a temporary database, then drives dashboard/API views from concurrent
+Django test clients, once with a fresh RPC connection per ``open_db()`` block (the previous
+behaviour) and once with the shared connection pool.
+
+Example::
+
+    python -m benchmarks.dashboard_api --threads 1 --threads 8 --seconds 5
+    python -m benchmarks.dashboard_api --path /api/workers/
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import secrets
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from celery_root.config import CeleryRootConfig, DatabaseConfigSqlite, FrontendConfig, reset_settings, set_settings
+from celery_root.core.db.adapters.sqlite import SQLiteController
+from celery_root.core.db.manager import DBManager
+from celery_root.core.db.models import TaskEvent
+from celery_root.core.db.rpc_client import DbRpcClient, close_shared_pools
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_PATHS = ("/dashboard/fragment/", "/api/events/latest/", "/api/workers/")
+_STATES = ("SUCCESS", "SUCCESS", "FAILURE", "STARTED", "RECEIVED")
+
+
+def _seed(path: Path, tasks: int) -> None:
+    controller = SQLiteController(path)
+    controller.initialize()
+    rng = random.Random(tasks)  # noqa: S311 - deterministic benchmark data
+    now = datetime.now(UTC)
+    controller.store_task_events(
+        [
+            TaskEvent(
+                task_id=f"task-{index}",
+                name=f"bench.task_{index % 20}",
+                state=rng.choice(_STATES),
+                timestamp=now - timedelta(seconds=rng.randrange(24 * 3600)),
+                worker=f"worker-{index % 5}@bench",
+                runtime=rng.random() * 5,
+            )
+            for index in range(tasks)
+        ],
+    )
+    controller.close()
+
+
+def _wait_ready(config: CeleryRootConfig, timeout_seconds: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout_seconds
+    client = DbRpcClient.from_config(config, client_name="bench")
+    try:
+        while True:
+            try:
+                client.ping()
+            except (OSError, RuntimeError):
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.05)
+            else:
+                return
+    finally:
+        client.close()
+
+
+class _PerCallPool:
+    """Stand-in for the shared pool that opens a fresh connection for every block."""
+
+    def __init__(self, config: CeleryRootConfig, *, client_name: str | None = None) -> None:
+        self._config = config
+        self._client_name = client_name
+
+    @contextmanager
+    def client(self) -> Iterator[DbRpcClient]:
+        client = DbRpcClient.from_config(self._config, client_name=self._client_name)
+        try:
+            yield client
+        finally:
+            client.close()
+
+
+def _drive(path: str, threads: int, seconds: float) -> float:
+    from django.test import Client  # noqa: PLC0415
+
+    completed = [0] * threads
+    deadline = time.monotonic() + seconds
+
+    def _worker(slot: int) -> None:
+        client = Client()
+        while time.monotonic() < deadline:
+            response = client.get(path)
+            if response.status_code != 200:  # noqa: PLR2004
+                msg = f"{path} returned {response.status_code}"
+                raise RuntimeError(msg)
+            completed[slot] += 1
+
+    workers = [threading.Thread(target=_worker, args=(slot,)) for slot in range(threads)]
+    began = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return sum(completed) / (time.perf_counter() - began)
+
+
+def run(paths: list[str], thread_counts: list[int], *, seconds: float, tasks: int, workdir: Path) -> None:
+    """Start a DB manager and print requests/second per path and connection mode."""
+    db_path = workdir / "dashboard.db"
+    _seed(db_path, tasks)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "celery_root.components.web.settings")
+    reset_settings()
+    config = CeleryRootConfig(
+        database=DatabaseConfigSqlite(
+            db_path=db_path,
+            rpc_auth_key=secrets.token_urlsafe(32),
+            rpc_socket_path=workdir / "rpc.sock",
+            rpc_pool_size=max(thread_counts),
+        ),
+        frontend=FrontendConfig(secret_key=secrets.token_urlsafe(32), debug=False),
+    )
+    set_settings(config)
+    import django  # noqa: PLC0415
+
+    django.setup()
+    from celery_root.components.web import services  # noqa: PLC0415
+
+    shared_pool = services.shared_pool  # type: ignore[attr-defined]
+    manager = DBManager(config)
+    manager.start()
+    try:
+        _wait_ready(config)
+        print(f"\n{tasks:,} tasks, {seconds:.0f}s per run")  # noqa: T201
+        print(f"{'path':<22} {'threads':>7} {'per-call req/s':>15} {'pooled req/s':>13} {'speedup':>8}")  # noqa: T201
+        for path in paths:
+            for threads in thread_counts:
+                services.shared_pool = _PerCallPool  # type: ignore[attr-defined,assignment]
+                per_call = _drive(path, threads, seconds)
+                services.shared_pool = shared_pool  # type: ignore[attr-defined]
+                pooled = _drive(path, threads, seconds)
+                print(  # noqa: T201
+                    f"{path:<22} {threads:>7} {per_call:>15.1f} {pooled:>13.1f} {pooled / per_call:>7.2f}x",
+                )
+    finally:
+        services.shared_pool = shared_pool  # type: ignore[attr-defined]
+        close_shared_pools()
+        manager.stop()
+        manager.join(timeout=5)
+        if manager.is_alive():
+            manager.terminate()
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", action="append", help="Request path to drive (repeatable).")
+    parser.add_argument("--threads", type=int, action="append", help="Concurrent request threads (repeatable).")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Duration of each run.")
+    parser.add_argument("--tasks", type=int, default=500, help="Tasks to seed into the database.")
+    args = parser.parse_args()
+    thread_counts: list[int] = args.threads or [1, 8]
+    with tempfile.TemporaryDirectory() as tmp:
+        run(args.path or list(_PATHS), thread_counts, seconds=args.seconds, tasks=args.tasks, workdir=Path(tmp))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark event fan-out from an event listener to Prometheus exporter processes.
+
+Compares the per-event fan-out (one pickled model and one ``put_nowait`` per event and exporter)
+with batched fan-out (one compact blob per batch, shared by every exporter queue). Each exporter
+queue is drained by a child process running :class:`PrometheusExporter`. ``listener cpu ms`` is the
+CPU time the listener process spends on fan-out, including the queue feeder threads that pickle
+and write; ``events/s`` covers the whole path until every exporter has applied every event.
+
+Example::
+
+    python -m benchmarks.exporter_fanout --events 50000 --exporters 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import UTC, datetime, timedelta
+from multiprocessing import Process, Queue
+from queue import Empty
+
+from prometheus_client import CollectorRegistry
+
+from celery_root.components.metrics.batch import decode_events
+from celery_root.components.metrics.prometheus import PrometheusExporter
+from celery_root.core.db.models import TaskEvent
+from celery_root.core.event_listener import _FANOUT_BATCH_SIZE, _FANOUT_INTERVAL, _MetricsFanout
+
+_STATES = ("RECEIVED", "STARTED", "SUCCESS")
+
+
+def _events(count: int) -> list[TaskEvent]:
+    now = datetime.now(UTC)
+    return [
+        TaskEvent(
+            task_id=f"{index // len(_STATES):08x}-6f1c-4d2e-9a51-bench",
+            name=f"bench.task_{index // len(_STATES) % 20}",
+            state=_STATES[index % len(_STATES)],
+            timestamp=now + timedelta(milliseconds=index),
+            worker=f"worker-{index // len(_STATES) % 4}@bench",
+            runtime=0.05 if _STATES[index % len(_STATES)] == "SUCCESS" else None,
+        )
+        for index in range(count)
+    ]
+
+
+def _exporter(queue: Queue[object], done: Queue[int], expected: int) -> None:
+    exporter = PrometheusExporter(registry=CollectorRegistry())
+    applied = 0
+    while applied < expected:
+        try:
+            item = queue.get(timeout=10.0)
+        except Empty:
+            break
+        if isinstance(item, bytes):
+            items = decode_events(item)
+            exporter.on_events(items)
+            applied += len(items)
+        elif isinstance(item, TaskEvent):
+            exporter.on_task_event(item)
+            applied += 1
+    done.put(applied)
+
+
+def _measure(events: list[TaskEvent], exporters: int, *, batched: bool) -> tuple[float, float, int]:
+    queues: list[Queue[object]] = [Queue() for _ in range(exporters)]
+    done: Queue[int] = Queue()
+    children = [Process(target=_exporter, args=(queue, done, len(events))) for queue in queues]
+    for child in children:
+        child.start()
+    began = time.perf_counter()
+    cpu_began = time.process_time()
+    if batched:
+        fanout = _MetricsFanout(queues, _FANOUT_BATCH_SIZE, _FANOUT_INTERVAL)
+        for event in events:
+            fanout.append(event)
+        fanout.flush(time.monotonic())
+    else:
+        for event in events:
+            for queue in queues:
+                queue.put_nowait(event)
+    applied = min(done.get() for _ in children)
+    elapsed = time.perf_counter() - began
+    cpu = time.process_time() - cpu_began
+    for child in children:
+        child.join()
+    return cpu, elapsed, applied
+
+
+def run(events: int, exporters: int) -> None:
+    """Print listener CPU time and end-to-end throughput for each fan-out strategy."""
+    batch = _events(events)
+    print(f"{events:,} task events, {exporters} exporter process(es)")  # noqa: T201
+    print(f"{'strategy':<12} {'listener cpu ms':>16} {'events/s':>12} {'applied':>10}")  # noqa: T201
+    for label, batched in (("per event", False), ("batched", True)):
+        cpu, elapsed, applied = _measure(batch, exporters, batched=batched)
+        rate = applied / elapsed if elapsed else 0.0
+        print(f"{label:<12} {cpu * 1000:>16.1f} {rate:>12,.0f} {applied:>10,}")  # noqa: T201
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=50_000, help="Task events to fan out.")
+    parser.add_argument("--exporters", type=int, default=2, help="Exporter processes, one queue each.")
+    args = parser.parse_args()
+    run(args.events, args.exporters)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark JSON vs msgpack DB RPC envelopes for task list responses.
+
+Measures the full path a ``tasks.list`` response takes: payload dump and envelope encoding in the
+DB manager, then envelope decoding and response validation in the client.
+
+Example::
+
+    python -m benchmarks.rpc_codec --tasks 100 --tasks 1000 --rounds 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from celery_root.core.db.codec import decode_envelope, encode_envelope, msgpack_available, payload_mode
+from celery_root.shared.schemas import ListTasksResponse, RpcResponseEnvelope
+from celery_root.shared.schemas.domain import Task
+
+if TYPE_CHECKING:
+    from celery_root.config import RpcCodec
+
+_STATES = ("SUCCESS", "SUCCESS", "FAILURE", "STARTED", "RECEIVED")
+
+
+def _response(tasks: int) -> ListTasksResponse:
+    rng = random.Random(tasks)  # noqa: S311 - deterministic benchmark data
+    now = datetime.now(UTC)
+    rows = []
+    for index in range(tasks):
+        received = now - timedelta(seconds=rng.randrange(24 * 3600))
+        rows.append(
+            Task(
+                task_id=f"{index:08x}-6f1c-4d2e-9a51-{index:012x}",
+                name=f"bench.task_{index % 20}",
+                state=rng.choice(_STATES),
+                worker=f"worker-{index % 5}@bench",
+                received=received,
+                started=received + timedelta(milliseconds=rng.randrange(500)),
+                finished=received + timedelta(seconds=rng.random() * 5),
+                runtime=rng.random() * 5,
+                args=f"({index}, 'payload')",
+                kwargs="{'retry': False}",
+                result="'ok'",
+                retries=rng.randrange(3),
+            ),
+        )
+    return ListTasksResponse(tasks=rows, total=tasks)
+
+
+def _round_trip(response: ListTasksResponse, codec: RpcCodec) -> int:
+    envelope = RpcResponseEnvelope(
+        request_id="bench",
+        ok=True,
+        payload=response.model_dump(mode=payload_mode(codec)),
+        timestamp=datetime.now(UTC),
+        codec=codec,
+    )
+    data = encode_envelope(envelope, codec)
+    decoded = decode_envelope(data, RpcResponseEnvelope)
+    ListTasksResponse.model_validate(decoded.payload)
+    return len(data)
+
+
+def run(task_counts: list[int], rounds: int) -> None:
+    """Print per-round latency and frame size for each codec."""
+    codecs: list[RpcCodec] = ["json", "msgpack"] if msgpack_available() else ["json"]
+    print(f"{'tasks':>6} {'codec':<8} {'ms/round':>9} {'bytes':>10}")  # noqa: T201
+    for tasks in task_counts:
+        response = _response(tasks)
+        for codec in codecs:
+            size = _round_trip(response, codec)
+            began = time.perf_counter()
+            for _ in range(rounds):
+                _round_trip(response, codec)
+            elapsed_ms = (time.perf_counter() - began) * 1000 / rounds
+            print(f"{tasks:>6} {codec:<8} {elapsed_ms:>9.3f} {size:>10,}")  # noqa: T201
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, action="append", help="Tasks per response (repeatable).")
+    parser.add_argument("--rounds", type=int, default=200, help="Round trips per measurement.")
+    args = parser.parse_args()
+    run(args.tasks or [100, 1000], args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark dashboard statistics on the SQLite and DuckDB controllers.
+
+Both controllers ingest the same task events through ``store_task_events`` in batches of
+``--batch`` events, then answer each statistics call over the whole table. The DuckDB controller
+also writes every batch to SQLite, so its ingest time includes loading the column store.
+
+Example::
+
+    python -m benchmarks.stats_backends --tasks 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from celery_root.core.db.adapters.duckdb import DuckDBController
+from celery_root.core.db.adapters.sqlite import SQLiteController
+from celery_root.core.db.models import TaskEvent, TimeRange
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_NAMES = tuple(f"bench.task_{index}" for index in range(50))
+_WORKERS = tuple(f"worker-{index}@bench" for index in range(20))
+_STATES = ("SUCCESS", "SUCCESS", "SUCCESS", "FAILURE", "STARTED", "RECEIVED", "RETRY", "REVOKED")
+_SPAN = timedelta(days=7)
+_COLUMNS = ("stats", "by name", "through", "heatmap", "workers")
+
+
+def _events(count: int, start: datetime) -> list[TaskEvent]:
+    rng = random.Random(7)  # noqa: S311 - deterministic benchmark data
+    span_seconds = int(_SPAN.total_seconds())
+    return [
+        TaskEvent(
+            task_id=f"task-{index}",
+            name=rng.choice(_NAMES),
+            state=(state := rng.choice(_STATES)),
+            timestamp=start + timedelta(seconds=rng.randrange(span_seconds)),
+            worker=rng.choice(_WORKERS),
+            runtime=rng.random() * 5 if state in {"SUCCESS", "FAILURE"} else None,
+        )
+        for index in range(count)
+    ]
+
+
+def _median_ms(call: Callable[[], object], repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        began = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - began) * 1000)
+    return statistics.median(timings)
+
+
+def run(tasks: int, batch: int, repeats: int) -> None:
+    """Print ingest time and median statistics latency for each controller."""
+    start = datetime(2026, 1, 5, tzinfo=UTC)
+    events = _events(tasks, start)
+    window = TimeRange(start=start, end=start + _SPAN)
+    print(f"{tasks:,} tasks, ingested in batches of {batch}")  # noqa: T201
+    columns = " ".join(f"{label:>8}" for label in _COLUMNS)
+    print(f"{'controller':<10} {'ingest s':>9} {columns}")  # noqa: T201
+    for label, factory in (("sqlite", SQLiteController), ("duckdb", DuckDBController)):
+        with tempfile.TemporaryDirectory() as directory:
+            controller = factory(Path(directory) / "bench.db")
+            controller.initialize()
+            began = time.perf_counter()
+            for offset in range(0, len(events), batch):
+                controller.store_task_events(events[offset : offset + batch])
+            controller.get_state_distribution()
+            ingest = time.perf_counter() - began
+            timings = [
+                _median_ms(partial(controller.get_task_stats, None, window), repeats),
+                _median_ms(partial(controller.get_task_stats, _NAMES[0], window), repeats),
+                _median_ms(partial(controller.get_throughput, window, 3600), repeats),
+                _median_ms(partial(controller.get_heatmap, window), repeats),
+                _median_ms(controller.get_worker_state_counts, repeats),
+            ]
+            controller.close()
+        cells = " ".join(f"{value:>8.1f}" for value in timings)
+        print(f"{label:<10} {ingest:>9.2f} {cells}")  # noqa: T201
+    print("statistics columns are median milliseconds per call")  # noqa: T201
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=200_000, help="Tasks to ingest.")
+    parser.add_argument("--batch", type=int, default=500, help="Events per store_task_events call.")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed calls per statistic.")
+    args = parser.parse_args()
+    run(args.tasks, args.batch, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
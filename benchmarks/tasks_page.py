@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark ``SQLiteController.get_tasks_page`` latency on large task tables.
+
+Example::
+
+    python -m benchmarks.tasks_page --rows 1000000 --rows 10000000
+    python -m benchmarks.tasks_page --rows 1000000 --without-indexes
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from celery_root.core.db.adapters.sqlite import SQLiteController
+from celery_root.core.db.models import TaskFilter, TimeRange
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_INSERT_CHUNK = 50_000
+_NAMES = tuple(f"bench.task_{index}" for index in range(50))
+_WORKERS = tuple(f"worker-{index}@bench" for index in range(20))
+_STATES = ("SUCCESS", "SUCCESS", "SUCCESS", "FAILURE", "STARTED", "RECEIVED", "RETRY", "REVOKED")
+_TS_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+def _task_rows(count: int, start: datetime, rng: random.Random) -> Iterator[tuple[object, ...]]:
+    span_seconds = 30 * 24 * 3600
+    for index in range(count):
+        received = start + timedelta(seconds=rng.randrange(span_seconds))
+        state = rng.choice(_STATES)
+        started = received + timedelta(milliseconds=rng.randrange(500)) if state != "RECEIVED" else None
+        runtime = rng.random() * 5
+        finished = (
+            started + timedelta(seconds=runtime)
+            if started is not None and state in {"SUCCESS", "FAILURE", "REVOKED"}
+            else None
+        )
+        root = f"root-{index // 100}"
+        yield (
+            f"task-{index}",
+            rng.choice(_NAMES),
+            state,
+            rng.choice(_WORKERS),
+            received.strftime(_TS_FORMAT),
+            started.strftime(_TS_FORMAT) if started is not None else None,
+            finished.strftime(_TS_FORMAT) if finished is not None else None,
+            runtime if finished is not None else None,
+            f"[{index}, {index + 1}]",
+            "{}",
+            root,
+            f"group-{index // 10}",
+        )
+
+
+def _populate(path: Path, rows: int, *, with_indexes: bool) -> float:
+    controller = SQLiteController(path)
+    controller.initialize()
+    controller.close()
+    rng = random.Random(rows)  # noqa: S311 - deterministic benchmark data
+    start = datetime.now(UTC) - timedelta(days=30)
+    began = time.perf_counter()
+    with sqlite3.connect(path) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=OFF")
+        # Bulk load without secondary indexes, then build them once.
+        indexes = conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND name LIKE 'ix_%'",
+        ).fetchall()
+        for name, _sql in indexes:
+            conn.execute(f'DROP INDEX "{name}"')
+        generator = _task_rows(rows, start, rng)
+        while True:
+            chunk = [row for _, row in zip(range(_INSERT_CHUNK), generator, strict=False)]
+            if not chunk:
+                break
+            conn.executemany(
+                "INSERT INTO tasks (task_id, name, state, worker, received, started, finished, runtime, "
+                "args, kwargs, root_id, group_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                chunk,
+            )
+        if with_indexes:
+            for _name, sql in indexes:
+                conn.execute(sql)
+        conn.execute("ANALYZE")
+    return time.perf_counter() - began
+
+
+def _cases() -> list[tuple[str, TaskFilter | None, str | None, str | None]]:
+    now = datetime.now(UTC)
+    last_day = TimeRange(start=now - timedelta(days=1), end=now)
+    return [
+        ("latest page", None, None, "desc"),
+        ("state=FAILURE", TaskFilter(state="FAILURE"), None, "desc"),
+        ("name", TaskFilter(task_name=_NAMES[7]), None, "desc"),
+        ("worker + last 24h", TaskFilter(worker=_WORKERS[3], time_range=last_day), None, "desc"),
+        ("root_id", TaskFilter(root_id="root-42"), None, "desc"),
+        ("oldest page", None, None, "asc"),
+    ]
+
+
+def _measure(controller: SQLiteController, filters: TaskFilter | None, sort_dir: str | None, repeat: int) -> float:
+    timings: list[float] = []
+    for _ in range(repeat):
+        began = time.perf_counter()
+        controller.get_tasks_page(filters, sort_key=None, sort_dir=sort_dir, limit=50, offset=0)
+        timings.append((time.perf_counter() - began) * 1000.0)
+    return statistics.median(timings)
+
+
+def run(rows: int, *, repeat: int, without_indexes: bool, workdir: Path) -> None:
+    """Populate a database with ``rows`` tasks and print page latencies."""
+    path = workdir / f"tasks_{rows}.db"
+    load_seconds = _populate(path, rows, with_indexes=not without_indexes)
+    controller = SQLiteController(path)
+    label = "without secondary indexes" if without_indexes else "with secondary indexes"
+    print(f"\n{rows:,} tasks ({label}); load {load_seconds:.1f}s")  # noqa: T201
+    print(f"{'case':<22} {'median ms':>10}")  # noqa: T201
+    for name, filters, _sort_key, sort_dir in _cases():
+        print(f"{name:<22} {_measure(controller, filters, sort_dir, repeat):>10.1f}")  # noqa: T201
+    controller.close()
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, action="append", help="Task rows to generate (repeatable).")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per query; the median is reported.")
+    parser.add_argument("--without-indexes", action="store_true", help="Drop secondary indexes for comparison.")
+    parser.add_argument("--workdir", type=Path, default=None, help="Directory for the generated databases.")
+    args = parser.parse_args()
+    rows_list: list[int] = args.rows or [1_000_000, 10_000_000]
+    if args.workdir is not None:
+        args.workdir.mkdir(parents=True, exist_ok=True)
+        for rows in rows_list:
+            run(rows, repeat=args.repeat, without_indexes=args.without_indexes, workdir=args.workdir)
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in rows_list:
+            run(rows, repeat=args.repeat, without_indexes=args.without_indexes, workdir=Path(tmp))
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,7 @@ from .config import (
     BeatConfig,
     CeleryRootConfig,
     DatabaseConfigBase,
+    DatabaseConfigDuckdb,
     DatabaseConfigSqlite,
     FrontendConfig,
     McpConfig,
@@ -280,6 +281,7 @@ __all__ = [
     "CeleryRoot",
     "CeleryRootConfig",
     "DatabaseConfigBase",
+    "DatabaseConfigDuckdb",
     "DatabaseConfigSqlite",
     "FrontendConfig",
     "McpConfig",
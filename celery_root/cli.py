@@ -15,7 +15,8 @@ import click
 from celery import Celery
 
 from celery_root import CeleryRoot
-from celery_root.config import MAX_PORT, CeleryRootConfig, FrontendConfig, get_settings
+from celery_root.config import MAX_PORT, CeleryRootConfig, DatabaseConfigSqlite, FrontendConfig, get_settings
+from celery_root.core.db.adapters.sqlite import SQLiteController
 from celery_root.core.registry import WorkerRegistry
 
 if TYPE_CHECKING:
@@ -94,6 +95,20 @@ def _run_root(apps: Sequence[Celery], config: CeleryRootConfig) -> None:
     root.run()
 
 
+def _invoke_subcommand(ctx: click.Context, args: Sequence[str]) -> bool:
+    # Worker paths and subcommand names share the positional slot, so dispatch by name here.
+    group = ctx.command
+    if not isinstance(group, click.Group):
+        return False
+    name, *rest = args
+    command = group.get_command(ctx, name)
+    if command is None:
+        return False
+    with command.make_context(name, rest, parent=ctx) as sub_ctx:
+        command.invoke(sub_ctx)
+    return True
+
+
 def _get_app_from_context(ctx: click.Context) -> Celery | None:
     obj = ctx.obj
     if obj is None:
@@ -102,7 +117,11 @@ def _get_app_from_context(ctx: click.Context) -> Celery | None:
     return app if isinstance(app, Celery) else None
 
 
-@click.command(help="Run Celery Root as a standalone service.")
+@click.group(
+    invoke_without_command=True,
+    context_settings={"allow_interspersed_args": True},
+    help="Run Celery Root as a standalone service.",
+)
 @click.option(
     "-A",
     "--app",
@@ -123,7 +142,9 @@ def _get_app_from_context(ctx: click.Context) -> Celery | None:
     help="Enable or disable Django debug mode.",
 )
 @click.argument("workers", nargs=-1)
-def main(
+@click.pass_context
+def main(  # noqa: PLR0913
+    ctx: click.Context,
     apps: tuple[str, ...],
     host: str | None,
     port: int | None,
@@ -131,7 +152,9 @@ def main(
     *,
     debug: bool | None,
 ) -> None:
-    """Start the Celery Root process manager."""
+    """Start the Celery Root process manager, or run the subcommand named by the first argument."""
+    if workers and _invoke_subcommand(ctx, workers):
+        return
     paths = _resolve_worker_paths((*apps, *workers))
     config = _apply_frontend_overrides(get_settings(), host, port, debug=debug)
     config = _apply_worker_paths(config, paths)
@@ -167,3 +190,20 @@ def celery_root(ctx: click.Context, host: str | None, port: int | None, *, debug
         _run_root(loaded_apps, config)
         return
     _run_root((app,), config)
+
+
+@main.command(name="rebuild-rollups", help="Rebuild the dashboard rollup tables from stored task history.")
+def rebuild_rollups() -> None:
+    """Backfill the pre-aggregated dashboard rollups in the configured SQLite database."""
+    db_config = get_settings().database
+    if not isinstance(db_config, DatabaseConfigSqlite) or db_config.db_path is None:
+        message = "Rebuilding rollups requires a file-backed SQLite database (set database.db_path)."
+        raise click.UsageError(message)
+    controller = SQLiteController(db_config.db_path)
+    try:
+        controller.initialize()
+        controller.ensure_schema()
+        tasks = controller.rebuild_rollups()
+    finally:
+        controller.close()
+    click.echo(f"Rebuilt rollups from {tasks} tasks in {db_config.db_path}.")
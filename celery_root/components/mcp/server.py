@@ -13,7 +13,7 @@ from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, cast
 
 from celery_root.config import CeleryRootConfig, McpConfig, get_settings
-from celery_root.core.db.rpc_client import DbRpcClient
+from celery_root.core.db.rpc_client import DbRpcClient, shared_pool
 from celery_root.optional import require_optional_scope
 
 if TYPE_CHECKING:
@@ -24,8 +24,6 @@ if TYPE_CHECKING:
     from starlette.requests import Request
     from starlette.responses import Response
 
-    from celery_root.shared.schemas.domain import Task
-
     ASGIMessage = MutableMapping[str, object]
     ASGIReceive = Callable[[], Awaitable[ASGIMessage]]
     ASGISend = Callable[[ASGIMessage], Awaitable[None]]
@@ -149,7 +147,13 @@ _DB_TABLE_CATALOG: tuple[tuple[str, str], ...] = (
     ("task_relations", "Edges between tasks in a workflow graph."),
     ("workers", "Latest worker status, heartbeat, queues, and registered tasks."),
     ("worker_events", "Raw worker event stream (online/offline/heartbeat)."),
-    ("broker_queue_events", "Queue depth snapshots per broker/queue."),
+    ("broker_queue_events", "Queue depth changes per broker/queue (last hour only)."),
+    ("broker_queue_snapshots", "Latest queue depth per broker/queue."),
+    ("broker_queue_rollups_minute", "Per-minute min/max/last queue depth per broker/queue."),
+    ("task_rollups_minute", "Per-minute task counts by name, state, and worker."),
+    ("task_rollups_hour", "Per-hour task counts by name, state, and worker."),
+    ("task_runtime_rollups_minute", "Per-minute runtime histogram bins by task name."),
+    ("task_runtime_rollups_hour", "Per-hour runtime histogram bins by task name."),
     ("schedules", "Beat schedules stored in the DB."),
     ("schema_version", "Database schema version tracker."),
 )
@@ -171,10 +175,10 @@ _DB_QUERY_EXAMPLES: tuple[dict[str, object], ...] = (
         "sql": ("SELECT hostname, status, last_heartbeat, active_tasks, pool_size FROM workers ORDER BY hostname;"),
     },
     {
-        "description": "Queue depth snapshots (latest 50).",
+        "description": "Latest queue depths.",
         "sql": (
             "SELECT broker_url, queue, messages, consumers, timestamp "
-            "FROM broker_queue_events ORDER BY timestamp DESC LIMIT 50;"
+            "FROM broker_queue_snapshots ORDER BY broker_url, queue;"
         ),
     },
     {
@@ -205,15 +209,16 @@ def _db_catalog_payload() -> dict[str, object]:
 
 
 def _fetch_task_stats(db: DbRpcClient) -> list[dict[str, object]]:
-    tasks = db.get_tasks()
-    grouped: dict[str, list[Task]] = {}
-    for task in tasks:
+    counts: dict[str, int] = {}
+    grouped_runtimes: dict[str, list[float]] = {}
+    for task in db.iter_tasks():
         name = task.name or "unknown"
-        grouped.setdefault(name, []).append(task)
+        counts[name] = counts.get(name, 0) + 1
+        if task.runtime is not None:
+            grouped_runtimes.setdefault(name, []).append(task.runtime)
     rows: list[dict[str, object]] = []
-    for name, group in grouped.items():
-        runtimes = sorted([task.runtime for task in group if task.runtime is not None])
-        count = len(group)
+    for name, count in counts.items():
+        runtimes = sorted(grouped_runtimes.get(name, []))
         if runtimes:
             avg = sum(runtimes) / len(runtimes)
             min_runtime = runtimes[0]
@@ -325,14 +330,14 @@ def _register_mcp_tools(mcp: FastMCP, config: CeleryRootConfig) -> None:
     @mcp.tool(name="fetch_schema")
     def fetch_schema() -> dict[str, object]:
         """Return the current database schema as structured metadata."""
-        with DbRpcClient.from_config(config, client_name="mcp") as db:
+        with shared_pool(config, client_name="mcp").client() as db:
             schema = db.get_schema()
         return cast("dict[str, object]", schema.model_dump(mode="json"))
 
     @mcp.tool(name="db_info")
     def db_info() -> dict[str, object]:
         """Return database backend metadata."""
-        with DbRpcClient.from_config(config, client_name="mcp") as db:
+        with shared_pool(config, client_name="mcp").client() as db:
             info = db.get_db_info()
         return cast("dict[str, object]", info.model_dump(mode="json"))
 
@@ -347,7 +352,7 @@ def _register_mcp_tools(mcp: FastMCP, config: CeleryRootConfig) -> None:
         Common tables include: tasks, task_events, task_relations, workers,
         worker_events, broker_queue_events, schedules, schema_version.
         """
-        with DbRpcClient.from_config(config, client_name="mcp") as db:
+        with shared_pool(config, client_name="mcp").client() as db:
             result = db.raw_query(query, params=params, max_rows=max_rows)
         return cast("dict[str, object]", result.model_dump(mode="json"))
 
@@ -358,7 +363,7 @@ def _register_mcp_tools(mcp: FastMCP, config: CeleryRootConfig) -> None:
         from celery_root.components.web.views import dashboard as dashboard_views  # noqa: PLC0415
 
         payload = dashboard_views.dashboard_stats()
-        with DbRpcClient.from_config(config, client_name="mcp") as db:
+        with shared_pool(config, client_name="mcp").client() as db:
             task_stats = _fetch_task_stats(db)
         return cast("dict[str, object]", {**payload, "task_stats": task_stats})
 
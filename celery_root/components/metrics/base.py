@@ -11,8 +11,10 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from celery_root.core.db.models import EventListenerStats, TaskEvent, TaskStats, WorkerEvent
+
 if TYPE_CHECKING:
-    from celery_root.core.db.models import TaskEvent, TaskStats, WorkerEvent
+    from collections.abc import Sequence
 
 
 class BaseMonitoringExporter(ABC):
@@ -33,6 +35,22 @@ class BaseMonitoringExporter(ABC):
         """Handle periodic task statistics."""
         ...
 
+    def on_listener_stats(self, stats: EventListenerStats) -> None:
+        """Handle event listener write-stage statistics; ignored unless overridden."""
+        _ = stats
+
+    def on_events(self, items: Sequence[object]) -> None:
+        """Handle a batch of metrics items in arrival order; override to aggregate across the batch."""
+        for item in items:
+            if isinstance(item, TaskEvent):
+                self.on_task_event(item)
+            elif isinstance(item, WorkerEvent):
+                self.on_worker_event(item)
+            elif isinstance(item, TaskStats):
+                self.update_stats(item)
+            elif isinstance(item, EventListenerStats):
+                self.on_listener_stats(item)
+
     @abstractmethod
     def serve(self) -> None:
         """Start serving exporter data."""
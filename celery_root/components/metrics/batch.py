@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Compact wire format for event batches sent to the metrics exporter processes.
+
+Event listeners pickle a whole batch once and put the same bytes on every exporter queue. Each
+model is reduced to a ``(kind, values)`` tuple in field order, which lets pickle share repeated
+strings and datetimes across the batch instead of serializing every pydantic model on its own.
+Exporters rebuild the models with ``model_construct``; the values were validated when the listener
+created them.
+"""
+
+from __future__ import annotations
+
+import pickle
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+from celery_root.core.db.models import EventListenerStats, TaskEvent, WorkerEvent
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pydantic import BaseModel
+
+MetricsItem = TaskEvent | WorkerEvent | EventListenerStats
+
+_MODELS: dict[str, type[MetricsItem]] = {
+    model.__name__: model for model in (TaskEvent, WorkerEvent, EventListenerStats)
+}
+_FIELDS = {kind: tuple(model.model_fields) for kind, model in _MODELS.items()}
+_GETTERS = {kind: attrgetter(*fields) for kind, fields in _FIELDS.items()}
+
+
+def encode_events(items: Iterable[BaseModel]) -> bytes:
+    """Pickle a batch of metrics items into one compact blob."""
+    rows = []
+    for item in items:
+        kind = type(item).__name__
+        getter = _GETTERS.get(kind)
+        if getter is None:
+            msg = f"Unsupported metrics item: {kind}"
+            raise TypeError(msg)
+        rows.append((kind, getter(item)))
+    return pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def decode_events(data: bytes) -> list[MetricsItem]:
+    """Rebuild the metrics items of a blob produced by :func:`encode_events`."""
+    rows: list[tuple[str, tuple[Any, ...]]] = pickle.loads(data)  # noqa: S301 - produced by our own listeners
+    return [_MODELS[kind].model_construct(**dict(zip(_FIELDS[kind], values, strict=True))) for kind, values in rows]
@@ -9,7 +9,6 @@
 from __future__ import annotations
 
 import threading
-from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from urllib.parse import urlsplit, urlunsplit
 
@@ -20,14 +19,14 @@ from opentelemetry.sdk.metrics.export import MetricReader, PeriodicExportingMetr
 from opentelemetry.sdk.resources import Resource
 
 from celery_root.components.metrics.base import BaseMonitoringExporter
+from celery_root.components.metrics.tracking import TaskTracker, TaskTrackerTable
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Mapping
-    from datetime import datetime
 
     from opentelemetry.metrics import CallbackOptions
 
-    from celery_root.core.db.models import TaskEvent, TaskStats, WorkerEvent
+    from celery_root.core.db.models import EventListenerStats, TaskEvent, TaskStats, WorkerEvent
 
 __all__ = ["OTelExporter"]
 
@@ -43,6 +42,7 @@ _TASK_EVENT_TYPE_BY_STATE = {
     "PENDING": "task-sent",
 }
 _TERMINAL_TASK_STATES = {"SUCCESS", "FAILURE", "REVOKED", "REJECTED"}
+_MAX_LABEL_SETS = 50_000
 _FLOWER_RUNTIME_BUCKETS = (
     0.005,
     0.01,
@@ -61,18 +61,10 @@ _FLOWER_RUNTIME_BUCKETS = (
 )
 
 
-@dataclass(slots=True)
-class _TaskTracker:
-    name: str
-    worker: str
-    state: str
-    received_at: datetime | None
-
-
 class OTelExporter(BaseMonitoringExporter):
     """OpenTelemetry exporter capturing task and worker metrics."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         service_name: str = "celery_root",
@@ -80,6 +72,8 @@ class OTelExporter(BaseMonitoringExporter):
         broker_backend_map: Mapping[str, str] | None = None,
         metric_prefix: str = "celery_root",
         metric_reader: MetricReader | None = None,
+        max_tracked_tasks: int = 100_000,
+        tracked_task_ttl_seconds: float = 86_400.0,
     ) -> None:
         """Initialize the metrics provider and OTLP exporter."""
         self._endpoint = endpoint
@@ -87,13 +81,15 @@ class OTelExporter(BaseMonitoringExporter):
         self._broker_backend_map = dict(broker_backend_map or {})
         self._state_lock = threading.Lock()
         self._worker_brokers: dict[str, str] = {}
-        self._task_trackers: dict[str, _TaskTracker] = {}
+        self._task_trackers = TaskTrackerTable(max_tracked_tasks, tracked_task_ttl_seconds)
+        self._label_sets: dict[tuple[str | None, ...], dict[str, str]] = {}
         self._prefetched_counts: dict[tuple[str, str], int] = {}
         self._active_counts: dict[str, int] = {}
         self._worker_online: dict[str, int] = {}
         self._worker_last_heartbeat: dict[str, float] = {}
         self._task_prefetch_times: dict[tuple[str, str], float] = {}
         self._worker_pool_size: dict[str, int] = {}
+        self._listener_stats: dict[str, EventListenerStats] = {}
 
         resource = Resource.create({"service.name": service_name})
         if metric_reader is None:
@@ -163,6 +159,29 @@ class OTelExporter(BaseMonitoringExporter):
             callbacks=[self._observe_worker_pool_size],
             description="Worker pool size",
         )
+        self._listener_pending_gauge = self._meter.create_observable_gauge(
+            f"{self._metric_prefix}_event_listener_pending_events",
+            callbacks=[self._observe_listener_pending],
+            description="Events waiting for the event listener DB writer.",
+        )
+        self._listener_lag_gauge = self._meter.create_observable_gauge(
+            f"{self._metric_prefix}_event_listener_lag_seconds",
+            callbacks=[self._observe_listener_lag],
+            unit="s",
+            description="Age of the oldest event waiting for the event listener DB writer.",
+        )
+        self._listener_dropped = self._meter.create_counter(
+            f"{self._metric_prefix}_event_listener_dropped_events_total",
+            description="Events dropped because the event listener write queue was full.",
+        )
+        self._listener_spilled = self._meter.create_counter(
+            f"{self._metric_prefix}_event_listener_spilled_events_total",
+            description="Events spilled to disk because the event listener write queue was full.",
+        )
+        self._listener_metrics_dropped = self._meter.create_counter(
+            f"{self._metric_prefix}_event_listener_metrics_dropped_events_total",
+            description="Events the event listener dropped because a metrics exporter queue was full.",
+        )
 
     @property
     def metric_reader(self) -> MetricReader:
@@ -195,8 +214,10 @@ class OTelExporter(BaseMonitoringExporter):
     def on_worker_event(self, event: WorkerEvent) -> None:
         """Update metrics for a worker event."""
         with self._state_lock:
-            if event.broker_url is not None:
+            if event.broker_url is not None and self._worker_brokers.get(event.hostname) != event.broker_url:
                 self._worker_brokers[event.hostname] = event.broker_url
+                # Cached label sets carry the worker's old broker and backend labels.
+                self._label_sets.clear()
             if isinstance(event.info, dict):
                 active = _parse_active_tasks(event.info.get("active"))
                 if active is not None:
@@ -215,6 +236,22 @@ class OTelExporter(BaseMonitoringExporter):
         """Handle periodic task statistics (noop)."""
         _ = stats
 
+    def on_listener_stats(self, stats: EventListenerStats) -> None:
+        """Update the event listener write-stage gauges and counters."""
+        with self._state_lock:
+            previous = self._listener_stats.get(stats.broker_url)
+            self._listener_stats[stats.broker_url] = stats
+        attributes = {"broker": stats.broker_url}
+        for counter, total, last in (
+            (self._listener_dropped, stats.dropped, previous.dropped if previous else 0),
+            (self._listener_spilled, stats.spilled, previous.spilled if previous else 0),
+            (self._listener_metrics_dropped, stats.metrics_dropped, previous.metrics_dropped if previous else 0),
+        ):
+            # Listeners report running totals, which restart from zero when a listener restarts.
+            delta = total - last if total >= last else total
+            if delta:
+                counter.add(delta, attributes=attributes)
+
     def serve(self) -> None:
         """Serve exporter data (noop for OTLP exporter)."""
         return
@@ -251,6 +288,20 @@ class OTelExporter(BaseMonitoringExporter):
                 for worker, value in self._worker_pool_size.items()
             ]
 
+    def _observe_listener_pending(self, _: CallbackOptions) -> Iterable[Observation]:
+        with self._state_lock:
+            return [
+                Observation(stats.pending, attributes={"broker": broker})
+                for broker, stats in self._listener_stats.items()
+            ]
+
+    def _observe_listener_lag(self, _: CallbackOptions) -> Iterable[Observation]:
+        with self._state_lock:
+            return [
+                Observation(stats.lag_seconds, attributes={"broker": broker})
+                for broker, stats in self._listener_stats.items()
+            ]
+
     def _track_task_state(self, event: TaskEvent, task_name: str, worker: str, state: str) -> None:
         task_id = event.task_id
         previous = self._task_trackers.get(task_id)
@@ -277,16 +328,20 @@ class OTelExporter(BaseMonitoringExporter):
             self._task_queue_latency.record(prefetch_seconds, attributes=self._task_labels(task_name, worker))
 
         if state in _TERMINAL_TASK_STATES:
-            self._task_trackers.pop(task_id, None)
+            self._task_trackers.pop(task_id)
             return
 
         received_at = event.timestamp if state == "RECEIVED" else None
-        self._task_trackers[task_id] = _TaskTracker(
-            name=task_name,
-            worker=worker,
-            state=state,
-            received_at=received_at,
-        )
+        tracker = TaskTracker(name=task_name, worker=worker, state=state, received_at=received_at)
+        for evicted in self._task_trackers.put(task_id, tracker):
+            self._release_tracker(evicted)
+
+    def _release_tracker(self, tracker: TaskTracker) -> None:
+        """Undo the gauge contributions of a task that stopped being tracked before finishing."""
+        if tracker.state == "RECEIVED":
+            self._update_prefetched(tracker.name, tracker.worker, -1)
+        elif tracker.state == "STARTED":
+            self._update_active(tracker.worker, -1)
 
     def _update_prefetched(self, task: str, worker: str, delta: int) -> None:
         key = (task, worker)
@@ -326,29 +381,49 @@ class OTelExporter(BaseMonitoringExporter):
             self._worker_current.add(actual_delta, attributes=self._worker_labels(worker))
 
     def _task_labels(self, task: str, worker: str, event_type: str | None = None) -> dict[str, str]:
-        labels = {
-            "task": task,
-            "worker": worker,
-            "broker": self._broker_label(worker),
-            "backend": self._backend_label(worker),
-        }
-        if event_type is not None:
-            labels["type"] = event_type
+        key = ("task", task, worker, event_type)
+        labels = self._label_sets.get(key)
+        if labels is None:
+            labels = {
+                "task": task,
+                "worker": worker,
+                "broker": self._broker_label(worker),
+                "backend": self._backend_label(worker),
+            }
+            if event_type is not None:
+                labels["type"] = event_type
+            self._cache_labels(key, labels)
         return labels
 
     def _task_summary_labels(self, task: str, worker: str) -> dict[str, str]:
-        return {
-            "task": task,
-            "broker": self._broker_label(worker),
-            "backend": self._backend_label(worker),
-        }
+        key = ("summary", task, worker)
+        labels = self._label_sets.get(key)
+        if labels is None:
+            labels = {
+                "task": task,
+                "broker": self._broker_label(worker),
+                "backend": self._backend_label(worker),
+            }
+            self._cache_labels(key, labels)
+        return labels
 
     def _worker_labels(self, worker: str) -> dict[str, str]:
-        return {
-            "worker": worker,
-            "broker": self._broker_label(worker),
-            "backend": self._backend_label(worker),
-        }
+        key = ("worker", worker)
+        labels = self._label_sets.get(key)
+        if labels is None:
+            labels = {
+                "worker": worker,
+                "broker": self._broker_label(worker),
+                "backend": self._backend_label(worker),
+            }
+            self._cache_labels(key, labels)
+        return labels
+
+    def _cache_labels(self, key: tuple[str | None, ...], labels: dict[str, str]) -> None:
+        # Label sets are shared between calls; the SDK only reads them.
+        if len(self._label_sets) >= _MAX_LABEL_SETS:
+            self._label_sets.clear()
+        self._label_sets[key] = labels
 
     def _broker_label(self, worker: str) -> str:
         broker_url = self._worker_brokers.get(worker)
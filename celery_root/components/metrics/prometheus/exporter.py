@@ -8,8 +8,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, cast
 from urllib.parse import urlsplit, urlunsplit
 
 from prometheus_client import (
@@ -24,12 +24,15 @@ from prometheus_client import (
 )
 
 from celery_root.components.metrics.base import BaseMonitoringExporter
+from celery_root.components.metrics.tracking import TaskTracker, TaskTrackerTable
+from celery_root.core.db.models import TaskEvent
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
-    from datetime import datetime
+    from collections.abc import Mapping, Sequence
 
-    from celery_root.core.db.models import TaskEvent, TaskStats, WorkerEvent
+    from prometheus_client.metrics import MetricWrapperBase
+
+    from celery_root.core.db.models import EventListenerStats, TaskStats, WorkerEvent
 
 __all__ = ["PrometheusExporter"]
 
@@ -45,6 +48,7 @@ _TASK_EVENT_TYPE_BY_STATE = {
     "PENDING": "task-sent",
 }
 _TERMINAL_TASK_STATES = {"SUCCESS", "FAILURE", "REVOKED", "REJECTED"}
+_MAX_LABEL_CHILDREN = 50_000
 _FLOWER_RUNTIME_BUCKETS = (
     0.005,
     0.01,
@@ -64,32 +68,40 @@ _FLOWER_RUNTIME_BUCKETS = (
 
 
 @dataclass(slots=True)
-class _TaskTracker:
-    name: str
-    worker: str
-    state: str
-    received_at: datetime | None
+class _BatchTally:
+    """Counter increments and runtimes of a batch, grouped by label set."""
+
+    counts: dict[tuple[Counter, str, str, str | None], int] = field(default_factory=dict)
+    runtimes: dict[tuple[str, str], list[float]] = field(default_factory=dict)
+
+    def count(self, counter: Counter, task: str, worker: str, event_type: str | None = None) -> None:
+        key = (counter, task, worker, event_type)
+        self.counts[key] = self.counts.get(key, 0) + 1
 
 
 class PrometheusExporter(BaseMonitoringExporter):
     """Prometheus exporter capturing task and worker metrics."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         port: int | None = None,
         registry: CollectorRegistry | None = None,
         broker_backend_map: Mapping[str, str] | None = None,
         flower_compatibility: bool = False,
+        max_tracked_tasks: int = 100_000,
+        tracked_task_ttl_seconds: float = 86_400.0,
     ) -> None:
         """Initialize metrics and optionally start the HTTP server."""
         self.registry = registry or CollectorRegistry()
         self._register_default_collectors()
         self._broker_backend_map = dict(broker_backend_map or {})
         self._worker_brokers: dict[str, str] = {}
-        self._task_trackers: dict[str, _TaskTracker] = {}
+        self._task_trackers = TaskTrackerTable(max_tracked_tasks, tracked_task_ttl_seconds)
+        self._label_children: dict[tuple[object, ...], MetricWrapperBase] = {}
         self._prefetched_counts: dict[tuple[str, str], int] = {}
         self._active_counts: dict[str, int] = {}
+        self._listener_totals: dict[tuple[str, str], int] = {}
         self._metric_prefix = "flower" if flower_compatibility else "celery_root"
 
         self._event_counter = Counter(
@@ -167,6 +179,36 @@ class PrometheusExporter(BaseMonitoringExporter):
             ("worker", "broker", "backend"),
             registry=self.registry,
         )
+        self._listener_pending = Gauge(
+            f"{self._metric_prefix}_event_listener_pending_events",
+            "Events waiting for the event listener DB writer.",
+            ("broker",),
+            registry=self.registry,
+        )
+        self._listener_lag = Gauge(
+            f"{self._metric_prefix}_event_listener_lag_seconds",
+            "Age of the oldest event waiting for the event listener DB writer.",
+            ("broker",),
+            registry=self.registry,
+        )
+        self._listener_dropped = Counter(
+            f"{self._metric_prefix}_event_listener_dropped_events_total",
+            "Events dropped because the event listener write queue was full.",
+            ("broker",),
+            registry=self.registry,
+        )
+        self._listener_spilled = Counter(
+            f"{self._metric_prefix}_event_listener_spilled_events_total",
+            "Events spilled to disk because the event listener write queue was full.",
+            ("broker",),
+            registry=self.registry,
+        )
+        self._listener_metrics_dropped = Counter(
+            f"{self._metric_prefix}_event_listener_metrics_dropped_events_total",
+            "Events the event listener dropped because a metrics exporter queue was full.",
+            ("broker",),
+            registry=self.registry,
+        )
 
         self._started_server = False
         if port is not None:
@@ -175,45 +217,62 @@ class PrometheusExporter(BaseMonitoringExporter):
 
     def on_task_event(self, event: TaskEvent) -> None:
         """Update metrics for a task event."""
-        worker = event.worker or "unknown"
-        task_name = event.name or "unknown"
-        state = event.state.upper()
-        event_type = _TASK_EVENT_TYPE_BY_STATE.get(state, f"task-{state.lower()}")
-        self._event_counter.labels(**self._task_labels(task_name, worker, event_type)).inc()
-        if state == "FAILURE":
-            self._task_failures.labels(**self._task_labels(task_name, worker)).inc()
-        if state == "RETRY":
-            self._task_retries.labels(**self._task_labels(task_name, worker)).inc()
-        if event.runtime is not None:
-            self._task_runtime.labels(**self._task_labels(task_name, worker)).observe(event.runtime)
-            self._task_runtime_by_task.labels(**self._task_summary_labels(task_name, worker)).observe(
-                event.runtime,
-            )
-        self._track_task_state(event, task_name, worker, state)
+        tally = _BatchTally()
+        self._tally_task_event(event, tally)
+        self._apply_tally(tally)
+
+    def on_events(self, items: Sequence[object]) -> None:
+        """Update metrics for a batch, with one counter update per label set instead of per event."""
+        tally = _BatchTally()
+        for item in items:
+            if isinstance(item, TaskEvent):
+                self._tally_task_event(item, tally)
+            else:
+                super().on_events((item,))
+        self._apply_tally(tally)
 
     def on_worker_event(self, event: WorkerEvent) -> None:
         """Update metrics for a worker event."""
-        if event.broker_url is not None:
+        if event.broker_url is not None and self._worker_brokers.get(event.hostname) != event.broker_url:
             self._worker_brokers[event.hostname] = event.broker_url
-        labels = self._worker_labels(event.hostname)
+            # Cached children carry the worker's old broker and backend labels.
+            self._label_children.clear()
+        worker = event.hostname
         normalized = event.event.lower()
         if isinstance(event.info, dict):
             active = _parse_active_tasks(event.info.get("active"))
             if active is not None:
-                self._set_active_count(event.hostname, active)
+                self._set_active_count(worker, active)
             pool_size = _parse_pool_size(event.info.get("pool"))
             if pool_size is not None:
-                self._worker_pool_size.labels(**labels).set(pool_size)
+                self._worker_child(self._worker_pool_size, worker).set(pool_size)
         if normalized in {"worker-online", "online", "worker-heartbeat", "heartbeat"}:
-            self._worker_online.labels(**labels).set(1)
-            self._worker_last_heartbeat.labels(**labels).set(event.timestamp.timestamp())
+            self._worker_child(self._worker_online, worker).set(1)
+            self._worker_child(self._worker_last_heartbeat, worker).set(event.timestamp.timestamp())
         elif normalized in {"worker-offline", "offline"}:
-            self._worker_online.labels(**labels).set(0)
+            self._worker_child(self._worker_online, worker).set(0)
 
     def update_stats(self, stats: TaskStats) -> None:
         """Update runtime gauges from task statistics."""
         _ = stats
 
+    def on_listener_stats(self, stats: EventListenerStats) -> None:
+        """Update the event listener write-stage gauges and counters."""
+        broker = stats.broker_url
+        self._listener_pending.labels(broker=broker).set(stats.pending)
+        self._listener_lag.labels(broker=broker).set(stats.lag_seconds)
+        for kind, counter, total in (
+            ("dropped", self._listener_dropped, stats.dropped),
+            ("spilled", self._listener_spilled, stats.spilled),
+            ("metrics_dropped", self._listener_metrics_dropped, stats.metrics_dropped),
+        ):
+            # Listeners report running totals, which restart from zero when a listener restarts.
+            previous = self._listener_totals.get((broker, kind), 0)
+            delta = total - previous if total >= previous else total
+            self._listener_totals[(broker, kind)] = total
+            if delta:
+                counter.labels(broker=broker).inc(delta)
+
     def serve(self) -> None:
         """Start the HTTP server if not already running."""
         if not self._started_server:
@@ -224,6 +283,30 @@ class PrometheusExporter(BaseMonitoringExporter):
         """Shutdown hook for API parity (noop)."""
         return
 
+    def _tally_task_event(self, event: TaskEvent, tally: _BatchTally) -> None:
+        worker = event.worker or "unknown"
+        task_name = event.name or "unknown"
+        state = event.state.upper()
+        event_type = _TASK_EVENT_TYPE_BY_STATE.get(state, f"task-{state.lower()}")
+        tally.count(self._event_counter, task_name, worker, event_type)
+        if state == "FAILURE":
+            tally.count(self._task_failures, task_name, worker)
+        if state == "RETRY":
+            tally.count(self._task_retries, task_name, worker)
+        if event.runtime is not None:
+            tally.runtimes.setdefault((task_name, worker), []).append(event.runtime)
+        self._track_task_state(event, task_name, worker, state)
+
+    def _apply_tally(self, tally: _BatchTally) -> None:
+        for (counter, task_name, worker, event_type), count in tally.counts.items():
+            self._task_child(counter, task_name, worker, event_type).inc(count)
+        for (task_name, worker), runtimes in tally.runtimes.items():
+            by_worker = self._task_child(self._task_runtime, task_name, worker)
+            by_task = self._task_child(self._task_runtime_by_task, task_name, worker, summary=True)
+            for runtime in runtimes:
+                by_worker.observe(runtime)
+                by_task.observe(runtime)
+
     def _register_default_collectors(self) -> None:
         for collector in (PROCESS_COLLECTOR, PLATFORM_COLLECTOR, GC_COLLECTOR):
             try:
@@ -252,20 +335,24 @@ class PrometheusExporter(BaseMonitoringExporter):
             prefetch_seconds = (event.timestamp - previous.received_at).total_seconds()
             if prefetch_seconds < 0:
                 prefetch_seconds = 0.0
-            self._task_prefetch.labels(**self._task_labels(task_name, worker)).set(prefetch_seconds)
-            self._task_queue_latency.labels(**self._task_labels(task_name, worker)).observe(prefetch_seconds)
+            self._task_child(self._task_prefetch, task_name, worker).set(prefetch_seconds)
+            self._task_child(self._task_queue_latency, task_name, worker).observe(prefetch_seconds)
 
         if state in _TERMINAL_TASK_STATES:
-            self._task_trackers.pop(task_id, None)
+            self._task_trackers.pop(task_id)
             return
 
         received_at = event.timestamp if state == "RECEIVED" else None
-        self._task_trackers[task_id] = _TaskTracker(
-            name=task_name,
-            worker=worker,
-            state=state,
-            received_at=received_at,
-        )
+        tracker = TaskTracker(name=task_name, worker=worker, state=state, received_at=received_at)
+        for evicted in self._task_trackers.put(task_id, tracker):
+            self._release_tracker(evicted)
+
+    def _release_tracker(self, tracker: TaskTracker) -> None:
+        """Undo the gauge contributions of a task that stopped being tracked before finishing."""
+        if tracker.state == "RECEIVED":
+            self._update_prefetched(tracker.name, tracker.worker, -1)
+        elif tracker.state == "STARTED":
+            self._update_active(tracker.worker, -1)
 
     def _update_prefetched(self, task: str, worker: str, delta: int) -> None:
         key = (task, worker)
@@ -275,7 +362,7 @@ class PrometheusExporter(BaseMonitoringExporter):
             current = 0
         else:
             self._prefetched_counts[key] = current
-        self._prefetched_tasks.labels(**self._task_labels(task, worker)).set(current)
+        self._task_child(self._prefetched_tasks, task, worker).set(current)
 
     def _update_active(self, worker: str, delta: int) -> None:
         current = self._active_counts.get(worker, 0) + delta
@@ -284,7 +371,7 @@ class PrometheusExporter(BaseMonitoringExporter):
             current = 0
         else:
             self._active_counts[worker] = current
-        self._worker_current.labels(**self._worker_labels(worker)).set(current)
+        self._worker_child(self._worker_current, worker).set(current)
 
     def _set_active_count(self, worker: str, count: int) -> None:
         current = max(count, 0)
@@ -293,7 +380,36 @@ class PrometheusExporter(BaseMonitoringExporter):
             current = 0
         else:
             self._active_counts[worker] = current
-        self._worker_current.labels(**self._worker_labels(worker)).set(current)
+        self._worker_child(self._worker_current, worker).set(current)
+
+    def _task_child[MetricT: MetricWrapperBase](
+        self,
+        metric: MetricT,
+        task: str,
+        worker: str,
+        event_type: str | None = None,
+        *,
+        summary: bool = False,
+    ) -> MetricT:
+        key = (metric, task, worker, event_type)
+        child = self._label_children.get(key)
+        if child is None:
+            labels = self._task_summary_labels(task, worker) if summary else self._task_labels(task, worker, event_type)
+            child = self._cache_child(key, metric.labels(**labels))
+        return cast("MetricT", child)
+
+    def _worker_child[MetricT: MetricWrapperBase](self, metric: MetricT, worker: str) -> MetricT:
+        key = (metric, worker)
+        child = self._label_children.get(key)
+        if child is None:
+            child = self._cache_child(key, metric.labels(**self._worker_labels(worker)))
+        return cast("MetricT", child)
+
+    def _cache_child(self, key: tuple[object, ...], child: MetricWrapperBase) -> MetricWrapperBase:
+        if len(self._label_children) >= _MAX_LABEL_CHILDREN:
+            self._label_children.clear()
+        self._label_children[key] = child
+        return child
 
     def _task_labels(self, task: str, worker: str, event_type: str | None = None) -> dict[str, str]:
         labels = {
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Bounded per-task state tracking shared by the monitoring exporters."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+@dataclass(slots=True)
+class TaskTracker:
+    """Last known state of a task that has not reached a terminal state."""
+
+    name: str
+    worker: str
+    state: str
+    received_at: datetime | None
+    updated: float = 0.0
+
+
+class TaskTrackerTable:
+    """Task trackers in least recently updated order, bounded by size and age.
+
+    Tasks whose terminal event never arrives would otherwise stay tracked for the lifetime of the
+    exporter. Callers release the gauges held by evicted trackers.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        """Track at most ``max_size`` tasks, each for at most ``ttl_seconds`` since its last event."""
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._trackers: OrderedDict[str, TaskTracker] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of tracked tasks."""
+        return len(self._trackers)
+
+    def get(self, task_id: str) -> TaskTracker | None:
+        """Return the tracker of ``task_id`` if it is tracked."""
+        return self._trackers.get(task_id)
+
+    def pop(self, task_id: str) -> TaskTracker | None:
+        """Stop tracking ``task_id``."""
+        return self._trackers.pop(task_id, None)
+
+    def put(self, task_id: str, tracker: TaskTracker) -> list[TaskTracker]:
+        """Track ``task_id`` as most recently updated and return the trackers evicted to stay in bounds."""
+        now = time.monotonic()
+        tracker.updated = now
+        self._trackers[task_id] = tracker
+        self._trackers.move_to_end(task_id)
+        evicted = self.expire(now)
+        while len(self._trackers) > self._max_size:
+            evicted.append(self._trackers.popitem(last=False)[1])
+        return evicted
+
+    def expire(self, now: float) -> list[TaskTracker]:
+        """Drop and return the trackers not updated within the TTL."""
+        cutoff = now - self._ttl_seconds
+        expired: list[TaskTracker] = []
+        while self._trackers:
+            oldest = next(iter(self._trackers.values()))
+            if oldest.updated >= cutoff:
+                break
+            expired.append(self._trackers.popitem(last=False)[1])
+        return expired
@@ -9,8 +9,6 @@
 from __future__ import annotations
 
 import importlib
-import logging
-import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
@@ -20,7 +18,7 @@ from celery import Celery
 from django.conf import settings
 
 from celery_root.config import get_settings
-from celery_root.core.db.rpc_client import DbRpcClient
+from celery_root.core.db.rpc_client import DbRpcClient, shared_pool
 from celery_root.core.registry import WorkerRegistry
 
 if TYPE_CHECKING:
@@ -37,19 +35,6 @@ class WorkerOption:
     queue: str | None
 
 
-_CLEANUP_INTERVAL_SECONDS = 60.0
-_LAST_CLEANUP_AT: list[float | None] = [None]
-_LOGGER = logging.getLogger(__name__)
-
-
-def _should_cleanup(now: float) -> bool:
-    last_cleanup = _LAST_CLEANUP_AT[0]
-    if last_cleanup is None or (now - last_cleanup) >= _CLEANUP_INTERVAL_SECONDS:
-        _LAST_CLEANUP_AT[0] = now
-        return True
-    return False
-
-
 def _split_path(path: str) -> tuple[str, str]:
     if ":" in path:
         module_path, attr = path.split(":", 1)
@@ -100,20 +85,10 @@ def retention_days() -> int:
 
 @contextmanager
 def open_db() -> Iterator[DbRpcClient]:
-    """Open a DB RPC client for a request and close it afterwards."""
+    """Borrow a pooled DB RPC client for the duration of a block."""
     config = get_settings()
-    client = DbRpcClient.from_config(config, client_name="web")
-    try:
-        days = retention_days()
-        if days > 0 and _should_cleanup(time.monotonic()):
-            removed = client.cleanup(days)
-            if removed:
-                _LOGGER.info("DB cleanup removed %d records older than %d days.", removed, days)
-            else:
-                _LOGGER.debug("DB cleanup ran; no records removed.")
+    with shared_pool(config, client_name="web").client() as client:
         yield client
-    finally:
-        client.close()
 
 
 def get_registry() -> WorkerRegistry:
@@ -24,7 +24,8 @@ if TYPE_CHECKING:
 
     from django.http import HttpRequest, HttpResponse
 
-    from celery_root.core.db.models import Task, TaskStats, Worker
+    from celery_root.core.db.adapters.base import BaseDBController
+    from celery_root.core.db.models import TaskStats, TaskSummary, Worker
 
 STATE_BADGES = {
     "SUCCESS": "badge-success",
@@ -127,7 +128,7 @@ class _SummaryMetrics:
     workers_under_load: int
 
 
-def _task_timestamp(task: Task) -> datetime | None:
+def _task_timestamp(task: TaskSummary) -> datetime | None:
     return task.finished or task.started or task.received
 
 
@@ -203,37 +204,39 @@ def _resolve_worker_status(status: str, active_tasks: int, last_seen: timedelta
     return "online"
 
 
-def _task_delta_percentage(tasks: Sequence[Task], now: datetime) -> float | None:
-    last_hour_start = now - timedelta(hours=1)
-    prev_hour_start = now - timedelta(hours=2)
-    last_hour_count = 0
-    prev_hour_count = 0
-    for task in tasks:
-        timestamp = _task_timestamp(task)
-        if timestamp is None:
-            continue
-        if last_hour_start <= timestamp <= now:
-            last_hour_count += 1
-        elif prev_hour_start <= timestamp < last_hour_start:
-            prev_hour_count += 1
-    if last_hour_count == 0 and prev_hour_count == 0:
-        return None
+def _task_delta_percentage(last_hour_count: int, prev_hour_count: int) -> float | None:
     if prev_hour_count == 0:
         return None
     return (last_hour_count - prev_hour_count) / prev_hour_count * 100
 
 
+def _rollup_total(db: BaseDBController, time_range: TimeRange) -> int:
+    return sum(row.count for row in db.get_rollup_counts(time_range))
+
+
+def _rollup_state_counts(db: BaseDBController, time_range: TimeRange | None) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for row in db.get_rollup_counts(time_range, ("state",)):
+        if row.state is not None:
+            counts[row.state] = counts.get(row.state, 0) + row.count
+    return counts
+
+
 def _compute_metrics(now: datetime) -> _SummaryMetrics:
     with open_db() as db:
         workers = db.get_workers()
         online, delta, under_load = _worker_online_counts(workers, now)
 
         day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        task_filter = TaskFilter(time_range=TimeRange(start=day_start, end=now))
-        tasks_today = db.get_tasks(task_filter)
-        stats = db.get_task_stats(None, task_filter.time_range)
-
-        tasks_delta_pct = _task_delta_percentage(tasks_today, now)
+        today = TimeRange(start=day_start, end=now)
+        tasks_today = _rollup_total(db, today)
+        stats = db.get_rollup_task_stats(None, today)
+
+        last_hour_start = now - timedelta(hours=1)
+        tasks_delta_pct = _task_delta_percentage(
+            _rollup_total(db, TimeRange(start=last_hour_start, end=now)),
+            _rollup_total(db, TimeRange(start=now - timedelta(hours=2), end=last_hour_start)),
+        )
 
         registry = get_registry()
         broker_groups = registry.get_brokers()
@@ -246,7 +249,7 @@ def _compute_metrics(now: datetime) -> _SummaryMetrics:
     return _SummaryMetrics(
         workers_online=online,
         workers_delta=delta,
-        tasks_today=len(tasks_today),
+        tasks_today=tasks_today,
         tasks_delta_pct=tasks_delta_pct,
         runtime_stats=stats,
         pending_tasks=pending_tasks,
@@ -287,21 +290,10 @@ def _state_cards(now: datetime) -> Sequence[_StateCard]:
     prev_range = TimeRange(start=prev_hour_start, end=last_hour_start)
 
     with open_db() as db:
-        last_tasks = db.get_tasks(TaskFilter(time_range=last_range))
-        prev_tasks = db.get_tasks(TaskFilter(time_range=prev_range))
-        current_counts = db.get_state_distribution()
-
-    def _count_by_state(tasks: Sequence[Task]) -> dict[str, int]:
-        counts: dict[str, int] = {}
-        for task in tasks:
-            counts[task.state] = counts.get(task.state, 0) + 1
-        return counts
-
-    last_counts = _count_by_state(last_tasks)
-    prev_counts = _count_by_state(prev_tasks)
-    current_counts = _collapse_received(current_counts)
-    last_counts = _collapse_received(last_counts)
-    prev_counts = _collapse_received(prev_counts)
+        last_counts = _collapse_received(_rollup_state_counts(db, last_range))
+        prev_counts = _collapse_received(_rollup_state_counts(db, prev_range))
+        # All-time counts come from the tasks table, so tasks without a timestamp are included.
+        current_counts = _collapse_received(db.get_state_distribution())
 
     def _delta(state: str) -> str:
         diff = last_counts.get(state, 0) - prev_counts.get(state, 0)
@@ -331,7 +323,7 @@ def _state_cards(now: datetime) -> Sequence[_StateCard]:
 def _throughput_series(now: datetime) -> Sequence[_ThroughputPoint]:
     time_range = TimeRange(start=now - timedelta(hours=1), end=now)
     with open_db() as db:
-        buckets = db.get_throughput(time_range, bucket_seconds=600)
+        buckets = db.get_rollup_throughput(time_range, bucket_seconds=600)
     return [{"label": bucket.bucket_start.strftime("%H:%M"), "count": bucket.count} for bucket in buckets]
 
 
@@ -357,9 +349,9 @@ def state_series(cards: Sequence[_StateCard]) -> Sequence[_StateSeriesPoint]:
 def _activity_feed(now: datetime) -> Sequence[_ActivityItem]:
     time_range = TimeRange(start=now - timedelta(hours=24), end=now)
     with open_db() as db:
-        tasks = db.get_tasks(TaskFilter(time_range=time_range))
+        tasks, _cursor = db.scan_tasks(TaskFilter(time_range=time_range), cursor=None, limit=5)
     items: list[_ActivityItem] = []
-    for task in tasks[:5]:
+    for task in tasks:
         timestamp = _task_timestamp(task)
         if timestamp is None:
             continue
@@ -378,20 +370,15 @@ def _activity_feed(now: datetime) -> Sequence[_ActivityItem]:
 def _worker_summary(now: datetime) -> list[_WorkerSummary]:
     with open_db() as db:
         workers = db.get_workers()
-        tasks = db.get_tasks()
+        state_counts = db.get_worker_state_counts()
 
     counts: dict[str, dict[str, int]] = {}
     for worker in workers:
         counts[worker.hostname] = dict.fromkeys(_WORKER_STATE_COLUMNS, 0)
-
-    for task in tasks:
-        if task.worker is None:
-            continue
-        if task.worker not in counts:
-            continue
-        state = "PENDING" if task.state == "RECEIVED" else task.state
-        if state in counts[task.worker]:
-            counts[task.worker][state] += 1
+        for raw_state, count in state_counts.get(worker.hostname, {}).items():
+            state = "PENDING" if raw_state == "RECEIVED" else raw_state
+            if state in counts[worker.hostname]:
+                counts[worker.hostname][state] += count
 
     rows: list[_WorkerSummary] = []
     for worker in workers:
@@ -18,7 +18,6 @@ from django.urls import reverse
 from django.utils import timezone
 
 from celery_root.components.web.services import open_db
-from celery_root.core.db.models import TaskFilter
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -27,7 +26,7 @@ if TYPE_CHECKING:
     from django.http import HttpRequest, HttpResponse
 
     from celery_root.core.db import DbClient
-    from celery_root.core.db.models import Task, TaskRelation
+    from celery_root.core.db.models import Task, TaskGraphChanges, TaskRelation
 
 _TASK_NOT_FOUND = "Task not found"
 _PREVIEW_LIMIT = 256
@@ -69,6 +68,7 @@ class GraphMeta(TypedDict):
     root_id: str
     generated_at: str
     counts: GraphCounts
+    cursor: int
 
 
 class GraphNode(TypedDict):
@@ -232,8 +232,8 @@ def _append_edge(
 def _collect_nodes_and_edges(
     root_id: str,
     relations: Sequence[TaskRelation],
-    db: DbClient,
-) -> tuple[set[str], list[dict[str, str | None]], list[Task]]:
+    tasks: Sequence[Task],
+) -> tuple[set[str], list[dict[str, str | None]]]:
     node_ids: set[str] = {root_id}
     edges = _build_edges(relations)
     edge_keys: set[tuple[str, str, str]] = set()
@@ -248,7 +248,6 @@ def _collect_nodes_and_edges(
         if child:
             node_ids.add(child)
 
-    tasks = list(db.get_tasks(TaskFilter(root_id=root_id)))
     for item in tasks:
         node_ids.add(item.task_id)
         if item.parent_id:
@@ -260,7 +259,7 @@ def _collect_nodes_and_edges(
         if item.chord_id:
             _append_edge(edges, edge_keys, parent=item.chord_id, child=item.task_id, relation="chord")
             node_ids.add(item.chord_id)
-    return node_ids, edges, tasks
+    return node_ids, edges
 
 
 def _build_state_counts(nodes_payload: Sequence[GraphNode]) -> GraphCounts:
@@ -294,16 +293,19 @@ def _build_state_counts(nodes_payload: Sequence[GraphNode]) -> GraphCounts:
 
 
 def _build_graph_payload(task_id: str, db: DbClient) -> GraphPayload:
-    task = db.get_task(task_id)
-    if task is None:
+    graph = db.get_task_graph(task_id)
+    if graph is None:
         raise Http404(_TASK_NOT_FOUND)
-    root_id = task.root_id or task.task_id
-    relations = db.get_task_relations(root_id)
-    node_ids, edges, tasks = _collect_nodes_and_edges(root_id, relations, db)
+    root_id = graph.root_id
+    relations = graph.relations
+    # Only workflow members contribute edges; tasks the graph merely references just fill in node details.
+    tasks = [item for item in graph.tasks if item.root_id == root_id]
+    tasks_by_id = {item.task_id: item for item in graph.tasks}
+    node_ids, edges = _collect_nodes_and_edges(root_id, relations, tasks)
     kind_map = _node_kind_map(edges)
     nodes_payload: list[GraphNode] = []
     for node_id in sorted(node_ids):
-        node_task = db.get_task(node_id)
+        node_task = tasks_by_id.get(node_id)
         node_kind = _canvas_kind(node_task) or kind_map.get(node_id)
         nodes_payload.append(_serialize_node(node_task, node_id, node_kind, root_id))
     edges_payload = [edge for edge in (_serialize_edge(edge) for edge in edges) if edge is not None]
@@ -325,6 +327,7 @@ def _build_graph_payload(task_id: str, db: DbClient) -> GraphPayload:
         "root_id": root_id,
         "generated_at": timezone.now().isoformat(),
         "counts": _build_state_counts(nodes_payload),
+        "cursor": graph.cursor,
     }
     return {"meta": meta, "nodes": nodes_payload, "edges": edges_payload}
 
@@ -390,31 +393,72 @@ def task_graph_api(_request: HttpRequest, task_id: str) -> JsonResponse:
     return JsonResponse(payload)
 
 
-def task_graph_updates_api(_request: HttpRequest, task_id: str) -> JsonResponse:
-    """Return incremental task graph updates."""
+def _parse_since(value: str | None) -> int | None:
+    if value is None or not value.isdigit():
+        return None
+    return int(value)
+
+
+def _node_update(node: GraphNode) -> dict[str, object]:
+    return {
+        "id": node["id"],
+        "state": node.get("state"),
+        "duration_ms": node.get("duration_ms"),
+        "retries": node.get("retries"),
+        "started_at": node.get("started_at"),
+        "finished_at": node.get("finished_at"),
+    }
+
+
+def _graph_changes_response(changes: TaskGraphChanges) -> JsonResponse:
+    node_updates = [_node_update(_serialize_node(task, task.task_id, None, changes.root_id)) for task in changes.tasks]
+    edge_updates: list[GraphEdge] = []
+    if changes.topology_changed:
+        _node_ids, edges = _collect_nodes_and_edges(changes.root_id, changes.relations, changes.tasks)
+        edge_updates = [edge for edge in (_serialize_edge(edge) for edge in edges) if edge is not None]
+    _LOGGER.info(
+        "task_graph_updates_api root_id=%s cursor=%d node_updates=%d topology_changed=%s",
+        changes.root_id,
+        changes.cursor,
+        len(node_updates),
+        changes.topology_changed,
+    )
+    return JsonResponse(
+        {
+            "generated_at": timezone.now().isoformat(),
+            "cursor": changes.cursor,
+            "node_updates": node_updates,
+            "edge_updates": edge_updates,
+            "topology_changed": changes.topology_changed,
+        },
+    )
+
+
+def task_graph_updates_api(request: HttpRequest, task_id: str) -> JsonResponse:
+    """Return task graph updates.
+
+    With ``?since=<cursor>`` only the nodes and edges that changed after the cursor are returned, and
+    ``topology_changed`` tells the client to reload the snapshot. Without a cursor, or when the backend
+    does not track changes, every node is returned.
+    """
+    since = _parse_since(request.GET.get("since"))
     with open_db() as db:
-        payload = _build_graph_payload_with_retry(task_id, db)
+        changes = db.get_task_graph_changes(task_id, since) if since is not None else None
+        if changes is None:
+            payload = _build_graph_payload_with_retry(task_id, db)
+    if changes is not None:
+        return _graph_changes_response(changes)
     _LOGGER.info(
         "task_graph_updates_api root_id=%s nodes=%d edges=%d",
         payload["meta"]["root_id"],
         len(payload["nodes"]),
         len(payload["edges"]),
     )
-    node_updates = []
-    for node in payload["nodes"]:
-        update = {
-            "id": node["id"],
-            "state": node.get("state"),
-            "duration_ms": node.get("duration_ms"),
-            "retries": node.get("retries"),
-            "started_at": node.get("started_at"),
-            "finished_at": node.get("finished_at"),
-        }
-        node_updates.append(update)
     return JsonResponse(
         {
             "generated_at": payload["meta"]["generated_at"],
-            "node_updates": node_updates,
+            "cursor": payload["meta"]["cursor"],
+            "node_updates": [_node_update(node) for node in payload["nodes"]],
             "meta_counts": payload["meta"]["counts"],
             "topology_changed": False,
             "node_count": len(payload["nodes"]),
@@ -24,16 +24,17 @@ from django.shortcuts import redirect, render
 from django.utils import timezone
 
 from celery_root.components.web.services import app_name, get_registry, list_task_names, open_db
-from celery_root.core.db.models import Task, TaskFilter, TimeRange
+from celery_root.core.db.models import Task, TaskFilter, TaskSummary, TimeRange
 from celery_root.core.engine import tasks as task_control
 
 from .decorators import require_post
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from celery import Celery
     from django.http import HttpRequest, HttpResponse, QueryDict
 
-    from celery_root.core.db import DbClient
     from celery_root.core.db.models import TaskRelation
 
 _TASK_NOT_FOUND = "Task not found"
@@ -194,11 +195,11 @@ def _is_date_only(value: str | None) -> bool:
     return "T" not in value and " " not in value
 
 
-def _task_timestamp(task: Task) -> datetime | None:
+def _task_timestamp(task: TaskSummary) -> datetime | None:
     return task.finished or task.started or task.received
 
 
-def _task_to_view(task: Task) -> _TaskView:
+def _task_to_view(task: TaskSummary) -> _TaskView:
     timestamp = _task_timestamp(task)
     state = task.state
     return {
@@ -652,8 +653,7 @@ def _build_task_schemas(apps: Sequence[Celery], task_names: Sequence[str]) -> di
 
 def _build_tasks(filters: TaskFilter | None = None) -> list[_TaskView]:
     with open_db() as db:
-        tasks = db.get_tasks(filters)
-    return [_task_to_view(task) for task in tasks]
+        return [_task_to_view(task) for task in db.iter_tasks(filters)]
 
 
 def build_tasks(filters: TaskFilter | None = None) -> list[_TaskView]:
@@ -821,7 +821,7 @@ def _percentile(values: list[float], pct: float) -> float | None:
     return values[lower] + (values[upper] - values[lower]) * weight
 
 
-def _build_stats_rows(tasks: Sequence[Task]) -> list[dict[str, object]]:
+def _build_stats_rows(tasks: Iterable[TaskSummary]) -> list[dict[str, object]]:
     counts: dict[str, int] = {}
     failures: dict[str, int] = {}
     retries: dict[str, int] = {}
@@ -1008,19 +1008,15 @@ def task_list(request: HttpRequest) -> HttpResponse:  # noqa: PLR0912, PLR0915
     with open_db() as db:
         worker_rows = db.get_workers()
         task_name_options = db.list_task_names()
-        all_tasks = db.get_tasks() if build_stats else []
+        stats_rows = _build_stats_rows(db.iter_tasks()) if build_stats else []
     workers = sorted({worker.hostname for worker in worker_rows})
 
     stats_task = request.GET.get("stats_task", "").strip()
-    stats_rows: list[dict[str, object]] = []
-    stats_options: list[str] = []
-    if build_stats:
-        stats_rows = _build_stats_rows(all_tasks)
-        if stats_task:
-            stats_rows = [row for row in stats_rows if row["name"] == stats_task]
-        for row in stats_rows:
-            row["link"] = f"{request.path}?search={quote_plus(str(row['name']))}"
-        stats_options = sorted({task.name or "unknown" for task in all_tasks})
+    stats_options = sorted(str(row["name"]) for row in stats_rows)
+    if stats_task:
+        stats_rows = [row for row in stats_rows if row["name"] == stats_task]
+    for row in stats_rows:
+        row["link"] = f"{request.path}?search={quote_plus(str(row['name']))}"
     stats_sort_key, stats_sort_dir = _normalize_stats_sort(
         request.GET.get("stats_sort"),
         request.GET.get("stats_dir"),
@@ -1102,8 +1098,8 @@ def _build_relations(task: Task) -> list[dict[str, str]]:
     return steps
 
 
-def _build_task_link(db: DbClient, task_id: str) -> _TaskLink:
-    task = db.get_task(task_id)
+def _build_task_link(task_id: str, tasks: Mapping[str, Task]) -> _TaskLink:
+    task = tasks.get(task_id)
     if task is None:
         return {
             "id": task_id,
@@ -1229,8 +1225,11 @@ def task_detail(request: HttpRequest, task_id: str) -> HttpResponse:
     with open_db() as db:
         relations = db.get_task_relations(root_id)
         parent = _parent_id(task, relations)
-        parent_link = _build_task_link(db, parent) if parent else None
-        child_links = [_build_task_link(db, child_id) for child_id in _child_ids(task, relations)]
+        child_ids = _child_ids(task, relations)
+        linked_ids = [parent, *child_ids] if parent else child_ids
+        linked = {item.task_id: item for item in db.get_tasks_by_id(linked_ids)}
+    parent_link = _build_task_link(parent, linked) if parent else None
+    child_links = [_build_task_link(child_id, linked) for child_id in child_ids]
 
     show_traceback = bool(task.traceback) or task.state in {"FAILURE", "RETRY"}
     context = {
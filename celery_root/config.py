@@ -13,11 +13,16 @@ import secrets
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 MAX_PORT = 65_535
 
+RetentionMaintenance = Literal["none", "incremental_vacuum", "wal_checkpoint"]
+RpcCodec = Literal["json", "msgpack"]
+EventOverflowPolicy = Literal["block", "drop_oldest", "spill"]
+
 
 def _default_rpc_socket_path() -> Path:
     root = Path.cwd().resolve()
@@ -37,6 +42,9 @@ class DatabaseConfigBase(BaseModel):
     rpc_max_message_bytes: int = Field(default=4_194_304, gt=0)
     rpc_max_inflight: int = Field(default=64, gt=0)
     rpc_timeout_seconds: float = Field(default=5.0, gt=0)
+    rpc_codec: RpcCodec = "json"
+    rpc_pool_size: int = Field(default=8, gt=0)
+    rpc_pool_health_check_seconds: float = Field(default=30.0, ge=0)
 
     @field_validator("rpc_socket_path", mode="after")
     @classmethod
@@ -55,11 +63,17 @@ class DatabaseConfigSqlite(DatabaseConfigBase):
 
     db_path: Path | None = None
     retention_days: int = Field(default=7, gt=0)
+    retention_interval_seconds: float = Field(default=300.0, gt=0)
+    retention_chunk_size: int = Field(default=5_000, gt=0)
+    retention_maintenance: RetentionMaintenance = "wal_checkpoint"
+    read_pool_size: int = Field(default=4, ge=0)
+    heartbeat_history_seconds: float = Field(default=60.0, ge=0)
     batch_size: int = Field(default=500, gt=0)
     flush_interval: float = Field(default=1.0, gt=0)
     purge_db: bool = False
+    archive_path: Path | None = None
 
-    @field_validator("db_path", mode="after")
+    @field_validator("db_path", "archive_path", mode="after")
     @classmethod
     def _expand_db_path(cls, value: Path | None) -> Path | None:
         if value is None:
@@ -73,6 +87,24 @@ class DatabaseConfigSqlite(DatabaseConfigBase):
         return self
 
 
+class DatabaseConfigDuckdb(DatabaseConfigSqlite):
+    """SQLite row store with a DuckDB column store answering the dashboard statistics.
+
+    The column store lives next to ``db_path`` (``.duckdb`` suffix) unless ``analytics_path`` is set,
+    and in memory when ``db_path`` is None.
+    """
+
+    engine: Literal["duckdb"] = "duckdb"
+    analytics_path: Path | None = None
+
+    @field_validator("analytics_path", mode="after")
+    @classmethod
+    def _expand_analytics_path(cls, value: Path | None) -> Path | None:
+        if value is None:
+            return None
+        return value.expanduser()
+
+
 class BeatConfig(BaseModel):
     """Beat scheduler configuration."""
 
@@ -171,6 +203,11 @@ class CeleryRootConfig(BaseModel):
 
     worker_import_paths: list[str] = Field(default_factory=list)
     event_queue_maxsize: int = Field(default=32_767, gt=0, le=32_767)
+    event_writer_queue_size: int = Field(default=10_000, gt=0)
+    event_overflow_policy: EventOverflowPolicy = "block"
+    metrics_max_tracked_tasks: int = Field(default=100_000, gt=0)
+    metrics_tracked_task_ttl_seconds: float = Field(default=86_400.0, gt=0)
+    reconciler_fleet_inspection: bool = True
     integration: bool = False
 
     @field_validator("database", mode="before")
@@ -179,6 +216,8 @@ class CeleryRootConfig(BaseModel):
         if isinstance(value, DatabaseConfigSqlite):
             return value
         if isinstance(value, dict):
+            if value.get("engine") == "duckdb":
+                return DatabaseConfigDuckdb(**value)
             return DatabaseConfigSqlite(**value)
         return value
 
@@ -217,6 +256,7 @@ __all__ = [
     "BeatConfig",
     "CeleryRootConfig",
     "DatabaseConfigBase",
+    "DatabaseConfigDuckdb",
     "DatabaseConfigSqlite",
     "FrontendConfig",
     "McpConfig",
@@ -14,6 +14,7 @@ from .models import (
     TaskEvent,
     TaskFilter,
     TaskRelation,
+    TaskRollupCount,
     TaskStats,
     ThroughputBucket,
     TimeRange,
@@ -21,7 +22,7 @@ from .models import (
     WorkerEvent,
     WorkerStats,
 )
-from .rpc_client import DbRpcClient, RpcCallError
+from .rpc_client import DbRpcClient, RpcCallError, RpcMessageTooLargeError
 
 DbClient = BaseDBController
 
@@ -31,11 +32,13 @@ __all__ = [
     "DbClient",
     "DbRpcClient",
     "RpcCallError",
+    "RpcMessageTooLargeError",
     "Schedule",
     "Task",
     "TaskEvent",
     "TaskFilter",
     "TaskRelation",
+    "TaskRollupCount",
     "TaskStats",
     "ThroughputBucket",
     "TimeRange",
@@ -7,6 +7,7 @@
 """Database adapter implementations."""
 
 from .base import BaseDBController
+from .duckdb import DuckDBController
 from .sqlite import SQLiteController
 
-__all__ = ["BaseDBController", "SQLiteController"]
+__all__ = ["BaseDBController", "DuckDBController", "SQLiteController"]
@@ -9,25 +9,61 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
+from celery_root.core.db.models import TaskCursor, TaskFilter, TaskGraph, TaskRollupCount
+
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
 
+    from celery_root.config import RetentionMaintenance
     from celery_root.core.db.models import (
         BrokerQueueEvent,
+        BrokerQueueSample,
+        RollupDimension,
         Schedule,
         Task,
         TaskEvent,
-        TaskFilter,
+        TaskGraphChanges,
         TaskRelation,
         TaskStats,
+        TaskSummary,
         ThroughputBucket,
         TimeRange,
         Worker,
         WorkerEvent,
     )
 
+_ScanKey = tuple[bool, datetime, str]
+
+
+def _task_last_ts(task: TaskSummary) -> datetime | None:
+    return task.finished or task.started or task.received
+
+
+def _cursor_key(cursor: TaskCursor) -> _ScanKey:
+    last_ts = cursor.last_ts
+    if last_ts is None:
+        return False, datetime.min.replace(tzinfo=UTC), cursor.task_id
+    return True, last_ts if last_ts.tzinfo is not None else last_ts.replace(tzinfo=UTC), cursor.task_id
+
+
+def _scan_key(task: TaskSummary) -> _ScanKey:
+    return _cursor_key(TaskCursor(last_ts=_task_last_ts(task), task_id=task.task_id))
+
+
+def graph_node_ids(root_id: str, relations: Iterable[TaskRelation], tasks: Iterable[TaskSummary]) -> set[str]:
+    """Return every task ID a workflow graph references, including IDs without a stored task."""
+    node_ids = {root_id}
+    for relation in relations:
+        node_ids.add(relation.parent_id or relation.root_id)
+        node_ids.add(relation.child_id)
+    for task in tasks:
+        node_ids.add(task.task_id)
+        node_ids.update(item for item in (task.parent_id, task.group_id, task.chord_id) if item)
+    return node_ids
+
 
 class BaseDBController(ABC):
     """Subclass to provide a custom storage backend."""
@@ -57,11 +93,51 @@ class BaseDBController(ABC):
         """Persist a task event."""
         ...
 
+    def store_task_events(self, events: Sequence[TaskEvent]) -> None:
+        """Persist a batch of task events in order.
+
+        Backends should override this to write the whole batch in a single transaction.
+        """
+        for event in events:
+            self.store_task_event(event)
+
     @abstractmethod
-    def get_tasks(self, filters: TaskFilter | None = None) -> Sequence[Task]:
-        """Return tasks matching optional filters."""
+    def get_tasks(self, filters: TaskFilter | None = None) -> Sequence[TaskSummary]:
+        """Return summaries of the tasks matching optional filters."""
         ...
 
+    def scan_tasks(
+        self,
+        filters: TaskFilter | None,
+        *,
+        cursor: TaskCursor | None,
+        limit: int,
+    ) -> tuple[list[TaskSummary], TaskCursor | None]:
+        """Return summaries of up to ``limit`` tasks after ``cursor`` and the cursor to continue from.
+
+        Tasks are ordered newest first by ``(last_ts, task_id)``, where ``last_ts`` is the finished, started
+        or received time; tasks without one come last. The returned cursor is ``None`` once the scan is
+        complete. Backends should override this with a keyset query instead of filtering ``get_tasks``.
+        """
+        tasks = sorted(self.get_tasks(filters), key=_scan_key, reverse=True)
+        if cursor is not None:
+            position = _cursor_key(cursor)
+            tasks = [task for task in tasks if _scan_key(task) < position]
+        chunk = tasks[:limit]
+        if len(chunk) < limit:
+            return chunk, None
+        last = chunk[-1]
+        return chunk, TaskCursor(last_ts=_task_last_ts(last), task_id=last.task_id)
+
+    def iter_tasks(self, filters: TaskFilter | None = None, *, chunk_size: int = 500) -> Iterator[TaskSummary]:
+        """Yield summaries of all tasks matching ``filters`` in ``scan_tasks`` order, one chunk at a time."""
+        cursor: TaskCursor | None = None
+        while True:
+            tasks, cursor = self.scan_tasks(filters, cursor=cursor, limit=chunk_size)
+            yield from tasks
+            if cursor is None:
+                return
+
     @abstractmethod
     def get_tasks_page(
         self,
@@ -71,8 +147,8 @@ class BaseDBController(ABC):
         sort_dir: str | None,
         limit: int,
         offset: int,
-    ) -> tuple[list[Task], int]:
-        """Return paginated tasks and total count."""
+    ) -> tuple[list[TaskSummary], int]:
+        """Return paginated task summaries and total count."""
         ...
 
     @abstractmethod
@@ -82,14 +158,50 @@ class BaseDBController(ABC):
 
     @abstractmethod
     def get_task(self, task_id: str) -> Task | None:
-        """Return a task by ID, if present."""
+        """Return a task by ID with its full payloads, if present."""
         ...
 
+    def get_tasks_by_id(self, task_ids: Sequence[str]) -> list[Task]:
+        """Return the stored tasks among ``task_ids``; unknown IDs are skipped.
+
+        Backends should override this with a bulk lookup instead of one ``get_task`` per ID.
+        """
+        tasks = (self.get_task(task_id) for task_id in dict.fromkeys(task_ids))
+        return [task for task in tasks if task is not None]
+
+    def get_task_graph(self, task_id: str) -> TaskGraph | None:
+        """Return the tasks and relations of the workflow containing ``task_id``, if the task is known."""
+        task = self.get_task(task_id)
+        if task is None:
+            return None
+        root_id = task.root_id or task.task_id
+        relations = list(self.get_task_relations(root_id))
+        members = [item.task_id for item in self.iter_tasks(TaskFilter(root_id=root_id))]
+        tasks = {item.task_id: item for item in self.get_tasks_by_id(members)}
+        tasks.setdefault(task.task_id, task)
+        missing = sorted(graph_node_ids(root_id, relations, tasks.values()) - tasks.keys())
+        tasks.update((item.task_id, item) for item in self.get_tasks_by_id(missing))
+        return TaskGraph(root_id=root_id, tasks=list(tasks.values()), relations=relations)
+
+    def get_task_graph_changes(self, task_id: str, since: int) -> TaskGraphChanges | None:
+        """Return what changed in the workflow containing ``task_id`` after the cursor ``since``.
+
+        Returns ``None`` when the backend does not track changes; callers then fall back to
+        ``get_task_graph``.
+        """
+        _ = (task_id, since)
+        return None
+
     @abstractmethod
     def store_task_relation(self, relation: TaskRelation) -> None:
         """Persist a task relation edge."""
         ...
 
+    def store_task_relations(self, relations: Sequence[TaskRelation]) -> None:
+        """Persist a batch of task relation edges."""
+        for relation in relations:
+            self.store_task_relation(relation)
+
     @abstractmethod
     def get_task_relations(self, root_id: str) -> Sequence[TaskRelation]:
         """Return task relations for a root task."""
@@ -100,16 +212,45 @@ class BaseDBController(ABC):
         """Persist a worker event."""
         ...
 
+    def store_worker_events(self, events: Sequence[WorkerEvent]) -> None:
+        """Persist a batch of worker events in order.
+
+        Backends should override this to write the whole batch in a single transaction.
+        """
+        for event in events:
+            self.store_worker_event(event)
+
     @abstractmethod
     def store_broker_queue_event(self, event: BrokerQueueEvent) -> None:
         """Persist a broker queue snapshot."""
         ...
 
+    def store_broker_queue_events(self, events: Sequence[BrokerQueueEvent]) -> None:
+        """Persist a batch of broker queue snapshots in order.
+
+        Backends should override this to write the whole batch in a single transaction.
+        """
+        for event in events:
+            self.store_broker_queue_event(event)
+
     @abstractmethod
     def get_broker_queue_snapshot(self, broker_url: str) -> Sequence[BrokerQueueEvent]:
         """Return the latest broker queue snapshots."""
         ...
 
+    def get_broker_queue_history(
+        self,
+        broker_url: str,
+        queue: str,
+        time_range: TimeRange,
+    ) -> Sequence[BrokerQueueSample]:
+        """Return the depth history of a queue, oldest first.
+
+        Backends that keep a queue depth history should override this; the default has none.
+        """
+        _ = (broker_url, queue, time_range)
+        return []
+
     @abstractmethod
     def get_workers(self) -> Sequence[Worker]:
         """Return all known workers."""
@@ -140,11 +281,54 @@ class BaseDBController(ABC):
         """Return counts by task state."""
         ...
 
+    def get_worker_state_counts(self) -> dict[str, dict[str, int]]:
+        """Return task counts by state for each worker, keyed by hostname.
+
+        Backends should override this with a grouped query; the default scans every task.
+        """
+        counts: dict[str, dict[str, int]] = {}
+        for task in self.iter_tasks():
+            if task.worker is None:
+                continue
+            states = counts.setdefault(task.worker, {})
+            states[task.state] = states.get(task.state, 0) + 1
+        return counts
+
     @abstractmethod
     def get_heatmap(self, time_range: TimeRange | None) -> list[list[int]]:
         """Return a heatmap of task activity."""
         ...
 
+    def get_rollup_counts(
+        self,
+        time_range: TimeRange | None,
+        group_by: Sequence[RollupDimension] = (),
+    ) -> Sequence[TaskRollupCount]:
+        """Return task counts grouped by the requested dimensions.
+
+        Backends with rollup tables should override this; the default aggregates ``get_tasks``.
+        """
+        counts: dict[tuple[str | None, ...], int] = {}
+        for task in self.get_tasks(TaskFilter(time_range=time_range)):
+            key = tuple(getattr(task, dimension) for dimension in group_by)
+            counts[key] = counts.get(key, 0) + 1
+        return [
+            TaskRollupCount.model_validate({"count": count, **dict(zip(group_by, key, strict=True))})
+            for key, count in counts.items()
+        ]
+
+    def get_rollup_throughput(self, time_range: TimeRange, bucket_seconds: int) -> Sequence[ThroughputBucket]:
+        """Return throughput buckets from pre-aggregated counters when available."""
+        return self.get_throughput(time_range, bucket_seconds)
+
+    def get_rollup_task_stats(self, task_name: str | None, time_range: TimeRange | None) -> TaskStats:
+        """Return task statistics from a pre-aggregated runtime histogram when available."""
+        return self.get_task_stats(task_name, time_range)
+
+    def rebuild_rollups(self) -> int:
+        """Rebuild pre-aggregated rollups from stored history and return the number of tasks aggregated."""
+        return 0
+
     @abstractmethod
     def get_schedules(self) -> Sequence[Schedule]:
         """Return all stored schedules."""
@@ -165,6 +349,29 @@ class BaseDBController(ABC):
         """Delete historical data older than the retention window."""
         ...
 
+    def purge_expired(self, cutoff: datetime, chunk_size: int) -> tuple[str, int] | None:
+        """Delete one bounded chunk of data older than ``cutoff``.
+
+        Returns the table the chunk was taken from and the rows removed, or ``None`` once nothing older
+        than the cutoff remains. Backends without chunked deletes fall back to a single ``cleanup`` pass.
+        """
+        _ = chunk_size
+        days = max((datetime.now(UTC) - cutoff).days, 1)
+        removed = self.cleanup(days)
+        return ("*", removed) if removed else None
+
+    def compact(self, mode: RetentionMaintenance) -> None:
+        """Reclaim storage after a retention pass; a no-op unless the backend supports ``mode``."""
+        _ = mode
+
+    def open_reader(self, pool_size: int) -> BaseDBController | None:
+        """Return a read-only controller that can serve reads concurrently with writes.
+
+        ``None`` means reads must share this controller (and its write lock).
+        """
+        _ = pool_size
+        return None
+
     @abstractmethod
     def close(self) -> None:
         """Close any backend resources."""
@@ -0,0 +1,352 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""SQLite controller with a DuckDB column store for the dashboard statistics.
+
+SQLite stays the system of record: task rows, events, graphs, workers, schedules and rollups are
+written and read exactly as by :class:`SQLiteController`. Every task upsert is also staged as one
+narrow fact row (name, state, worker, last activity, runtime) and bulk-loaded into DuckDB, where
+the statistics endpoints run as vectorized scans over a few columns instead of walking the wide
+SQLite rows.
+"""
+
+from __future__ import annotations
+
+import csv
+import importlib
+import os
+import tempfile
+import threading
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import func, select
+
+from celery_root.core.db.adapters.sqlite import (
+    _MICROS_PER_SECOND,
+    _SQLITE_IN_CHUNK_SIZE,
+    SQLiteController,
+    _as_optional_float,
+    _coerce_dt,
+    _epoch_micros,
+    _facts_stats,
+)
+from celery_root.core.db.models import TaskStats, ThroughputBucket
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from sqlalchemy.sql import Select
+
+    from celery_root.core.db.models import TaskEvent, TimeRange
+
+# Rows staged before they are loaded; every statistics read loads whatever is staged first.
+_LOAD_BATCH_ROWS = 5_000
+_NULL = r"\N"
+_FACT_COLUMNS = (
+    ("task_id", "VARCHAR"),
+    ("name", "VARCHAR"),
+    ("state", "VARCHAR"),
+    ("worker", "VARCHAR"),
+    ("last_ts", "TIMESTAMP"),
+    ("runtime", "DOUBLE"),
+    ("change_seq", "BIGINT"),
+)
+_FACTS_DDL = (
+    "CREATE TABLE IF NOT EXISTS task_facts ("
+    + ", ".join(f"{name} {kind}{' PRIMARY KEY' if name == 'task_id' else ''}" for name, kind in _FACT_COLUMNS)
+    + ")"
+)
+# Binding Python lists costs far more per value than DuckDB's CSV reader, so batches are loaded from a
+# temporary CSV file. ``auto_detect=false`` with explicit columns skips the sniffing pass.
+_FACTS_LOAD = (
+    "INSERT OR REPLACE INTO task_facts SELECT * FROM read_csv(?, header=false, auto_detect=false, "  # noqa: S608
+    f"nullstr='{_NULL}', columns={{" + ", ".join(f"'{name}': '{kind}'" for name, kind in _FACT_COLUMNS) + "})"
+)
+
+_FactRow = tuple[object, ...]
+
+
+def _duckdb() -> Any:  # noqa: ANN401 - optional dependency without bundled stubs
+    return importlib.import_module("duckdb")
+
+
+def _naive(value: datetime) -> datetime:
+    # SQLite stores the wall-clock value without tzinfo; compare the facts the same way.
+    return value.replace(tzinfo=None)
+
+
+def _csv_value(value: object) -> object:
+    return _NULL if value is None else value
+
+
+class _TaskColumnStore:
+    """DuckDB table of per-task facts, loaded in batches and shared by a writer and its readers."""
+
+    def __init__(self, path: Path | None) -> None:
+        """Open the DuckDB database at ``path``, or an in-memory database when it is None."""
+        self._conn = _duckdb().connect(str(path) if path is not None else ":memory:")
+        self._conn.execute(_FACTS_DDL)
+        self._lock = threading.Lock()
+        self._pending: dict[str, _FactRow] = {}
+
+    def stage(self, rows: Iterable[_FactRow]) -> None:
+        """Queue fact rows for loading, replacing rows staged earlier for the same task."""
+        with self._lock:
+            for row in rows:
+                self._pending[str(row[0])] = row
+            if len(self._pending) >= _LOAD_BATCH_ROWS:
+                self._load_pending()
+
+    def flush(self) -> None:
+        """Load every staged row."""
+        with self._lock:
+            self._load_pending()
+
+    def summary(self) -> tuple[int, int]:
+        """Return the number of facts and the highest change sequence they were loaded at."""
+        count, change_seq = self.query("SELECT count(*), coalesce(max(change_seq), 0) FROM task_facts")[0]
+        return int(count), int(change_seq)
+
+    def replace_all(self, chunks: Iterable[Sequence[_FactRow]]) -> None:
+        """Drop every fact and load ``chunks`` in their place."""
+        with self._lock:
+            self._pending.clear()
+            self._conn.execute("DELETE FROM task_facts")
+            for chunk in chunks:
+                self._pending.update((str(row[0]), row) for row in chunk)
+                self._load_pending()
+
+    def delete_before(self, cutoff: datetime) -> None:
+        """Drop the facts of tasks last active before ``cutoff``."""
+        with self._lock:
+            self._load_pending()
+            self._conn.execute("DELETE FROM task_facts WHERE last_ts < ?", [_naive(cutoff)])
+
+    def query(self, sql: str, params: Sequence[object] = ()) -> list[tuple[Any, ...]]:
+        """Load staged rows, then run ``sql`` on a cursor of its own so readers run concurrently."""
+        with self._lock:
+            self._load_pending()
+            cursor = self._conn.cursor()
+        try:
+            return list(cursor.execute(sql, list(params)).fetchall())
+        finally:
+            cursor.close()
+
+    def close(self) -> None:
+        """Load staged rows and close the database."""
+        with self._lock:
+            self._load_pending()
+            self._conn.close()
+
+    def _load_pending(self) -> None:
+        if not self._pending:
+            return
+        handle, name = tempfile.mkstemp(prefix="celery_root_facts_", suffix=".csv")
+        try:
+            with os.fdopen(handle, "w", newline="", encoding="utf-8") as stream:
+                writer = csv.writer(stream, lineterminator="\n")
+                writer.writerows([_csv_value(value) for value in row] for row in self._pending.values())
+            self._conn.execute(_FACTS_LOAD, [name])
+        finally:
+            Path(name).unlink(missing_ok=True)
+        self._pending.clear()
+
+
+class DuckDBController(SQLiteController):
+    """SQLite controller that answers task statistics from a DuckDB column store."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: str | Path | None = None,
+        *,
+        analytics_path: str | Path | None = None,
+        read_only: bool = False,
+        pool_size: int = 5,
+        heartbeat_history_seconds: float = 0.0,
+        archive_path: str | Path | None = None,
+        column_store: _TaskColumnStore | None = None,
+    ) -> None:
+        """Initialize the SQLite row store and the DuckDB column store next to it.
+
+        The column store defaults to ``path`` with a ``.duckdb`` suffix, or memory when ``path`` is None.
+        Read-only controllers share the ``column_store`` of the writer that opened them, since DuckDB
+        allows one writable connection per database file.
+        """
+        super().__init__(
+            path,
+            read_only=read_only,
+            pool_size=pool_size,
+            heartbeat_history_seconds=heartbeat_history_seconds,
+            archive_path=archive_path,
+        )
+        self._owns_store = column_store is None
+        if column_store is None:
+            if read_only:
+                msg = "Read-only DuckDB controllers share the column store of their writer."
+                raise ValueError(msg)
+            if analytics_path is not None:
+                resolved: Path | None = Path(analytics_path).expanduser().resolve()
+            else:
+                resolved = self._path.with_suffix(".duckdb") if self._path is not None else None
+            if resolved is not None:
+                resolved.parent.mkdir(parents=True, exist_ok=True)
+            column_store = _TaskColumnStore(resolved)
+        self._store = column_store
+
+    def initialize(self) -> None:
+        """Create tables and reload the column store when it does not match the SQLite tasks."""
+        super().initialize()
+        tasks = self._tasks
+        with self._engine.begin() as conn:
+            count, change_seq = conn.execute(select(func.count(), func.coalesce(func.max(tasks.c.change_seq), 0))).one()
+        if self._store.summary() != (int(count), int(change_seq)):
+            self._store.replace_all(self._iter_facts())
+
+    def store_task_events(self, events: Sequence[TaskEvent]) -> None:
+        """Persist task events in SQLite and stage the updated task facts for the column store."""
+        super().store_task_events(events)
+        task_ids = list(dict.fromkeys(event.task_id for event in events))
+        tasks = self._tasks
+        with self._engine.begin() as conn:
+            for offset in range(0, len(task_ids), _SQLITE_IN_CHUNK_SIZE):
+                chunk = task_ids[offset : offset + _SQLITE_IN_CHUNK_SIZE]
+                rows = conn.execute(self._facts_select().where(tasks.c.task_id.in_(chunk))).all()
+                self._store.stage(tuple(row) for row in rows)
+
+    def get_task_stats(self, task_name: str | None, time_range: TimeRange | None) -> TaskStats:
+        """Compute task runtime statistics in one columnar aggregate."""
+        facts = self._facts_with_archive(task_name, time_range)
+        if facts is not None:
+            return _facts_stats(facts)
+        where, params = self._facts_conditions(task_name, time_range)
+        rows = self._store.query(
+            "SELECT count(*), count(runtime), min(runtime), max(runtime), avg(runtime), "  # noqa: S608 - values are bound
+            f"quantile_cont(runtime, [0.5, 0.95, 0.99]) FROM task_facts{where}",
+            params,
+        )
+        count, runtime_count, min_runtime, max_runtime, avg_runtime, percentiles = rows[0]
+        if not runtime_count:
+            return TaskStats(count=int(count or 0))
+        p50, p95, p99 = (_as_optional_float(value) for value in percentiles)
+        return TaskStats(
+            count=int(count),
+            min_runtime=_as_optional_float(min_runtime),
+            max_runtime=_as_optional_float(max_runtime),
+            avg_runtime=_as_optional_float(avg_runtime),
+            p50=p50,
+            p95=p95,
+            p99=p99,
+        )
+
+    def get_throughput(self, time_range: TimeRange, bucket_seconds: int) -> list[ThroughputBucket]:
+        """Compute throughput buckets with a columnar grouped count."""
+        buckets = self._init_buckets(time_range, bucket_seconds)
+        start = _coerce_dt(time_range.start) or time_range.start
+        facts = self._facts_with_archive(None, time_range)
+        if facts is not None:
+            return self._facts_throughput(facts, buckets, start, bucket_seconds)
+        where, params = self._facts_conditions(None, time_range)
+        rows = self._store.query(
+            "SELECT greatest((epoch_us(last_ts) - ?) // ?, 0) AS bucket_index, count(*) "  # noqa: S608 - values are bound
+            f"FROM task_facts{where} GROUP BY bucket_index",
+            [_epoch_micros(start), bucket_seconds * _MICROS_PER_SECOND, *params],
+        )
+        for bucket_index, count in rows:
+            bucket_start = start + timedelta(seconds=int(bucket_index) * bucket_seconds)
+            if bucket_start in buckets:
+                buckets[bucket_start] += int(count)
+        return [ThroughputBucket(bucket_start=key, count=value) for key, value in buckets.items()]
+
+    def get_state_distribution(self) -> dict[str, int]:
+        """Return task counts by state."""
+        rows = self._store.query("SELECT state, count(*) FROM task_facts WHERE state IS NOT NULL GROUP BY state")
+        return {str(state): int(count) for state, count in rows}
+
+    def get_worker_state_counts(self) -> dict[str, dict[str, int]]:
+        """Return task counts by state for each worker."""
+        rows = self._store.query(
+            "SELECT worker, state, count(*) FROM task_facts WHERE worker IS NOT NULL GROUP BY worker, state",
+        )
+        counts: dict[str, dict[str, int]] = {}
+        for worker, state, count in rows:
+            counts.setdefault(str(worker), {})[str(state)] = int(count)
+        return counts
+
+    def get_heatmap(self, time_range: TimeRange | None) -> list[list[int]]:
+        """Return a weekday/hour heatmap of task activity from a columnar grouped count."""
+        facts = self._facts_with_archive(None, time_range)
+        if facts is not None:
+            return self._facts_heatmap(facts)
+        where, params = self._facts_conditions(None, time_range)
+        where = f"{where} AND last_ts IS NOT NULL" if where else " WHERE last_ts IS NOT NULL"
+        # isodow counts Monday as 1; shift so Monday is 0 like datetime.weekday().
+        rows = self._store.query(
+            "SELECT isodow(last_ts) - 1 AS weekday, hour(last_ts) AS hour, count(*) "  # noqa: S608 - values are bound
+            f"FROM task_facts{where} GROUP BY weekday, hour",
+            params,
+        )
+        heatmap = [[0 for _ in range(24)] for _ in range(7)]
+        for weekday, hour, count in rows:
+            heatmap[int(weekday)][int(hour)] += int(count)
+        return heatmap
+
+    def cleanup(self, older_than_days: int) -> int:
+        """Delete historical data older than the cutoff from both stores."""
+        removed = super().cleanup(older_than_days)
+        self._store.delete_before(datetime.now(UTC) - timedelta(days=older_than_days))
+        return removed
+
+    def purge_expired(self, cutoff: datetime, chunk_size: int) -> tuple[str, int] | None:
+        """Delete a chunk of expired SQLite rows, dropping expired task facts along with task rows."""
+        result = super().purge_expired(cutoff, chunk_size)
+        if result is not None and result[0] == self._tasks.name:
+            self._store.delete_before(_coerce_dt(cutoff) or cutoff)
+        return result
+
+    def open_reader(self, pool_size: int) -> DuckDBController | None:
+        """Return a read-only controller over the same SQLite file that shares this column store."""
+        if self._path is None or pool_size <= 0:
+            return None
+        return DuckDBController(
+            self._path,
+            read_only=True,
+            pool_size=pool_size,
+            archive_path=self._archive.root if self._archive is not None else None,
+            column_store=self._store,
+        )
+
+    def close(self) -> None:
+        """Dispose of the SQLite engine and close the column store this controller opened."""
+        super().close()
+        if self._owns_store:
+            self._store.close()
+
+    def _facts_select(self) -> Select[tuple[object, ...]]:
+        tasks = self._tasks
+        return select(*(tasks.c[name] for name, _kind in _FACT_COLUMNS))
+
+    def _iter_facts(self) -> Iterable[list[_FactRow]]:
+        with self._engine.connect() as conn:
+            result = conn.execution_options(stream_results=True).execute(self._facts_select())
+            for partition in result.partitions(_LOAD_BATCH_ROWS):
+                yield [tuple(row) for row in partition]
+
+    @staticmethod
+    def _facts_conditions(task_name: str | None, time_range: TimeRange | None) -> tuple[str, list[object]]:
+        clauses: list[str] = []
+        params: list[object] = []
+        if task_name is not None:
+            clauses.append("name = ?")
+            params.append(task_name)
+        if time_range is not None:
+            clauses.append("last_ts BETWEEN ? AND ?")
+            params.extend([_naive(time_range.start), _naive(time_range.end)])
+        return (f" WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+
+__all__ = ["DuckDBController"]
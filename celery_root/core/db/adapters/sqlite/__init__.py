@@ -8,41 +8,66 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import re
+import sqlite3
+import zlib
+from bisect import bisect_left
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy import (
     Boolean,
     Column,
+    Computed,
     DateTime,
     Float,
+    Index,
     Integer,
+    LargeBinary,
     MetaData,
     String,
     Table,
     Text,
+    and_,
+    bindparam,
+    case,
+    column,
     create_engine,
     delete,
     event,
+    exists,
     func,
+    literal_column,
+    or_,
     select,
+    table,
     text,
+    tuple_,
 )
+from sqlalchemy import cast as sql_cast
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 
-from celery_root.core.db.adapters.base import BaseDBController
+from celery_root.core.db.adapters.base import BaseDBController, graph_node_ids
+from celery_root.core.db.archive import JsonlArchive
 from celery_root.core.db.models import (
     BrokerQueueEvent,
+    BrokerQueueSample,
     Schedule,
     Task,
+    TaskCursor,
     TaskEvent,
     TaskFilter,
+    TaskGraph,
+    TaskGraphChanges,
     TaskRelation,
+    TaskRollupCount,
     TaskStats,
+    TaskSummary,
     ThroughputBucket,
     TimeRange,
     Worker,
@@ -50,30 +75,182 @@ from celery_root.core.db.models import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Collection, Mapping, Sequence
     from sqlite3 import Connection as SQLiteConnection
 
-    from sqlalchemy.engine import Connection, Engine
-    from sqlalchemy.sql import Select
+    from sqlalchemy.dialects.sqlite import Insert
+    from sqlalchemy.engine import Connection, Engine, Row
+    from sqlalchemy.sql import Select, TableClause
     from sqlalchemy.sql.elements import ColumnElement
 
+    from celery_root.config import RetentionMaintenance
+    from celery_root.core.db.models import RollupDimension
+
 
 _FINAL_STATES = {"SUCCESS", "FAILURE", "REVOKED"}
 _SQLITE_BUSY_TIMEOUT_MS = 30_000
+_SQLITE_IN_CHUNK_SIZE = 500
 _SCHEDULE_APP_SCHEMA_VERSION = 2
 _BROKER_URL_SCHEMA_VERSION = 3
 _STAMPS_SCHEMA_VERSION = 4
 _BROKER_QUEUE_SCHEMA_VERSION = 5
+_INDEX_SCHEMA_VERSION = 6
+_ROLLUP_SCHEMA_VERSION = 7
+_SCAN_INDEX_SCHEMA_VERSION = 8
+_WORKER_STATE_INDEX_SCHEMA_VERSION = 9
+_CHANGE_SEQ_SCHEMA_VERSION = 10
+_WORKER_SNAPSHOT_SCHEMA_VERSION = 11
+_BROKER_QUEUE_HISTORY_SCHEMA_VERSION = 12
+_TASK_SEARCH_SCHEMA_VERSION = 13
+_PAYLOAD_BLOB_SCHEMA_VERSION = 14
+_TASK_LAST_TS_SQL = "coalesce(finished, started, received)"
+_MICROS_PER_SECOND = 1_000_000
+_EPOCH = datetime(1970, 1, 1)  # noqa: DTZ001 - matches the naive values stored by SQLite
+_TASK_SNAPSHOT_COLUMNS = ("name", "state", "worker", "received", "started", "finished", "runtime", "retries")
+# Columns that place a task in its workflow graph; changing one changes the graph topology.
+_TASK_LINK_COLUMNS = ("parent_id", "root_id", "group_id", "chord_id")
+# Columns read for task summaries; payload columns are added as previews.
+_TASK_SUMMARY_COLUMNS = (
+    "task_id",
+    "name",
+    "state",
+    "worker",
+    "received",
+    "started",
+    "finished",
+    "runtime",
+    "retries",
+    *_TASK_LINK_COLUMNS,
+    "last_ts",
+)
+# Rollup resolutions in seconds, mapped to the stored-timestamp prefix length and suffix of a bucket start.
+_ROLLUP_RESOLUTIONS = {60: ("minute", 16, ":00.000000"), 3600: ("hour", 13, ":00:00.000000")}
+_ROLLUP_MINUTE = 60
+_ROLLUP_HOUR = 3600
+# Rollup keys form the primary key, where NULLs would never conflict; unknown names/workers are stored as "".
+_ROLLUP_UNKNOWN = ""
+# Upper bounds (seconds) of the runtime histogram bins on a 1-2-5 scale; the last bin is unbounded.
+# Raw broker queue changes are kept this long; older history is served from the minute rollups.
+_BROKER_QUEUE_RAW_SECONDS = 3600
+_RUNTIME_HISTOGRAM_BOUNDS = tuple(round(step * 10.0**exponent, 3) for exponent in range(-3, 4) for step in (1, 2, 5))
+
+# Task payload columns. Values longer than ``_PAYLOAD_INLINE_CHARS`` are stored once per distinct text,
+# zlib-compressed, in ``payload_blobs`` keyed by their digest; the ``<column>_ref`` of task and event rows
+# points at the blob, tasks keep a short preview for list views and events keep no text at all.
+_PAYLOAD_COLUMNS = ("args", "kwargs", "result", "traceback")
+_PAYLOAD_INLINE_CHARS = 256
+_PAYLOAD_PREVIEW_CHARS = 200
+_PAYLOAD_DIGEST_BYTES = 16
+_TASK_SEARCH_COLUMNS = ("task_id", "name", "worker", *_PAYLOAD_COLUMNS)
+
+
+def _search_values(row: str) -> str:
+    """Return the FTS values of trigger row ``row``; payloads stored as blobs contribute their preview."""
+    return ", ".join(f"{row}.{name}" for name in ("rowid", *_TASK_SEARCH_COLUMNS))
+
+
+# Full-text index over the searchable task columns. It is an external-content FTS5 table keyed by the
+# tasks rowid and kept in sync by triggers, so the text is not stored twice. Only incremental vacuum
+# is used on this database, which leaves rowids in place. The triggers are plain SQL so any connection,
+# including the sqlite3 shell, can write to ``tasks``.
+#
+# The triggers only see the stored previews of blob payloads. ``task_search`` holds the full text of the
+# tasks that reference blobs under the same rowid; the controller writes it after each task upsert, and the
+# triggers drop a row whenever its task's text changes so it is never stale.
+_TASK_SEARCH_TRIGGERS = ("tasks_fts_insert", "tasks_fts_delete", "tasks_fts_update")
+_TASK_SEARCH_DDL = (
+    (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+        "task_id, name, worker, args, kwargs, result, traceback, content='tasks', content_rowid='rowid')"
+    ),
+    "CREATE VIRTUAL TABLE IF NOT EXISTS task_search USING fts5(task_id, name, worker, args, kwargs, result, traceback)",
+    (
+        "CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN "  # noqa: S608 - constant columns
+        "INSERT INTO tasks_fts (rowid, task_id, name, worker, args, kwargs, result, traceback) "
+        f"VALUES ({_search_values('new')}); "
+        "END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN "  # noqa: S608 - constant columns
+        "INSERT INTO tasks_fts (tasks_fts, rowid, task_id, name, worker, args, kwargs, result, traceback) "
+        f"VALUES ('delete', {_search_values('old')}); "
+        "DELETE FROM task_search WHERE rowid = old.rowid; "
+        "END"
+    ),
+    # Most task upserts only move state and timestamps; re-index a row only when its text changes.
+    (
+        "CREATE TRIGGER IF NOT EXISTS tasks_fts_update "  # noqa: S608 - constant columns
+        "AFTER UPDATE OF task_id, name, worker, args, kwargs, result, traceback, "
+        "args_ref, kwargs_ref, result_ref, traceback_ref ON tasks "
+        "WHEN old.task_id IS NOT new.task_id OR old.name IS NOT new.name OR old.worker IS NOT new.worker "
+        "OR old.args IS NOT new.args OR old.kwargs IS NOT new.kwargs OR old.result IS NOT new.result "
+        "OR old.traceback IS NOT new.traceback OR old.args_ref IS NOT new.args_ref "
+        "OR old.kwargs_ref IS NOT new.kwargs_ref OR old.result_ref IS NOT new.result_ref "
+        "OR old.traceback_ref IS NOT new.traceback_ref BEGIN "
+        "INSERT INTO tasks_fts (tasks_fts, rowid, task_id, name, worker, args, kwargs, result, traceback) "
+        f"VALUES ('delete', {_search_values('old')}); "
+        "INSERT INTO tasks_fts (rowid, task_id, name, worker, args, kwargs, result, traceback) "
+        f"VALUES ({_search_values('new')}); "
+        "DELETE FROM task_search WHERE rowid = old.rowid; "
+        "END"
+    ),
+)
+_TASK_SEARCH_TERM = re.compile(r'"([^"]*)"|(\S+)')
+
+# Tables whose expired rows are moved to the archive when one is configured, and their day column.
+_ARCHIVED_TABLES = {"task_events": "timestamp", "tasks": "last_ts", "worker_events": "timestamp"}
+
+_RollupKey = tuple[datetime, str, str, str, float | None]
+# (name, state, worker, last_ts, runtime) of a task, hot or archived, for statistics spanning both.
+_TaskFact = tuple[str | None, str | None, str | None, datetime, float | None]
 
 
 def _configure_sqlite(dbapi_connection: SQLiteConnection, _connection_record: object) -> None:
     cursor = dbapi_connection.cursor()
+    # Only takes effect while the database is still empty, so it must precede the journal mode switch.
+    cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
     cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("PRAGMA synchronous=NORMAL")
     cursor.execute(f"PRAGMA busy_timeout={_SQLITE_BUSY_TIMEOUT_MS}")
     cursor.close()
 
 
+def _configure_sqlite_reader(dbapi_connection: SQLiteConnection, _connection_record: object) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=ON")
+    cursor.execute(f"PRAGMA busy_timeout={_SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.close()
+
+
+def _payload_digest(value: str) -> bytes:
+    return hashlib.blake2b(value.encode(), digest_size=_PAYLOAD_DIGEST_BYTES).digest()
+
+
+def _inflate_payload(data: bytes | None) -> str | None:
+    return zlib.decompress(data).decode() if data is not None else None
+
+
+def _externalize_payloads(values: dict[str, object], digests: dict[str, bytes], *, preview: bool) -> list[bytes]:
+    """Replace the large payloads of ``values`` by their digest, recording each text in ``digests``.
+
+    With ``preview`` the payload column keeps a truncated copy of the text, otherwise it is cleared.
+    Returns the digests referenced by ``values``.
+    """
+    referenced: list[bytes] = []
+    for name in _PAYLOAD_COLUMNS:
+        value = values.get(name)
+        values[f"{name}_ref"] = None
+        if not isinstance(value, str) or len(value) <= _PAYLOAD_INLINE_CHARS:
+            continue
+        digest = digests.get(value)
+        if digest is None:
+            digest = digests[value] = _payload_digest(value)
+        values[name] = f"{value[:_PAYLOAD_PREVIEW_CHARS]}..." if preview else None
+        values[f"{name}_ref"] = digest
+        referenced.append(digest)
+    return referenced
+
+
 def _coerce_dt(value: datetime | None) -> datetime | None:
     if value is None:
         return None
@@ -82,24 +259,100 @@ def _coerce_dt(value: datetime | None) -> datetime | None:
     return value
 
 
-def _task_timestamp(task: Task) -> datetime | None:
-    return task.finished or task.started or task.received
-
-
-def _percentile(values: list[float], pct: float) -> float | None:
-    if not values:
-        return None
+def _percentile_positions(count: int, pct: float) -> tuple[int, int, float]:
+    """Return the sorted positions and weight used to interpolate a percentile."""
     if pct <= 0:
-        return values[0]
+        return 0, 0, 0.0
     if pct >= 1:
-        return values[-1]
-    index = (len(values) - 1) * pct
+        return count - 1, count - 1, 0.0
+    index = (count - 1) * pct
     lower = int(index)
-    upper = min(lower + 1, len(values) - 1)
-    if lower == upper:
-        return values[lower]
-    weight = index - lower
-    return values[lower] + (values[upper] - values[lower]) * weight
+    upper = min(lower + 1, count - 1)
+    return lower, upper, index - lower
+
+
+def _epoch_micros(value: datetime) -> int:
+    # Stored timestamps drop tzinfo, so compare against the naive wall-clock value as SQLite sees it.
+    naive = value.replace(tzinfo=None)
+    delta = naive - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * _MICROS_PER_SECOND + delta.microseconds
+
+
+def _epoch_micros_sql(column: ColumnElement[datetime]) -> ColumnElement[int]:
+    # DateTime values are stored as "YYYY-MM-DD HH:MM:SS.ffffff"; combine whole seconds with the
+    # microsecond suffix so bucketing stays in exact integer arithmetic.
+    seconds = sql_cast(func.strftime("%s", column), Integer)
+    micros = sql_cast(func.substr(column, 21, 6), Integer)
+    return seconds * _MICROS_PER_SECOND + micros
+
+
+def _bucket_floor(value: datetime, seconds: int) -> datetime:
+    step = seconds * _MICROS_PER_SECOND
+    return _EPOCH + timedelta(microseconds=_epoch_micros(value) // step * step)
+
+
+def _facts_stats(facts: Sequence[_TaskFact]) -> TaskStats:
+    runtimes = sorted(fact[4] for fact in facts if fact[4] is not None)
+    if not runtimes:
+        return TaskStats(count=len(facts))
+    percentiles: list[float] = []
+    for pct in (0.5, 0.95, 0.99):
+        lower, upper, weight = _percentile_positions(len(runtimes), pct)
+        percentiles.append(runtimes[lower] + (runtimes[upper] - runtimes[lower]) * weight)
+    return TaskStats(
+        count=len(facts),
+        min_runtime=runtimes[0],
+        max_runtime=runtimes[-1],
+        avg_runtime=sum(runtimes) / len(runtimes),
+        p50=percentiles[0],
+        p95=percentiles[1],
+        p99=percentiles[2],
+    )
+
+
+def _runtime_bin(runtime: float) -> int:
+    return bisect_left(_RUNTIME_HISTOGRAM_BOUNDS, runtime)
+
+
+def _histogram_quantile(bins: Mapping[int, tuple[int, float]], total: int, pct: float) -> float | None:
+    """Estimate a percentile by interpolating linearly inside the histogram bin holding its rank."""
+    rank = pct * total
+    seen = 0
+    for index in sorted(bins):
+        count, runtime_sum = bins[index]
+        if count <= 0:
+            continue
+        if seen + count >= rank:
+            lower = _RUNTIME_HISTOGRAM_BOUNDS[index - 1] if index > 0 else 0.0
+            if index >= len(_RUNTIME_HISTOGRAM_BOUNDS):
+                # The overflow bin has no upper bound; fall back to its mean.
+                return max(lower, runtime_sum / count)
+            upper = _RUNTIME_HISTOGRAM_BOUNDS[index]
+            return lower + (upper - lower) * max(rank - seen, 0) / count
+        seen += count
+    return None
+
+
+def _rollup_key(snapshot: Mapping[str, object] | None) -> _RollupKey | None:
+    """Return the rollup contribution of a task row: its last timestamp, labels and runtime."""
+    if snapshot is None:
+        return None
+    last_ts = snapshot.get("finished") or snapshot.get("started") or snapshot.get("received")
+    if last_ts is None:
+        return None
+    return (
+        cast("datetime", last_ts).replace(tzinfo=None),
+        _as_optional_str(snapshot.get("name")) or _ROLLUP_UNKNOWN,
+        _as_str(snapshot["state"]),
+        _as_optional_str(snapshot.get("worker")) or _ROLLUP_UNKNOWN,
+        _as_optional_float(snapshot.get("runtime")),
+    )
+
+
+def _add_missing_column(conn: Connection, table: str, definition: str) -> None:
+    existing = {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")}
+    if definition.split(maxsplit=1)[0] not in existing:
+        conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {definition}")
 
 
 def _row_dict(row: object) -> dict[str, object]:
@@ -129,6 +382,29 @@ def _as_optional_datetime(value: object) -> datetime | None:
     return cast("datetime | None", value)
 
 
+def _depth_bounds(*values: int | None) -> tuple[int | None, int | None]:
+    known = [value for value in values if value is not None]
+    if not known:
+        return None, None
+    return min(known), max(known)
+
+
+def _task_search_query(search: str) -> str | None:
+    """Translate a search box value into an FTS5 query.
+
+    Quoted text becomes a phrase and every other word a prefix, so results narrow while typing. Returns
+    ``None`` when nothing in ``search`` can be tokenized.
+    """
+    terms: list[str] = []
+    for phrase, word in _TASK_SEARCH_TERM.findall(search):
+        value = phrase or word.rstrip("*")
+        if not any(char.isalnum() for char in value):
+            continue
+        quoted = '"' + value.replace('"', '""') + '"'
+        terms.append(quoted if phrase else f"{quoted}*")
+    return " ".join(terms) or None
+
+
 def _merge_retries(existing: int | None, incoming: int | None) -> int | None:
     if incoming is None:
         return existing
@@ -140,13 +416,34 @@ def _merge_retries(existing: int | None, incoming: int | None) -> int | None:
 class SQLiteController(BaseDBController):
     """SQLite-backed controller."""
 
-    _SCHEMA_VERSION = 5
+    _SCHEMA_VERSION = 14
 
-    def __init__(self, path: str | Path | None = None) -> None:
-        """Initialize the SQLite controller with a database path or in-memory storage."""
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        read_only: bool = False,
+        pool_size: int = 5,
+        heartbeat_history_seconds: float = 0.0,
+        archive_path: str | Path | None = None,
+    ) -> None:
+        """Initialize the SQLite controller with a database path or in-memory storage.
+
+        With ``read_only`` the controller opens up to ``pool_size`` read-only connections to an existing
+        database file, which WAL mode lets run concurrently with the writer. Worker heartbeats are appended
+        to the event history at most once per ``heartbeat_history_seconds`` per host; 0 keeps every one.
+        With ``archive_path``, retention moves expired tasks and events into a :class:`JsonlArchive`
+        there instead of deleting them, and task lookups and statistics fall through to it.
+        """
         self._path: Path | None = None
+        self._heartbeat_history_seconds = heartbeat_history_seconds
+        self._archive = JsonlArchive(Path(archive_path).expanduser().resolve()) if archive_path is not None else None
+        self._task_search: bool | None = None
         self._engine: Engine
         if path is None:
+            if read_only:
+                msg = "Read-only SQLite controllers require a database file."
+                raise ValueError(msg)
             self._engine = create_engine(
                 "sqlite+pysqlite:///:memory:",
                 future=True,
@@ -156,6 +453,24 @@ class SQLiteController(BaseDBController):
                 },
                 poolclass=StaticPool,
             )
+            event.listen(self._engine, "connect", _configure_sqlite)
+        elif read_only:
+            self._path = Path(path).expanduser().resolve()
+            uri = f"{self._path.as_uri()}?mode=ro"
+            self._engine = create_engine(
+                "sqlite+pysqlite://",
+                future=True,
+                creator=lambda: sqlite3.connect(
+                    uri,
+                    uri=True,
+                    timeout=_SQLITE_BUSY_TIMEOUT_MS / 1000,
+                    check_same_thread=False,
+                ),
+                poolclass=QueuePool,
+                pool_size=pool_size,
+                max_overflow=0,
+            )
+            event.listen(self._engine, "connect", _configure_sqlite_reader)
         else:
             self._path = Path(path).expanduser().resolve()
             self._ensure_writable_path()
@@ -164,7 +479,7 @@ class SQLiteController(BaseDBController):
                 future=True,
                 connect_args={"timeout": _SQLITE_BUSY_TIMEOUT_MS / 1000},
             )
-        event.listen(self._engine, "connect", _configure_sqlite)
+            event.listen(self._engine, "connect", _configure_sqlite)
         self._metadata = MetaData()
         self._define_tables()
 
@@ -172,9 +487,11 @@ class SQLiteController(BaseDBController):
         """Create tables and initialize schema version."""
         self._metadata.create_all(self._engine)
         with self._engine.begin() as conn:
+            self._create_task_search(conn)
             existing = conn.execute(select(self._schema_version.c.version)).scalar_one_or_none()
             if existing is None:
                 conn.execute(self._schema_version.insert().values(version=self._SCHEMA_VERSION))
+                self._seed_change_sequence(conn)
 
     def get_schema_version(self) -> int:
         """Return the stored schema version."""
@@ -214,39 +531,196 @@ class SQLiteController(BaseDBController):
                         ")",
                     ),
                 )
+            if from_version < _INDEX_SCHEMA_VERSION <= to_version:
+                conn.execute(
+                    text(
+                        "ALTER TABLE tasks ADD COLUMN last_ts DATETIME "
+                        f"GENERATED ALWAYS AS ({_TASK_LAST_TS_SQL}) VIRTUAL",
+                    ),
+                )
+                for index in self._indexes:
+                    index.create(conn, checkfirst=True)
+            if from_version < _ROLLUP_SCHEMA_VERSION <= to_version:
+                for table in (*self._task_rollups.values(), *self._runtime_rollups.values()):
+                    table.create(conn, checkfirst=True)
+                self._rebuild_rollups(conn)
+            self._migrate_access_paths(conn, from_version, to_version)
+            self._migrate_payload_blobs(conn, from_version, to_version)
             conn.execute(self._schema_version.delete())
             conn.execute(self._schema_version.insert().values(version=to_version))
 
+    def _migrate_access_paths(self, conn: Connection, from_version: int, to_version: int) -> None:
+        """Apply the migrations that reshape how task, graph and worker reads find their rows."""
+        if from_version < _SCAN_INDEX_SCHEMA_VERSION <= to_version:
+            # The (last_ts, task_id) index serves both last_ts ordering and keyset scans.
+            conn.execute(text("DROP INDEX IF EXISTS ix_tasks_last_ts"))
+            self._tasks_scan_index.create(conn, checkfirst=True)
+        if from_version < _WORKER_STATE_INDEX_SCHEMA_VERSION <= to_version:
+            self._tasks_worker_state_index.create(conn, checkfirst=True)
+        if from_version < _CHANGE_SEQ_SCHEMA_VERSION <= to_version:
+            # task_relations may have just been created by ``initialize`` with the new column.
+            _add_missing_column(conn, "tasks", "change_seq INTEGER")
+            _add_missing_column(conn, "tasks", "topology_seq INTEGER")
+            _add_missing_column(conn, "task_relations", "change_seq INTEGER")
+            self._change_sequence.create(conn, checkfirst=True)
+            self._seed_change_sequence(conn)
+            # Existing rows keep a NULL sequence, which sorts before every cursor handed out.
+            conn.execute(text("DROP INDEX IF EXISTS ix_tasks_root_id"))
+            conn.execute(text("DROP INDEX IF EXISTS ix_task_relations_root_id"))
+            for index in self._change_seq_indexes:
+                index.create(conn, checkfirst=True)
+        if from_version < _WORKER_SNAPSHOT_SCHEMA_VERSION <= to_version:
+            self._worker_snapshots.create(conn, checkfirst=True)
+            conn.execute(
+                text(
+                    "INSERT OR REPLACE INTO worker_snapshots "
+                    "(hostname, event, timestamp, info, broker_url, history_ts) "
+                    "SELECT hostname, event, timestamp, info, broker_url, timestamp FROM worker_events AS latest "
+                    "WHERE id = (SELECT id FROM worker_events WHERE hostname = latest.hostname "
+                    "ORDER BY timestamp DESC, id DESC LIMIT 1)",
+                ),
+            )
+        if from_version < _BROKER_QUEUE_HISTORY_SCHEMA_VERSION <= to_version:
+            self._broker_queue_snapshots.create(conn, checkfirst=True)
+            self._broker_queue_rollups.create(conn, checkfirst=True)
+            conn.execute(
+                text(
+                    "INSERT OR REPLACE INTO broker_queue_snapshots "
+                    "(broker_url, queue, messages, consumers, timestamp) "
+                    "SELECT broker_url, queue, messages, consumers, timestamp FROM broker_queue_events AS latest "
+                    "WHERE id = (SELECT max(id) FROM broker_queue_events "
+                    "WHERE broker_url = latest.broker_url AND queue = latest.queue)",
+                ),
+            )
+        if from_version < _TASK_SEARCH_SCHEMA_VERSION <= to_version and self._create_task_search(conn):
+            conn.execute(text("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')"))
+
+    def _migrate_payload_blobs(self, conn: Connection, from_version: int, to_version: int) -> None:
+        """Add the payload blob table and the references pointing into it."""
+        if from_version < _PAYLOAD_BLOB_SCHEMA_VERSION <= to_version:
+            # Existing payloads stay inline; only rows written from now on reference blobs.
+            for table_name in (self._tasks.name, self._task_events.name):
+                for name in _PAYLOAD_COLUMNS:
+                    _add_missing_column(conn, table_name, f"{name}_ref BLOB")
+            self._payload_blobs.create(conn, checkfirst=True)
+            for index in self._payload_indexes:
+                index.create(conn, checkfirst=True)
+            if self._task_search_enabled():
+                # The search triggers now also clear ``task_search``; the indexed text of existing rows is unchanged.
+                for trigger in _TASK_SEARCH_TRIGGERS:
+                    conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+                self._create_task_search(conn)
+                self._index_payload_search(conn, None)
+
+    def _create_task_search(self, conn: Connection) -> bool:
+        """Create the task full-text index if this SQLite build ships FTS5 and report whether it exists."""
+        self._task_search = bool(conn.exec_driver_sql("SELECT sqlite_compileoption_used('ENABLE_FTS5')").scalar())
+        if self._task_search:
+            for statement in _TASK_SEARCH_DDL:
+                conn.exec_driver_sql(statement)
+        return self._task_search
+
+    def _task_search_enabled(self) -> bool:
+        if self._task_search is None:
+            # Read-only controllers never run ``initialize``; look the index up once instead.
+            with self._engine.begin() as conn:
+                found = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts'"),
+                ).first()
+            self._task_search = found is not None
+        return self._task_search
+
     def store_task_event(self, event: TaskEvent) -> None:
         """Persist a task event and update the task record."""
-        event_values = self._event_values(event)
-        with self._engine.begin() as conn:
-            existing_state, existing_retries = self._get_task_state_and_retries(conn, event.task_id)
-            task_values = self._task_values_from_event(event, existing_state, existing_retries)
-            update_values = dict(task_values)
-            update_values.pop("task_id", None)
-            stmt = sqlite_insert(self._tasks).values(**task_values)
-            stmt = stmt.on_conflict_do_update(
-                index_elements=[self._tasks.c.task_id],
-                set_=update_values,
-            )
-            conn.execute(self._task_events.insert().values(**event_values))
-            conn.execute(stmt)
+        self.store_task_events([event])
 
-    def get_tasks(self, filters: TaskFilter | None = None) -> list[Task]:
-        """Return tasks matching optional filters."""
-        stmt: Select[tuple[object, ...]] = select(self._tasks)
-        ts_col = func.coalesce(
-            self._tasks.c.finished,
-            self._tasks.c.started,
-            self._tasks.c.received,
-        )
+    def store_task_events(self, events: Sequence[TaskEvent]) -> None:
+        """Persist task events and update task records in a single transaction."""
+        if not events:
+            return
+        digests: dict[str, bytes] = {}
+        seen: dict[bytes, datetime] = {}
+        event_rows = [self._event_values(event) for event in events]
+        for task_event, row in zip(events, event_rows, strict=True):
+            timestamp = cast("datetime", _coerce_dt(task_event.timestamp))
+            for digest in _externalize_payloads(row, digests, preview=False):
+                seen[digest] = max(seen.get(digest, timestamp), timestamp)
+        with self._engine.begin() as conn:
+            change_seq = self._next_change_seq(conn)
+            known = self._get_task_snapshots(conn, {event.task_id for event in events})
+            before: dict[str, dict[str, object] | None] = {}
+            task_rows: list[dict[str, object]] = []
+            for event in events:
+                existing = known.get(event.task_id)
+                before.setdefault(event.task_id, existing)
+                existing_state = _as_optional_str(existing["state"]) if existing is not None else None
+                existing_retries = _as_optional_int(existing["retries"]) if existing is not None else None
+                task_values = self._task_values_from_event(event, existing_state, existing_retries)
+                links = {name: task_values[name] for name in _TASK_LINK_COLUMNS if task_values.get(name) is not None}
+                task_values["change_seq"] = change_seq
+                if existing is None or any(existing.get(name) != value for name, value in links.items()):
+                    task_values["topology_seq"] = change_seq
+                # Mirror the coalescing upsert so later events in the batch see the merged row.
+                merged = dict(existing or {})
+                merged.update(
+                    {name: task_values[name] for name in _TASK_SNAPSHOT_COLUMNS if task_values.get(name) is not None},
+                )
+                merged.update(links)
+                merged["retries"] = _merge_retries(existing_retries, event.retries)
+                known[event.task_id] = merged
+                _externalize_payloads(task_values, digests, preview=True)
+                task_rows.append({column.name: task_values.get(column.name) for column in self._task_write_columns()})
+            self._store_payload_blobs(conn, digests, seen)
+            conn.execute(self._task_events.insert(), event_rows)
+            conn.execute(self._task_upsert_stmt(), task_rows)
+            self._index_payload_search(conn, before.keys(), digests)
+            self._update_rollups(conn, before, known)
+
+    def get_tasks(self, filters: TaskFilter | None = None) -> list[TaskSummary]:
+        """Return summaries of the tasks matching optional filters."""
+        stmt = self._task_summary_select()
         if filters:
-            stmt = self._apply_task_filters(stmt, filters, ts_col)
-        stmt = stmt.order_by(ts_col.desc())
+            stmt = self._apply_task_filters(stmt, filters)
+        stmt = stmt.order_by(self._tasks.c.last_ts.desc())
         with self._engine.begin() as conn:
             rows = conn.execute(stmt).all()
-        return [self._row_to_task(_row_dict(row)) for row in rows]
+        return [self._row_to_task_summary(_row_dict(row)) for row in rows]
+
+    def scan_tasks(
+        self,
+        filters: TaskFilter | None,
+        *,
+        cursor: TaskCursor | None,
+        limit: int,
+    ) -> tuple[list[TaskSummary], TaskCursor | None]:
+        """Return the next chunk of task summaries of a newest-first keyset scan over ``(last_ts, task_id)``."""
+        last_ts = self._tasks.c.last_ts
+        task_id = self._tasks.c.task_id
+        stmt = self._task_summary_select()
+        if filters:
+            stmt = self._apply_task_filters(stmt, filters)
+        stmt = stmt.order_by(last_ts.desc(), task_id.desc())
+        # Tasks without a timestamp sort last, so a timestamped cursor continues into them once exhausted.
+        null_tail = stmt.where(last_ts.is_(None))
+        if cursor is not None and cursor.last_ts is None:
+            stmt = null_tail.where(task_id < cursor.task_id)
+        elif cursor is not None:
+            position = tuple_(
+                bindparam("cursor_last_ts", cursor.last_ts, type_=last_ts.type),
+                bindparam("cursor_task_id", cursor.task_id, type_=task_id.type),
+            )
+            stmt = stmt.where(tuple_(last_ts, task_id) < position)
+        with self._engine.begin() as conn:
+            rows = [_row_dict(row) for row in conn.execute(stmt.limit(limit)).all()]
+            if cursor is not None and cursor.last_ts is not None and len(rows) < limit:
+                rows.extend(_row_dict(row) for row in conn.execute(null_tail.limit(limit - len(rows))).all())
+        next_cursor = None
+        if len(rows) == limit:
+            next_cursor = TaskCursor(
+                last_ts=_as_optional_datetime(rows[-1]["last_ts"]),
+                task_id=_as_str(rows[-1]["task_id"]),
+            )
+        return [self._row_to_task_summary(row) for row in rows], next_cursor
 
     def get_tasks_page(
         self,
@@ -256,20 +730,15 @@ class SQLiteController(BaseDBController):
         sort_dir: str | None,
         limit: int,
         offset: int,
-    ) -> tuple[list[Task], int]:
-        """Return paginated tasks and total count."""
-        stmt: Select[tuple[object, ...]] = select(self._tasks)
+    ) -> tuple[list[TaskSummary], int]:
+        """Return paginated task summaries and total count."""
+        stmt = self._task_summary_select()
         count_stmt = cast("Select[tuple[object, ...]]", select(func.count()).select_from(self._tasks))
-        ts_col = func.coalesce(
-            self._tasks.c.finished,
-            self._tasks.c.started,
-            self._tasks.c.received,
-        )
         if filters:
-            stmt = self._apply_task_filters(stmt, filters, ts_col)
-            count_stmt = self._apply_task_filters(count_stmt, filters, ts_col)
+            stmt = self._apply_task_filters(stmt, filters)
+            count_stmt = self._apply_task_filters(count_stmt, filters)
 
-        sort_column = self._task_sort_column(sort_key, ts_col)
+        sort_column = self._task_sort_column(sort_key)
         direction = (sort_dir or "desc").lower()
         stmt = stmt.order_by(sort_column.asc()) if direction == "asc" else stmt.order_by(sort_column.desc())
         stmt = stmt.limit(limit).offset(offset)
@@ -278,7 +747,7 @@ class SQLiteController(BaseDBController):
             total_raw = conn.execute(count_stmt).scalar_one()
             rows = conn.execute(stmt).all()
         total = int(total_raw) if isinstance(total_raw, (int, float)) else int(total_raw or 0)
-        return [self._row_to_task(_row_dict(row)) for row in rows], total
+        return [self._row_to_task_summary(_row_dict(row)) for row in rows], total
 
     def list_task_names(self) -> list[str]:
         """Return distinct task names stored in the DB."""
@@ -298,16 +767,113 @@ class SQLiteController(BaseDBController):
         return sorted(names)
 
     def get_task(self, task_id: str) -> Task | None:
-        """Return a task by ID, if present."""
+        """Return a task by ID, if present, with its payloads in full."""
         stmt = select(self._tasks).where(self._tasks.c.task_id == task_id)
         with self._engine.begin() as conn:
             row = conn.execute(stmt).first()
-        return self._row_to_task(_row_dict(row)) if row else None
+            data = self._inflate_payloads(conn, [_row_dict(row)])[0] if row is not None else None
+        if data is not None:
+            return self._row_to_task(data)
+        if self._archive is None:
+            return None
+        archived = self._archive.find_row(self._tasks.name, "task_id", task_id)
+        return self._row_to_task(self._from_archive(self._tasks, archived)) if archived is not None else None
+
+    def get_tasks_by_id(self, task_ids: Sequence[str]) -> list[Task]:
+        """Return the stored tasks among ``task_ids`` using chunked ``IN`` lookups."""
+        with self._engine.begin() as conn:
+            return self._tasks_by_id(conn, task_ids)
+
+    def get_task_graph(self, task_id: str) -> TaskGraph | None:
+        """Return the workflow graph containing ``task_id`` from one read transaction."""
+        tasks = self._tasks.c
+        with self._engine.begin() as conn:
+            row = conn.execute(select(self._tasks).where(tasks.task_id == task_id)).first()
+            if row is None:
+                return None
+            task = self._row_to_task(self._inflate_payloads(conn, [_row_dict(row)])[0])
+            root_id = task.root_id or task.task_id
+            relation_rows = conn.execute(
+                select(self._task_relations).where(self._task_relations.c.root_id == root_id),
+            ).all()
+            relations = [self._row_to_relation(_row_dict(item)) for item in relation_rows]
+            members = self._inflate_payloads(
+                conn,
+                [_row_dict(item) for item in conn.execute(select(self._tasks).where(tasks.root_id == root_id)).all()],
+            )
+            by_id = {member.task_id: member for member in (self._row_to_task(item) for item in members)}
+            by_id.setdefault(task.task_id, task)
+            missing = graph_node_ids(root_id, relations, by_id.values()) - by_id.keys()
+            by_id.update((member.task_id, member) for member in self._tasks_by_id(conn, sorted(missing)))
+            cursor = self._current_change_seq(conn)
+        return TaskGraph(root_id=root_id, tasks=list(by_id.values()), relations=relations, cursor=cursor)
+
+    def get_task_graph_changes(self, task_id: str, since: int) -> TaskGraphChanges | None:
+        """Return the graph rows stamped with a change sequence after ``since``.
+
+        Reads go through the ``(root_id, change_seq)`` indexes, so a poll costs about as much as the
+        number of changes. A relation only counts as a topology change if the same edge was not already
+        stored at ``since``, because ingestion records an edge again for every event that carries it.
+        """
+        tasks = self._tasks.c
+        relations = self._task_relations.c
+        with self._engine.begin() as conn:
+            cursor = self._current_change_seq(conn)
+            row = conn.execute(select(tasks.root_id).where(tasks.task_id == task_id)).first()
+            root_id = (row[0] if row is not None else None) or task_id
+            task_rows = conn.execute(
+                select(self._tasks).where(
+                    (tasks.root_id == root_id) | (tasks.task_id == root_id),
+                    tasks.change_seq > since,
+                ),
+            ).all()
+            changed = self._inflate_payloads(conn, [_row_dict(item) for item in task_rows])
+            earlier = self._task_relations.alias("earlier")
+            known_edge = (
+                select(earlier.c.id)
+                .where(
+                    earlier.c.root_id == root_id,
+                    earlier.c.parent_id.is_(relations.parent_id),
+                    earlier.c.child_id == relations.child_id,
+                    earlier.c.relation == relations.relation,
+                    func.coalesce(earlier.c.change_seq, 0) <= since,
+                )
+                .exists()
+            )
+            relation_rows = conn.execute(
+                select(self._task_relations, known_edge.label("known")).where(
+                    relations.root_id == root_id,
+                    relations.change_seq > since,
+                ),
+            ).all()
+        new_relations = [
+            self._row_to_relation(data) for data in (_row_dict(item) for item in relation_rows) if not data["known"]
+        ]
+        topology_changed = bool(new_relations) or any(
+            (_as_optional_int(data.get("topology_seq")) or 0) > since for data in changed
+        )
+        return TaskGraphChanges(
+            root_id=root_id,
+            cursor=max(cursor, since),
+            tasks=[self._row_to_task(data) for data in changed],
+            relations=new_relations,
+            topology_changed=topology_changed,
+        )
 
     def store_task_relation(self, relation: TaskRelation) -> None:
         """Persist a task relation edge."""
+        self.store_task_relations([relation])
+
+    def store_task_relations(self, relations: Sequence[TaskRelation]) -> None:
+        """Persist task relation edges in a single transaction."""
+        if not relations:
+            return
         with self._engine.begin() as conn:
-            conn.execute(self._task_relations.insert().values(**relation.model_dump()))
+            change_seq = self._next_change_seq(conn)
+            conn.execute(
+                self._task_relations.insert(),
+                [{**relation.model_dump(), "change_seq": change_seq} for relation in relations],
+            )
 
     def get_task_relations(self, root_id: str) -> list[TaskRelation]:
         """Return task relations for a root task."""
@@ -317,9 +883,30 @@ class SQLiteController(BaseDBController):
         return [self._row_to_relation(_row_dict(row)) for row in rows]
 
     def store_worker_event(self, event: WorkerEvent) -> None:
-        """Persist a worker event and update worker state."""
-        info_json = json.dumps(event.info) if event.info is not None else None
+        """Persist a worker event and update worker state.
+
+        The latest event per host is kept in place in ``worker_snapshots``. Heartbeats are appended to
+        the ``worker_events`` history only once per configured interval, every other event always is.
+        """
+        self.store_worker_events([event])
+
+    def store_worker_events(self, events: Sequence[WorkerEvent]) -> None:
+        """Persist worker events and update worker state in a single transaction."""
+        if not events:
+            return
         with self._engine.begin() as conn:
+            for event in events:
+                self._store_worker_event(conn, event)
+
+    def _store_worker_event(self, conn: Connection, event: WorkerEvent) -> None:
+        info_json = json.dumps(event.info) if event.info is not None else None
+        snapshots = self._worker_snapshots
+        timestamp = _coerce_dt(event.timestamp)
+        current = conn.execute(
+            select(snapshots.c.timestamp, snapshots.c.history_ts).where(snapshots.c.hostname == event.hostname),
+        ).first()
+        history_ts = _coerce_dt(_as_optional_datetime(current[1])) if current is not None else None
+        if self._keeps_history(event, timestamp, history_ts):
             conn.execute(
                 self._worker_events.insert().values(
                     hostname=event.hostname,
@@ -329,42 +916,118 @@ class SQLiteController(BaseDBController):
                     broker_url=event.broker_url,
                 ),
             )
-            worker = self._worker_from_event(event)
-            stmt = sqlite_insert(self._workers).values(**worker)
-            update_values = dict(worker)
-            update_values.pop("hostname", None)
-            if event.event == "worker-offline":
-                update_values["last_heartbeat"] = func.coalesce(
-                    self._workers.c.last_heartbeat,
-                    event.timestamp,
-                )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=[self._workers.c.hostname],
-                set_=update_values,
+            history_ts = timestamp if history_ts is None else max(history_ts, cast("datetime", timestamp))
+        latest = _coerce_dt(_as_optional_datetime(current[0])) if current is not None else None
+        snapshot: dict[str, object] = {"history_ts": history_ts}
+        if latest is None or cast("datetime", timestamp) >= latest:
+            snapshot.update(
+                event=event.event,
+                timestamp=event.timestamp,
+                info=info_json,
+                broker_url=event.broker_url,
             )
-            conn.execute(stmt)
+        if current is None:
+            conn.execute(snapshots.insert().values(hostname=event.hostname, **snapshot))
+        else:
+            conn.execute(snapshots.update().where(snapshots.c.hostname == event.hostname).values(**snapshot))
+        worker = self._worker_from_event(event)
+        stmt = sqlite_insert(self._workers).values(**worker)
+        update_values = dict(worker)
+        update_values.pop("hostname", None)
+        if event.event == "worker-offline":
+            update_values["last_heartbeat"] = func.coalesce(
+                self._workers.c.last_heartbeat,
+                event.timestamp,
+            )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self._workers.c.hostname],
+            set_=update_values,
+        )
+        conn.execute(stmt)
 
     def store_broker_queue_event(self, event: BrokerQueueEvent) -> None:
-        """Persist a broker queue snapshot."""
+        """Persist a broker queue snapshot.
+
+        The latest value per queue is kept in place in ``broker_queue_snapshots``. A history row and the
+        per-minute min/max/last rollup are only written when the depth or consumer count changes.
+        """
+        self.store_broker_queue_events([event])
+
+    def store_broker_queue_events(self, events: Sequence[BrokerQueueEvent]) -> None:
+        """Persist broker queue snapshots in a single transaction and prune raw history past its window."""
+        if not events:
+            return
         with self._engine.begin() as conn:
-            conn.execute(
-                self._broker_queue_events.insert().values(
-                    broker_url=event.broker_url,
-                    queue=event.queue,
-                    messages=event.messages,
-                    consumers=event.consumers,
-                    timestamp=event.timestamp,
-                ),
-            )
+            for event in events:
+                self._store_broker_queue_event(conn, event)
+            newest = max(event.timestamp.replace(tzinfo=None) for event in events)
+            raw_cutoff = newest - timedelta(seconds=_BROKER_QUEUE_RAW_SECONDS)
+            conn.execute(delete(self._broker_queue_events).where(self._broker_queue_events.c.timestamp < raw_cutoff))
+
+    def _store_broker_queue_event(self, conn: Connection, event: BrokerQueueEvent) -> None:
+        snapshots = self._broker_queue_snapshots
+        timestamp = event.timestamp.replace(tzinfo=None)
+        current = conn.execute(
+            select(snapshots.c.messages, snapshots.c.consumers, snapshots.c.timestamp).where(
+                snapshots.c.broker_url == event.broker_url,
+                snapshots.c.queue == event.queue,
+            ),
+        ).first()
+        previous: int | None = None
+        if current is not None:
+            if timestamp < cast("datetime", current[2]).replace(tzinfo=None):
+                return
+            if (current[0], current[1]) == (event.messages, event.consumers):
+                conn.execute(
+                    snapshots.update()
+                    .where(snapshots.c.broker_url == event.broker_url, snapshots.c.queue == event.queue)
+                    .values(timestamp=event.timestamp),
+                )
+                return
+            previous = _as_optional_int(current[0])
+        values = {
+            "broker_url": event.broker_url,
+            "queue": event.queue,
+            "messages": event.messages,
+            "consumers": event.consumers,
+            "timestamp": event.timestamp,
+        }
+        upsert = sqlite_insert(snapshots).values(**values)
+        conn.execute(
+            upsert.on_conflict_do_update(
+                index_elements=[snapshots.c.broker_url, snapshots.c.queue],
+                set_={key: upsert.excluded[key] for key in ("messages", "consumers", "timestamp")},
+            ),
+        )
+        conn.execute(self._broker_queue_events.insert().values(**values))
+        rollups = self._broker_queue_rollups
+        key = {
+            "broker_url": event.broker_url,
+            "queue": event.queue,
+            "bucket_start": _bucket_floor(timestamp, _ROLLUP_MINUTE),
+        }
+        bucket = conn.execute(
+            select(rollups.c.min_messages, rollups.c.max_messages).where(
+                *(rollups.c[column] == value for column, value in key.items()),
+            ),
+        ).first()
+        # The previous depth holds until this change, so it belongs to the bucket as well.
+        if bucket is not None:
+            low, high = _depth_bounds(bucket[0], bucket[1], event.messages)
+        else:
+            low, high = _depth_bounds(previous, event.messages)
+        rollup = {"min_messages": low, "max_messages": high, "messages": event.messages, "consumers": event.consumers}
+        rollup_upsert = sqlite_insert(rollups).values(**key, **rollup)
+        conn.execute(
+            rollup_upsert.on_conflict_do_update(
+                index_elements=[rollups.c.broker_url, rollups.c.queue, rollups.c.bucket_start],
+                set_=rollup,
+            ),
+        )
 
     def get_broker_queue_snapshot(self, broker_url: str) -> list[BrokerQueueEvent]:
         """Return latest broker queue snapshots for a broker."""
-        latest_ids = (
-            select(func.max(self._broker_queue_events.c.id).label("id"))
-            .where(self._broker_queue_events.c.broker_url == broker_url)
-            .group_by(self._broker_queue_events.c.queue)
-        )
-        stmt = select(self._broker_queue_events).where(self._broker_queue_events.c.id.in_(latest_ids))
+        stmt = select(self._broker_queue_snapshots).where(self._broker_queue_snapshots.c.broker_url == broker_url)
         with self._engine.begin() as conn:
             rows = conn.execute(stmt).all()
         events: list[BrokerQueueEvent] = []
@@ -382,6 +1045,76 @@ class SQLiteController(BaseDBController):
         events.sort(key=lambda event: event.queue)
         return events
 
+    def get_broker_queue_history(
+        self,
+        broker_url: str,
+        queue: str,
+        time_range: TimeRange,
+    ) -> list[BrokerQueueSample]:
+        """Return queue depth changes, oldest first: minute rollups before the raw window, raw changes after."""
+        raw = self._broker_queue_events
+        rollups = self._broker_queue_rollups
+        start = time_range.start.replace(tzinfo=None)
+        end = time_range.end.replace(tzinfo=None)
+        with self._engine.begin() as conn:
+            oldest_raw = conn.execute(
+                select(func.min(raw.c.timestamp)).where(raw.c.broker_url == broker_url, raw.c.queue == queue),
+            ).scalar_one_or_none()
+            # The bucket holding the oldest raw row may have lost rows to pruning; serve it from the rollup.
+            boundary = (
+                None
+                if oldest_raw is None
+                else _bucket_floor(oldest_raw, _ROLLUP_MINUTE) + timedelta(seconds=_ROLLUP_MINUTE)
+            )
+            rollup_conditions = [
+                rollups.c.broker_url == broker_url,
+                rollups.c.queue == queue,
+                rollups.c.bucket_start >= _bucket_floor(start, _ROLLUP_MINUTE),
+                rollups.c.bucket_start <= end,
+            ]
+            if boundary is not None:
+                rollup_conditions.append(rollups.c.bucket_start < boundary)
+            rollup_rows = conn.execute(
+                select(rollups).where(*rollup_conditions).order_by(rollups.c.bucket_start),
+            ).all()
+            raw_rows: Sequence[Row[Any]] = ()
+            if boundary is not None:
+                raw_rows = conn.execute(
+                    select(raw)
+                    .where(
+                        raw.c.broker_url == broker_url,
+                        raw.c.queue == queue,
+                        raw.c.timestamp >= max(start, boundary),
+                        raw.c.timestamp <= end,
+                    )
+                    .order_by(raw.c.timestamp, raw.c.id),
+                ).all()
+        samples: list[BrokerQueueSample] = []
+        for row in rollup_rows:
+            data = _row_dict(row)
+            samples.append(
+                BrokerQueueSample(
+                    timestamp=_coerce_dt(_as_optional_datetime(data["bucket_start"])) or datetime.now(UTC),
+                    messages=_as_optional_int(data.get("messages")),
+                    consumers=_as_optional_int(data.get("consumers")),
+                    min_messages=_as_optional_int(data.get("min_messages")),
+                    max_messages=_as_optional_int(data.get("max_messages")),
+                ),
+            )
+        for row in raw_rows:
+            data = _row_dict(row)
+            messages = _as_optional_int(data.get("messages"))
+            samples.append(
+                BrokerQueueSample(
+                    timestamp=_coerce_dt(_as_optional_datetime(data["timestamp"])) or datetime.now(UTC),
+                    messages=messages,
+                    consumers=_as_optional_int(data.get("consumers")),
+                    min_messages=messages,
+                    max_messages=messages,
+                ),
+            )
+        return samples
+
     def get_workers(self) -> list[Worker]:
         """Return all workers."""
         with self._engine.begin() as conn:
@@ -397,12 +1130,7 @@ class SQLiteController(BaseDBController):
 
     def get_worker_event_snapshot(self, hostname: str) -> WorkerEvent | None:
         """Return the latest worker event snapshot for a hostname."""
-        stmt = (
-            select(self._worker_events)
-            .where(self._worker_events.c.hostname == hostname)
-            .order_by(self._worker_events.c.timestamp.desc(), self._worker_events.c.id.desc())
-            .limit(1)
-        )
+        stmt = select(self._worker_snapshots).where(self._worker_snapshots.c.hostname == hostname)
         with self._engine.begin() as conn:
             row = conn.execute(stmt).first()
         if row is None:
@@ -427,32 +1155,61 @@ class SQLiteController(BaseDBController):
         )
 
     def get_task_stats(self, task_name: str | None, time_range: TimeRange | None) -> TaskStats:
-        """Compute task runtime statistics."""
-        tasks = self._filter_tasks(task_name, time_range)
-        runtimes = sorted([task.runtime for task in tasks if task.runtime is not None])
-        count = len(tasks)
-        if not runtimes:
-            return TaskStats(count=count)
+        """Compute task runtime statistics with SQL aggregates."""
+        facts = self._facts_with_archive(task_name, time_range)
+        if facts is not None:
+            return _facts_stats(facts)
+        conditions = self._stats_conditions(task_name, time_range)
+        runtime = self._tasks.c.runtime
+        summary_stmt = (
+            select(
+                func.count(),
+                func.count(runtime),
+                func.min(runtime),
+                func.max(runtime),
+                func.avg(runtime),
+            )
+            .select_from(self._tasks)
+            .where(*conditions)
+        )
+        with self._engine.begin() as conn:
+            count_raw, runtime_count_raw, min_runtime, max_runtime, avg_runtime = conn.execute(summary_stmt).one()
+            count = int(count_raw or 0)
+            runtime_count = int(runtime_count_raw or 0)
+            if runtime_count == 0:
+                return TaskStats(count=count)
+            p50, p95, p99 = self._runtime_percentiles(conn, conditions, runtime_count, (0.5, 0.95, 0.99))
         return TaskStats(
             count=count,
-            min_runtime=runtimes[0],
-            max_runtime=runtimes[-1],
-            avg_runtime=sum(runtimes) / len(runtimes),
-            p50=_percentile(runtimes, 0.5),
-            p95=_percentile(runtimes, 0.95),
-            p99=_percentile(runtimes, 0.99),
+            min_runtime=_as_optional_float(min_runtime),
+            max_runtime=_as_optional_float(max_runtime),
+            avg_runtime=_as_optional_float(avg_runtime),
+            p50=p50,
+            p95=p95,
+            p99=p99,
         )
 
     def get_throughput(self, time_range: TimeRange, bucket_seconds: int) -> list[ThroughputBucket]:
-        """Compute throughput buckets for tasks."""
+        """Compute throughput buckets for tasks with a grouped SQL count."""
         buckets = self._init_buckets(time_range, bucket_seconds)
-        for task in self._filter_tasks(None, time_range):
-            timestamp = _task_timestamp(task)
-            if timestamp is None:
-                continue
-            bucket_start = self._bucket_start(time_range.start, timestamp, bucket_seconds)
+        start = _coerce_dt(time_range.start) or time_range.start
+        facts = self._facts_with_archive(None, time_range)
+        if facts is not None:
+            return self._facts_throughput(facts, buckets, start, bucket_seconds)
+        start_us = _epoch_micros(start)
+        bucket_index = func.max(
+            (_epoch_micros_sql(self._tasks.c.last_ts) - start_us) // (bucket_seconds * _MICROS_PER_SECOND),
+            0,
+        ).label("bucket_index")
+        stmt = (
+            select(bucket_index, func.count()).where(*self._stats_conditions(None, time_range)).group_by(bucket_index)
+        )
+        with self._engine.begin() as conn:
+            rows = conn.execute(stmt).all()
+        for row in rows:
+            bucket_start = start + timedelta(seconds=int(row[0]) * bucket_seconds)
             if bucket_start in buckets:
-                buckets[bucket_start] += 1
+                buckets[bucket_start] += int(row[1])
         return [ThroughputBucket(bucket_start=key, count=value) for key, value in buckets.items()]
 
     def get_state_distribution(self) -> dict[str, int]:
@@ -462,18 +1219,119 @@ class SQLiteController(BaseDBController):
             rows = conn.execute(stmt).all()
         return {row[0]: int(row[1]) for row in rows if row[0] is not None}
 
+    def get_worker_state_counts(self) -> dict[str, dict[str, int]]:
+        """Return task counts by state for each worker, grouped in SQL."""
+        worker = self._tasks.c.worker
+        state = self._tasks.c.state
+        stmt = select(worker, state, func.count()).where(worker.is_not(None)).group_by(worker, state)
+        with self._engine.begin() as conn:
+            rows = conn.execute(stmt).all()
+        counts: dict[str, dict[str, int]] = {}
+        for row in rows:
+            counts.setdefault(str(row[0]), {})[str(row[1])] = int(row[2])
+        return counts
+
     def get_heatmap(self, time_range: TimeRange | None) -> list[list[int]]:
-        """Return a heatmap of task activity."""
+        """Return a weekday/hour heatmap of task activity grouped in SQL."""
+        facts = self._facts_with_archive(None, time_range)
+        if facts is not None:
+            return self._facts_heatmap(facts)
+        last_ts = self._tasks.c.last_ts
+        # strftime('%w') counts from Sunday; shift so Monday is 0 like datetime.weekday().
+        weekday = ((sql_cast(func.strftime("%w", last_ts), Integer) + 6) % 7).label("weekday")
+        hour = sql_cast(func.strftime("%H", last_ts), Integer).label("hour")
+        stmt = (
+            select(weekday, hour, func.count())
+            .where(last_ts.is_not(None), *self._stats_conditions(None, time_range))
+            .group_by(weekday, hour)
+        )
+        with self._engine.begin() as conn:
+            rows = conn.execute(stmt).all()
         heatmap = [[0 for _ in range(24)] for _ in range(7)]
-        tasks = self._filter_tasks(None, time_range)
-        for task in tasks:
-            timestamp = _task_timestamp(task)
-            if timestamp is None:
-                continue
-            timestamp = _coerce_dt(timestamp) or timestamp
-            heatmap[timestamp.weekday()][timestamp.hour] += 1
+        for row in rows:
+            heatmap[int(row[0])][int(row[1])] += int(row[2])
         return heatmap
 
+    def get_rollup_counts(
+        self,
+        time_range: TimeRange | None,
+        group_by: Sequence[RollupDimension] = (),
+    ) -> list[TaskRollupCount]:
+        """Return task counts from the rollup tables, grouped by the requested dimensions."""
+        merged: dict[tuple[str, ...], int] = {}
+        with self._engine.begin() as conn:
+            for table, conditions in self._rollup_sources(self._task_rollups, time_range):
+                columns = [table.c[dimension] for dimension in group_by]
+                stmt = select(*columns, func.sum(table.c.count)).where(*conditions).group_by(*columns)
+                for row in conn.execute(stmt).all():
+                    key = tuple(_as_str(value) for value in row[:-1])
+                    merged[key] = merged.get(key, 0) + int(row[-1] or 0)
+        return [
+            TaskRollupCount.model_validate(
+                {"count": count, **{dimension: value or None for dimension, value in zip(group_by, key, strict=True)}},
+            )
+            for key, count in merged.items()
+            if count > 0
+        ]
+
+    def get_rollup_throughput(self, time_range: TimeRange, bucket_seconds: int) -> list[ThroughputBucket]:
+        """Compute throughput buckets from the rollup tables (minute resolution)."""
+        buckets = self._init_buckets(time_range, bucket_seconds)
+        start = _coerce_dt(time_range.start) or time_range.start
+        start_us = _epoch_micros(start)
+        with self._engine.begin() as conn:
+            # Hourly rows cannot be split across smaller buckets, so throughput reads minute rows only.
+            for table, conditions in self._rollup_sources(self._task_rollups, time_range, use_hours=False):
+                bucket_index = func.max(
+                    (_epoch_micros_sql(table.c.bucket_start) - start_us) // (bucket_seconds * _MICROS_PER_SECOND),
+                    0,
+                ).label("bucket_index")
+                stmt = select(bucket_index, func.sum(table.c.count)).where(*conditions).group_by(bucket_index)
+                for row in conn.execute(stmt).all():
+                    bucket_start = start + timedelta(seconds=int(row[0]) * bucket_seconds)
+                    if bucket_start in buckets:
+                        buckets[bucket_start] += int(row[1] or 0)
+        return [ThroughputBucket(bucket_start=key, count=value) for key, value in buckets.items()]
+
+    def get_rollup_task_stats(self, task_name: str | None, time_range: TimeRange | None) -> TaskStats:
+        """Return task statistics with runtimes estimated from the rollup histogram."""
+        count = 0
+        bins: dict[int, tuple[int, float]] = {}
+        with self._engine.begin() as conn:
+            for table, conditions in self._rollup_sources(self._task_rollups, time_range):
+                if task_name is not None:
+                    conditions.append(table.c.name == task_name)
+                count += int(conn.execute(select(func.sum(table.c.count)).where(*conditions)).scalar_one() or 0)
+            for table, conditions in self._rollup_sources(self._runtime_rollups, time_range):
+                if task_name is not None:
+                    conditions.append(table.c.name == task_name)
+                stmt = (
+                    select(table.c.bin, func.sum(table.c.count), func.sum(table.c.runtime_sum))
+                    .where(*conditions)
+                    .group_by(table.c.bin)
+                )
+                for row in conn.execute(stmt).all():
+                    bin_count, bin_sum = bins.get(int(row[0]), (0, 0.0))
+                    bins[int(row[0])] = (bin_count + int(row[1] or 0), bin_sum + float(row[2] or 0.0))
+        runtime_count = sum(bin_count for bin_count, _bin_sum in bins.values())
+        if runtime_count <= 0:
+            return TaskStats(count=count)
+        runtime_sum = sum(bin_sum for _bin_count, bin_sum in bins.values())
+        return TaskStats(
+            count=count,
+            min_runtime=_histogram_quantile(bins, runtime_count, 0.0),
+            max_runtime=_histogram_quantile(bins, runtime_count, 1.0),
+            avg_runtime=max(runtime_sum / runtime_count, 0.0),
+            p50=_histogram_quantile(bins, runtime_count, 0.5),
+            p95=_histogram_quantile(bins, runtime_count, 0.95),
+            p99=_histogram_quantile(bins, runtime_count, 0.99),
+        )
+
+    def rebuild_rollups(self) -> int:
+        """Rebuild the rollup tables from the stored task history."""
+        with self._engine.begin() as conn:
+            return self._rebuild_rollups(conn)
+
     def get_schedules(self) -> list[Schedule]:
         """Return all stored schedules."""
         with self._engine.begin() as conn:
@@ -503,30 +1361,179 @@ class SQLiteController(BaseDBController):
         cutoff = _coerce_dt(datetime.now(UTC) - timedelta(days=older_than_days))
         if cutoff is None:
             return 0
-        ts_col = func.coalesce(
-            self._tasks.c.finished,
-            self._tasks.c.started,
-            self._tasks.c.received,
-        )
         total_removed = 0
         with self._engine.begin() as conn:
-            result = conn.execute(delete(self._task_events).where(self._task_events.c.timestamp < cutoff))
-            total_removed += result.rowcount or 0
-            result = conn.execute(delete(self._tasks).where(ts_col < cutoff))
-            total_removed += result.rowcount or 0
-            result = conn.execute(delete(self._worker_events).where(self._worker_events.c.timestamp < cutoff))
-            total_removed += result.rowcount or 0
-            result = conn.execute(
-                delete(self._broker_queue_events).where(self._broker_queue_events.c.timestamp < cutoff),
-            )
-            total_removed += result.rowcount or 0
-            result = conn.execute(
-                delete(self._workers).where(
-                    (self._workers.c.last_heartbeat.is_not(None)) & (self._workers.c.last_heartbeat < cutoff),
+            for table, expired, counted in self._retention_targets(cutoff):
+                if self._archive is not None and table.name in _ARCHIVED_TABLES:
+                    removed = self._archive_expired(conn, table, expired, None)
+                else:
+                    removed = conn.execute(delete(table).where(expired)).rowcount or 0
+                if counted:
+                    total_removed += removed
+        return total_removed
+
+    def purge_expired(self, cutoff: datetime, chunk_size: int) -> tuple[str, int] | None:
+        """Delete up to ``chunk_size`` rows older than ``cutoff`` from the first table that has any."""
+        cutoff = cast("datetime", _coerce_dt(cutoff))
+        rowid: ColumnElement[int] = literal_column("rowid")
+        with self._engine.begin() as conn:
+            for table, expired, _counted in self._retention_targets(cutoff):
+                if self._archive is not None and table.name in _ARCHIVED_TABLES:
+                    removed = self._archive_expired(conn, table, expired, chunk_size)
+                else:
+                    chunk = select(rowid).select_from(table).where(expired).limit(chunk_size).scalar_subquery()
+                    removed = conn.execute(delete(table).where(rowid.in_(chunk))).rowcount or 0
+                if removed:
+                    return table.name, removed
+        return None
+
+    def compact(self, mode: RetentionMaintenance) -> None:
+        """Return freed pages to the filesystem or fold the WAL back into the database file."""
+        if mode == "none" or self._path is None:
+            return
+        statement = "PRAGMA incremental_vacuum" if mode == "incremental_vacuum" else "PRAGMA wal_checkpoint(TRUNCATE)"
+        raw = self._engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            # Both pragmas do their work while rows are stepped, so drain the cursor.
+            cursor.execute(statement)
+            cursor.fetchall()
+            cursor.close()
+            raw.commit()
+        finally:
+            raw.close()
+
+    def _archive_expired(
+        self,
+        conn: Connection,
+        table: Table,
+        expired: ColumnElement[bool],
+        limit: int | None,
+    ) -> int:
+        """Move up to ``limit`` expired rows of ``table`` into the archive and return how many moved."""
+        archive = cast("JsonlArchive", self._archive)
+        rowid: ColumnElement[int] = literal_column("rowid")
+        stmt = select(rowid.label("archive_rowid"), table).where(expired)
+        rows = [_row_dict(row) for row in conn.execute(stmt if limit is None else stmt.limit(limit)).all()]
+        if not rows:
+            return 0
+        rowids = [row.pop("archive_rowid") for row in rows]
+        self._inflate_payloads(conn, rows)
+        archive.write(table.name, rows, _ARCHIVED_TABLES[table.name])
+        for offset in range(0, len(rowids), _SQLITE_IN_CHUNK_SIZE):
+            conn.execute(delete(table).where(rowid.in_(rowids[offset : offset + _SQLITE_IN_CHUNK_SIZE])))
+        return len(rowids)
+
+    def _facts_with_archive(self, task_name: str | None, time_range: TimeRange | None) -> list[_TaskFact] | None:
+        """Return hot and archived task facts in ``time_range``, or None when the archive is not reached."""
+        if self._archive is None or time_range is None:
+            return None
+        start = time_range.start.replace(tzinfo=None)
+        end = time_range.end.replace(tzinfo=None)
+        if not self._archive.covers(self._tasks.name, start):
+            return None
+        tasks = self._tasks.c
+        stmt = select(tasks.name, tasks.state, tasks.worker, tasks.last_ts, tasks.runtime).where(
+            *self._stats_conditions(task_name, time_range),
+        )
+        with self._engine.begin() as conn:
+            facts: list[_TaskFact] = [
+                (row[0], row[1], row[2], row[3], row[4]) for row in conn.execute(stmt).all() if row[3] is not None
+            ]
+        for raw in self._archive.iter_rows(self._tasks.name, start.date(), end.date()):
+            row = self._from_archive(self._tasks, raw)
+            last_ts = _as_optional_datetime(row.get("last_ts"))
+            if last_ts is None or not start <= last_ts <= end:
+                continue
+            if task_name is not None and row.get("name") != task_name:
+                continue
+            facts.append(
+                (
+                    _as_optional_str(row.get("name")),
+                    _as_optional_str(row.get("state")),
+                    _as_optional_str(row.get("worker")),
+                    last_ts,
+                    _as_optional_float(row.get("runtime")),
                 ),
             )
-            total_removed += result.rowcount or 0
-        return total_removed
+        return facts
+
+    @staticmethod
+    def _facts_throughput(
+        facts: Sequence[_TaskFact],
+        buckets: dict[datetime, int],
+        start: datetime,
+        bucket_seconds: int,
+    ) -> list[ThroughputBucket]:
+        start_us = _epoch_micros(start)
+        step = bucket_seconds * _MICROS_PER_SECOND
+        for fact in facts:
+            index = max((_epoch_micros(fact[3]) - start_us) // step, 0)
+            bucket_start = start + timedelta(seconds=index * bucket_seconds)
+            if bucket_start in buckets:
+                buckets[bucket_start] += 1
+        return [ThroughputBucket(bucket_start=key, count=value) for key, value in buckets.items()]
+
+    @staticmethod
+    def _facts_heatmap(facts: Sequence[_TaskFact]) -> list[list[int]]:
+        heatmap = [[0 for _ in range(24)] for _ in range(7)]
+        for fact in facts:
+            heatmap[fact[3].weekday()][fact[3].hour] += 1
+        return heatmap
+
+    @staticmethod
+    def _from_archive(table: Table, row: Mapping[str, object]) -> dict[str, object]:
+        """Restore the datetime columns of an archived ``table`` row."""
+        restored = dict(row)
+        for table_column in table.columns:
+            value = restored.get(table_column.name)
+            if isinstance(table_column.type, DateTime) and isinstance(value, str):
+                restored[table_column.name] = datetime.fromisoformat(value)
+        return restored
+
+    def _retention_targets(self, cutoff: datetime) -> list[tuple[Table, ColumnElement[bool], bool]]:
+        """Return the tables pruned by retention, their expiry condition and whether removals are counted."""
+        targets: list[tuple[Table, ColumnElement[bool], bool]] = [
+            (self._task_events, self._task_events.c.timestamp < cutoff, True),
+            (self._tasks, self._tasks.c.last_ts < cutoff, True),
+        ]
+        for seconds in _ROLLUP_RESOLUTIONS:
+            # Keep the bucket that straddles the cutoff; its tasks may still be stored.
+            rollup_cutoff = _bucket_floor(cutoff, seconds)
+            targets.extend(
+                (table, table.c.bucket_start < rollup_cutoff, False)
+                for table in (self._task_rollups[seconds], self._runtime_rollups[seconds])
+            )
+        targets.extend(
+            [
+                (self._worker_events, self._worker_events.c.timestamp < cutoff, True),
+                (self._worker_snapshots, self._worker_snapshots.c.timestamp < cutoff, True),
+                (self._broker_queue_events, self._broker_queue_events.c.timestamp < cutoff, True),
+                (self._broker_queue_snapshots, self._broker_queue_snapshots.c.timestamp < cutoff, True),
+                (
+                    self._broker_queue_rollups,
+                    self._broker_queue_rollups.c.bucket_start < _bucket_floor(cutoff, _ROLLUP_MINUTE),
+                    False,
+                ),
+                (
+                    self._workers,
+                    (self._workers.c.last_heartbeat.is_not(None)) & (self._workers.c.last_heartbeat < cutoff),
+                    True,
+                ),
+            ],
+        )
+        # Last, once the events that referenced them are gone; blobs of stored tasks are kept.
+        blobs = self._payload_blobs
+        unreferenced = [~exists().where(self._tasks.c[f"{name}_ref"] == blobs.c.digest) for name in _PAYLOAD_COLUMNS]
+        targets.append((blobs, and_(blobs.c.last_seen < cutoff, *unreferenced), False))
+        return targets
+
+    def open_reader(self, pool_size: int) -> SQLiteController | None:
+        """Return a read-only controller over the same database file, or ``None`` for in-memory databases."""
+        if self._path is None or pool_size <= 0:
+            return None
+        archive_path = self._archive.root if self._archive is not None else None
+        return SQLiteController(self._path, read_only=True, pool_size=pool_size, archive_path=archive_path)
 
     def close(self) -> None:
         """Dispose of the SQLite engine."""
@@ -586,6 +1593,10 @@ class SQLiteController(BaseDBController):
             Column("root_id", String),
             Column("group_id", String),
             Column("chord_id", String),
+            Column("last_ts", DateTime(timezone=True), Computed(_TASK_LAST_TS_SQL, persisted=False)),
+            Column("change_seq", Integer),
+            Column("topology_seq", Integer),
+            *(Column(f"{name}_ref", LargeBinary) for name in _PAYLOAD_COLUMNS),
         )
         self._task_events = Table(
             "task_events",
@@ -609,6 +1620,15 @@ class SQLiteController(BaseDBController):
             Column("root_id", String),
             Column("group_id", String),
             Column("chord_id", String),
+            *(Column(f"{name}_ref", LargeBinary) for name in _PAYLOAD_COLUMNS),
+        )
+        self._payload_blobs = Table(
+            "payload_blobs",
+            self._metadata,
+            Column("digest", LargeBinary, primary_key=True),
+            Column("data", LargeBinary, nullable=False),
+            Column("size", Integer, nullable=False),
+            Column("last_seen", DateTime(timezone=True), nullable=False),
         )
         self._task_relations = Table(
             "task_relations",
@@ -618,6 +1638,14 @@ class SQLiteController(BaseDBController):
             Column("parent_id", String),
             Column("child_id", String, nullable=False),
             Column("relation", String, nullable=False),
+            Column("change_seq", Integer),
+        )
+        # Single-row counter stamped on every task and relation write; graph change cursors point into it.
+        self._change_sequence = Table(
+            "change_sequence",
+            self._metadata,
+            Column("id", Integer, primary_key=True),
+            Column("value", Integer, nullable=False),
         )
         self._worker_events = Table(
             "worker_events",
@@ -629,6 +1657,17 @@ class SQLiteController(BaseDBController):
             Column("info", Text),
             Column("broker_url", Text),
         )
+        # Latest event per host, updated in place; ``history_ts`` is the last event appended to the history.
+        self._worker_snapshots = Table(
+            "worker_snapshots",
+            self._metadata,
+            Column("hostname", String, primary_key=True),
+            Column("event", String, nullable=False),
+            Column("timestamp", DateTime(timezone=True), nullable=False),
+            Column("info", Text),
+            Column("broker_url", Text),
+            Column("history_ts", DateTime(timezone=True)),
+        )
         self._workers = Table(
             "workers",
             self._metadata,
@@ -651,6 +1690,26 @@ class SQLiteController(BaseDBController):
             Column("consumers", Integer),
             Column("timestamp", DateTime(timezone=True), nullable=False),
         )
+        self._broker_queue_snapshots = Table(
+            "broker_queue_snapshots",
+            self._metadata,
+            Column("broker_url", Text, primary_key=True),
+            Column("queue", Text, primary_key=True),
+            Column("messages", Integer),
+            Column("consumers", Integer),
+            Column("timestamp", DateTime(timezone=True), nullable=False),
+        )
+        self._broker_queue_rollups = Table(
+            "broker_queue_rollups_minute",
+            self._metadata,
+            Column("broker_url", Text, primary_key=True),
+            Column("queue", Text, primary_key=True),
+            Column("bucket_start", DateTime(timezone=True), primary_key=True),
+            Column("min_messages", Integer),
+            Column("max_messages", Integer),
+            Column("messages", Integer),
+            Column("consumers", Integer),
+        )
         self._schedules = Table(
             "schedules",
             self._metadata,
@@ -665,6 +1724,75 @@ class SQLiteController(BaseDBController):
             Column("total_run_count", Integer),
             Column("app", String),
         )
+        self._task_rollups = {
+            seconds: Table(
+                f"task_rollups_{label}",
+                self._metadata,
+                Column("bucket_start", DateTime(timezone=True), primary_key=True),
+                Column("name", String, primary_key=True),
+                Column("state", String, primary_key=True),
+                Column("worker", String, primary_key=True),
+                Column("count", Integer, nullable=False),
+            )
+            for seconds, (label, _prefix_length, _suffix) in _ROLLUP_RESOLUTIONS.items()
+        }
+        self._runtime_rollups = {
+            seconds: Table(
+                f"task_runtime_rollups_{label}",
+                self._metadata,
+                Column("bucket_start", DateTime(timezone=True), primary_key=True),
+                Column("name", String, primary_key=True),
+                Column("bin", Integer, primary_key=True),
+                Column("count", Integer, nullable=False),
+                Column("runtime_sum", Float, nullable=False),
+            )
+            for seconds, (label, _prefix_length, _suffix) in _ROLLUP_RESOLUTIONS.items()
+        }
+        self._tasks_scan_index = Index("ix_tasks_last_ts_task_id", self._tasks.c.last_ts, self._tasks.c.task_id)
+        # Covers the per-worker state counts of the dashboard fleet table.
+        self._tasks_worker_state_index = Index("ix_tasks_worker_state", self._tasks.c.worker, self._tasks.c.state)
+        self._change_seq_indexes = (
+            Index("ix_tasks_root_id_change_seq", self._tasks.c.root_id, self._tasks.c.change_seq),
+            Index(
+                "ix_task_relations_root_id_change_seq",
+                self._task_relations.c.root_id,
+                self._task_relations.c.change_seq,
+            ),
+        )
+        # Partial indexes over the few tasks with blob payloads; retention checks them before dropping a blob.
+        self._payload_indexes = (
+            *(
+                Index(
+                    f"ix_tasks_{name}_ref",
+                    self._tasks.c[f"{name}_ref"],
+                    sqlite_where=self._tasks.c[f"{name}_ref"].is_not(None),
+                )
+                for name in _PAYLOAD_COLUMNS
+            ),
+            Index("ix_payload_blobs_last_seen", self._payload_blobs.c.last_seen),
+        )
+        self._indexes = (
+            self._tasks_scan_index,
+            self._tasks_worker_state_index,
+            Index("ix_tasks_name_last_ts", self._tasks.c.name, self._tasks.c.last_ts),
+            Index("ix_tasks_state_last_ts", self._tasks.c.state, self._tasks.c.last_ts),
+            Index("ix_tasks_worker_last_ts", self._tasks.c.worker, self._tasks.c.last_ts),
+            Index("ix_tasks_group_id", self._tasks.c.group_id),
+            Index("ix_task_events_timestamp", self._task_events.c.timestamp),
+            Index(
+                "ix_worker_events_hostname_timestamp",
+                self._worker_events.c.hostname,
+                self._worker_events.c.timestamp,
+            ),
+            Index("ix_worker_events_timestamp", self._worker_events.c.timestamp),
+            Index(
+                "ix_broker_queue_events_broker_url_queue",
+                self._broker_queue_events.c.broker_url,
+                self._broker_queue_events.c.queue,
+                self._broker_queue_events.c.id,
+            ),
+            Index("ix_broker_queue_events_timestamp", self._broker_queue_events.c.timestamp),
+        )
 
     def _event_values(self, event: TaskEvent) -> dict[str, object]:
         return {
@@ -729,15 +1857,320 @@ class SQLiteController(BaseDBController):
                 values["finished"] = event.timestamp
         return values
 
-    def _get_task_state_and_retries(self, conn: Connection, task_id: str) -> tuple[str | None, int | None]:
-        row = conn.execute(
-            select(self._tasks.c.state, self._tasks.c.retries).where(self._tasks.c.task_id == task_id),
-        ).first()
-        if row is None:
-            return None, None
-        state_value = str(row[0]) if row[0] is not None else None
-        retries_value = _as_optional_int(row[1])
-        return state_value, retries_value
+    def _get_task_snapshots(self, conn: Connection, task_ids: set[str]) -> dict[str, dict[str, object]]:
+        known: dict[str, dict[str, object]] = {}
+        ordered_ids = sorted(task_ids)
+        columns = [self._tasks.c[name] for name in (*_TASK_SNAPSHOT_COLUMNS, *_TASK_LINK_COLUMNS)]
+        for offset in range(0, len(ordered_ids), _SQLITE_IN_CHUNK_SIZE):
+            chunk = ordered_ids[offset : offset + _SQLITE_IN_CHUNK_SIZE]
+            rows = conn.execute(
+                select(self._tasks.c.task_id, *columns).where(self._tasks.c.task_id.in_(chunk)),
+            ).all()
+            for row in rows:
+                data = _row_dict(row)
+                known[_as_str(data.pop("task_id"))] = data
+        return known
+
+    def _seed_change_sequence(self, conn: Connection) -> None:
+        if conn.execute(select(self._change_sequence.c.value)).first() is None:
+            conn.execute(self._change_sequence.insert().values(id=1, value=0))
+
+    def _next_change_seq(self, conn: Connection) -> int:
+        # The UPDATE takes SQLite's write lock, so sequence numbers follow commit order across writers.
+        stmt = (
+            self._change_sequence.update()
+            .values(value=self._change_sequence.c.value + 1)
+            .returning(self._change_sequence.c.value)
+        )
+        return int(conn.execute(stmt).scalar_one())
+
+    def _current_change_seq(self, conn: Connection) -> int:
+        return int(conn.execute(select(self._change_sequence.c.value)).scalar_one_or_none() or 0)
+
+    def _tasks_by_id(self, conn: Connection, task_ids: Sequence[str]) -> list[Task]:
+        ordered_ids = list(dict.fromkeys(task_ids))
+        tasks: list[Task] = []
+        for offset in range(0, len(ordered_ids), _SQLITE_IN_CHUNK_SIZE):
+            chunk = ordered_ids[offset : offset + _SQLITE_IN_CHUNK_SIZE]
+            rows = conn.execute(select(self._tasks).where(self._tasks.c.task_id.in_(chunk))).all()
+            tasks.extend(
+                self._row_to_task(row) for row in self._inflate_payloads(conn, [_row_dict(row) for row in rows])
+            )
+        return tasks
+
+    def _store_payload_blobs(
+        self,
+        conn: Connection,
+        digests: Mapping[str, bytes],
+        seen: Mapping[bytes, datetime],
+    ) -> None:
+        """Compress and store the payloads in ``digests`` that have no blob yet.
+
+        ``seen`` maps each digest to its newest event, which retention compares against the cutoff.
+        """
+        if not digests:
+            return
+        blobs = self._payload_blobs
+        payloads = {digest: value for value, digest in digests.items()}
+        ordered = sorted(payloads)
+        stored: set[bytes] = set()
+        for offset in range(0, len(ordered), _SQLITE_IN_CHUNK_SIZE):
+            chunk = ordered[offset : offset + _SQLITE_IN_CHUNK_SIZE]
+            stored.update(conn.execute(select(blobs.c.digest).where(blobs.c.digest.in_(chunk))).scalars())
+        if stored:
+            conn.execute(
+                blobs.update()
+                .where(blobs.c.digest == bindparam("blob_digest"), blobs.c.last_seen < bindparam("blob_seen"))
+                .values(last_seen=bindparam("blob_seen")),
+                [{"blob_digest": digest, "blob_seen": seen[digest]} for digest in stored],
+            )
+        rows = []
+        for digest, value in payloads.items():
+            if digest in stored:
+                continue
+            raw = value.encode()
+            rows.append({"digest": digest, "data": zlib.compress(raw), "size": len(raw), "last_seen": seen[digest]})
+        if rows:
+            conn.execute(blobs.insert(), rows)
+
+    def _index_payload_search(
+        self,
+        conn: Connection,
+        task_ids: Collection[str] | None,
+        digests: Mapping[str, bytes] | None = None,
+    ) -> None:
+        """Write the full text of blob-backed tasks that ``task_search`` does not hold yet.
+
+        ``task_ids`` limits the pass to those tasks; ``None`` covers the whole table, as the migration
+        backfill does. ``digests`` are payloads already in memory, which saves inflating their blobs.
+        """
+        if not self._task_search_enabled():
+            return
+        tasks = self._tasks
+        rowid: ColumnElement[int] = literal_column("tasks.rowid")
+        search = table("task_search", column("rowid"), *(column(name) for name in _TASK_SEARCH_COLUMNS))
+        refs = [tasks.c[f"{name}_ref"] for name in _PAYLOAD_COLUMNS]
+        stmt = select(rowid.label("rowid"), *(tasks.c[name] for name in _TASK_SEARCH_COLUMNS), *refs).where(
+            or_(*(ref.is_not(None) for ref in refs)),
+            ~exists().where(search.c.rowid == rowid),
+        )
+        known = {digest: value for value, digest in (digests or {}).items()}
+        if task_ids is None:
+            last = 0
+            while rows := [
+                _row_dict(row)
+                for row in conn.execute(stmt.where(rowid > last).order_by(rowid).limit(_SQLITE_IN_CHUNK_SIZE))
+            ]:
+                last = cast("int", rows[-1]["rowid"])
+                self._write_payload_search(conn, search, rows, known)
+            return
+        ordered = sorted(task_ids)
+        for offset in range(0, len(ordered), _SQLITE_IN_CHUNK_SIZE):
+            chunk = ordered[offset : offset + _SQLITE_IN_CHUNK_SIZE]
+            rows = [_row_dict(row) for row in conn.execute(stmt.where(tasks.c.task_id.in_(chunk)))]
+            if rows:
+                self._write_payload_search(conn, search, rows, known)
+
+    def _write_payload_search(
+        self,
+        conn: Connection,
+        search: TableClause,
+        rows: list[dict[str, object]],
+        known: Mapping[bytes, str],
+    ) -> None:
+        pending: list[dict[str, object]] = []
+        for row in rows:
+            for name in _PAYLOAD_COLUMNS:
+                digest = row.get(f"{name}_ref")
+                if isinstance(digest, bytes) and digest in known:
+                    row[name] = known[digest]
+                    row[f"{name}_ref"] = None
+            if any(row.get(f"{name}_ref") is not None for name in _PAYLOAD_COLUMNS):
+                pending.append(row)
+        self._inflate_payloads(conn, pending)
+        conn.execute(
+            search.insert(),
+            [{name: row.get(name) for name in ("rowid", *_TASK_SEARCH_COLUMNS)} for row in rows],
+        )
+
+    def _inflate_payloads(self, conn: Connection, rows: list[dict[str, object]]) -> list[dict[str, object]]:
+        """Restore the blob payloads of task or event ``rows`` in place and drop their references."""
+        refs = {row[f"{name}_ref"] for row in rows for name in _PAYLOAD_COLUMNS if row.get(f"{name}_ref") is not None}
+        texts: dict[object, str | None] = {}
+        ordered = list(refs)
+        blobs = self._payload_blobs
+        for offset in range(0, len(ordered), _SQLITE_IN_CHUNK_SIZE):
+            chunk = ordered[offset : offset + _SQLITE_IN_CHUNK_SIZE]
+            for digest, data in conn.execute(select(blobs.c.digest, blobs.c.data).where(blobs.c.digest.in_(chunk))):
+                texts[digest] = _inflate_payload(data)
+        for row in rows:
+            for name in _PAYLOAD_COLUMNS:
+                digest = row.pop(f"{name}_ref", None)
+                # A missing blob leaves the preview in place.
+                if digest is not None and texts.get(digest) is not None:
+                    row[name] = texts[digest]
+        return rows
+
+    def _update_rollups(
+        self,
+        conn: Connection,
+        before: Mapping[str, Mapping[str, object] | None],
+        after: Mapping[str, Mapping[str, object]],
+    ) -> None:
+        """Move each changed task's contribution from its previous rollup buckets to its new ones."""
+        counts: dict[tuple[int, datetime, str, str, str], int] = {}
+        runtimes: dict[tuple[int, datetime, str, int], tuple[int, float]] = {}
+        for task_id, previous in before.items():
+            old_key = _rollup_key(previous)
+            new_key = _rollup_key(after[task_id])
+            if old_key == new_key:
+                continue
+            for key, sign in ((old_key, -1), (new_key, 1)):
+                if key is None:
+                    continue
+                timestamp, name, state, worker, runtime = key
+                for seconds in _ROLLUP_RESOLUTIONS:
+                    bucket_start = _bucket_floor(timestamp, seconds)
+                    count_key = (seconds, bucket_start, name, state, worker)
+                    counts[count_key] = counts.get(count_key, 0) + sign
+                    if runtime is not None:
+                        runtime_key = (seconds, bucket_start, name, _runtime_bin(runtime))
+                        bin_count, bin_sum = runtimes.get(runtime_key, (0, 0.0))
+                        runtimes[runtime_key] = (bin_count + sign, bin_sum + sign * runtime)
+        for seconds in _ROLLUP_RESOLUTIONS:
+            count_rows = [
+                {"bucket_start": bucket_start, "name": name, "state": state, "worker": worker, "count": delta}
+                for (resolution, bucket_start, name, state, worker), delta in counts.items()
+                if resolution == seconds and delta != 0
+            ]
+            runtime_rows = [
+                {"bucket_start": bucket_start, "name": name, "bin": bin_index, "count": delta, "runtime_sum": total}
+                for (resolution, bucket_start, name, bin_index), (delta, total) in runtimes.items()
+                if resolution == seconds and (delta != 0 or total != 0)
+            ]
+            self._apply_rollup_rows(conn, self._task_rollups[seconds], count_rows)
+            self._apply_rollup_rows(conn, self._runtime_rollups[seconds], runtime_rows)
+
+    @staticmethod
+    def _apply_rollup_rows(conn: Connection, table: Table, rows: list[dict[str, object]]) -> None:
+        if not rows:
+            return
+        key_names = [column.name for column in table.primary_key.columns]
+        stmt = sqlite_insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=key_names,
+            set_={
+                column.name: column + stmt.excluded[column.name] for column in table.c if column.name not in key_names
+            },
+        )
+        conn.execute(stmt, rows)
+        # Drop buckets a task moved out of so empty rows do not accumulate.
+        emptied = [{f"key_{name}": row[name] for name in key_names} for row in rows if cast("int", row["count"]) < 0]
+        if emptied:
+            prune = delete(table).where(
+                *(table.c[name] == bindparam(f"key_{name}") for name in key_names),
+                table.c.count <= 0,
+            )
+            conn.execute(prune, emptied)
+
+    def _rebuild_rollups(self, conn: Connection) -> int:
+        # The tasks table is the fold of task_events, so aggregating it matches a full event replay.
+        last_ts = self._tasks.c.last_ts
+        name = func.coalesce(self._tasks.c.name, _ROLLUP_UNKNOWN)
+        worker = func.coalesce(self._tasks.c.worker, _ROLLUP_UNKNOWN)
+        runtime = self._tasks.c.runtime
+        runtime_bin = case(
+            *((runtime <= bound, index) for index, bound in enumerate(_RUNTIME_HISTOGRAM_BOUNDS)),
+            else_=len(_RUNTIME_HISTOGRAM_BOUNDS),
+        )
+        for seconds, (_label, prefix_length, suffix) in _ROLLUP_RESOLUTIONS.items():
+            bucket_start = func.substr(last_ts, 1, prefix_length).op("||")(suffix)
+            count_table = self._task_rollups[seconds]
+            runtime_table = self._runtime_rollups[seconds]
+            conn.execute(delete(count_table))
+            conn.execute(delete(runtime_table))
+            conn.execute(
+                count_table.insert().from_select(
+                    ["bucket_start", "name", "state", "worker", "count"],
+                    select(bucket_start, name, self._tasks.c.state, worker, func.count())
+                    .where(last_ts.is_not(None))
+                    .group_by(bucket_start, name, self._tasks.c.state, worker),
+                ),
+            )
+            conn.execute(
+                runtime_table.insert().from_select(
+                    ["bucket_start", "name", "bin", "count", "runtime_sum"],
+                    select(bucket_start, name, runtime_bin, func.count(), func.sum(runtime))
+                    .where(last_ts.is_not(None), runtime.is_not(None))
+                    .group_by(bucket_start, name, runtime_bin),
+                ),
+            )
+        return int(conn.execute(select(func.count()).where(last_ts.is_not(None))).scalar_one())
+
+    def _rollup_sources(
+        self,
+        tables: Mapping[int, Table],
+        time_range: TimeRange | None,
+        *,
+        use_hours: bool = True,
+    ) -> list[tuple[Table, list[ColumnElement[bool]]]]:
+        """Split a time range into hourly rollups for whole hours and minute rollups for the edges."""
+        hours = tables[_ROLLUP_HOUR]
+        if time_range is None:
+            return [(hours, [])]
+        minutes = tables[_ROLLUP_MINUTE]
+        start = time_range.start.replace(tzinfo=None)
+        end = time_range.end.replace(tzinfo=None)
+        first_minute = _bucket_floor(start, _ROLLUP_MINUTE)
+        if not use_hours:
+            return [(minutes, [minutes.c.bucket_start >= first_minute, minutes.c.bucket_start <= end])]
+        first_hour = _bucket_floor(start, _ROLLUP_HOUR)
+        if first_hour < start:
+            first_hour += timedelta(seconds=_ROLLUP_HOUR)
+        last_hour = _bucket_floor(end, _ROLLUP_HOUR)
+        if first_hour >= last_hour:
+            return [(minutes, [minutes.c.bucket_start >= first_minute, minutes.c.bucket_start <= end])]
+        return [
+            (minutes, [minutes.c.bucket_start >= first_minute, minutes.c.bucket_start < first_hour]),
+            (hours, [hours.c.bucket_start >= first_hour, hours.c.bucket_start < last_hour]),
+            (minutes, [minutes.c.bucket_start >= last_hour, minutes.c.bucket_start <= end]),
+        ]
+
+    def _task_summary_select(self) -> Select[tuple[object, ...]]:
+        """Select the summary columns of tasks, with each payload cut to a preview inside SQLite."""
+        tasks = self._tasks.c
+        previews = [
+            case(
+                (
+                    func.length(tasks[name]) > _PAYLOAD_PREVIEW_CHARS,
+                    func.substr(tasks[name], 1, _PAYLOAD_PREVIEW_CHARS, type_=Text) + "...",
+                ),
+                else_=tasks[name],
+            ).label(name)
+            for name in _PAYLOAD_COLUMNS
+        ]
+        return select(*(tasks[name] for name in _TASK_SUMMARY_COLUMNS), *previews)
+
+    def _task_write_columns(self) -> list[Column[object]]:
+        return [column for column in self._tasks.c if column.computed is None]
+
+    def _task_upsert_stmt(self) -> Insert:
+        # Every column is bound on each row so the statement can be used with executemany; a NULL
+        # means "keep the stored value", which matches the per-event partial updates.
+        stmt = sqlite_insert(self._tasks)
+        update_values: dict[str, object] = {
+            column.name: func.coalesce(stmt.excluded[column.name], column)
+            for column in self._task_write_columns()
+            if column.name not in {"task_id", "state"}
+        }
+        update_values["state"] = stmt.excluded.state
+        # A reference follows its payload column; a new inline payload clears it.
+        for name in _PAYLOAD_COLUMNS:
+            update_values[f"{name}_ref"] = case(
+                (stmt.excluded[name].is_not(None), stmt.excluded[f"{name}_ref"]),
+                else_=self._tasks.c[f"{name}_ref"],
+            )
+        return stmt.on_conflict_do_update(index_elements=[self._tasks.c.task_id], set_=update_values)
 
     @staticmethod
     def _should_preserve_state(existing_state: str, incoming_state: str) -> bool:
@@ -749,26 +2182,34 @@ class SQLiteController(BaseDBController):
 
     @staticmethod
     def _row_to_task(row: Mapping[str, object]) -> Task:
-        return Task(
-            task_id=_as_str(row["task_id"]),
-            name=_as_optional_str(row.get("name")),
-            state=_as_str(row["state"]),
-            worker=_as_optional_str(row.get("worker")),
-            received=_coerce_dt(_as_optional_datetime(row.get("received"))),
-            started=_coerce_dt(_as_optional_datetime(row.get("started"))),
-            finished=_coerce_dt(_as_optional_datetime(row.get("finished"))),
-            runtime=_as_optional_float(row.get("runtime")),
-            args=_as_optional_str(row.get("args")),
-            kwargs_=_as_optional_str(row.get("kwargs")),
-            result=_as_optional_str(row.get("result")),
-            traceback=_as_optional_str(row.get("traceback")),
-            stamps=_as_optional_str(row.get("stamps")),
-            retries=_as_optional_int(row.get("retries")),
-            parent_id=_as_optional_str(row.get("parent_id")),
-            root_id=_as_optional_str(row.get("root_id")),
-            group_id=_as_optional_str(row.get("group_id")),
-            chord_id=_as_optional_str(row.get("chord_id")),
-        )
+        fields = SQLiteController._task_summary_fields(row)
+        return Task.model_validate({**fields, "stamps": _as_optional_str(row.get("stamps"))})
+
+    @staticmethod
+    def _row_to_task_summary(row: Mapping[str, object]) -> TaskSummary:
+        return TaskSummary.model_validate(SQLiteController._task_summary_fields(row))
+
+    @staticmethod
+    def _task_summary_fields(row: Mapping[str, object]) -> dict[str, object]:
+        return {
+            "task_id": _as_str(row["task_id"]),
+            "name": _as_optional_str(row.get("name")),
+            "state": _as_str(row["state"]),
+            "worker": _as_optional_str(row.get("worker")),
+            "received": _coerce_dt(_as_optional_datetime(row.get("received"))),
+            "started": _coerce_dt(_as_optional_datetime(row.get("started"))),
+            "finished": _coerce_dt(_as_optional_datetime(row.get("finished"))),
+            "runtime": _as_optional_float(row.get("runtime")),
+            "args": _as_optional_str(row.get("args")),
+            "kwargs_": _as_optional_str(row.get("kwargs")),
+            "result": _as_optional_str(row.get("result")),
+            "traceback": _as_optional_str(row.get("traceback")),
+            "retries": _as_optional_int(row.get("retries")),
+            "parent_id": _as_optional_str(row.get("parent_id")),
+            "root_id": _as_optional_str(row.get("root_id")),
+            "group_id": _as_optional_str(row.get("group_id")),
+            "chord_id": _as_optional_str(row.get("chord_id")),
+        }
 
     @staticmethod
     def _row_to_worker(row: Mapping[str, object]) -> Worker:
@@ -821,6 +2262,13 @@ class SQLiteController(BaseDBController):
             return [str(item) for item in data]
         return None
 
+    def _keeps_history(self, event: WorkerEvent, timestamp: datetime | None, history_ts: datetime | None) -> bool:
+        if event.event != "worker-heartbeat" or self._heartbeat_history_seconds <= 0:
+            return True
+        if history_ts is None or timestamp is None:
+            return True
+        return (timestamp - history_ts).total_seconds() >= self._heartbeat_history_seconds
+
     def _worker_from_event(self, event: WorkerEvent) -> dict[str, object]:
         status = "OFFLINE" if event.event == "worker-offline" else "ONLINE"
         info = event.info or {}
@@ -883,7 +2331,6 @@ class SQLiteController(BaseDBController):
         self,
         stmt: Select[tuple[object, ...]],
         filters: TaskFilter,
-        ts_col: ColumnElement[object],
     ) -> Select[tuple[object, ...]]:
         if filters.task_name:
             stmt = stmt.where(self._tasks.c.name == filters.task_name)
@@ -895,7 +2342,15 @@ class SQLiteController(BaseDBController):
             stmt = stmt.where(self._tasks.c.group_id == filters.group_id)
         if filters.root_id:
             stmt = stmt.where(self._tasks.c.root_id == filters.root_id)
-        if filters.search:
+        search_query = _task_search_query(filters.search) if filters.search else None
+        if search_query is not None and self._task_search_enabled():
+            # Blob-backed tasks are matched on their full text in ``task_search`` as well as their previews.
+            index = table("tasks_fts", column("rowid"), column("tasks_fts"))
+            full = table("task_search", column("rowid"), column("task_search"))
+            matches = select(index.c.rowid).where(index.c.tasks_fts.match(search_query))
+            full_matches = select(full.c.rowid).where(full.c.task_search.match(search_query))
+            stmt = stmt.where(literal_column("tasks.rowid").in_(matches.union(full_matches)))
+        elif filters.search:
             pattern = f"%{filters.search}%"
             stmt = stmt.where(
                 (self._tasks.c.name.like(pattern))
@@ -907,14 +2362,10 @@ class SQLiteController(BaseDBController):
         if filters.time_range:
             start = filters.time_range.start
             end = filters.time_range.end
-            stmt = stmt.where(ts_col.between(start, end))
+            stmt = stmt.where(self._tasks.c.last_ts.between(start, end))
         return stmt
 
-    def _task_sort_column(
-        self,
-        sort_key: str | None,
-        ts_col: ColumnElement[object],
-    ) -> ColumnElement[object]:
+    def _task_sort_column(self, sort_key: str | None) -> ColumnElement[object]:
         if sort_key == "state":
             return self._tasks.c.state
         if sort_key == "worker":
@@ -925,22 +2376,46 @@ class SQLiteController(BaseDBController):
             return self._tasks.c.started
         if sort_key == "runtime":
             return self._tasks.c.runtime
-        return ts_col
+        return self._tasks.c.last_ts
 
-    def _filter_tasks(self, task_name: str | None, time_range: TimeRange | None) -> list[Task]:
-        stmt: Select[tuple[object, ...]] = select(self._tasks)
-        ts_col = func.coalesce(
-            self._tasks.c.finished,
-            self._tasks.c.started,
-            self._tasks.c.received,
-        )
+    def _stats_conditions(self, task_name: str | None, time_range: TimeRange | None) -> list[ColumnElement[bool]]:
+        last_ts = self._tasks.c.last_ts
+        conditions: list[ColumnElement[bool]] = []
         if task_name is not None:
-            stmt = stmt.where(self._tasks.c.name == task_name)
+            conditions.append(self._tasks.c.name == task_name)
         if time_range is not None:
-            stmt = stmt.where(ts_col.between(time_range.start, time_range.end))
-        with self._engine.begin() as conn:
-            rows = conn.execute(stmt).all()
-        return [self._row_to_task(_row_dict(row)) for row in rows]
+            conditions.append(last_ts.between(time_range.start, time_range.end))
+        return conditions
+
+    def _runtime_percentiles(
+        self,
+        conn: Connection,
+        conditions: list[ColumnElement[bool]],
+        runtime_count: int,
+        percentiles: tuple[float, ...],
+    ) -> list[float | None]:
+        runtime = self._tasks.c.runtime
+        positions = [_percentile_positions(runtime_count, pct) for pct in percentiles]
+        wanted = sorted({position for lower, upper, _weight in positions for position in (lower, upper)})
+        ranked = (
+            select(
+                runtime.label("runtime"),
+                (func.row_number().over(order_by=runtime) - 1).label("position"),
+            )
+            .where(*conditions, runtime.is_not(None))
+            .subquery()
+        )
+        rows = conn.execute(select(ranked.c.position, ranked.c.runtime).where(ranked.c.position.in_(wanted))).all()
+        values = {int(row[0]): float(row[1]) for row in rows}
+        results: list[float | None] = []
+        for lower, upper, weight in positions:
+            if lower not in values or upper not in values:
+                results.append(None)
+            elif lower == upper:
+                results.append(values[lower])
+            else:
+                results.append(values[lower] + (values[upper] - values[lower]) * weight)
+        return results
 
     @staticmethod
     def _init_buckets(time_range: TimeRange, bucket_seconds: int) -> dict[datetime, int]:
@@ -953,14 +2428,6 @@ class SQLiteController(BaseDBController):
             cursor = cursor + timedelta(seconds=bucket_seconds)
         return buckets
 
-    @staticmethod
-    def _bucket_start(start: datetime, timestamp: datetime, bucket_seconds: int) -> datetime:
-        start = _coerce_dt(start) or start
-        timestamp = _coerce_dt(timestamp) or timestamp
-        delta_seconds = int((timestamp - start).total_seconds())
-        bucket_index = max(delta_seconds // bucket_seconds, 0)
-        return start + timedelta(seconds=bucket_index * bucket_seconds)
-
     @staticmethod
     def _schedule_values(schedule: Schedule) -> dict[str, object]:
         return {
@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Cold storage for rows that have aged out of the database.
+
+Retention moves expired rows into gzip-compressed JSON Lines files partitioned by table and day
+(``<root>/<table>/date=YYYY-MM-DD/part-*.jsonl.gz``) instead of deleting them. Every chunk becomes
+new part files that are renamed into place once complete, so readers never see a partial file.
+Reads only open the partitions of the requested days.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import uuid
+from datetime import UTC, date, datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+    from pathlib import Path
+
+_PARTITION_PREFIX = "date="
+_PART_SUFFIX = ".jsonl.gz"
+
+
+def _json_default(value: object) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    msg = f"Cannot archive value of type {type(value).__name__}"
+    raise TypeError(msg)
+
+
+def _row_day(value: object) -> date | None:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).date()
+    return None
+
+
+class JsonlArchive:
+    """Day-partitioned, gzip-compressed JSON Lines archive of database rows."""
+
+    def __init__(self, root: Path) -> None:
+        """Archive under ``root``, creating it on the first write."""
+        self._root = root
+
+    @property
+    def root(self) -> Path:
+        """Return the archive directory."""
+        return self._root
+
+    def write(self, table: str, rows: Iterable[Mapping[str, object]], day_column: str) -> int:
+        """Append ``rows`` to the partitions of the day in ``day_column`` and return the rows written.
+
+        Rows without a value in ``day_column`` are filed under the epoch day.
+        """
+        by_day: dict[date, list[str]] = {}
+        for row in rows:
+            day = _row_day(row.get(day_column)) or date(1970, 1, 1)
+            by_day.setdefault(day, []).append(json.dumps(row, default=_json_default, separators=(",", ":")))
+        part = f"part-{datetime.now(UTC):%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:8]}{_PART_SUFFIX}"
+        for day, lines in by_day.items():
+            directory = self._root / table / f"{_PARTITION_PREFIX}{day.isoformat()}"
+            directory.mkdir(parents=True, exist_ok=True)
+            staging = directory / f".{part}.tmp"
+            with gzip.open(staging, "wt", encoding="utf-8") as stream:
+                stream.write("\n".join(lines))
+                stream.write("\n")
+            staging.replace(directory / part)
+        return sum(len(lines) for lines in by_day.values())
+
+    def days(self, table: str) -> list[date]:
+        """Return the archived days of ``table`` in ascending order."""
+        directory = self._root / table
+        if not directory.is_dir():
+            return []
+        return sorted(
+            date.fromisoformat(entry.name.removeprefix(_PARTITION_PREFIX))
+            for entry in directory.iterdir()
+            if entry.is_dir() and entry.name.startswith(_PARTITION_PREFIX)
+        )
+
+    def covers(self, table: str, start: datetime) -> bool:
+        """Return whether ``table`` has archived rows on or after the day of ``start``."""
+        days = self.days(table)
+        return bool(days) and days[-1] >= start.date()
+
+    def find_row(self, table: str, column: str, value: str) -> dict[str, object] | None:
+        """Return the most recently archived row of ``table`` whose ``column`` equals ``value``.
+
+        Scans the archived days newest first. Lines are matched as text before they are parsed, so
+        only candidate rows pay for JSON decoding.
+        """
+        needle = json.dumps({column: value}, separators=(",", ":"))[1:-1]
+        for day in reversed(self.days(table)):
+            for lines in self._partition_lines(table, day, newest_first=True):
+                for line in lines:
+                    if needle in line:
+                        row: dict[str, object] = json.loads(line)
+                        if row.get(column) == value:
+                            return row
+        return None
+
+    def iter_rows(
+        self,
+        table: str,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> Iterator[dict[str, object]]:
+        """Yield the archived rows of ``table`` whose day lies within ``start`` and ``end``."""
+        for day in self.days(table):
+            if (start is not None and day < start) or (end is not None and day > end):
+                continue
+            for lines in self._partition_lines(table, day, newest_first=False):
+                for line in lines:
+                    if line:
+                        yield json.loads(line)
+
+    def _partition_lines(self, table: str, day: date, *, newest_first: bool) -> Iterator[list[str]]:
+        directory = self._root / table / f"{_PARTITION_PREFIX}{day.isoformat()}"
+        for part in sorted(directory.glob(f"part-*{_PART_SUFFIX}"), reverse=newest_first):
+            with gzip.open(part, "rt", encoding="utf-8") as stream:
+                lines = stream.read().splitlines()
+            if newest_first:
+                lines.reverse()
+            yield lines
+
+
+__all__ = ["JsonlArchive"]
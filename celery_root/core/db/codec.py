@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Wire codecs for DB RPC envelopes.
+
+JSON frames always start with ``{`` while msgpack frames start with a map header, so the DB manager
+detects the codec of each request from its first byte and answers in the same codec. That lets JSON
+and msgpack clients share one DB manager.
+"""
+
+from __future__ import annotations
+
+import importlib
+from datetime import datetime
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Literal
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+if TYPE_CHECKING:
+    from celery_root.config import RpcCodec
+
+_JSON_PREFIX = b"{"
+
+
+class RpcFrameError(ValueError):
+    """Raised when a binary RPC frame cannot be decoded."""
+
+
+def _msgpack() -> Any:  # noqa: ANN401 - msgpack ships without type information
+    return importlib.import_module("msgpack")
+
+
+def msgpack_available() -> bool:
+    """Return whether the msgpack codec can be used in this process."""
+    return find_spec("msgpack") is not None
+
+
+def detect_codec(data: bytes) -> RpcCodec:
+    """Return the codec a raw RPC frame was encoded with."""
+    return "json" if data[:1] == _JSON_PREFIX else "msgpack"
+
+
+def payload_mode(codec: RpcCodec) -> Literal["json", "python"]:
+    """Return the ``model_dump`` mode that produces payloads suitable for ``codec``."""
+    return "json" if codec == "json" else "python"
+
+
+def _msgpack_default(value: object) -> object:
+    if isinstance(value, datetime):
+        # Aware datetimes use the compact msgpack timestamp extension; naive ones keep their ISO form.
+        return value.isoformat()
+    return to_jsonable_python(value)
+
+
+def encode_envelope(envelope: BaseModel, codec: RpcCodec) -> bytes:
+    """Serialize an RPC envelope with ``codec``."""
+    if codec == "json":
+        return envelope.model_dump_json().encode("utf-8")
+    packed: bytes = _msgpack().packb(
+        envelope.model_dump(mode="python"),
+        datetime=True,
+        default=_msgpack_default,
+        use_bin_type=True,
+    )
+    return packed
+
+
+def decode_envelope[EnvelopeT: BaseModel](data: bytes, model: type[EnvelopeT]) -> EnvelopeT:
+    """Deserialize an RPC envelope, detecting its codec from the frame."""
+    if detect_codec(data) == "json":
+        return model.model_validate_json(data)
+    try:
+        decoded = _msgpack().unpackb(data, timestamp=3, raw=False)
+    except ValueError as exc:
+        raise RpcFrameError(str(exc)) from exc
+    if not isinstance(decoded, dict):
+        msg = "RPC msgpack frame is not a map"
+        raise RpcFrameError(msg)
+    return model.model_validate(decoded)
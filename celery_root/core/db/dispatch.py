@@ -9,28 +9,41 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel
 from sqlalchemy import inspect, text
 
 from celery_root.core.db.adapters.sqlite import SQLiteController
+from celery_root.core.db.retention import retention_status
 from celery_root.shared.schemas import (
+    BrokerQueueHistoryRequest,
+    BrokerQueueHistoryResponse,
     BrokerQueueSnapshotRequest,
     BrokerQueueSnapshotResponse,
+    BuildTaskGraphRequest,
+    BuildTaskGraphResponse,
     CleanupRequest,
     CleanupResponse,
     DbInfoRequest,
     DbInfoResponse,
     DeleteScheduleRequest,
+    GetManyTasksRequest,
+    GetManyTasksResponse,
     GetTaskRequest,
     GetTaskResponse,
     GetWorkerRequest,
     GetWorkerResponse,
     HeatmapRequest,
     HeatmapResponse,
+    IngestBrokerQueueEventBatchRequest,
+    IngestBrokerQueueEventBatchResponse,
     IngestBrokerQueueEventRequest,
+    IngestTaskEventBatchRequest,
+    IngestTaskEventBatchResponse,
     IngestTaskEventRequest,
+    IngestWorkerEventBatchRequest,
+    IngestWorkerEventBatchResponse,
     IngestWorkerEventRequest,
     ListSchedulesRequest,
     ListSchedulesResponse,
@@ -49,6 +62,16 @@ from celery_root.shared.schemas import (
     PingResponse,
     RawQueryRequest,
     RawQueryResponse,
+    RebuildRollupsRequest,
+    RebuildRollupsResponse,
+    RetentionStatusRequest,
+    RetentionStatusResponse,
+    RollupCountsRequest,
+    RollupCountsResponse,
+    RollupTaskStatsRequest,
+    RollupThroughputRequest,
+    ScanTasksRequest,
+    ScanTasksResponse,
     SchemaColumn,
     SchemaIndex,
     SchemaRequest,
@@ -60,12 +83,16 @@ from celery_root.shared.schemas import (
     StateDistributionResponse,
     StoreScheduleRequest,
     StoreTaskRelationRequest,
+    TaskGraphChangesRequest,
+    TaskGraphChangesResponse,
     TaskStatsRequest,
     TaskStatsResponse,
     ThroughputRequest,
     ThroughputResponse,
     WorkerEventSnapshotRequest,
     WorkerEventSnapshotResponse,
+    WorkerStateCountsRequest,
+    WorkerStateCountsResponse,
 )
 from celery_root.shared.schemas.domain import TaskEvent, TaskRelation
 
@@ -75,20 +102,29 @@ if TYPE_CHECKING:
     from celery_root.core.db.adapters.base import BaseDBController
 
 
+OperationAccess = Literal["read", "write"]
+
+
 @dataclass(frozen=True, slots=True)
 class RpcOperation[ReqT: BaseModel, ResT: BaseModel]:
-    """RPC operation specification."""
+    """RPC operation specification.
+
+    ``read`` operations run concurrently on the read-only connection pool; ``write`` operations are
+    serialized on the writer.
+    """
 
     op: str
     request_model: type[ReqT]
     response_model: type[ResT]
     handler: Callable[[BaseDBController, ReqT], ResT]
+    access: OperationAccess = "write"
 
 
-def _store_relations(controller: BaseDBController, event: TaskEvent) -> None:
+def _event_relations(event: TaskEvent) -> list[TaskRelation]:
     root_id = event.root_id or event.task_id
+    relations: list[TaskRelation] = []
     if event.parent_id:
-        controller.store_task_relation(
+        relations.append(
             TaskRelation(
                 root_id=root_id,
                 parent_id=event.parent_id,
@@ -97,7 +133,7 @@ def _store_relations(controller: BaseDBController, event: TaskEvent) -> None:
             ),
         )
     if event.group_id:
-        controller.store_task_relation(
+        relations.append(
             TaskRelation(
                 root_id=root_id,
                 parent_id=event.group_id,
@@ -106,7 +142,7 @@ def _store_relations(controller: BaseDBController, event: TaskEvent) -> None:
             ),
         )
     if event.chord_id:
-        controller.store_task_relation(
+        relations.append(
             TaskRelation(
                 root_id=root_id,
                 parent_id=event.chord_id,
@@ -114,6 +150,12 @@ def _store_relations(controller: BaseDBController, event: TaskEvent) -> None:
                 relation="chord",
             ),
         )
+    return relations
+
+
+def _store_relations(controller: BaseDBController, event: TaskEvent) -> None:
+    for relation in _event_relations(event):
+        controller.store_task_relation(relation)
 
 
 def _ping(_controller: BaseDBController, _request: PingRequest) -> PingResponse:
@@ -205,16 +247,42 @@ def _ingest_task_event(controller: BaseDBController, request: IngestTaskEventReq
     return Ok()
 
 
+def _ingest_task_event_batch(
+    controller: BaseDBController,
+    request: IngestTaskEventBatchRequest,
+) -> IngestTaskEventBatchResponse:
+    controller.store_task_events(request.events)
+    relations = [relation for event in request.events for relation in _event_relations(event)]
+    controller.store_task_relations(relations)
+    return IngestTaskEventBatchResponse(stored=len(request.events))
+
+
 def _ingest_worker_event(controller: BaseDBController, request: IngestWorkerEventRequest) -> Ok:
     controller.store_worker_event(request.event)
     return Ok()
 
 
+def _ingest_worker_event_batch(
+    controller: BaseDBController,
+    request: IngestWorkerEventBatchRequest,
+) -> IngestWorkerEventBatchResponse:
+    controller.store_worker_events(request.events)
+    return IngestWorkerEventBatchResponse(stored=len(request.events))
+
+
 def _ingest_broker_queue_event(controller: BaseDBController, request: IngestBrokerQueueEventRequest) -> Ok:
     controller.store_broker_queue_event(request.event)
     return Ok()
 
 
+def _ingest_broker_queue_event_batch(
+    controller: BaseDBController,
+    request: IngestBrokerQueueEventBatchRequest,
+) -> IngestBrokerQueueEventBatchResponse:
+    controller.store_broker_queue_events(request.events)
+    return IngestBrokerQueueEventBatchResponse(stored=len(request.events))
+
+
 def _broker_queue_snapshot(
     controller: BaseDBController,
     request: BrokerQueueSnapshotRequest,
@@ -223,6 +291,14 @@ def _broker_queue_snapshot(
     return BrokerQueueSnapshotResponse(events=events)
 
 
+def _broker_queue_history(
+    controller: BaseDBController,
+    request: BrokerQueueHistoryRequest,
+) -> BrokerQueueHistoryResponse:
+    samples = controller.get_broker_queue_history(request.broker_url, request.queue, request.time_range)
+    return BrokerQueueHistoryResponse(samples=list(samples))
+
+
 def _worker_event_snapshot(
     controller: BaseDBController,
     request: WorkerEventSnapshotRequest,
@@ -241,6 +317,11 @@ def _list_tasks(controller: BaseDBController, request: ListTasksRequest) -> List
     return ListTasksResponse(tasks=tasks)
 
 
+def _scan_tasks(controller: BaseDBController, request: ScanTasksRequest) -> ScanTasksResponse:
+    tasks, next_cursor = controller.scan_tasks(request.filters, cursor=request.cursor, limit=request.limit)
+    return ScanTasksResponse(tasks=tasks, next_cursor=next_cursor)
+
+
 def _list_tasks_page(controller: BaseDBController, request: ListTasksPageRequest) -> ListTasksPageResponse:
     tasks, total = controller.get_tasks_page(
         request.filters,
@@ -262,6 +343,18 @@ def _get_task(controller: BaseDBController, request: GetTaskRequest) -> GetTaskR
     return GetTaskResponse(task=task)
 
 
+def _get_many_tasks(controller: BaseDBController, request: GetManyTasksRequest) -> GetManyTasksResponse:
+    return GetManyTasksResponse(tasks=controller.get_tasks_by_id(request.task_ids))
+
+
+def _build_task_graph(controller: BaseDBController, request: BuildTaskGraphRequest) -> BuildTaskGraphResponse:
+    return BuildTaskGraphResponse(graph=controller.get_task_graph(request.task_id))
+
+
+def _task_graph_changes(controller: BaseDBController, request: TaskGraphChangesRequest) -> TaskGraphChangesResponse:
+    return TaskGraphChangesResponse(changes=controller.get_task_graph_changes(request.task_id, request.since))
+
+
 def _list_relations(controller: BaseDBController, request: ListTaskRelationsRequest) -> ListTaskRelationsResponse:
     relations = list(controller.get_task_relations(request.root_id))
     return ListTaskRelationsResponse(relations=relations)
@@ -292,11 +385,38 @@ def _state_distribution(controller: BaseDBController, _request: StateDistributio
     return StateDistributionResponse(counts=counts)
 
 
+def _worker_state_counts(
+    controller: BaseDBController,
+    _request: WorkerStateCountsRequest,
+) -> WorkerStateCountsResponse:
+    return WorkerStateCountsResponse(counts=controller.get_worker_state_counts())
+
+
 def _heatmap(controller: BaseDBController, request: HeatmapRequest) -> HeatmapResponse:
     heatmap = controller.get_heatmap(request.time_range)
     return HeatmapResponse(heatmap=heatmap)
 
 
+def _rollup_counts(controller: BaseDBController, request: RollupCountsRequest) -> RollupCountsResponse:
+    counts = list(controller.get_rollup_counts(request.time_range, request.group_by))
+    return RollupCountsResponse(counts=counts)
+
+
+def _rollup_throughput(controller: BaseDBController, request: RollupThroughputRequest) -> ThroughputResponse:
+    buckets = list(controller.get_rollup_throughput(request.time_range, request.bucket_seconds))
+    return ThroughputResponse(buckets=buckets)
+
+
+def _rollup_task_stats(controller: BaseDBController, request: RollupTaskStatsRequest) -> TaskStatsResponse:
+    stats = controller.get_rollup_task_stats(request.task_name, request.time_range)
+    return TaskStatsResponse(stats=stats)
+
+
+def _rebuild_rollups(controller: BaseDBController, _request: RebuildRollupsRequest) -> RebuildRollupsResponse:
+    tasks = controller.rebuild_rollups()
+    return RebuildRollupsResponse(tasks=tasks)
+
+
 def _list_schedules(controller: BaseDBController, _request: ListSchedulesRequest) -> ListSchedulesResponse:
     schedules = list(controller.get_schedules())
     return ListSchedulesResponse(schedules=schedules)
@@ -317,31 +437,39 @@ def _cleanup(controller: BaseDBController, request: CleanupRequest) -> CleanupRe
     return CleanupResponse(removed=removed)
 
 
+def _retention_status(_controller: BaseDBController, _request: RetentionStatusRequest) -> RetentionStatusResponse:
+    return retention_status()
+
+
 RPC_OPERATIONS: dict[str, RpcOperation[Any, Any]] = {
-    "db.ping": RpcOperation("db.ping", PingRequest, PingResponse, _ping),
+    "db.ping": RpcOperation("db.ping", PingRequest, PingResponse, _ping, access="read"),
     "db.schema_version": RpcOperation(
         "db.schema_version",
         SchemaVersionRequest,
         SchemaVersionResponse,
         _schema_version,
+        access="read",
     ),
     "db.schema": RpcOperation(
         "db.schema",
         SchemaRequest,
         SchemaResponse,
         _schema,
+        access="read",
     ),
     "db.info": RpcOperation(
         "db.info",
         DbInfoRequest,
         DbInfoResponse,
         _db_info,
+        access="read",
     ),
     "db.raw_query": RpcOperation(
         "db.raw_query",
         RawQueryRequest,
         RawQueryResponse,
         _raw_query,
+        access="read",
     ),
     "events.task.ingest": RpcOperation(
         "events.task.ingest",
@@ -349,29 +477,56 @@ RPC_OPERATIONS: dict[str, RpcOperation[Any, Any]] = {
         Ok,
         _ingest_task_event,
     ),
+    "events.task.ingest_batch": RpcOperation(
+        "events.task.ingest_batch",
+        IngestTaskEventBatchRequest,
+        IngestTaskEventBatchResponse,
+        _ingest_task_event_batch,
+    ),
     "events.worker.ingest": RpcOperation(
         "events.worker.ingest",
         IngestWorkerEventRequest,
         Ok,
         _ingest_worker_event,
     ),
+    "events.worker.ingest_batch": RpcOperation(
+        "events.worker.ingest_batch",
+        IngestWorkerEventBatchRequest,
+        IngestWorkerEventBatchResponse,
+        _ingest_worker_event_batch,
+    ),
     "events.broker_queue.ingest": RpcOperation(
         "events.broker_queue.ingest",
         IngestBrokerQueueEventRequest,
         Ok,
         _ingest_broker_queue_event,
     ),
+    "events.broker_queue.ingest_batch": RpcOperation(
+        "events.broker_queue.ingest_batch",
+        IngestBrokerQueueEventBatchRequest,
+        IngestBrokerQueueEventBatchResponse,
+        _ingest_broker_queue_event_batch,
+    ),
     "broker.queues.snapshot": RpcOperation(
         "broker.queues.snapshot",
         BrokerQueueSnapshotRequest,
         BrokerQueueSnapshotResponse,
         _broker_queue_snapshot,
+        access="read",
+    ),
+    "broker.queues.history": RpcOperation(
+        "broker.queues.history",
+        BrokerQueueHistoryRequest,
+        BrokerQueueHistoryResponse,
+        _broker_queue_history,
+        access="read",
     ),
     "workers.events.snapshot": RpcOperation(
         "workers.events.snapshot",
         WorkerEventSnapshotRequest,
         WorkerEventSnapshotResponse,
         _worker_event_snapshot,
+        access="read",
     ),
     "relations.store": RpcOperation(
         "relations.store",
@@ -379,52 +534,121 @@ RPC_OPERATIONS: dict[str, RpcOperation[Any, Any]] = {
         Ok,
         _store_relation,
     ),
-    "tasks.list": RpcOperation("tasks.list", ListTasksRequest, ListTasksResponse, _list_tasks),
+    "tasks.list": RpcOperation("tasks.list", ListTasksRequest, ListTasksResponse, _list_tasks, access="read"),
+    "tasks.scan": RpcOperation(
+        "tasks.scan",
+        ScanTasksRequest,
+        ScanTasksResponse,
+        _scan_tasks,
+        access="read",
+    ),
     "tasks.page": RpcOperation(
         "tasks.page",
         ListTasksPageRequest,
         ListTasksPageResponse,
         _list_tasks_page,
+        access="read",
     ),
     "tasks.names": RpcOperation(
         "tasks.names",
         ListTaskNamesRequest,
         ListTaskNamesResponse,
         _list_task_names,
+        access="read",
+    ),
+    "tasks.get": RpcOperation("tasks.get", GetTaskRequest, GetTaskResponse, _get_task, access="read"),
+    "tasks.get_many": RpcOperation(
+        "tasks.get_many",
+        GetManyTasksRequest,
+        GetManyTasksResponse,
+        _get_many_tasks,
+        access="read",
+    ),
+    "graph.build": RpcOperation(
+        "graph.build",
+        BuildTaskGraphRequest,
+        BuildTaskGraphResponse,
+        _build_task_graph,
+        access="read",
+    ),
+    "graph.changes": RpcOperation(
+        "graph.changes",
+        TaskGraphChangesRequest,
+        TaskGraphChangesResponse,
+        _task_graph_changes,
+        access="read",
     ),
-    "tasks.get": RpcOperation("tasks.get", GetTaskRequest, GetTaskResponse, _get_task),
     "relations.list": RpcOperation(
         "relations.list",
         ListTaskRelationsRequest,
         ListTaskRelationsResponse,
         _list_relations,
+        access="read",
     ),
     "workers.list": RpcOperation(
         "workers.list",
         ListWorkersRequest,
         ListWorkersResponse,
         _list_workers,
+        access="read",
     ),
-    "workers.get": RpcOperation("workers.get", GetWorkerRequest, GetWorkerResponse, _get_worker),
-    "stats.task": RpcOperation("stats.task", TaskStatsRequest, TaskStatsResponse, _task_stats),
+    "workers.get": RpcOperation("workers.get", GetWorkerRequest, GetWorkerResponse, _get_worker, access="read"),
+    "stats.task": RpcOperation("stats.task", TaskStatsRequest, TaskStatsResponse, _task_stats, access="read"),
     "stats.throughput": RpcOperation(
         "stats.throughput",
         ThroughputRequest,
         ThroughputResponse,
         _throughput,
+        access="read",
     ),
     "stats.state_distribution": RpcOperation(
         "stats.state_distribution",
         StateDistributionRequest,
         StateDistributionResponse,
         _state_distribution,
+        access="read",
+    ),
+    "stats.worker_state_counts": RpcOperation(
+        "stats.worker_state_counts",
+        WorkerStateCountsRequest,
+        WorkerStateCountsResponse,
+        _worker_state_counts,
+        access="read",
+    ),
+    "stats.heatmap": RpcOperation("stats.heatmap", HeatmapRequest, HeatmapResponse, _heatmap, access="read"),
+    "stats.rollup.counts": RpcOperation(
+        "stats.rollup.counts",
+        RollupCountsRequest,
+        RollupCountsResponse,
+        _rollup_counts,
+        access="read",
+    ),
+    "stats.rollup.throughput": RpcOperation(
+        "stats.rollup.throughput",
+        RollupThroughputRequest,
+        ThroughputResponse,
+        _rollup_throughput,
+        access="read",
+    ),
+    "stats.rollup.task": RpcOperation(
+        "stats.rollup.task",
+        RollupTaskStatsRequest,
+        TaskStatsResponse,
+        _rollup_task_stats,
+        access="read",
+    ),
+    "stats.rollup.rebuild": RpcOperation(
+        "stats.rollup.rebuild",
+        RebuildRollupsRequest,
+        RebuildRollupsResponse,
+        _rebuild_rollups,
     ),
-    "stats.heatmap": RpcOperation("stats.heatmap", HeatmapRequest, HeatmapResponse, _heatmap),
     "schedules.list": RpcOperation(
         "schedules.list",
         ListSchedulesRequest,
         ListSchedulesResponse,
         _list_schedules,
+        access="read",
     ),
     "schedules.store": RpcOperation(
         "schedules.store",
@@ -439,4 +663,11 @@ RPC_OPERATIONS: dict[str, RpcOperation[Any, Any]] = {
         _delete_schedule,
     ),
     "db.cleanup": RpcOperation("db.cleanup", CleanupRequest, CleanupResponse, _cleanup),
+    "db.retention.status": RpcOperation(
+        "db.retention.status",
+        RetentionStatusRequest,
+        RetentionStatusResponse,
+        _retention_status,
+        access="read",
+    ),
 }
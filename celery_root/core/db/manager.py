@@ -23,17 +23,28 @@ from typing import TYPE_CHECKING, Any
 
 from pydantic import ValidationError
 
-from celery_root.config import DatabaseConfigSqlite, set_settings
+from celery_root.config import DatabaseConfigDuckdb, DatabaseConfigSqlite, set_settings
+from celery_root.core.db.adapters.duckdb import DuckDBController
 from celery_root.core.db.adapters.sqlite import SQLiteController
+from celery_root.core.db.codec import (
+    RpcFrameError,
+    decode_envelope,
+    detect_codec,
+    encode_envelope,
+    msgpack_available,
+    payload_mode,
+)
 from celery_root.core.db.dispatch import RPC_OPERATIONS
+from celery_root.core.db.retention import RetentionScheduler
 from celery_root.core.logging import LogQueueConfig, configure_subprocess_logging
+from celery_root.optional import require_optional_scope
 from celery_root.shared.schemas import RPC_SCHEMA_VERSION, RpcError, RpcRequestEnvelope, RpcResponseEnvelope
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from multiprocessing.connection import Connection
 
-    from celery_root.config import CeleryRootConfig
+    from celery_root.config import CeleryRootConfig, RpcCodec
     from celery_root.core.db.adapters.base import BaseDBController
     from celery_root.core.db.dispatch import RpcOperation
 
@@ -43,6 +54,7 @@ class _ErrorContext:
     request_id: str
     op: str
     duration_ms: float
+    codec: RpcCodec = "json"
 
 
 def _authkey_from_config(config: CeleryRootConfig) -> bytes | None:
@@ -85,8 +97,20 @@ def _build_backend(
     if controller_factory is not None:
         return controller_factory()
     db_config = config.database
+    if isinstance(db_config, DatabaseConfigDuckdb):
+        require_optional_scope("duckdb")
+        return DuckDBController(
+            db_config.db_path,
+            analytics_path=db_config.analytics_path,
+            heartbeat_history_seconds=db_config.heartbeat_history_seconds,
+            archive_path=db_config.archive_path,
+        )
     if isinstance(db_config, DatabaseConfigSqlite):
-        return SQLiteController(db_config.db_path)
+        return SQLiteController(
+            db_config.db_path,
+            heartbeat_history_seconds=db_config.heartbeat_history_seconds,
+            archive_path=db_config.archive_path,
+        )
     msg = f"Unsupported database config: {type(db_config).__name__}"
     raise RuntimeError(msg)
 
@@ -109,6 +133,8 @@ class DBManager(Process):
         self._logger = logging.getLogger(__name__)
         self._address = config.database.rpc_address()
         self._authkey = _authkey_from_config(config)
+        # Read-only controller for ``read`` operations; reads fall back to the writer (under the lock) when unset.
+        self._reader: BaseDBController | None = None
 
     def stop(self) -> None:
         """Signal the DB manager to stop."""
@@ -127,6 +153,11 @@ class DBManager(Process):
         controller = _build_backend(self._config, self._controller_factory)
         controller.initialize()
         controller.ensure_schema()
+        db_config = self._config.database
+        read_pool_size = db_config.read_pool_size if isinstance(db_config, DatabaseConfigSqlite) else 0
+        self._reader = controller.open_reader(read_pool_size)
+        if self._reader is not None:
+            self._logger.info("DBManager serving reads from %d read-only connections.", read_pool_size)
 
         try:
             self._serve(controller)
@@ -134,6 +165,8 @@ class DBManager(Process):
             self._logger.info("DBManager interrupted; shutting down.")
             self._stop_event.set()
         finally:
+            if self._reader is not None:
+                self._reader.close()
             controller.close()
             self._logger.info("DBManager stopped.")
 
@@ -156,6 +189,7 @@ class DBManager(Process):
                 socket_path.unlink()
 
         threading.Thread(target=_watch_stop, daemon=True).start()
+        self._start_retention(controller, lock)
 
         try:
             while not self._stop_event.is_set():
@@ -177,6 +211,26 @@ class DBManager(Process):
             with suppress(OSError):
                 socket_path.unlink()
 
+    def _start_retention(self, controller: BaseDBController, lock: threading.Lock) -> None:
+        db_config = self._config.database
+        if not isinstance(db_config, DatabaseConfigSqlite):
+            return
+        RetentionScheduler(
+            controller,
+            lock,
+            self._stop_event,
+            retention_days=db_config.retention_days,
+            interval_seconds=db_config.retention_interval_seconds,
+            chunk_size=db_config.retention_chunk_size,
+            maintenance=db_config.retention_maintenance,
+        ).start()
+        self._logger.info(
+            "DBManager retention every %.0fs (keep %d days, chunks of %d rows).",
+            db_config.retention_interval_seconds,
+            db_config.retention_days,
+            db_config.retention_chunk_size,
+        )
+
     def _handle_connection(
         self,
         conn: Connection,
@@ -195,6 +249,7 @@ class DBManager(Process):
                         request_id=uuid.uuid4().hex,
                         code="BUSY",
                         message="DB manager is busy",
+                        codec=self._reply_codec(data),
                     )
                     conn.send_bytes(response)
                     continue
@@ -214,16 +269,14 @@ class DBManager(Process):
         request_id = uuid.uuid4().hex
         op = "unknown"
         start = time.monotonic()
-        max_bytes = self._config.database.rpc_max_message_bytes
+        codec = self._reply_codec(data)
 
         try:
-            if len(data) > max_bytes:
-                return self._error_response(
-                    request_id=request_id,
-                    code="MESSAGE_TOO_LARGE",
-                    message="RPC request exceeded max message size",
-                )
-            envelope = RpcRequestEnvelope.model_validate_json(data)
+            rejection = self._reject_frame(data, codec)
+            if rejection is not None:
+                code, message = rejection
+                return self._error_response(request_id=request_id, code=code, message=message, codec=codec)
+            envelope = decode_envelope(data, RpcRequestEnvelope)
             request_id = envelope.request_id
             op = envelope.op
             self._logger.debug(
@@ -238,6 +291,7 @@ class DBManager(Process):
                     request_id=request_id,
                     code="SCHEMA_UNSUPPORTED",
                     message="Unsupported RPC schema version",
+                    codec=codec,
                 )
             operation = RPC_OPERATIONS.get(op)
             if operation is None:
@@ -245,15 +299,17 @@ class DBManager(Process):
                     request_id=request_id,
                     code="OP_NOT_FOUND",
                     message=f"Unknown operation: {op}",
+                    codec=codec,
                 )
-            response_payload = self._handle_operation(operation, envelope.payload, controller, lock)
+            response_payload = self._handle_operation(operation, envelope.payload, controller, lock, codec)
             response = RpcResponseEnvelope(
                 request_id=request_id,
                 ok=True,
                 payload=response_payload,
                 timestamp=datetime.now(UTC),
+                codec=codec,
             )
-            response_bytes = response.model_dump_json().encode("utf-8")
+            response_bytes = encode_envelope(response, codec)
             self._logger.debug(
                 "DB RPC ok request_id=%s op=%s payload_bytes=%s",
                 request_id,
@@ -267,13 +323,13 @@ class DBManager(Process):
                 op,
                 duration_ms,
             )
-        except ValidationError as exc:
+        except (ValidationError, RpcFrameError) as exc:
             duration_ms = (time.monotonic() - start) * 1000.0
-            context = _ErrorContext(request_id=request_id, op=op, duration_ms=duration_ms)
+            context = _ErrorContext(request_id=request_id, op=op, duration_ms=duration_ms, codec=codec)
             return self._handle_error(context, "VALIDATION_ERROR", "Invalid RPC payload", exc)
         except Exception as exc:  # pragma: no cover - defensive  # noqa: BLE001
             duration_ms = (time.monotonic() - start) * 1000.0
-            context = _ErrorContext(request_id=request_id, op=op, duration_ms=duration_ms)
+            context = _ErrorContext(request_id=request_id, op=op, duration_ms=duration_ms, codec=codec)
             return self._handle_error(context, "SERVER_ERROR", "RPC handler failed", exc)
         else:
             return response_bytes
@@ -284,12 +340,16 @@ class DBManager(Process):
         payload: dict[str, Any] | list[Any] | None,
         controller: BaseDBController,
         lock: threading.Lock,
+        codec: RpcCodec = "json",
     ) -> dict[str, Any] | list[Any] | None:
         payload_dict = payload if isinstance(payload, dict) else {}
         request_model = operation.request_model.model_validate(payload_dict)
-        with lock:
-            response_model = operation.handler(controller, request_model)
-        return response_model.model_dump(mode="json")
+        if operation.access == "read" and self._reader is not None:
+            response_model = operation.handler(self._reader, request_model)
+        else:
+            with lock:
+                response_model = operation.handler(controller, request_model)
+        return response_model.model_dump(mode=payload_mode(codec))
 
     def _handle_error(
         self,
@@ -324,15 +384,32 @@ class DBManager(Process):
             ok=False,
             error=error,
             timestamp=datetime.now(UTC),
+            codec=context.codec,
         )
-        return response.model_dump_json().encode("utf-8")
+        return encode_envelope(response, context.codec)
+
+    def _reject_frame(self, data: bytes, codec: RpcCodec) -> tuple[str, str] | None:
+        if len(data) > self._config.database.rpc_max_message_bytes:
+            return "MESSAGE_TOO_LARGE", "RPC request exceeded max message size"
+        if codec != detect_codec(data):
+            return "CODEC_UNSUPPORTED", "RPC codec is not available on the DB manager"
+        return None
+
+    @staticmethod
+    def _reply_codec(data: bytes) -> RpcCodec:
+        """Answer in the request's codec, or JSON when that codec is unavailable here."""
+        codec = detect_codec(data)
+        if codec == "msgpack" and not msgpack_available():
+            return "json"
+        return codec
 
     @staticmethod
-    def _error_response(request_id: str, code: str, message: str) -> bytes:
+    def _error_response(request_id: str, code: str, message: str, codec: RpcCodec = "json") -> bytes:
         response = RpcResponseEnvelope(
             request_id=request_id,
             ok=False,
             error=RpcError(code=code, message=message),
             timestamp=datetime.now(UTC),
+            codec=codec,
         )
-        return response.model_dump_json().encode("utf-8")
+        return encode_envelope(response, codec)
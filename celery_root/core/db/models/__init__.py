@@ -8,12 +8,20 @@
 
 from celery_root.shared.schemas import (
     BrokerQueueEvent,
+    BrokerQueueSample,
+    EventListenerStats,
+    RollupDimension,
     Schedule,
     Task,
+    TaskCursor,
     TaskEvent,
     TaskFilter,
+    TaskGraph,
+    TaskGraphChanges,
     TaskRelation,
+    TaskRollupCount,
     TaskStats,
+    TaskSummary,
     ThroughputBucket,
     TimeRange,
     Worker,
@@ -23,12 +31,20 @@ from celery_root.shared.schemas import (
 
 __all__ = [
     "BrokerQueueEvent",
+    "BrokerQueueSample",
+    "EventListenerStats",
+    "RollupDimension",
     "Schedule",
     "Task",
+    "TaskCursor",
     "TaskEvent",
     "TaskFilter",
+    "TaskGraph",
+    "TaskGraphChanges",
     "TaskRelation",
+    "TaskRollupCount",
     "TaskStats",
+    "TaskSummary",
     "ThroughputBucket",
     "TimeRange",
     "Worker",
@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Background retention job run inside the DB manager."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from celery_root.shared.schemas import RetentionStatusResponse
+
+if TYPE_CHECKING:
+    from multiprocessing.synchronize import Event
+
+    from celery_root.config import RetentionMaintenance
+    from celery_root.core.db.adapters.base import BaseDBController
+
+_LOGGER = logging.getLogger(__name__)
+# Pause between chunks so RPC handlers waiting on the DB lock get a turn.
+_CHUNK_PAUSE_SECONDS = 0.01
+_ACTIVE: list[RetentionScheduler | None] = [None]
+
+
+def retention_status() -> RetentionStatusResponse:
+    """Return the progress of the retention job running in this process."""
+    scheduler = _ACTIVE[0]
+    if scheduler is None:
+        return RetentionStatusResponse()
+    return scheduler.status()
+
+
+class RetentionScheduler:
+    """Periodically delete expired rows in bounded chunks, releasing the DB lock between chunks."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        controller: BaseDBController,
+        lock: threading.Lock,
+        stop_event: Event,
+        *,
+        retention_days: int,
+        interval_seconds: float,
+        chunk_size: int,
+        maintenance: RetentionMaintenance = "none",
+    ) -> None:
+        """Create a scheduler; call :meth:`start` to run it in a daemon thread."""
+        self._controller = controller
+        self._lock = lock
+        self._stop_event = stop_event
+        self._retention_days = retention_days
+        self._interval_seconds = interval_seconds
+        self._chunk_size = chunk_size
+        self._maintenance = maintenance
+        self._status_lock = threading.Lock()
+        self._status = RetentionStatusResponse(enabled=True, retention_days=retention_days)
+
+    def start(self) -> threading.Thread:
+        """Start the scheduler loop and register it as this process's active retention job."""
+        _ACTIVE[0] = self
+        thread = threading.Thread(target=self._loop, name="db-retention", daemon=True)
+        thread.start()
+        return thread
+
+    def status(self) -> RetentionStatusResponse:
+        """Return a snapshot of the progress metrics."""
+        with self._status_lock:
+            return self._status.model_copy(deep=True)
+
+    def run_once(self) -> int:
+        """Delete everything older than the retention window and return the rows removed."""
+        started = datetime.now(UTC)
+        began = time.monotonic()
+        cutoff = started - timedelta(days=self._retention_days)
+        with self._status_lock:
+            self._status.running = True
+            self._status.last_started = started
+            self._status.chunks = 0
+            self._status.last_removed = 0
+            self._status.removed_by_table = {}
+        try:
+            while not self._stop_event.is_set():
+                with self._lock:
+                    chunk = self._controller.purge_expired(cutoff, self._chunk_size)
+                if chunk is None:
+                    break
+                table, removed = chunk
+                with self._status_lock:
+                    self._status.chunks += 1
+                    self._status.last_removed += removed
+                    self._status.total_removed += removed
+                    self._status.removed_by_table[table] = self._status.removed_by_table.get(table, 0) + removed
+                self._stop_event.wait(_CHUNK_PAUSE_SECONDS)
+            if self._maintenance != "none" and not self._stop_event.is_set():
+                with self._lock:
+                    self._controller.compact(self._maintenance)
+        except Exception as exc:
+            with self._status_lock:
+                self._status.last_error = str(exc)
+            raise
+        finally:
+            with self._status_lock:
+                self._status.running = False
+                self._status.runs += 1
+                self._status.last_finished = datetime.now(UTC)
+                self._status.last_duration_seconds = time.monotonic() - began
+                removed_total = self._status.last_removed
+                chunks = self._status.chunks
+        _LOGGER.info(
+            "DB retention removed %d rows older than %d days in %d chunks (%.1fs).",
+            removed_total,
+            self._retention_days,
+            chunks,
+            time.monotonic() - began,
+        )
+        return removed_total
+
+    def _loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                _LOGGER.exception("DB retention run failed.")
+            self._stop_event.wait(self._interval_seconds)
@@ -8,32 +8,51 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+import threading
+import time
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from multiprocessing.connection import Client, Connection
-from typing import TYPE_CHECKING, Any, Self, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Literal, Self, TypeVar, cast
 
 from pydantic import BaseModel, ValidationError
 
 from celery_root.core.db.adapters.base import BaseDBController
+from celery_root.core.db.codec import decode_envelope, encode_envelope, payload_mode
+from celery_root.optional import require_optional_scope
 from celery_root.shared.schemas import (
+    BrokerQueueHistoryRequest,
+    BrokerQueueHistoryResponse,
     BrokerQueueSnapshotRequest,
     BrokerQueueSnapshotResponse,
+    BuildTaskGraphRequest,
+    BuildTaskGraphResponse,
     CleanupRequest,
     CleanupResponse,
     DbInfoRequest,
     DbInfoResponse,
     DeleteScheduleRequest,
+    GetManyTasksRequest,
+    GetManyTasksResponse,
     GetTaskRequest,
     GetTaskResponse,
     GetWorkerRequest,
     GetWorkerResponse,
     HeatmapRequest,
     HeatmapResponse,
+    IngestBrokerQueueEventBatchRequest,
+    IngestBrokerQueueEventBatchResponse,
     IngestBrokerQueueEventRequest,
+    IngestTaskEventBatchRequest,
+    IngestTaskEventBatchResponse,
     IngestTaskEventRequest,
+    IngestWorkerEventBatchRequest,
+    IngestWorkerEventBatchResponse,
     IngestWorkerEventRequest,
     ListSchedulesRequest,
     ListSchedulesResponse,
@@ -52,9 +71,19 @@ from celery_root.shared.schemas import (
     PingResponse,
     RawQueryRequest,
     RawQueryResponse,
+    RebuildRollupsRequest,
+    RebuildRollupsResponse,
+    RetentionStatusRequest,
+    RetentionStatusResponse,
+    RollupCountsRequest,
+    RollupCountsResponse,
+    RollupTaskStatsRequest,
+    RollupThroughputRequest,
     RpcError,
     RpcRequestEnvelope,
     RpcResponseEnvelope,
+    ScanTasksRequest,
+    ScanTasksResponse,
     SchemaRequest,
     SchemaResponse,
     SchemaVersionRequest,
@@ -63,26 +92,37 @@ from celery_root.shared.schemas import (
     StateDistributionResponse,
     StoreScheduleRequest,
     StoreTaskRelationRequest,
+    TaskGraphChangesRequest,
+    TaskGraphChangesResponse,
     TaskStatsRequest,
     TaskStatsResponse,
     ThroughputRequest,
     ThroughputResponse,
     WorkerEventSnapshotRequest,
     WorkerEventSnapshotResponse,
+    WorkerStateCountsRequest,
+    WorkerStateCountsResponse,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping, Sequence
 
-    from celery_root.config import CeleryRootConfig
+    from celery_root.config import CeleryRootConfig, RpcCodec
     from celery_root.shared.schemas.domain import (
         BrokerQueueEvent,
+        BrokerQueueSample,
+        RollupDimension,
         Schedule,
         Task,
+        TaskCursor,
         TaskEvent,
         TaskFilter,
+        TaskGraph,
+        TaskGraphChanges,
         TaskRelation,
+        TaskRollupCount,
         TaskStats,
+        TaskSummary,
         ThroughputBucket,
         TimeRange,
         Worker,
@@ -104,6 +144,10 @@ class RpcCallError(RuntimeError):
         self.error = error
 
 
+class RpcMessageTooLargeError(ValueError):
+    """Raised when an RPC request exceeds the configured message size limit."""
+
+
 def _authkey_from_config(config: CeleryRootConfig) -> bytes | None:
     auth = config.database.rpc_auth_key
     if not auth:
@@ -117,6 +161,7 @@ class _RpcSettings:
     authkey: bytes | None
     timeout_seconds: float
     max_message_bytes: int
+    codec: RpcCodec = "json"
 
 
 class _RpcTransport:
@@ -126,6 +171,7 @@ class _RpcTransport:
         self._settings = settings
         self._client_name = client_name
         self._connection: Connection | None = None
+        self._codec: RpcCodec = settings.codec
 
     def connect(self) -> None:
         if self._connection is not None:
@@ -139,6 +185,14 @@ class _RpcTransport:
         self._connection.close()
         self._connection = None
 
+    @property
+    def connected(self) -> bool:
+        return self._connection is not None
+
+    @property
+    def payload_mode(self) -> Literal["json", "python"]:
+        return payload_mode(self._codec)
+
     def request(
         self,
         op: str,
@@ -154,8 +208,9 @@ class _RpcTransport:
             payload=dict(payload) if payload is not None else None,
             timestamp=datetime.now(UTC),
             client=self._client_name,
+            codec=self._codec,
         )
-        data = envelope.model_dump_json().encode("utf-8")
+        data = encode_envelope(envelope, self._codec)
         _LOGGER.debug(
             "RPC request start op=%s request_id=%s bytes=%d timeout=%.2f retries=%d",
             op,
@@ -166,29 +221,28 @@ class _RpcTransport:
         )
         if len(data) > self._settings.max_message_bytes:
             msg = f"RPC request too large ({len(data)} bytes)"
-            raise ValueError(msg)
+            raise RpcMessageTooLargeError(msg)
 
         timeout = timeout_seconds or self._settings.timeout_seconds
         attempts = max_retries + 1
         last_error: Exception | None = None
-        for _ in range(attempts):
+        reconnected = False
+        while attempts > 0:
+            attempts -= 1
+            reused = self._connection is not None
             try:
-                self.connect()
-                if self._connection is None:
-                    msg = "RPC connection unavailable"
-                    raise RuntimeError(msg)
-                self._connection.send_bytes(data)
-                poll_ok = self._connection.poll(timeout)
-                if not poll_ok:
+                resp_bytes = self._exchange(data, timeout)
+                if resp_bytes is None:
                     msg = "RPC response timed out"
                     last_error = TimeoutError(msg)
                     self.close()
                     continue
-                resp_bytes = self._connection.recv_bytes()
-                if len(resp_bytes) > self._settings.max_message_bytes:
-                    msg = f"RPC response too large ({len(resp_bytes)} bytes)"
-                    raise ValueError(msg)
-                response = RpcResponseEnvelope.model_validate_json(resp_bytes)
+                response = decode_envelope(resp_bytes, RpcResponseEnvelope)
+                if envelope.codec != "json" and _codec_rejected(response):
+                    envelope = self._fall_back_to_json(envelope, response)
+                    data = encode_envelope(envelope, "json")
+                    attempts += 1
+                    continue
                 _LOGGER.debug(
                     "RPC response recv op=%s request_id=%s ok=%s bytes=%d",
                     op,
@@ -206,30 +260,85 @@ class _RpcTransport:
                 last_error = exc
                 _LOGGER.debug("RPC request failed to %s: %s", self._settings.address, exc)
                 self.close()
+                if reused and not reconnected and isinstance(exc, (OSError, EOFError)):
+                    # A kept-alive connection went stale (e.g. the DB manager restarted); retry once on a
+                    # fresh connection without consuming a retry.
+                    reconnected = True
+                    attempts += 1
                 continue
             else:
                 return response
         msg = f"RPC request failed (address={self._settings.address})"
         raise RuntimeError(msg) from last_error
 
+    def _exchange(self, data: bytes, timeout: float) -> bytes | None:
+        """Send one frame and return the reply, or ``None`` when it timed out."""
+        self.connect()
+        if self._connection is None:
+            msg = "RPC connection unavailable"
+            raise RuntimeError(msg)
+        self._connection.send_bytes(data)
+        if not self._connection.poll(timeout):
+            return None
+        resp_bytes = self._connection.recv_bytes()
+        if len(resp_bytes) > self._settings.max_message_bytes:
+            msg = f"RPC response too large ({len(resp_bytes)} bytes)"
+            raise RpcMessageTooLargeError(msg)
+        return resp_bytes
+
+    def _fall_back_to_json(
+        self,
+        envelope: RpcRequestEnvelope,
+        response: RpcResponseEnvelope,
+    ) -> RpcRequestEnvelope:
+        """Switch this connection to JSON after the DB manager rejected the binary codec."""
+        _LOGGER.warning(
+            "DB manager rejected the %s codec (%s); falling back to JSON.",
+            envelope.codec,
+            response.error.code if response.error is not None else "UNKNOWN",
+        )
+        self._codec = "json"
+        return envelope.model_copy(update={"codec": "json"})
+
+
+def _codec_rejected(response: RpcResponseEnvelope) -> bool:
+    return not response.ok and response.error is not None and response.error.code == "CODEC_UNSUPPORTED"
+
+
+def _settings_from_config(config: CeleryRootConfig) -> _RpcSettings:
+    return _RpcSettings(
+        address=config.database.rpc_address(),
+        authkey=_authkey_from_config(config),
+        timeout_seconds=config.database.rpc_timeout_seconds,
+        max_message_bytes=config.database.rpc_max_message_bytes,
+        codec=_codec_from_config(config),
+    )
+
+
+def _codec_from_config(config: CeleryRootConfig) -> RpcCodec:
+    codec = config.database.rpc_codec
+    if codec == "msgpack":
+        require_optional_scope("msgpack")
+    return codec
+
 
 class DbRpcClient(BaseDBController):
     """RPC-backed DB client implementing the DB controller interface."""
 
-    def __init__(self, settings: _RpcSettings, *, client_name: str | None = None) -> None:
-        """Initialize the RPC client."""
-        self._transport = _RpcTransport(settings, client_name)
+    def __init__(
+        self,
+        settings: _RpcSettings,
+        *,
+        client_name: str | None = None,
+        transport: _RpcTransport | None = None,
+    ) -> None:
+        """Initialize the RPC client, optionally on top of an existing (pooled) transport."""
+        self._transport = transport if transport is not None else _RpcTransport(settings, client_name)
 
     @classmethod
     def from_config(cls, config: CeleryRootConfig, *, client_name: str | None = None) -> DbRpcClient:
         """Create a client from shared configuration settings."""
-        settings = _RpcSettings(
-            address=config.database.rpc_address(),
-            authkey=_authkey_from_config(config),
-            timeout_seconds=config.database.rpc_timeout_seconds,
-            max_message_bytes=config.database.rpc_max_message_bytes,
-        )
-        return cls(settings, client_name=client_name)
+        return cls(_settings_from_config(config), client_name=client_name)
 
     def connect(self) -> None:
         """Open the RPC connection."""
@@ -291,11 +400,60 @@ class DbRpcClient(BaseDBController):
         """Persist a task event via RPC."""
         _ = self._call("events.task.ingest", IngestTaskEventRequest(event=event), Ok)
 
-    def get_tasks(self, filters: TaskFilter | None = None) -> list[Task]:
-        """Return tasks matching optional filters."""
+    def store_task_events(self, events: Sequence[TaskEvent]) -> None:
+        """Persist a batch of task events in a single RPC round trip.
+
+        Batches that exceed the RPC message size limit are split in half and retried.
+        """
+        if not events:
+            return
+        request = IngestTaskEventBatchRequest(events=list(events))
+        try:
+            _ = self._call("events.task.ingest_batch", request, IngestTaskEventBatchResponse)
+        except RpcMessageTooLargeError:
+            if len(events) == 1:
+                raise
+            middle = len(events) // 2
+            self.store_task_events(events[:middle])
+            self.store_task_events(events[middle:])
+
+    def get_tasks(self, filters: TaskFilter | None = None) -> list[TaskSummary]:
+        """Return summaries of the tasks matching optional filters."""
         response = self._call("tasks.list", ListTasksRequest(filters=filters), ListTasksResponse)
         return response.tasks
 
+    def scan_tasks(
+        self,
+        filters: TaskFilter | None,
+        *,
+        cursor: TaskCursor | None,
+        limit: int,
+    ) -> tuple[list[TaskSummary], TaskCursor | None]:
+        """Return one chunk of a keyset-paginated task scan and the cursor for the next chunk."""
+        request = ScanTasksRequest(filters=filters, cursor=cursor, limit=limit)
+        response = self._call("tasks.scan", request, ScanTasksResponse)
+        return response.tasks, response.next_cursor
+
+    def iter_tasks(self, filters: TaskFilter | None = None, *, chunk_size: int = 500) -> Iterator[TaskSummary]:
+        """Yield summaries of all tasks matching ``filters``, newest first, fetching ``chunk_size`` tasks per RPC call.
+
+        Chunks whose response exceeds the RPC message size limit are re-requested at half the size.
+        """
+        cursor: TaskCursor | None = None
+        limit = chunk_size
+        while True:
+            try:
+                tasks, next_cursor = self.scan_tasks(filters, cursor=cursor, limit=limit)
+            except RpcMessageTooLargeError:
+                if limit == 1:
+                    raise
+                limit = max(limit // 2, 1)
+                continue
+            yield from tasks
+            if next_cursor is None:
+                return
+            cursor = next_cursor
+
     def get_tasks_page(
         self,
         filters: TaskFilter | None,
@@ -304,8 +462,8 @@ class DbRpcClient(BaseDBController):
         sort_dir: str | None,
         limit: int,
         offset: int,
-    ) -> tuple[list[Task], int]:
-        """Return paginated tasks and total count."""
+    ) -> tuple[list[TaskSummary], int]:
+        """Return paginated task summaries and total count."""
         request = ListTasksPageRequest(
             filters=filters,
             sort_key=sort_key,
@@ -326,6 +484,27 @@ class DbRpcClient(BaseDBController):
         response = self._call("tasks.get", GetTaskRequest(task_id=task_id), GetTaskResponse)
         return response.task
 
+    def get_tasks_by_id(self, task_ids: Sequence[str]) -> list[Task]:
+        """Return the stored tasks among ``task_ids`` in a single round trip."""
+        if not task_ids:
+            return []
+        response = self._call("tasks.get_many", GetManyTasksRequest(task_ids=list(task_ids)), GetManyTasksResponse)
+        return response.tasks
+
+    def get_task_graph(self, task_id: str) -> TaskGraph | None:
+        """Return the workflow graph containing ``task_id``, assembled by the DB manager."""
+        response = self._call("graph.build", BuildTaskGraphRequest(task_id=task_id), BuildTaskGraphResponse)
+        return response.graph
+
+    def get_task_graph_changes(self, task_id: str, since: int) -> TaskGraphChanges | None:
+        """Return what changed in the workflow containing ``task_id`` after the cursor ``since``."""
+        response = self._call(
+            "graph.changes",
+            TaskGraphChangesRequest(task_id=task_id, since=since),
+            TaskGraphChangesResponse,
+        )
+        return response.changes
+
     def store_task_relation(self, relation: TaskRelation) -> None:
         """Persist a task relation edge."""
         _ = self._call("relations.store", StoreTaskRelationRequest(relation=relation), Ok)
@@ -343,10 +522,44 @@ class DbRpcClient(BaseDBController):
         """Persist a worker event."""
         _ = self._call("events.worker.ingest", IngestWorkerEventRequest(event=event), Ok)
 
+    def store_worker_events(self, events: Sequence[WorkerEvent]) -> None:
+        """Persist a batch of worker events in a single RPC round trip.
+
+        Batches that exceed the RPC message size limit are split in half and retried.
+        """
+        if not events:
+            return
+        request = IngestWorkerEventBatchRequest(events=list(events))
+        try:
+            _ = self._call("events.worker.ingest_batch", request, IngestWorkerEventBatchResponse)
+        except RpcMessageTooLargeError:
+            if len(events) == 1:
+                raise
+            middle = len(events) // 2
+            self.store_worker_events(events[:middle])
+            self.store_worker_events(events[middle:])
+
     def store_broker_queue_event(self, event: BrokerQueueEvent) -> None:
         """Persist a broker queue snapshot."""
         _ = self._call("events.broker_queue.ingest", IngestBrokerQueueEventRequest(event=event), Ok)
 
+    def store_broker_queue_events(self, events: Sequence[BrokerQueueEvent]) -> None:
+        """Persist a batch of broker queue snapshots in a single RPC round trip.
+
+        Batches that exceed the RPC message size limit are split in half and retried.
+        """
+        if not events:
+            return
+        request = IngestBrokerQueueEventBatchRequest(events=list(events))
+        try:
+            _ = self._call("events.broker_queue.ingest_batch", request, IngestBrokerQueueEventBatchResponse)
+        except RpcMessageTooLargeError:
+            if len(events) == 1:
+                raise
+            middle = len(events) // 2
+            self.store_broker_queue_events(events[:middle])
+            self.store_broker_queue_events(events[middle:])
+
     def get_broker_queue_snapshot(self, broker_url: str) -> list[BrokerQueueEvent]:
         """Return latest broker queue snapshots."""
         response = self._call(
@@ -356,6 +569,20 @@ class DbRpcClient(BaseDBController):
         )
         return response.events
 
+    def get_broker_queue_history(
+        self,
+        broker_url: str,
+        queue: str,
+        time_range: TimeRange,
+    ) -> list[BrokerQueueSample]:
+        """Return the depth history of a queue, oldest first."""
+        response = self._call(
+            "broker.queues.history",
+            BrokerQueueHistoryRequest(broker_url=broker_url, queue=queue, time_range=time_range),
+            BrokerQueueHistoryResponse,
+        )
+        return response.samples
+
     def get_workers(self) -> list[Worker]:
         """Return all known workers."""
         response = self._call("workers.list", ListWorkersRequest(), ListWorkersResponse)
@@ -402,11 +629,56 @@ class DbRpcClient(BaseDBController):
         )
         return response.counts
 
+    def get_worker_state_counts(self) -> dict[str, dict[str, int]]:
+        """Return task counts by state for each worker."""
+        response = self._call(
+            "stats.worker_state_counts",
+            WorkerStateCountsRequest(),
+            WorkerStateCountsResponse,
+        )
+        return response.counts
+
     def get_heatmap(self, time_range: TimeRange | None) -> list[list[int]]:
         """Return a heatmap of task activity."""
         response = self._call("stats.heatmap", HeatmapRequest(time_range=time_range), HeatmapResponse)
         return response.heatmap
 
+    def get_rollup_counts(
+        self,
+        time_range: TimeRange | None,
+        group_by: Sequence[RollupDimension] = (),
+    ) -> list[TaskRollupCount]:
+        """Return pre-aggregated task counts grouped by the requested dimensions."""
+        response = self._call(
+            "stats.rollup.counts",
+            RollupCountsRequest(time_range=time_range, group_by=list(group_by)),
+            RollupCountsResponse,
+        )
+        return response.counts
+
+    def get_rollup_throughput(self, time_range: TimeRange, bucket_seconds: int) -> list[ThroughputBucket]:
+        """Return throughput buckets from the rollup tables."""
+        response = self._call(
+            "stats.rollup.throughput",
+            RollupThroughputRequest(time_range=time_range, bucket_seconds=bucket_seconds),
+            ThroughputResponse,
+        )
+        return response.buckets
+
+    def get_rollup_task_stats(self, task_name: str | None, time_range: TimeRange | None) -> TaskStats:
+        """Return task statistics estimated from the runtime histogram."""
+        response = self._call(
+            "stats.rollup.task",
+            RollupTaskStatsRequest(task_name=task_name, time_range=time_range),
+            TaskStatsResponse,
+        )
+        return response.stats
+
+    def rebuild_rollups(self) -> int:
+        """Rebuild the rollup tables from stored history."""
+        response = self._call("stats.rollup.rebuild", RebuildRollupsRequest(), RebuildRollupsResponse)
+        return response.tasks
+
     def get_schedules(self) -> list[Schedule]:
         """Return all stored schedules."""
         response = self._call("schedules.list", ListSchedulesRequest(), ListSchedulesResponse)
@@ -425,6 +697,10 @@ class DbRpcClient(BaseDBController):
         response = self._call("db.cleanup", CleanupRequest(older_than_days=older_than_days), CleanupResponse)
         return response.removed
 
+    def get_retention_status(self) -> RetentionStatusResponse:
+        """Return progress metrics of the DB manager's background retention job."""
+        return self._call("db.retention.status", RetentionStatusRequest(), RetentionStatusResponse)
+
     def __enter__(self) -> Self:
         """Enter the context manager and connect."""
         self.connect()
@@ -443,7 +719,7 @@ class DbRpcClient(BaseDBController):
         timeout_seconds: float | None = None,
         max_retries: int = 0,
     ) -> ResT:
-        payload = request.model_dump(mode="json")
+        payload = request.model_dump(mode=self._transport.payload_mode)
         response = self._transport.request(
             op,
             payload,
@@ -462,3 +738,130 @@ class DbRpcClient(BaseDBController):
         if response.payload is None:
             return response_model()
         return response_model.model_validate(cast("Mapping[str, Any]", response.payload))
+
+
+@dataclass(slots=True)
+class _PooledTransport:
+    transport: _RpcTransport
+    last_used: float
+
+
+class DbRpcClientPool:
+    """Thread-safe pool of persistent DB RPC connections.
+
+    Connections are opened lazily, reused across threads, health-checked with ``db.ping`` after
+    sitting idle, and transparently re-established when the DB manager drops them.
+    """
+
+    def __init__(
+        self,
+        settings: _RpcSettings,
+        *,
+        size: int,
+        health_check_seconds: float,
+        client_name: str | None = None,
+    ) -> None:
+        """Initialize an empty pool holding at most ``size`` connections."""
+        self._settings = settings
+        self._size = size
+        self._health_check_seconds = health_check_seconds
+        self._client_name = client_name
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: queue.LifoQueue[_PooledTransport] = queue.LifoQueue()
+        self._closed = False
+
+    @classmethod
+    def from_config(cls, config: CeleryRootConfig, *, client_name: str | None = None) -> DbRpcClientPool:
+        """Create a pool from shared configuration settings."""
+        return cls(
+            _settings_from_config(config),
+            size=config.database.rpc_pool_size,
+            health_check_seconds=config.database.rpc_pool_health_check_seconds,
+            client_name=client_name,
+        )
+
+    @property
+    def size(self) -> int:
+        """Return the maximum number of pooled connections."""
+        return self._size
+
+    @contextmanager
+    def client(self) -> Iterator[DbRpcClient]:
+        """Borrow a connection for the duration of the block."""
+        if self._closed:
+            msg = "RPC connection pool is closed"
+            raise RuntimeError(msg)
+        if not self._slots.acquire(timeout=self._settings.timeout_seconds):
+            msg = f"RPC connection pool exhausted (size={self._size})"
+            raise RuntimeError(msg)
+        pooled: _PooledTransport | None = None
+        try:
+            pooled = self._checkout()
+            yield DbRpcClient(self._settings, transport=pooled.transport)
+        finally:
+            if pooled is not None:
+                pooled.last_used = time.monotonic()
+                if self._closed:
+                    pooled.transport.close()
+                else:
+                    self._idle.put(pooled)
+            self._slots.release()
+
+    def close(self) -> None:
+        """Close all idle connections; borrowed ones are closed when returned."""
+        self._closed = True
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            pooled.transport.close()
+
+    def _checkout(self) -> _PooledTransport:
+        try:
+            pooled = self._idle.get_nowait()
+        except queue.Empty:
+            return _PooledTransport(_RpcTransport(self._settings, self._client_name), time.monotonic())
+        idle_for = time.monotonic() - pooled.last_used
+        if pooled.transport.connected and idle_for >= self._health_check_seconds:
+            self._health_check(pooled.transport)
+        return pooled
+
+    def _health_check(self, transport: _RpcTransport) -> None:
+        try:
+            response = transport.request("db.ping", None)
+        except (RuntimeError, ValueError) as exc:
+            _LOGGER.debug("RPC pool health check failed: %s", exc)
+            transport.close()
+            return
+        if not response.ok:
+            transport.close()
+
+
+_SHARED_POOLS: dict[tuple[str, bytes | None, str | None], DbRpcClientPool] = {}
+_SHARED_POOLS_LOCK = threading.Lock()
+
+
+def shared_pool(config: CeleryRootConfig, *, client_name: str | None = None) -> DbRpcClientPool:
+    """Return the process-wide connection pool for the configured DB manager and client name."""
+    settings = _settings_from_config(config)
+    key = (settings.address, settings.authkey, client_name)
+    with _SHARED_POOLS_LOCK:
+        pool = _SHARED_POOLS.get(key)
+        if pool is None:
+            pool = DbRpcClientPool.from_config(config, client_name=client_name)
+            _SHARED_POOLS[key] = pool
+        return pool
+
+
+def close_shared_pools() -> None:
+    """Close and forget every process-wide connection pool."""
+    with _SHARED_POOLS_LOCK:
+        pools = list(_SHARED_POOLS.values())
+        _SHARED_POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+# Web and MCP apps hosted by an external server keep their pools for the process lifetime.
+atexit.register(close_shared_pools)
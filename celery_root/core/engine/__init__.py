@@ -6,9 +6,9 @@
 
 """Convenience helpers for Root operations."""
 
-from .backend import StoredResult, clear_results, list_results
+from .backend import StoredResult, clear_results, get_task_metas, list_results
 from .beat import delete_schedule, detect_backend, list_schedules, save_schedule
-from .brokers import QueueInfo, list_queues, purge_queues
+from .brokers import QueueInfo, broker_queue_stats, list_queues, purge_queues, queue_stats
 from .health import health_check
 from .retry import smart_retry
 from .tasks import rate_limit, revoke, send_task, time_limit
@@ -19,10 +19,12 @@ __all__ = [
     "StoredResult",
     "add_consumer",
     "autoscale",
+    "broker_queue_stats",
     "clear_results",
     "delete_schedule",
     "detect_backend",
     "get_stats",
+    "get_task_metas",
     "health_check",
     "list_queues",
     "list_results",
@@ -30,6 +32,7 @@ __all__ = [
     "pool_grow",
     "pool_shrink",
     "purge_queues",
+    "queue_stats",
     "rate_limit",
     "remove_consumer",
     "restart",
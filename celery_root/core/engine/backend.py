@@ -8,7 +8,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from fnmatch import fnmatch
 from typing import TYPE_CHECKING
@@ -18,7 +18,9 @@ if TYPE_CHECKING:
 
     from celery_root.core.registry import WorkerRegistry
 
-__all__ = ["StoredResult", "clear_results", "list_results"]
+__all__ = ["StoredResult", "clear_results", "get_task_metas", "list_results"]
+
+_META_CHUNK_SIZE = 250
 
 
 @dataclass(slots=True)
@@ -107,6 +109,55 @@ def clear_results(
     return cleared
 
 
+def get_task_metas(
+    backend: object,
+    task_ids: Sequence[str],
+    *,
+    chunk_size: int = _META_CHUNK_SIZE,
+) -> dict[str, Mapping[str, object]]:
+    """Return stored result metadata for many tasks, ``chunk_size`` ids per backend round trip.
+
+    Key-value backends such as Redis are read with one ``mget`` per chunk and SQLAlchemy backends
+    with one ``IN`` query per chunk. Other backends fall back to ``get_task_meta`` per task. Tasks
+    without a stored result may be missing from the returned mapping.
+    """
+    metas: dict[str, Mapping[str, object]] = {}
+    for start in range(0, len(task_ids), chunk_size):
+        metas.update(_fetch_task_metas(backend, task_ids[start : start + chunk_size]))
+    return metas
+
+
+def _fetch_task_metas(backend: object, task_ids: Sequence[str]) -> dict[str, Mapping[str, object]]:
+    mget = getattr(backend, "mget", None)
+    get_key_for_task = getattr(backend, "get_key_for_task", None)
+    decode_result = getattr(backend, "decode_result", None)
+    if callable(mget) and callable(get_key_for_task) and callable(decode_result):
+        keys = [get_key_for_task(task_id) for task_id in task_ids]
+        values = mget(keys)
+        # Memcached-style clients answer with a key mapping, Redis with a list in request order.
+        raw = [values.get(key) for key in keys] if isinstance(values, Mapping) else list(values)
+        return {task_id: decode_result(value) for task_id, value in zip(task_ids, raw, strict=True) if value}
+    session_factory = getattr(backend, "ResultSession", None)
+    task_cls = getattr(backend, "task_cls", None)
+    meta_from_decoded = getattr(backend, "meta_from_decoded", None)
+    if callable(session_factory) and task_cls is not None and callable(meta_from_decoded):
+        session = session_factory()
+        try:
+            rows = session.query(task_cls).filter(task_cls.task_id.in_(list(task_ids))).all()
+            return {str(row.task_id): meta_from_decoded(row.to_dict()) for row in rows}
+        finally:
+            session.close()
+    get_task_meta = getattr(backend, "get_task_meta", None)
+    if not callable(get_task_meta):
+        return {}
+    metas: dict[str, Mapping[str, object]] = {}
+    for task_id in task_ids:
+        meta = get_task_meta(task_id)
+        if isinstance(meta, Mapping):
+            metas[task_id] = meta
+    return metas
+
+
 def _iter_keys(backend: object, pattern: str) -> list[str]:
     client = getattr(backend, "client", None)
     keys: list[str] = []
@@ -6,6 +6,6 @@
 
 """Broker utilities and adapters."""
 
-from .base import QueueInfo, list_queues, purge_queues
+from .base import QueueInfo, broker_queue_stats, list_queues, purge_queues, queue_stats
 
-__all__ = ["QueueInfo", "list_queues", "purge_queues"]
+__all__ = ["QueueInfo", "broker_queue_stats", "list_queues", "purge_queues", "queue_stats"]
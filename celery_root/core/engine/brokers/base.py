@@ -8,21 +8,24 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from fnmatch import fnmatch
+from itertools import islice
 from typing import TYPE_CHECKING, Protocol, cast, runtime_checkable
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator
+    from collections.abc import Iterable, Iterator, Sequence
 
     from celery import Celery
 
     from celery_root.core.registry import WorkerRegistry
 
-__all__ = ["QueueInfo", "list_queues", "purge_queues"]
+__all__ = ["QueueInfo", "broker_queue_stats", "list_queues", "purge_queues", "queue_stats"]
 
 _INSPECT_TIMEOUT_SECONDS = 1.0
+# Kombu's Redis transport spreads a queue over one list per priority step, suffixed with this separator.
+_PRIORITY_SEPARATOR = "\x06\x16"
 
 
 @dataclass(slots=True)
@@ -55,12 +58,15 @@ class _Channel(Protocol):
 
 
 class _Transport(Protocol):
-    driver_type: str | None
+    @property
+    def driver_type(self) -> str | None: ...
 
 
 class _Connection(Protocol):
-    transport: _Transport | None
-    default_channel: object | None
+    @property
+    def transport(self) -> _Transport | None: ...
+    @property
+    def default_channel(self) -> object | None: ...
 
     def channel(self) -> _Channel: ...
 
@@ -99,7 +105,19 @@ def list_queues(
 
     with _connection(app, connection) as conn:
         connection_obj: _Connection = conn
-        return [_queue_info(app, name, connection=connection_obj) for name in queue_names]
+        return queue_stats(queue_names, connection=connection_obj)
+
+
+def broker_queue_stats(apps: Sequence[Celery], *, connection: _Connection | None = None) -> list[QueueInfo]:
+    """Return counts for the queues of apps that share one broker, read over a single connection.
+
+    The queue names are the union across ``apps``, so queues configured on only some of them are
+    still counted when no worker reports its active queues.
+    """
+    queue_names = _discover_queue_names(*apps)
+    with _connection(apps[0], connection) as conn:
+        connection_obj: _Connection = conn
+        return queue_stats(queue_names, connection=connection_obj)
 
 
 def purge_queues(
@@ -125,7 +143,11 @@ def purge_queues(
     return purged
 
 
-def _discover_queue_names(app: Celery) -> list[str]:
+def _discover_queue_names(app: Celery, *shared: Celery) -> list[str]:
+    """Return the queues workers consume from, else those configured on ``app`` and the ``shared`` apps.
+
+    Inspect broadcasts reach every worker on the broker, so only ``app`` is asked.
+    """
     inspector = _inspect(app)
     queue_names: set[str] = set()
     try:
@@ -138,36 +160,93 @@ def _discover_queue_names(app: Celery) -> list[str]:
                 name = queue.get("name")
                 if name:
                     queue_names.add(str(name))
-    if not queue_names and getattr(app.conf, "task_queues", None):
-        queue_names.update(str(q.name) for q in app.conf.task_queues if getattr(q, "name", None))
-    if not queue_names:
-        default_queue = getattr(app.conf, "task_default_queue", None) or "celery"
-        queue_names.add(str(default_queue))
+    if queue_names:
+        return sorted(queue_names)
+    for configured_app in (app, *shared):
+        queue_names.update(_configured_queue_names(configured_app))
     return sorted(queue_names)
 
 
-def _queue_info(app: Celery, queue: str, *, connection: _Connection) -> QueueInfo:
-    try:
-        return _broker_counts(app, queue, connection=connection)
-    except (AttributeError, OSError, RuntimeError, TypeError, ValueError):
-        return QueueInfo(queue, None, None)
+def _configured_queue_names(app: Celery) -> set[str]:
+    if getattr(app.conf, "task_queues", None):
+        return {str(q.name) for q in app.conf.task_queues if getattr(q, "name", None)}
+    default_queue = getattr(app.conf, "task_default_queue", None) or "celery"
+    return {str(default_queue)}
+
 
+def queue_stats(queue_names: Sequence[str], *, connection: _Connection) -> list[QueueInfo]:
+    """Return message (and, on AMQP, consumer) counts for queues on an open broker connection.
 
-def _broker_counts(_app: Celery, queue: str, *, connection: _Connection) -> QueueInfo:
+    Redis depths include the priority sub-queues and are read in one pipelined round trip. AMQP
+    queues are declared passively on one channel that is reused for the whole poll.
+    """
     transport = connection.transport
     driver = transport.driver_type if transport is not None else None
-    messages: int | None
     if driver == "redis":
         channel = connection.default_channel
         client = getattr(channel, "client", None)
         if isinstance(client, _RedisClient):
-            messages = int(client.llen(queue))
-            return QueueInfo(queue, messages, None)
-    channel = connection.channel()
-    result = channel.queue_declare(queue=queue, passive=True)
-    messages = _extract_field(result, "message_count")
-    consumers = _extract_field(result, "consumer_count")
-    return QueueInfo(queue, messages, consumers)
+            try:
+                return _redis_queue_stats(channel, client, queue_names)
+            except (AttributeError, OSError, RuntimeError, TypeError, ValueError):
+                return [QueueInfo(name, None, None) for name in queue_names]
+    return _amqp_queue_stats(connection, queue_names)
+
+
+def _priority_keys(channel: object, queue: str) -> list[str]:
+    steps = getattr(channel, "priority_steps", None) or (0,)
+    separator = str(getattr(channel, "sep", _PRIORITY_SEPARATOR))
+    return [f"{queue}{separator}{step}" if step else queue for step in steps]
+
+
+def _redis_queue_stats(channel: object, client: _RedisClient, queue_names: Sequence[str]) -> list[QueueInfo]:
+    """Count every queue, priority sub-queues included, in a single pipelined round trip."""
+    queue_keys = [_priority_keys(channel, name) for name in queue_names]
+    keys = [key for group in queue_keys for key in group]
+    pipeline = getattr(client, "pipeline", None)
+    if callable(pipeline):
+        with pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.llen(key)
+            sizes = iter(pipe.execute())
+    else:
+        sizes = iter([client.llen(key) for key in keys])
+    return [
+        QueueInfo(name, sum(int(size) for size in islice(sizes, len(group)) if isinstance(size, int)), None)
+        for name, group in zip(queue_names, queue_keys, strict=True)
+    ]
+
+
+def _amqp_queue_stats(connection: _Connection, queue_names: Sequence[str]) -> list[QueueInfo]:
+    """Passively declare every queue on one channel, reopening it only after a failed declare."""
+    infos: list[QueueInfo] = []
+    channel: _Channel | None = None
+    try:
+        for name in queue_names:
+            try:
+                if channel is None:
+                    channel = connection.channel()
+                result = channel.queue_declare(queue=name, passive=True)
+            except Exception:  # noqa: BLE001 - a failed passive declare (e.g. missing queue) closes the channel
+                _close_channel(channel)
+                channel = None
+                infos.append(QueueInfo(name, None, None))
+                continue
+            infos.append(
+                QueueInfo(name, _extract_field(result, "message_count"), _extract_field(result, "consumer_count")),
+            )
+    finally:
+        _close_channel(channel)
+    return infos
+
+
+def _close_channel(channel: _Channel | None) -> None:
+    close = getattr(channel, "close", None)
+    if not callable(close):
+        return
+    # The channel may already have been closed by the broker.
+    with suppress(Exception):
+        close()
 
 
 def _purge_queue(_app: Celery, queue: str, *, connection: _Connection) -> int | None:
@@ -177,8 +256,9 @@ def _purge_queue(_app: Celery, queue: str, *, connection: _Connection) -> int |
         channel = connection.default_channel
         client = getattr(channel, "client", None)
         if isinstance(client, _RedisClient):
-            pending = int(client.llen(queue))
-            client.delete(queue)
+            keys = _priority_keys(channel, queue)
+            pending = sum(int(client.llen(key)) for key in keys)
+            client.delete(*keys)
             return pending
     channel = connection.channel()
     result = channel.queue_purge(queue=queue)
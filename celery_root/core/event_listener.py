@@ -10,19 +10,23 @@ from __future__ import annotations
 
 import json
 import logging
+import tempfile
+import threading
 import time
+from collections import deque
 from datetime import UTC, datetime
 from multiprocessing import Event, Process, Queue
 from queue import Full
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING
 
 from celery import Celery
 from celery.events import EventReceiver
 from kombu.exceptions import OperationalError
 from pydantic import BaseModel
 
+from celery_root.components.metrics.batch import MetricsItem, encode_events
 from celery_root.config import set_settings
-from celery_root.core.db.models import TaskEvent, TaskRelation, WorkerEvent
+from celery_root.core.db.models import EventListenerStats, TaskEvent, TaskRelation, WorkerEvent
 from celery_root.core.db.rpc_client import DbRpcClient, RpcCallError
 from celery_root.core.logging import LogQueueConfig, configure_subprocess_logging
 from celery_root.core.logging.utils import sanitize_component
@@ -34,7 +38,7 @@ if TYPE_CHECKING:
 
     from kombu.connection import Connection
 
-    from celery_root.config import CeleryRootConfig
+    from celery_root.config import CeleryRootConfig, EventOverflowPolicy
 
 _TASK_STATE_MAP = {
     "task-received": "RECEIVED",
@@ -50,6 +54,11 @@ _TASK_STATE_MAP = {
 _ENABLE_EVENTS_INTERVAL = 30.0
 _HEARTBEAT_INTERVAL = 60.0
 _CAPTURE_TIMEOUT = 1.0
+_STATS_INTERVAL = 5.0
+_FANOUT_BATCH_SIZE = 256
+_FANOUT_INTERVAL = 0.25
+_WRITER_POLL_SECONDS = 0.25
+_WRITER_JOIN_SECONDS = 30.0
 _SERIALIZER_KEYS = ("event_serializer", "task_serializer", "result_serializer")
 _BROKER_KEYS = (
     "broker_use_ssl",
@@ -64,6 +73,10 @@ _BROKER_KEYS = (
 )
 
 
+_DbItem = TaskEvent | WorkerEvent | TaskRelation
+_SPILL_TYPES: dict[str, type[_DbItem]] = {model.__name__: model for model in (TaskEvent, WorkerEvent, TaskRelation)}
+
+
 def _redact_broker_url(value: str | None) -> str:
     if value is None:
         return ""
@@ -215,6 +228,192 @@ class _ManagedEventReceiver(EventReceiver):
         self._on_iteration()
 
 
+class _TaskEventBuffer:
+    """Write-behind buffer that batches task events bound for the DB manager."""
+
+    def __init__(self, batch_size: int, flush_interval: float) -> None:
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._events: list[TaskEvent] = []
+        self._last_flush = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def append(self, event: TaskEvent) -> None:
+        self._events.append(event)
+
+    def should_flush(self, now: float) -> bool:
+        if not self._events:
+            return False
+        return len(self._events) >= self._batch_size or now - self._last_flush >= self._flush_interval
+
+    def drain(self, now: float) -> list[TaskEvent]:
+        events = self._events
+        self._events = []
+        self._last_flush = now
+        return events
+
+
+class _MetricsFanout:
+    """Batches metrics items so each flush pickles once and puts one blob on every exporter queue."""
+
+    def __init__(self, queues: Sequence[Queue[object]], batch_size: int, flush_interval: float) -> None:
+        self._queues = queues
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._items: list[MetricsItem] = []
+        self._last_flush = time.monotonic()
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def append(self, item: MetricsItem) -> None:
+        self._items.append(item)
+        if len(self._items) >= self._batch_size:
+            self.flush(time.monotonic())
+
+    def maybe_flush(self, now: float) -> None:
+        if self._items and now - self._last_flush >= self._flush_interval:
+            self.flush(now)
+
+    def flush(self, now: float) -> None:
+        items = self._items
+        self._items = []
+        self._last_flush = now
+        if not items:
+            return
+        blob = encode_events(items)
+        for queue in self._queues:
+            try:
+                queue.put_nowait(blob)
+            except Full:
+                # Counted per exporter queue: a batch dropped by two exporters counts twice.
+                self.dropped += len(items)
+
+
+class _SpillFile:
+    """Anonymous temporary file holding the DB items that overflowed the in-memory write queue."""
+
+    def __init__(self) -> None:
+        self._file: IO[bytes] | None = None
+        self._read_offset = 0
+        self._count = 0
+        self.head_enqueued: float | None = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, enqueued: float, item: _DbItem) -> None:
+        if self._file is None:
+            self._file = tempfile.TemporaryFile()  # noqa: SIM115 - lives as long as the listener
+        record = {"enqueued": enqueued, "type": type(item).__name__, "item": item.model_dump(mode="json")}
+        self._file.seek(0, 2)
+        self._file.write(json.dumps(record).encode("utf-8") + b"\n")
+        if self._count == 0:
+            self.head_enqueued = enqueued
+        self._count += 1
+
+    def read(self, limit: int) -> list[_DbItem]:
+        if self._file is None or self._count == 0:
+            return []
+        self._file.seek(self._read_offset)
+        items: list[_DbItem] = []
+        while len(items) < limit and self._count:
+            record = json.loads(self._file.readline())
+            items.append(_SPILL_TYPES[record["type"]].model_validate(record["item"]))
+            self._count -= 1
+        self._read_offset = self._file.tell()
+        if self._count:
+            self.head_enqueued = float(json.loads(self._file.readline())["enqueued"])
+        else:
+            # Fully drained: start over so the file does not keep growing.
+            self._file.seek(0)
+            self._file.truncate()
+            self._read_offset = 0
+            self.head_enqueued = None
+        return items
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class _WriteQueue:
+    """Bounded hand-off from the broker consumer thread to the DB writer thread.
+
+    When the queue is full, ``block`` makes the consumer wait for the writer, ``drop_oldest``
+    discards the oldest pending item and ``spill`` appends to a temporary file that the writer
+    drains once the in-memory items are written. Items are written in the order they arrived.
+    """
+
+    def __init__(self, maxsize: int, policy: EventOverflowPolicy) -> None:
+        self._maxsize = maxsize
+        self._policy = policy
+        self._items: deque[tuple[float, _DbItem]] = deque()
+        self._spill = _SpillFile() if policy == "spill" else None
+        self._condition = threading.Condition()
+        self._closed = False
+        self.dropped = 0
+        self.spilled = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._items) + (len(self._spill) if self._spill is not None else 0)
+
+    def lag_seconds(self, now: float) -> float:
+        """Return how long the oldest pending item has been waiting for the writer."""
+        with self._condition:
+            if self._items:
+                oldest: float | None = self._items[0][0]
+            else:
+                oldest = self._spill.head_enqueued if self._spill is not None else None
+        return max(now - oldest, 0.0) if oldest is not None else 0.0
+
+    def put(self, item: _DbItem) -> None:
+        now = time.monotonic()
+        with self._condition:
+            if self._spill is not None and (len(self._spill) or len(self._items) >= self._maxsize):
+                # Once spilling, newer items queue behind the spilled ones to keep the write order.
+                self._spill.append(now, item)
+                self.spilled += 1
+            else:
+                while self._policy == "block" and len(self._items) >= self._maxsize and not self._closed:
+                    self._condition.wait(_WRITER_POLL_SECONDS)
+                if self._policy == "drop_oldest" and len(self._items) >= self._maxsize:
+                    self._items.popleft()
+                    self.dropped += 1
+                self._items.append((now, item))
+            self._condition.notify_all()
+
+    def get_batch(self, limit: int, timeout: float) -> list[_DbItem]:
+        with self._condition:
+            if not self._items and not (self._spill is not None and len(self._spill)) and not self._closed:
+                self._condition.wait(timeout)
+            batch = [self._items.popleft()[1] for _ in range(min(limit, len(self._items)))]
+            if not batch and self._spill is not None:
+                batch = self._spill.read(limit)
+            if batch:
+                self._condition.notify_all()
+            return batch
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def release(self) -> None:
+        if self._spill is not None:
+            self._spill.close()
+
+
 class EventListener(Process):
     """Listen to Celery events for a single broker."""
 
@@ -230,11 +429,19 @@ class EventListener(Process):
         self.broker_url = broker_url
         self._broker_url_redacted = _redact_broker_url(broker_url)
         self._metrics_queues = list(metrics_queues or [])
+        self._fanout = (
+            _MetricsFanout(self._metrics_queues, _FANOUT_BATCH_SIZE, _FANOUT_INTERVAL) if self._metrics_queues else None
+        )
         self._config = config
         self._log_config = log_config
         self._stop_event = Event()
         self._logger = logging.getLogger(__name__)
         self._db_client: DbRpcClient | None = None
+        self._task_buffer: _TaskEventBuffer | None = None
+        self._write_queue: _WriteQueue | None = None
+        self._writer: threading.Thread | None = None
+        self._write_batch_size = 1
+        self._last_stats = 0.0
 
     def stop(self) -> None:
         """Signal the listener to stop."""
@@ -258,6 +465,11 @@ class EventListener(Process):
             )
         if self._config is not None:
             self._db_client = DbRpcClient.from_config(self._config, client_name=component)
+            self._task_buffer = _TaskEventBuffer(
+                self._config.database.batch_size,
+                self._config.database.flush_interval,
+            )
+            self._start_writer(self._config)
         worker_apps: tuple[Celery, ...] = ()
         if self._config is not None:
             app, worker_apps = _select_event_app(self._config, self.broker_url, self._logger)
@@ -278,10 +490,54 @@ class EventListener(Process):
             except Exception:  # pragma: no cover - defensive
                 self._logger.exception("EventListener error for %s", self._broker_url_redacted)
                 time.sleep(1.0)
+        writer_stopped = self._stop_writer()
+        if writer_stopped:
+            self._flush_task_events()
+        self._flush_metrics()
         self._logger.info("EventListener stopped for %s", self._broker_url_redacted)
-        if self._db_client is not None:
+        # A writer that is still running owns the task buffer and the DB client; leave both to it.
+        if writer_stopped and self._db_client is not None:
             self._db_client.close()
 
+    def _start_writer(self, config: CeleryRootConfig) -> None:
+        """Move DB writes to a writer thread so a slow DB manager does not stall broker consumption."""
+        self._write_queue = _WriteQueue(config.event_writer_queue_size, config.event_overflow_policy)
+        self._write_batch_size = config.database.batch_size
+        self._writer = threading.Thread(
+            target=self._write_loop,
+            name=f"event-writer-{self._broker_url_redacted}",
+            daemon=True,
+        )
+        self._writer.start()
+
+    def _stop_writer(self) -> bool:
+        """Drain and join the writer thread; return ``False`` if it is still running after the timeout."""
+        if self._write_queue is None or self._writer is None:
+            return True
+        self._write_queue.close()
+        self._writer.join(timeout=_WRITER_JOIN_SECONDS)
+        if self._writer.is_alive():
+            self._logger.warning(
+                "EventListener writer for %s did not drain; %d events not stored",
+                self._broker_url_redacted,
+                self._write_queue.pending,
+            )
+            return False
+        self._write_queue.release()
+        return True
+
+    def _write_loop(self) -> None:
+        queue = self._write_queue
+        if queue is None:
+            return
+        while True:
+            items = queue.get_batch(self._write_batch_size, _WRITER_POLL_SECONDS)
+            self._write_items(items)
+            self._maybe_flush_task_events(time.monotonic())
+            if not items and queue.closed:
+                break
+        self._flush_task_events()
+
     def _listen(self, app: Celery, last_heartbeat: float) -> float:
         with app.connection() as connection:
             self._logger.info("EventListener connected to %s", self._broker_url_redacted)
@@ -293,6 +549,11 @@ class EventListener(Process):
                 now = time.monotonic()
                 last_heartbeat_box[0] = self._maybe_log_heartbeat(now, last_heartbeat_box[0])
                 last_enable_box[0] = self._maybe_enable_events(app, last_enable_box[0])
+                self._maybe_report_stats(now)
+                if self._fanout is not None:
+                    self._fanout.maybe_flush(now)
+                if self._write_queue is None:
+                    self._maybe_flush_task_events(now)
                 if self._stop_event.is_set():
                     receiver.should_stop = True
 
@@ -309,15 +570,53 @@ class EventListener(Process):
                     except TimeoutError:
                         continue
             finally:
+                self._flush_metrics()
+                if self._write_queue is None:
+                    self._flush_task_events()
                 self._logger.info("EventListener disconnected from %s", self.broker_url)
         return last_heartbeat_box[0]
 
     def _maybe_log_heartbeat(self, now: float, last_heartbeat: float) -> float:
         if now - last_heartbeat >= _HEARTBEAT_INTERVAL:
             self._logger.info("EventListener heartbeat for %s", self._broker_url_redacted)
+            if self._write_queue is not None:
+                stats = self._write_stats(now)
+                self._logger.info(
+                    "EventListener writer for %s: pending=%d lag=%.1fs dropped=%d spilled=%d",
+                    self._broker_url_redacted,
+                    stats.pending,
+                    stats.lag_seconds,
+                    stats.dropped,
+                    stats.spilled,
+                )
             return now
         return last_heartbeat
 
+    def _write_stats(self, now: float) -> EventListenerStats:
+        queue = self._write_queue
+        metrics_dropped = self._fanout.dropped if self._fanout is not None else 0
+        if queue is None:
+            return EventListenerStats(broker_url=self._broker_url_redacted, metrics_dropped=metrics_dropped)
+        return EventListenerStats(
+            broker_url=self._broker_url_redacted,
+            pending=queue.pending,
+            lag_seconds=queue.lag_seconds(now),
+            dropped=queue.dropped,
+            spilled=queue.spilled,
+            metrics_dropped=metrics_dropped,
+        )
+
+    def _maybe_report_stats(self, now: float) -> None:
+        if self._fanout is None or now - self._last_stats < _STATS_INTERVAL:
+            return
+        self._last_stats = now
+        self._fanout.append(self._write_stats(now))
+        self._fanout.flush(now)
+
+    def _flush_metrics(self) -> None:
+        if self._fanout is not None:
+            self._fanout.flush(time.monotonic())
+
     def _maybe_enable_events(self, app: Celery, last_enable: float) -> float:
         if time.monotonic() - last_enable < _ENABLE_EVENTS_INTERVAL:
             return last_enable
@@ -409,17 +708,36 @@ class EventListener(Process):
 
     def _emit(self, item: object, *, fanout: bool = True) -> None:
         self._send_to_db(item)
-        if not fanout or not self._metrics_queues:
-            return
-        for queue in self._metrics_queues:
-            try:
-                queue.put_nowait(item)
-            except Full:
-                self._logger.debug("Dropping event for full metrics queue: %s", type(item).__name__)
+        if fanout and self._fanout is not None and isinstance(item, MetricsItem):
+            self._fanout.append(item)
 
     def _send_to_db(self, item: object) -> None:
         if self._db_client is None:
             return
+        if self._write_queue is not None and isinstance(item, _DbItem):
+            self._write_queue.put(item)
+            return
+        self._write_item(item)
+
+    def _write_items(self, items: Sequence[_DbItem]) -> None:
+        worker_events = [item for item in items if isinstance(item, WorkerEvent)]
+        for item in items:
+            if not isinstance(item, WorkerEvent):
+                self._write_item(item)
+        if not worker_events or self._db_client is None:
+            return
+        try:
+            self._db_client.store_worker_events(worker_events)
+        except (RpcCallError, RuntimeError, ValueError):
+            self._logger.exception("DB RPC failed for batch of %d worker events", len(worker_events))
+
+    def _write_item(self, item: object) -> None:
+        if self._db_client is None:
+            return
+        if isinstance(item, TaskEvent) and self._task_buffer is not None:
+            self._task_buffer.append(item)
+            self._maybe_flush_task_events(time.monotonic())
+            return
         try:
             if isinstance(item, TaskEvent):
                 self._db_client.store_task_event(item)
@@ -430,6 +748,21 @@ class EventListener(Process):
         except (RpcCallError, RuntimeError):
             self._logger.exception("DB RPC failed for %s", type(item).__name__)
 
+    def _maybe_flush_task_events(self, now: float) -> None:
+        if self._task_buffer is not None and self._task_buffer.should_flush(now):
+            self._flush_task_events()
+
+    def _flush_task_events(self) -> None:
+        if self._task_buffer is None or self._db_client is None:
+            return
+        events = self._task_buffer.drain(time.monotonic())
+        if not events:
+            return
+        try:
+            self._db_client.store_task_events(events)
+        except (RpcCallError, RuntimeError, ValueError):
+            self._logger.exception("DB RPC failed for batch of %d task events", len(events))
+
 
 def _event_timestamp(event: dict[str, object]) -> datetime:
     raw = event.get("timestamp")
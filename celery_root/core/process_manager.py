@@ -26,6 +26,7 @@ from celery.beat import Service
 
 from celery_root.config import set_settings
 from celery_root.core.db.manager import DBManager
+from celery_root.core.db.rpc_client import close_shared_pools
 from celery_root.core.logging import LogQueueConfig, configure_subprocess_logging, log_level_name
 from celery_root.optional import require_optional_scope
 from celery_root.shared.redaction import redact_url_password
@@ -44,6 +45,7 @@ if TYPE_CHECKING:
 
 _MONITOR_INTERVAL = 1.0
 _HEARTBEAT_INTERVAL = 60.0
+_DRAIN_MAX_BATCHES = 64
 _DB_READY_TIMEOUT = 10.0
 _DB_READY_POLL = 0.05
 
@@ -184,7 +186,11 @@ class _WebServerProcess(Process):
         require_optional_scope("web")
         from celery_root.components.web import devserver  # noqa: PLC0415
 
-        devserver.serve(self._host, self._port, shutdown_event=self._stop_event)
+        try:
+            devserver.serve(self._host, self._port, shutdown_event=self._stop_event)
+        finally:
+            # multiprocessing children exit via os._exit, so atexit hooks never run here.
+            close_shared_pools()
         logger.info("Web server stopped on %s:%s", self._host, self._port)
 
 
@@ -234,35 +240,39 @@ class _ExporterProcess(Process):
             time.sleep(1.0)
             return
         try:
-            item = self._event_queue.get(timeout=1.0)
+            first = self._event_queue.get(timeout=1.0)
         except Empty:
             return
-        self._handle_event(exporter, logger, item)
-        while True:
+        blobs = [first]
+        while len(blobs) < _DRAIN_MAX_BATCHES:
             try:
-                item = self._event_queue.get_nowait()
+                blobs.append(self._event_queue.get_nowait())
             except Empty:
                 # multiprocessing.Queue uses a feeder thread; give it a brief
                 # chance to flush buffered items before declaring empty.
                 try:
-                    item = self._event_queue.get(timeout=0.01)
+                    blobs.append(self._event_queue.get(timeout=0.01))
                 except Empty:
-                    return
-            self._handle_event(exporter, logger, item)
+                    break
+        self._handle_events(exporter, logger, blobs)
 
     @staticmethod
-    def _handle_event(exporter: BaseMonitoringExporter, logger: logging.Logger, item: object) -> None:
-        from celery_root.core.db.models import TaskEvent, TaskStats, WorkerEvent  # noqa: PLC0415
+    def _handle_events(exporter: BaseMonitoringExporter, logger: logging.Logger, blobs: list[object]) -> None:
+        from celery_root.components.metrics.batch import decode_events  # noqa: PLC0415
 
+        items: list[object] = []
+        for blob in blobs:
+            if not isinstance(blob, bytes):
+                items.append(blob)
+                continue
+            try:
+                items.extend(decode_events(blob))
+            except Exception:  # pragma: no cover - defensive
+                logger.exception("Exporter failed to decode an event batch of %d bytes", len(blob))
         try:
-            if isinstance(item, TaskEvent):
-                exporter.on_task_event(item)
-            elif isinstance(item, WorkerEvent):
-                exporter.on_worker_event(item)
-            elif isinstance(item, TaskStats):
-                exporter.update_stats(item)
+            exporter.on_events(items)
         except Exception:  # pragma: no cover - defensive
-            logger.exception("Exporter failed to process event %r", item)
+            logger.exception("Exporter failed to process a batch of %d events", len(items))
 
 
 class _RootBeat(Beat):
@@ -385,7 +395,10 @@ class _McpServerProcess(Process):
             server.should_exit = True
 
         threading.Thread(target=_watch_stop, daemon=True).start()
-        server.run()
+        try:
+            server.run()
+        finally:
+            close_shared_pools()
         logger.info("MCP server stopped on %s:%s", self._host, self._port)
 
 
@@ -504,6 +517,8 @@ class ProcessManager:
                     port=self._config.prometheus.port,
                     broker_backend_map=backend_map,
                     flower_compatibility=self._config.prometheus.flower_compatibility,
+                    max_tracked_tasks=self._config.metrics_max_tracked_tasks,
+                    tracked_task_ttl_seconds=self._config.metrics_tracked_task_ttl_seconds,
                 ),
                 self._config,
                 prometheus_runtime,
@@ -527,6 +542,8 @@ class ProcessManager:
                     service_name=self._config.open_telemetry.service_name,
                     endpoint=self._config.open_telemetry.endpoint,
                     broker_backend_map=backend_map,
+                    max_tracked_tasks=self._config.metrics_max_tracked_tasks,
+                    tracked_task_ttl_seconds=self._config.metrics_tracked_task_ttl_seconds,
                 ),
                 self._config,
                 otel_runtime,
@@ -11,16 +11,18 @@ from __future__ import annotations
 import json
 import logging
 import time
-from collections import deque
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from itertools import islice
 from multiprocessing import Event, Process
 from typing import TYPE_CHECKING
 
 from celery_root.config import set_settings
-from celery_root.core.db.models import BrokerQueueEvent, Task, TaskEvent, TaskFilter, WorkerEvent
+from celery_root.core.db.models import BrokerQueueEvent, TaskEvent, TaskFilter, TaskSummary, WorkerEvent
 from celery_root.core.db.rpc_client import DbRpcClient, RpcCallError
-from celery_root.core.engine.brokers import list_queues
+from celery_root.core.engine.backend import get_task_metas
+from celery_root.core.engine.brokers import broker_queue_stats
 from celery_root.core.logging import LogQueueConfig, configure_subprocess_logging
 from celery_root.core.registry import WorkerRegistry
 from celery_root.shared.redaction import redact_access_data, redact_url_password
@@ -29,13 +31,18 @@ if TYPE_CHECKING:
     from celery import Celery
 
     from celery_root.config import CeleryRootConfig
+    from celery_root.core.engine.brokers import QueueInfo
 
 _FINAL_STATES = {"SUCCESS", "FAILURE", "REVOKED"}
 _NON_FINAL_STATES = ("PENDING", "RECEIVED", "STARTED", "RETRY", "REJECTED")
 
 _LOOP_INTERVAL_SECONDS = 1.0
 _WORKER_REFRESH_SECONDS = 30.0
-_TASK_REFRESH_SECONDS = 30.0
+_BACKFILL_BATCH_SIZE = 500
+_MAX_BROKER_POLLERS = 8
+_INSPECT_TIMEOUT_SECONDS = 1.0
+# Order matches the payload unpacking in ``_host_snapshot``.
+_INSPECT_COMMANDS = ("stats", "conf", "active_queues", "active", "registered")
 
 _WorkerSnapshot = tuple[
     Mapping[str, object] | None,
@@ -72,6 +79,35 @@ def _extract_host_payload(payload: object, hostname: str) -> object | None:
     return None
 
 
+def _replying_hosts(payloads: Sequence[object | None]) -> list[str]:
+    hosts: dict[str, None] = {}
+    for payload in payloads:
+        if isinstance(payload, dict):
+            hosts.update(dict.fromkeys(str(hostname) for hostname in payload))
+    return list(hosts)
+
+
+def _host_snapshot(
+    payloads: Sequence[object | None],
+    hostname: str,
+    broker_url: str,
+    app_name: str,
+) -> _WorkerSnapshot | None:
+    stats, conf, queues, active, registered = (_extract_host_payload(payload, hostname) for payload in payloads)
+    if stats is None and conf is None and queues is None and registered is None and active is None:
+        return None
+    stats_map = stats if isinstance(stats, Mapping) else None
+    conf_map = conf if isinstance(conf, Mapping) else None
+    return stats_map, conf_map, queues, registered, active, broker_url, app_name
+
+
+def _inspector(app: Celery, destination: list[str] | None) -> object | None:
+    try:
+        return app.control.inspect(timeout=_INSPECT_TIMEOUT_SECONDS, destination=destination)
+    except TypeError:
+        return app.control.inspect(destination=destination)
+
+
 def _parse_datetime(raw: object) -> datetime | None:
     if raw is None:
         return None
@@ -153,7 +189,7 @@ def _final_state(meta: Mapping[str, object]) -> str | None:
     return None
 
 
-def _task_event_from_meta(task: Task, status: str, meta: Mapping[str, object]) -> TaskEvent:
+def _task_event_from_meta(task: TaskSummary, status: str, meta: Mapping[str, object]) -> TaskEvent:
     timestamp = _parse_datetime(meta.get("date_done")) or datetime.now(UTC)
     return TaskEvent(
         task_id=task.task_id,
@@ -187,10 +223,10 @@ class Reconciler(Process):
         self._app_names: list[str] = []
         self._worker_names: list[str] = []
         self._worker_index = 0
-        self._broker_index = 0
-        self._task_queue: deque[Task] = deque()
-        self._task_refresh_at = 0.0
+        self._open_tasks: Iterator[TaskSummary] | None = None
+        self._open_state_index = 0
         self._worker_refresh_at = 0.0
+        self._fleet_inspected_at: float | None = None
         self._round_robin_index = 0
 
     def stop(self) -> None:
@@ -233,6 +269,9 @@ class Reconciler(Process):
     def _poll_worker_stats(self) -> None:
         if not self._apps:
             return
+        if self._config.reconciler_fleet_inspection:
+            self._poll_fleet_stats()
+            return
         now = time.monotonic()
         if self._should_refresh_workers(now):
             self._refresh_workers()
@@ -245,6 +284,52 @@ class Reconciler(Process):
             return
         self._store_worker_event(event, hostname)
 
+    def _poll_fleet_stats(self) -> None:
+        # A pass broadcasts every inspect command and stores a full snapshot per host, so it runs at the
+        # worker refresh interval rather than on every "workers" turn of the round robin.
+        now = time.monotonic()
+        if self._fleet_inspected_at is not None and now - self._fleet_inspected_at < _WORKER_REFRESH_SECONDS:
+            return
+        self._fleet_inspected_at = now
+        events: list[WorkerEvent] = []
+        for hostname, snapshot in self._inspect_fleet().items():
+            event = self._build_worker_event(hostname, snapshot)
+            if event is not None:
+                events.append(event)
+        self._store_worker_events(events)
+
+    def _inspect_fleet(self) -> dict[str, _WorkerSnapshot]:
+        """Broadcast each inspect command once per app and fan the replies out per host.
+
+        The commands run concurrently on a thread pool, so a pass costs one inspect timeout per app
+        instead of five per worker. Kombu keys the reply queue by thread, so the calls do not consume
+        each other's replies. A host answering for several apps keeps the snapshot of the first app.
+        """
+        snapshots: dict[str, _WorkerSnapshot] = {}
+        inspectors = [(app, _inspector(app, None)) for app in self._apps]
+        pending = [(app, inspector) for app, inspector in inspectors if inspector is not None]
+        if not pending:
+            return snapshots
+        with ThreadPoolExecutor(
+            max_workers=len(pending) * len(_INSPECT_COMMANDS),
+            thread_name_prefix="reconciler-inspect",
+        ) as pool:
+            futures = [
+                (app, [pool.submit(_safe_call, getattr(inspector, command)) for command in _INSPECT_COMMANDS])
+                for app, inspector in pending
+            ]
+            for app, app_futures in futures:
+                payloads = [future.result() for future in app_futures]
+                broker_url = str(app.conf.broker_url or "")
+                app_name = _app_name(app)
+                for hostname in _replying_hosts(payloads):
+                    if hostname in snapshots:
+                        continue
+                    snapshot = _host_snapshot(payloads, hostname, broker_url, app_name)
+                    if snapshot is not None:
+                        snapshots[hostname] = snapshot
+        return snapshots
+
     def _should_refresh_workers(self, now: float) -> bool:
         return now - self._worker_refresh_at >= _WORKER_REFRESH_SECONDS or not self._worker_names
 
@@ -324,47 +409,25 @@ class Reconciler(Process):
             active_value,
         )
 
-    def _inspect_worker(
-        self,
-        hostname: str,
-    ) -> tuple[
-        Mapping[str, object] | None,
-        Mapping[str, object] | None,
-        object | None,
-        object | None,
-        object | None,
-        str | None,
-        str | None,
-    ]:
+    def _store_worker_events(self, events: Sequence[WorkerEvent]) -> None:
+        if self._db_client is None or not events:
+            return
+        try:
+            self._db_client.store_worker_events(events)
+        except (RpcCallError, RuntimeError):
+            self._logger.exception("Reconciler failed to store %d worker snapshots via RPC", len(events))
+            return
+        self._logger.debug("Reconciler fleet snapshot persisted workers=%d", len(events))
+
+    def _inspect_worker(self, hostname: str) -> _WorkerSnapshot:
         for app in self._apps:
-            broker_url = str(app.conf.broker_url or "")
-            app_name = _app_name(app)
-            try:
-                inspector = app.control.inspect(timeout=1.0, destination=[hostname])
-            except TypeError:
-                inspector = app.control.inspect(destination=[hostname])
+            inspector = _inspector(app, [hostname])
             if inspector is None:
                 continue
-            stats_payload = _safe_call(inspector.stats)
-            conf_payload = _safe_call(inspector.conf)
-            queues_payload = _safe_call(inspector.active_queues)
-            active_payload = _safe_call(inspector.active)
-            registered_payload = _safe_call(inspector.registered)
-            stats = _extract_host_payload(stats_payload, hostname)
-            conf = _extract_host_payload(conf_payload, hostname)
-            queues = _extract_host_payload(queues_payload, hostname)
-            active = _extract_host_payload(active_payload, hostname)
-            registered = _extract_host_payload(registered_payload, hostname)
-            if (
-                stats is not None
-                or conf is not None
-                or queues is not None
-                or registered is not None
-                or active is not None
-            ):
-                stats_map = stats if isinstance(stats, Mapping) else None
-                conf_map = conf if isinstance(conf, Mapping) else None
-                return stats_map, conf_map, queues, registered, active, broker_url, app_name
+            payloads = [_safe_call(getattr(inspector, command)) for command in _INSPECT_COMMANDS]
+            snapshot = _host_snapshot(payloads, hostname, str(app.conf.broker_url or ""), _app_name(app))
+            if snapshot is not None:
+                return snapshot
         return None, None, None, None, None, None, None
 
     def _refresh_workers(self) -> None:
@@ -380,90 +443,118 @@ class Reconciler(Process):
         self._worker_index = 0
 
     def _poll_broker_stats(self, registry: WorkerRegistry) -> None:
+        """Poll the queue depths of every distinct broker concurrently.
+
+        Apps that share a broker URL are polled once, on one connection, for the union of their queues;
+        logs name the first app.
+        """
         if not self._app_names:
             return
-        app_name = self._app_names[self._broker_index % len(self._app_names)]
-        self._broker_index += 1
-        broker_url = ""
-        try:
-            app = registry.get_app(app_name)
-        except KeyError:
-            app = None
-        if app is not None:
-            broker_url = str(app.conf.broker_url or "")
-        redacted_broker_url = redact_url_password(broker_url) if broker_url else broker_url
-        try:
-            queues = list_queues(registry, app_name)
-        except Exception:  # pragma: no cover - broker dependent
-            self._logger.exception("Reconciler failed to fetch broker stats for %s", app_name)
+        targets = self._broker_targets(registry)
+        if not targets:
             return
+        with ThreadPoolExecutor(
+            max_workers=min(len(targets), _MAX_BROKER_POLLERS),
+            thread_name_prefix="reconciler-broker",
+        ) as pool:
+            futures = [
+                (app_name, broker_url, pool.submit(broker_queue_stats, apps)) for app_name, broker_url, apps in targets
+            ]
+            for app_name, broker_url, future in futures:
+                try:
+                    queues = future.result()
+                except Exception:  # pragma: no cover - broker dependent
+                    self._logger.exception("Reconciler failed to fetch broker stats for %s", app_name)
+                    continue
+                self._store_broker_queues(app_name, broker_url, queues)
+
+    def _broker_targets(self, registry: WorkerRegistry) -> list[tuple[str, str, Sequence[Celery]]]:
+        return [
+            (_app_name(group.apps[0]), redact_url_password(broker_url) or broker_url, group.apps)
+            for broker_url, group in registry.get_brokers().items()
+            if group.apps
+        ]
+
+    def _store_broker_queues(self, app_name: str, broker_url: str, queues: Sequence[QueueInfo]) -> None:
         pending = sum(queue.messages or 0 for queue in queues)
         self._logger.debug("Reconciler broker stats app=%s queues=%d pending=%d", app_name, len(queues), pending)
         if self._db_client is None:
             return
         timestamp = datetime.now(UTC)
-        for queue in queues:
-            event = BrokerQueueEvent(
-                broker_url=redacted_broker_url,
+        events = [
+            BrokerQueueEvent(
+                broker_url=broker_url,
                 queue=queue.name,
                 messages=queue.messages,
                 consumers=queue.consumers,
                 timestamp=timestamp,
             )
-            try:
-                self._db_client.store_broker_queue_event(event)
-            except (RpcCallError, RuntimeError):
-                self._logger.exception("Reconciler failed to store broker queue %s via RPC", queue.name)
+            for queue in queues
+        ]
+        try:
+            self._db_client.store_broker_queue_events(events)
+        except (RpcCallError, RuntimeError):
+            self._logger.exception("Reconciler failed to store broker queues of %s via RPC", app_name)
 
     def _reconcile_task_states(self) -> None:
         if self._db_client is None or not self._apps:
             return
-        now = time.monotonic()
-        if now - self._task_refresh_at >= _TASK_REFRESH_SECONDS or not self._task_queue:
-            self._refresh_tasks()
-        if not self._task_queue:
+        tasks = self._next_open_tasks()
+        if not tasks:
             return
-        task = self._task_queue.popleft()
-        meta, status = self._find_final_meta(task)
-        if meta is None or status is None:
+        events = self._backfill_events(tasks)
+        if not events:
             return
-        event = _task_event_from_meta(task, status, meta)
         try:
-            self._db_client.store_task_event(event)
+            self._db_client.store_task_events(events)
         except (RpcCallError, RuntimeError):
-            self._logger.exception("Reconciler failed to store task event %s via RPC", task.task_id)
+            self._logger.exception("Reconciler failed to store %d backfilled task events via RPC", len(events))
             return
-        self._logger.info("Reconciler backfilled task %s state=%s", task.task_id, status)
+        self._logger.info("Reconciler backfilled %d of %d open tasks", len(events), len(tasks))
+
+    def _next_open_tasks(self) -> list[TaskSummary]:
+        """Return the next batch of non-final tasks.
 
-    def _refresh_tasks(self) -> None:
+        Each state is paged through with a keyset scan that resumes where the previous batch stopped,
+        so a pass over a large backlog never reloads the tasks it has already checked.
+        """
         if self._db_client is None:
-            return
-        tasks: dict[str, Task] = {}
-        for state in _NON_FINAL_STATES:
+            return []
+        for _ in _NON_FINAL_STATES:
+            if self._open_tasks is None:
+                state = _NON_FINAL_STATES[self._open_state_index]
+                self._open_state_index = (self._open_state_index + 1) % len(_NON_FINAL_STATES)
+                self._open_tasks = self._db_client.iter_tasks(TaskFilter(state=state), chunk_size=_BACKFILL_BATCH_SIZE)
             try:
-                batch = self._db_client.get_tasks(TaskFilter(state=state))
+                tasks = list(islice(self._open_tasks, _BACKFILL_BATCH_SIZE))
             except (RpcCallError, RuntimeError):
-                self._logger.exception("Reconciler failed to fetch tasks state=%s via RPC", state)
-                continue
-            for task in batch:
-                tasks[task.task_id] = task
-        self._task_queue = deque(tasks.values())
-        self._task_refresh_at = time.monotonic()
-
-    def _find_final_meta(self, task: Task) -> tuple[Mapping[str, object] | None, str | None]:
+                self._logger.exception("Reconciler failed to fetch open tasks via RPC")
+                tasks = []
+            if len(tasks) < _BACKFILL_BATCH_SIZE:
+                self._open_tasks = None
+            if tasks:
+                return tasks
+        return []
+
+    def _backfill_events(self, tasks: Sequence[TaskSummary]) -> list[TaskEvent]:
+        pending = {task.task_id: task for task in tasks}
+        events: list[TaskEvent] = []
         for app in self._apps:
+            if not pending:
+                break
             backend = getattr(app, "backend", None)
-            get_task_meta = getattr(backend, "get_task_meta", None)
-            if not callable(get_task_meta):
+            if backend is None:
                 continue
             try:
-                meta = get_task_meta(task.task_id)
+                metas = get_task_metas(backend, list(pending))
             except Exception:  # pragma: no cover - backend dependent
-                self._logger.exception("Reconciler backend error app=%s task_id=%s", _app_name(app), task.task_id)
-                continue
-            if not isinstance(meta, Mapping):
+                self._logger.exception("Reconciler backend error app=%s tasks=%d", _app_name(app), len(pending))
                 continue
-            status = _final_state(meta)
-            if status is not None:
-                return meta, status
-        return None, None
+            for task_id, meta in metas.items():
+                status = _final_state(meta)
+                task = pending.get(task_id)
+                if status is None or task is None:
+                    continue
+                del pending[task_id]
+                events.append(_task_event_from_meta(task, status, meta))
+        return events
@@ -15,6 +15,8 @@ _SCOPE_DEPENDENCIES: dict[str, tuple[str, ...]] = {
     "prometheus": ("prometheus_client",),
     "otel": ("opentelemetry.sdk", "opentelemetry.exporter.otlp"),
     "mcp": ("fastmcp", "uvicorn", "django"),
+    "msgpack": ("msgpack",),
+    "duckdb": ("duckdb",),
 }
 
 
@@ -8,12 +8,20 @@
 
 from .domain import (
     BrokerQueueEvent,
+    BrokerQueueSample,
+    EventListenerStats,
+    RollupDimension,
     Schedule,
     Task,
+    TaskCursor,
     TaskEvent,
     TaskFilter,
+    TaskGraph,
+    TaskGraphChanges,
     TaskRelation,
+    TaskRollupCount,
     TaskStats,
+    TaskSummary,
     ThroughputBucket,
     TimeRange,
     Worker,
@@ -22,21 +30,33 @@ from .domain import (
 )
 from .rpc import (
     RPC_SCHEMA_VERSION,
+    BrokerQueueHistoryRequest,
+    BrokerQueueHistoryResponse,
     BrokerQueueSnapshotRequest,
     BrokerQueueSnapshotResponse,
+    BuildTaskGraphRequest,
+    BuildTaskGraphResponse,
     CleanupRequest,
     CleanupResponse,
     DbInfoRequest,
     DbInfoResponse,
     DeleteScheduleRequest,
+    GetManyTasksRequest,
+    GetManyTasksResponse,
     GetTaskRequest,
     GetTaskResponse,
     GetWorkerRequest,
     GetWorkerResponse,
     HeatmapRequest,
     HeatmapResponse,
+    IngestBrokerQueueEventBatchRequest,
+    IngestBrokerQueueEventBatchResponse,
     IngestBrokerQueueEventRequest,
+    IngestTaskEventBatchRequest,
+    IngestTaskEventBatchResponse,
     IngestTaskEventRequest,
+    IngestWorkerEventBatchRequest,
+    IngestWorkerEventBatchResponse,
     IngestWorkerEventRequest,
     ListSchedulesRequest,
     ListSchedulesResponse,
@@ -55,9 +75,19 @@ from .rpc import (
     PingResponse,
     RawQueryRequest,
     RawQueryResponse,
+    RebuildRollupsRequest,
+    RebuildRollupsResponse,
+    RetentionStatusRequest,
+    RetentionStatusResponse,
+    RollupCountsRequest,
+    RollupCountsResponse,
+    RollupTaskStatsRequest,
+    RollupThroughputRequest,
     RpcError,
     RpcRequestEnvelope,
     RpcResponseEnvelope,
+    ScanTasksRequest,
+    ScanTasksResponse,
     SchemaColumn,
     SchemaIndex,
     SchemaRequest,
@@ -69,32 +99,50 @@ from .rpc import (
     StateDistributionResponse,
     StoreScheduleRequest,
     StoreTaskRelationRequest,
+    TaskGraphChangesRequest,
+    TaskGraphChangesResponse,
     TaskStatsRequest,
     TaskStatsResponse,
     ThroughputRequest,
     ThroughputResponse,
     WorkerEventSnapshotRequest,
     WorkerEventSnapshotResponse,
+    WorkerStateCountsRequest,
+    WorkerStateCountsResponse,
 )
 
 __all__ = [
     "RPC_SCHEMA_VERSION",
     "BrokerQueueEvent",
+    "BrokerQueueHistoryRequest",
+    "BrokerQueueHistoryResponse",
+    "BrokerQueueSample",
     "BrokerQueueSnapshotRequest",
     "BrokerQueueSnapshotResponse",
+    "BuildTaskGraphRequest",
+    "BuildTaskGraphResponse",
     "CleanupRequest",
     "CleanupResponse",
     "DbInfoRequest",
     "DbInfoResponse",
     "DeleteScheduleRequest",
+    "EventListenerStats",
+    "GetManyTasksRequest",
+    "GetManyTasksResponse",
     "GetTaskRequest",
     "GetTaskResponse",
     "GetWorkerRequest",
     "GetWorkerResponse",
     "HeatmapRequest",
     "HeatmapResponse",
+    "IngestBrokerQueueEventBatchRequest",
+    "IngestBrokerQueueEventBatchResponse",
     "IngestBrokerQueueEventRequest",
+    "IngestTaskEventBatchRequest",
+    "IngestTaskEventBatchResponse",
     "IngestTaskEventRequest",
+    "IngestWorkerEventBatchRequest",
+    "IngestWorkerEventBatchResponse",
     "IngestWorkerEventRequest",
     "ListSchedulesRequest",
     "ListSchedulesResponse",
@@ -113,9 +161,20 @@ __all__ = [
     "PingResponse",
     "RawQueryRequest",
     "RawQueryResponse",
+    "RebuildRollupsRequest",
+    "RebuildRollupsResponse",
+    "RetentionStatusRequest",
+    "RetentionStatusResponse",
+    "RollupCountsRequest",
+    "RollupCountsResponse",
+    "RollupDimension",
+    "RollupTaskStatsRequest",
+    "RollupThroughputRequest",
     "RpcError",
     "RpcRequestEnvelope",
     "RpcResponseEnvelope",
+    "ScanTasksRequest",
+    "ScanTasksResponse",
     "Schedule",
     "SchemaColumn",
     "SchemaIndex",
@@ -129,12 +188,19 @@ __all__ = [
     "StoreScheduleRequest",
     "StoreTaskRelationRequest",
     "Task",
+    "TaskCursor",
     "TaskEvent",
     "TaskFilter",
+    "TaskGraph",
+    "TaskGraphChanges",
+    "TaskGraphChangesRequest",
+    "TaskGraphChangesResponse",
     "TaskRelation",
+    "TaskRollupCount",
     "TaskStats",
     "TaskStatsRequest",
     "TaskStatsResponse",
+    "TaskSummary",
     "ThroughputBucket",
     "ThroughputRequest",
     "ThroughputResponse",
@@ -143,5 +209,7 @@ __all__ = [
     "WorkerEvent",
     "WorkerEventSnapshotRequest",
     "WorkerEventSnapshotResponse",
+    "WorkerStateCountsRequest",
+    "WorkerStateCountsResponse",
     "WorkerStats",
 ]
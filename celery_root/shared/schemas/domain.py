@@ -9,11 +9,12 @@
 from __future__ import annotations
 
 import datetime as _dt
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
 Datetime = _dt.datetime
+RollupDimension = Literal["name", "state", "worker"]
 
 
 class _BaseSchema(BaseModel):
@@ -72,8 +73,25 @@ class BrokerQueueEvent(_BaseSchema):
     timestamp: Datetime
 
 
-class Task(_BaseSchema):
-    """Stored task record."""
+class BrokerQueueSample(_BaseSchema):
+    """Queue depth history point: a raw change or a per-minute min/max/last rollup.
+
+    Samples are only stored when the depth changes, so a value holds until the next sample.
+    """
+
+    timestamp: Datetime
+    messages: int | None = None
+    consumers: int | None = None
+    min_messages: int | None = None
+    max_messages: int | None = None
+
+
+class TaskSummary(_BaseSchema):
+    """Stored task as returned by list, scan and page queries.
+
+    ``args``, ``kwargs_``, ``result`` and ``traceback`` are previews cut to a few hundred characters and
+    stamps are left out; ``get_task`` returns the full :class:`Task`.
+    """
 
     task_id: str
     name: str | None
@@ -87,7 +105,6 @@ class Task(_BaseSchema):
     kwargs_: str | None = Field(default=None, alias="kwargs")
     result: str | None = None
     traceback: str | None = None
-    stamps: str | None = None
     retries: int | None = None
     parent_id: str | None = None
     root_id: str | None = None
@@ -95,6 +112,12 @@ class Task(_BaseSchema):
     chord_id: str | None = None
 
 
+class Task(TaskSummary):
+    """Stored task record with its full payloads."""
+
+    stamps: str | None = None
+
+
 class Worker(_BaseSchema):
     """Stored worker record."""
 
@@ -132,6 +155,29 @@ class TaskRelation(_BaseSchema):
     relation: str
 
 
+class TaskGraph(_BaseSchema):
+    """Stored tasks and relation edges that make up one workflow graph.
+
+    ``cursor`` is the change sequence the graph was read at; pass it to ``get_task_graph_changes`` to
+    fetch only later changes. Backends without change tracking leave it at 0.
+    """
+
+    root_id: str
+    tasks: list[Task]
+    relations: list[TaskRelation]
+    cursor: int = 0
+
+
+class TaskGraphChanges(_BaseSchema):
+    """Tasks and relation edges of a workflow graph that changed after a cursor."""
+
+    root_id: str
+    cursor: int
+    tasks: list[Task]
+    relations: list[TaskRelation]
+    topology_changed: bool
+
+
 class TaskFilter(_BaseSchema):
     """Filter options for task queries."""
 
@@ -144,6 +190,13 @@ class TaskFilter(_BaseSchema):
     root_id: str | None = None
 
 
+class TaskCursor(_BaseSchema):
+    """Keyset position in a newest-first task scan: the last task returned."""
+
+    last_ts: Datetime | None
+    task_id: str
+
+
 class TaskStats(_BaseSchema):
     """Aggregated task statistics."""
 
@@ -166,8 +219,28 @@ class WorkerStats(_BaseSchema):
     loadavg: tuple[float, float, float] | None = None
 
 
+class EventListenerStats(_BaseSchema):
+    """Write-stage counters of an event listener; the dropped and spilled counts are running totals."""
+
+    broker_url: str
+    pending: int = 0
+    lag_seconds: float = 0.0
+    dropped: int = 0
+    spilled: int = 0
+    metrics_dropped: int = 0
+
+
 class ThroughputBucket(_BaseSchema):
     """Counts for a throughput time bucket."""
 
     bucket_start: Datetime
     count: int
+
+
+class TaskRollupCount(_BaseSchema):
+    """Pre-aggregated task count; dimensions that were not grouped on are None."""
+
+    name: str | None = None
+    state: str | None = None
+    worker: str | None = None
+    count: int
@@ -18,12 +18,19 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 if TYPE_CHECKING:
     from .domain import (
         BrokerQueueEvent,
+        BrokerQueueSample,
+        RollupDimension,
         Schedule,
         Task,
+        TaskCursor,
         TaskEvent,
         TaskFilter,
+        TaskGraph,
+        TaskGraphChanges,
         TaskRelation,
+        TaskRollupCount,
         TaskStats,
+        TaskSummary,
         ThroughputBucket,
         TimeRange,
         Worker,
@@ -32,12 +39,19 @@ if TYPE_CHECKING:
 else:
     _domain = importlib.import_module("celery_root.shared.schemas.domain")
     BrokerQueueEvent = _domain.BrokerQueueEvent
+    BrokerQueueSample = _domain.BrokerQueueSample
+    RollupDimension = _domain.RollupDimension
     Schedule = _domain.Schedule
     Task = _domain.Task
+    TaskCursor = _domain.TaskCursor
     TaskEvent = _domain.TaskEvent
     TaskFilter = _domain.TaskFilter
+    TaskGraph = _domain.TaskGraph
+    TaskGraphChanges = _domain.TaskGraphChanges
     TaskRelation = _domain.TaskRelation
+    TaskRollupCount = _domain.TaskRollupCount
     TaskStats = _domain.TaskStats
+    TaskSummary = _domain.TaskSummary
     ThroughputBucket = _domain.ThroughputBucket
     TimeRange = _domain.TimeRange
     Worker = _domain.Worker
@@ -72,6 +86,7 @@ class RpcRequestEnvelope(_BaseSchema):
     timestamp: Datetime | None = None
     client: str | None = None
     trace: dict[str, str] | None = None
+    codec: Literal["json", "msgpack"] = "json"
 
 
 class RpcResponseEnvelope(_BaseSchema):
@@ -83,6 +98,7 @@ class RpcResponseEnvelope(_BaseSchema):
     error: RpcError | None = None
     schema_version: int = RPC_SCHEMA_VERSION
     timestamp: Datetime | None = None
+    codec: Literal["json", "msgpack"] = "json"
 
 
 class Ok(_BaseSchema):
@@ -108,6 +124,18 @@ class IngestTaskEventRequest(_BaseSchema):
     idempotency_key: str | None = None
 
 
+class IngestTaskEventBatchRequest(_BaseSchema):
+    """Request to ingest a batch of task events in one transaction."""
+
+    events: list[TaskEvent]
+
+
+class IngestTaskEventBatchResponse(_BaseSchema):
+    """Response with the number of ingested task events."""
+
+    stored: int
+
+
 class IngestWorkerEventRequest(_BaseSchema):
     """Request to ingest a worker event."""
 
@@ -115,6 +143,18 @@ class IngestWorkerEventRequest(_BaseSchema):
     idempotency_key: str | None = None
 
 
+class IngestWorkerEventBatchRequest(_BaseSchema):
+    """Request to ingest a batch of worker events in one transaction."""
+
+    events: list[WorkerEvent]
+
+
+class IngestWorkerEventBatchResponse(_BaseSchema):
+    """Response with the number of ingested worker events."""
+
+    stored: int
+
+
 class IngestBrokerQueueEventRequest(_BaseSchema):
     """Request to ingest a broker queue snapshot."""
 
@@ -122,6 +162,18 @@ class IngestBrokerQueueEventRequest(_BaseSchema):
     idempotency_key: str | None = None
 
 
+class IngestBrokerQueueEventBatchRequest(_BaseSchema):
+    """Request to ingest a batch of broker queue snapshots in one transaction."""
+
+    events: list[BrokerQueueEvent]
+
+
+class IngestBrokerQueueEventBatchResponse(_BaseSchema):
+    """Response with the number of ingested broker queue snapshots."""
+
+    stored: int
+
+
 class BrokerQueueSnapshotRequest(_BaseSchema):
     """Request latest broker queue snapshots."""
 
@@ -134,6 +186,20 @@ class BrokerQueueSnapshotResponse(_BaseSchema):
     events: list[BrokerQueueEvent]
 
 
+class BrokerQueueHistoryRequest(_BaseSchema):
+    """Request the depth history of one broker queue."""
+
+    broker_url: str
+    queue: str
+    time_range: TimeRange
+
+
+class BrokerQueueHistoryResponse(_BaseSchema):
+    """Response with broker queue depth history."""
+
+    samples: list[BrokerQueueSample]
+
+
 class WorkerEventSnapshotRequest(_BaseSchema):
     """Request latest worker event snapshot."""
 
@@ -162,7 +228,22 @@ class ListTasksRequest(_BaseSchema):
 class ListTasksResponse(_BaseSchema):
     """Response with matching tasks."""
 
-    tasks: list[Task]
+    tasks: list[TaskSummary]
+
+
+class ScanTasksRequest(_BaseSchema):
+    """Request for the next chunk of a keyset-paginated task scan."""
+
+    filters: TaskFilter | None = None
+    cursor: TaskCursor | None = None
+    limit: int = Field(default=500, gt=0, le=5_000)
+
+
+class ScanTasksResponse(_BaseSchema):
+    """Chunk of a task scan; ``next_cursor`` is ``None`` once the scan is complete."""
+
+    tasks: list[TaskSummary]
+    next_cursor: TaskCursor | None = None
 
 
 class ListTasksPageRequest(_BaseSchema):
@@ -178,7 +259,7 @@ class ListTasksPageRequest(_BaseSchema):
 class ListTasksPageResponse(_BaseSchema):
     """Response with paginated tasks and total count."""
 
-    tasks: list[Task]
+    tasks: list[TaskSummary]
     total: int
 
 
@@ -204,6 +285,43 @@ class GetTaskResponse(_BaseSchema):
     task: Task | None
 
 
+class GetManyTasksRequest(_BaseSchema):
+    """Request to fetch several tasks by ID in one round trip."""
+
+    task_ids: list[str]
+
+
+class GetManyTasksResponse(_BaseSchema):
+    """Response with the stored tasks among the requested IDs."""
+
+    tasks: list[Task]
+
+
+class BuildTaskGraphRequest(_BaseSchema):
+    """Request the workflow graph containing a task."""
+
+    task_id: str
+
+
+class BuildTaskGraphResponse(_BaseSchema):
+    """Response with the workflow graph, or ``None`` if the task is unknown."""
+
+    graph: TaskGraph | None
+
+
+class TaskGraphChangesRequest(_BaseSchema):
+    """Request the changes to a workflow graph after a change cursor."""
+
+    task_id: str
+    since: int = Field(ge=0)
+
+
+class TaskGraphChangesResponse(_BaseSchema):
+    """Response with graph changes, or ``None`` if the backend does not track them."""
+
+    changes: TaskGraphChanges | None
+
+
 class ListTaskRelationsRequest(_BaseSchema):
     """Request to list relations for a root task."""
 
@@ -274,6 +392,53 @@ class StateDistributionResponse(_BaseSchema):
     counts: dict[str, int]
 
 
+class WorkerStateCountsRequest(_BaseSchema):
+    """Request task counts by state for each worker."""
+
+
+class WorkerStateCountsResponse(_BaseSchema):
+    """Response with task state counts keyed by worker hostname."""
+
+    counts: dict[str, dict[str, int]]
+
+
+class RollupCountsRequest(_BaseSchema):
+    """Request pre-aggregated task counts."""
+
+    time_range: TimeRange | None = None
+    group_by: list[RollupDimension] = Field(default_factory=list)
+
+
+class RollupCountsResponse(_BaseSchema):
+    """Response with pre-aggregated task counts."""
+
+    counts: list[TaskRollupCount]
+
+
+class RollupThroughputRequest(_BaseSchema):
+    """Request throughput data from the rollup tables."""
+
+    time_range: TimeRange
+    bucket_seconds: int
+
+
+class RollupTaskStatsRequest(_BaseSchema):
+    """Request task statistics estimated from the runtime histogram."""
+
+    task_name: str | None = None
+    time_range: TimeRange | None = None
+
+
+class RebuildRollupsRequest(_BaseSchema):
+    """Request a full rebuild of the rollup tables."""
+
+
+class RebuildRollupsResponse(_BaseSchema):
+    """Response with the number of tasks aggregated by the rebuild."""
+
+    tasks: int
+
+
 class HeatmapRequest(_BaseSchema):
     """Request heatmap data."""
 
@@ -320,6 +485,27 @@ class CleanupResponse(_BaseSchema):
     removed: int
 
 
+class RetentionStatusRequest(_BaseSchema):
+    """Request the progress of the background retention job."""
+
+
+class RetentionStatusResponse(_BaseSchema):
+    """Progress metrics of the background retention job."""
+
+    enabled: bool = False
+    retention_days: int | None = None
+    running: bool = False
+    runs: int = 0
+    chunks: int = 0
+    last_started: Datetime | None = None
+    last_finished: Datetime | None = None
+    last_duration_seconds: float | None = None
+    last_removed: int = 0
+    total_removed: int = 0
+    removed_by_table: dict[str, int] = Field(default_factory=dict)
+    last_error: str | None = None
+
+
 class SchemaVersionRequest(_BaseSchema):
     """Request current schema version."""
 
@@ -224,7 +224,7 @@ function GraphCanvas({ payload, options }: GraphAppProps) {
   const manualPositionsRef = useRef<Map<string, { x: number; y: number }>>(new Map());
   const lastLayoutKeyRef = useRef<string | null>(null);
   const hasFitRef = useRef(false);
-  const lastUpdateRef = useRef<string | null>(payload.meta?.generated_at ?? null);
+  const lastUpdateRef = useRef<string | null>(null);
   const completedAtRef = useRef<number | null>(null);
   const [layoutPositions, setLayoutPositions] = useState<Map<string, { x: number; y: number }> | null>(null);
   const edgeRenderKeyRef = useRef<string | null>(null);
@@ -233,6 +233,9 @@ function GraphCanvas({ payload, options }: GraphAppProps) {
 
   useEffect(() => {
     graphModelRef.current = graphModel;
+    if (graphModel.meta?.cursor !== undefined) {
+      lastUpdateRef.current = String(graphModel.meta.cursor);
+    }
     if (graphModel.edges.length > 0) {
       hasSeenEdgesRef.current = true;
       lastStableEdgesRef.current = graphModel.edges;
@@ -701,7 +704,7 @@ function GraphCanvas({ payload, options }: GraphAppProps) {
         return;
       }
       const payload = (await response.json()) as GraphUpdatePayload;
-      lastUpdateRef.current = payload.generated_at;
+      // On topology changes the cursor advances with the snapshot that gets loaded below.
       if (payload.topology_changed) {
         const snapshotUrl = deriveSnapshotUrl(options);
         if (snapshotUrl) {
@@ -720,12 +723,13 @@ function GraphCanvas({ payload, options }: GraphAppProps) {
         }
         return;
       }
+      lastUpdateRef.current = payload.cursor !== undefined ? String(payload.cursor) : null;
       if (payload.node_updates.length === 0) {
         return;
       }
       if (
-        payload.node_count !== currentModel.nodes.size ||
-        payload.edge_count !== currentModel.edges.length
+        (payload.node_count !== undefined && payload.node_count !== currentModel.nodes.size) ||
+        (payload.edge_count !== undefined && payload.edge_count !== currentModel.edges.length)
       ) {
         const snapshotUrl = deriveSnapshotUrl(options);
         if (snapshotUrl) {
@@ -774,7 +778,8 @@ function GraphCanvas({ payload, options }: GraphAppProps) {
             root_id: current.root_id,
           });
         });
-        return { ...prev, nodes: updatedNodes, meta: { ...prev.meta, counts: payload.meta_counts } };
+        const counts = payload.meta_counts ?? computeCounts(updatedNodes.values());
+        return { ...prev, nodes: updatedNodes, meta: { ...prev.meta, counts, cursor: payload.cursor } };
       });
     };
 
@@ -27,6 +27,7 @@ export interface GraphMeta {
   root_id: string | null;
   generated_at: string | null;
   counts: GraphMetaCounts;
+  cursor?: number;
 }
 
 export interface GraphNodePayload {
@@ -73,9 +74,12 @@ export interface GraphOptions {
 
 export interface GraphUpdatePayload {
   generated_at: string | null;
+  cursor?: number;
   node_updates: Array<Partial<GraphNodePayload> & { id: string }>;
-  meta_counts: GraphMetaCounts;
+  edge_updates?: GraphEdgePayload[];
   topology_changed: boolean;
-  node_count: number;
-  edge_count: number;
+  // Only full updates, requested without `since`, carry graph-wide counts.
+  meta_counts?: GraphMetaCounts;
+  node_count?: number;
+  edge_count?: number;
 }
@@ -31,7 +31,7 @@ from celery_root.config import (
 from celery_root.core.db.adapters.sqlite import SQLiteController
 from celery_root.core.db.manager import DBManager
 from celery_root.core.db.models import Schedule, TaskEvent, WorkerEvent
-from celery_root.core.db.rpc_client import DbRpcClient
+from celery_root.core.db.rpc_client import DbRpcClient, close_shared_pools
 from tests.fixtures.app_one import app as app_one
 from tests.fixtures.app_two import app as app_two
 
@@ -106,6 +106,7 @@ def web_client(tmp_path_factory: pytest.TempPathFactory) -> Generator[Client, No
     try:
         yield Client()
     finally:
+        close_shared_pools()
         manager.stop()
         manager.join(timeout=5)
         if manager.is_alive():
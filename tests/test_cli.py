@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import pytest
+from click.testing import CliRunner
+
+from celery_root import cli
+from celery_root.config import CeleryRootConfig, DatabaseConfigSqlite, get_settings, set_settings
+from celery_root.core.db.adapters.sqlite import SQLiteController
+from celery_root.core.db.models import TaskEvent
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from celery import Celery
+
+
+@pytest.fixture
+def sqlite_settings(tmp_path: Path) -> Generator[Path]:
+    original = get_settings()
+    db_path = tmp_path / "root.db"
+    set_settings(CeleryRootConfig(database=DatabaseConfigSqlite(db_path=db_path)))
+    try:
+        yield db_path
+    finally:
+        set_settings(original)
+
+
+def test_rebuild_rollups_subcommand(sqlite_settings: Path) -> None:
+    controller = SQLiteController(sqlite_settings)
+    controller.initialize()
+    controller.store_task_event(
+        TaskEvent(
+            task_id="t1",
+            name="demo.add",
+            timestamp=datetime(2024, 1, 1, tzinfo=UTC),
+            worker="w1",
+            state="SUCCESS",
+        ),
+    )
+    controller.close()
+
+    result = CliRunner().invoke(cli.main, ["rebuild-rollups"])
+
+    assert result.exit_code == 0, result.output
+    assert f"Rebuilt rollups from 1 tasks in {sqlite_settings}." in result.output
+
+
+def test_rebuild_rollups_requires_file_backed_sqlite() -> None:
+    original = get_settings()
+    set_settings(CeleryRootConfig(database=DatabaseConfigSqlite(db_path=None)))
+    try:
+        result = CliRunner().invoke(cli.main, ["rebuild-rollups"])
+    finally:
+        set_settings(original)
+
+    assert result.exit_code != 0
+    assert "file-backed SQLite database" in result.output
+
+
+def test_main_treats_other_arguments_as_worker_paths(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen: dict[str, object] = {}
+
+    def _fake_load_apps(paths: list[str]) -> tuple[Celery, ...]:
+        seen["paths"] = paths
+        return ()
+
+    monkeypatch.setattr(cli, "_load_apps", _fake_load_apps)
+
+    result = CliRunner().invoke(cli.main, ["proj.celery:app", "--port", "5555"])
+
+    assert result.exit_code != 0
+    assert seen["paths"] == ["proj.celery:app"]
+    assert "No Celery app configured" in result.output
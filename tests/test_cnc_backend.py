@@ -9,8 +9,10 @@ from __future__ import annotations
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, cast
 
+from celery import Celery
+
 if TYPE_CHECKING:
-    from celery import Celery
+    from pathlib import Path
 
 from celery_root.core.engine import backend
 from celery_root.core.registry import WorkerRegistry
@@ -100,3 +102,50 @@ def test_clear_results_by_task_id() -> None:
     assert cleared == 1
     remaining = backend.list_results(registry, "dummy")
     assert {res.task_id for res in remaining} == {"task-2"}
+
+
+class _ListMgetBackend:
+    def __init__(self, store: dict[str, str]) -> None:
+        self.store = store
+        self.mget_calls: list[int] = []
+
+    def get_key_for_task(self, task_id: str) -> str:
+        return f"celery-task-meta-{task_id}"
+
+    def mget(self, keys: list[str]) -> list[str | None]:
+        self.mget_calls.append(len(keys))
+        return [self.store.get(key.removeprefix("celery-task-meta-")) for key in keys]
+
+    def decode_result(self, payload: str) -> dict[str, object]:
+        return {"status": payload}
+
+
+def test_get_task_metas_chunks_mget_lookups() -> None:
+    store = {f"t{index}": "SUCCESS" for index in range(5)}
+    result_backend = _ListMgetBackend(store)
+
+    metas = backend.get_task_metas(result_backend, [*store, "missing"], chunk_size=4)
+
+    assert result_backend.mget_calls == [4, 2]
+    assert sorted(metas) == sorted(store)
+    assert metas["t3"] == {"status": "SUCCESS"}
+
+
+def test_get_task_metas_reads_celery_backends(tmp_path: Path) -> None:
+    for url in ("cache+memory://", f"db+sqlite:///{tmp_path / 'results.db'}"):
+        app = Celery("metas", broker="memory://", backend=url)
+        app.backend.store_result("done", 3, "SUCCESS")
+        app.backend.store_result("failed", ValueError("boom"), "FAILURE")
+
+        metas = backend.get_task_metas(app.backend, ["done", "failed", "unknown"])
+
+        assert metas["done"]["status"] == "SUCCESS"
+        assert metas["done"]["result"] == 3
+        assert metas["failed"]["status"] == "FAILURE"
+        assert "unknown" not in metas
+
+
+def test_get_task_metas_falls_back_to_single_lookups() -> None:
+    metas = backend.get_task_metas(DummyBackend(), ["task-1", "task-2"])
+
+    assert metas["task-2"]["status"] == "FAILURE"
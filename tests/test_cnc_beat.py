@@ -21,6 +21,7 @@ from celery_root.core.db.models import (
     TaskFilter,
     TaskRelation,
     TaskStats,
+    TaskSummary,
     ThroughputBucket,
     TimeRange,
     Worker,
@@ -56,7 +57,7 @@ class FakeDB(BaseDBController):
         sort_dir: str | None,
         limit: int,
         offset: int,
-    ) -> tuple[list[Task], int]:
+    ) -> tuple[list[TaskSummary], int]:
         _ = (sort_key, sort_dir, limit, offset)
         return [], 0
 
@@ -127,3 +127,124 @@ def test_purge_by_pattern() -> None:
 
     assert purged == {"priority": 5}
     assert client.counts.get("priority", 0) == 0
+
+
+class PipelinedRedisClient(DummyRedisClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.counts["celery\x06\x163"] = 2
+        self.counts["celery\x06\x169"] = 1
+        self.round_trips = 0
+
+    def llen(self, key: str) -> int:
+        self.round_trips += 1
+        return super().llen(key)
+
+    def pipeline(self, *, transaction: bool) -> PipelinedRedisClient._Pipeline:
+        assert not transaction
+        return PipelinedRedisClient._Pipeline(self)
+
+    class _Pipeline:
+        def __init__(self, client: PipelinedRedisClient) -> None:
+            self._client = client
+            self._keys: list[str] = []
+
+        def __enter__(self) -> PipelinedRedisClient._Pipeline:
+            return self
+
+        def __exit__(self, *_exc: object) -> None:
+            return None
+
+        def llen(self, key: str) -> None:
+            self._keys.append(key)
+
+        def execute(self) -> list[int]:
+            self._client.round_trips += 1
+            return [self._client.counts.get(key, 0) for key in self._keys]
+
+
+class PriorityRedisChannel(DummyRedisChannel):
+    priority_steps = (0, 3, 6, 9)
+
+
+def test_list_queues_pipelines_priority_queues() -> None:
+    registry = make_registry(DummyApp())
+    client = PipelinedRedisClient()
+    connection = DummyRedisConnection(client)
+    connection.default_channel = PriorityRedisChannel(client)
+
+    infos = broker.list_queues(registry, "dummy", connection=connection)
+
+    assert [(info.name, info.messages) for info in infos] == [("celery", 6), ("priority", 5)]
+    assert client.round_trips == 1
+
+    purged = broker.purge_queues(registry, "dummy", queue="celery", connection=connection)
+
+    assert purged == {"celery": 6}
+    assert "celery\x06\x163" not in client.counts
+
+
+class DummyAmqpChannel:
+    def __init__(self, missing: set[str]) -> None:
+        self._missing = missing
+        self.closed = False
+
+    def queue_declare(self, *, queue: str, passive: bool) -> object:
+        assert passive
+        assert not self.closed
+        if queue in self._missing:
+            self.closed = True
+            msg = f"NOT_FOUND - no queue {queue!r}"
+            raise LookupError(msg)
+        return SimpleNamespace(message_count=len(queue), consumer_count=1)
+
+    def queue_purge(self, *, queue: str) -> object:  # pragma: no cover - not used here
+        _ = queue
+        return 0
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class DummyAmqpConnection:
+    def __init__(self, missing: set[str]) -> None:
+        self.transport = SimpleNamespace(driver_type="amqp")
+        self.default_channel = None
+        self.channels: list[DummyAmqpChannel] = []
+        self._missing = missing
+
+    def channel(self) -> DummyAmqpChannel:
+        channel = DummyAmqpChannel(self._missing)
+        self.channels.append(channel)
+        return channel
+
+
+def test_list_queues_reuses_amqp_channel() -> None:
+    connection = DummyAmqpConnection(missing={"b"})
+
+    infos = broker.queue_stats(["a", "b", "c", "dd"], connection=cast("broker._Connection", connection))
+
+    assert [(info.name, info.messages) for info in infos] == [("a", 1), ("b", None), ("c", 1), ("dd", 2)]
+    # One channel for the whole poll, plus one replacing the channel the failed declare closed.
+    assert len(connection.channels) == 2
+    assert all(channel.closed for channel in connection.channels)
+
+
+def test_broker_queue_stats_unions_configured_queues_of_shared_apps() -> None:
+    class _SilentInspector:
+        def active_queues(self) -> None:
+            return None
+
+    first = DummyApp()
+    first.control._inspector = cast("DummyInspector", _SilentInspector())
+    second = DummyApp()
+    second.conf = SimpleNamespace(task_queues=[SimpleNamespace(name="priority"), SimpleNamespace(name="reports")])
+    client = DummyRedisClient()
+    connection = DummyRedisConnection(client)
+
+    infos = broker.broker_queue_stats(
+        [cast("Celery", first), cast("Celery", second)],
+        connection=cast("broker._Connection", connection),
+    )
+
+    assert [(info.name, info.messages) for info in infos] == [("celery", 3), ("priority", 5), ("reports", 0)]
@@ -24,6 +24,7 @@ from celery_root.core.db.models import (
     TaskFilter,
     TaskRelation,
     TaskStats,
+    TaskSummary,
     ThroughputBucket,
     TimeRange,
     Worker,
@@ -60,9 +61,9 @@ class FakeDB(BaseDBController):
         sort_dir: str | None,
         limit: int,
         offset: int,
-    ) -> tuple[list[Task], int]:
+    ) -> tuple[list[TaskSummary], int]:
         _ = (sort_key, sort_dir)
-        tasks = list(self.tasks.values())
+        tasks: list[TaskSummary] = list(self.tasks.values())
         total = len(tasks)
         return tasks[offset : offset + limit], total
 
@@ -0,0 +1,178 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import threading
+import uuid
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from celery_root.config import CeleryRootConfig, DatabaseConfigSqlite
+from celery_root.core.db import codec, manager, rpc_client
+from celery_root.core.db.adapters.sqlite import SQLiteController
+from celery_root.shared.schemas import (
+    ListTasksRequest,
+    ListTasksResponse,
+    RpcError,
+    RpcRequestEnvelope,
+    RpcResponseEnvelope,
+)
+from celery_root.shared.schemas.domain import Task, TaskEvent
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from pathlib import Path
+
+pytest.importorskip("msgpack")
+
+
+def test_envelope_round_trip_preserves_datetimes() -> None:
+    aware = datetime(2026, 1, 2, 3, 4, 5, 678_000, tzinfo=UTC)
+    naive = datetime(2026, 1, 2, 3, 4, 5)  # noqa: DTZ001
+    payload = ListTasksResponse(
+        tasks=[Task(task_id="t1", name="demo", state="SUCCESS", received=aware, started=naive)],
+        total=1,
+    ).model_dump(mode=codec.payload_mode("msgpack"))
+    envelope = RpcResponseEnvelope(request_id="req", ok=True, payload=payload, timestamp=aware, codec="msgpack")
+    data = codec.encode_envelope(envelope, "msgpack")
+    assert codec.detect_codec(data) == "msgpack"
+    assert len(data) < len(codec.encode_envelope(envelope, "json"))
+    decoded = codec.decode_envelope(data, RpcResponseEnvelope)
+    assert decoded.timestamp == aware
+    task = ListTasksResponse.model_validate(decoded.payload).tasks[0]
+    assert task.received == aware
+    assert task.started == naive
+
+
+def test_decode_rejects_garbage_frames() -> None:
+    assert codec.detect_codec(b"{}") == "json"
+    with pytest.raises(codec.RpcFrameError):
+        codec.decode_envelope(b"\x01", RpcRequestEnvelope)
+
+
+def test_manager_answers_each_client_in_its_codec(tmp_path: Path) -> None:
+    db_path = tmp_path / "root.db"
+    db_manager = manager.DBManager(CeleryRootConfig(database=DatabaseConfigSqlite(db_path=db_path)))
+    controller = SQLiteController(db_path)
+    controller.initialize()
+    controller.store_task_event(
+        TaskEvent(task_id="t1", name="demo", state="SUCCESS", timestamp=datetime.now(UTC)),
+    )
+    lock = threading.Lock()
+    for wire in ("json", "msgpack"):
+        request = RpcRequestEnvelope(
+            request_id=f"req-{wire}",
+            op="tasks.list",
+            payload=ListTasksRequest().model_dump(mode=codec.payload_mode(wire)),
+            codec=wire,
+        )
+        data = db_manager._dispatch(codec.encode_envelope(request, wire), controller, lock)
+        assert codec.detect_codec(data) == wire
+        response = codec.decode_envelope(data, RpcResponseEnvelope)
+        assert response.ok, response.error
+        assert [task.task_id for task in ListTasksResponse.model_validate(response.payload).tasks] == ["t1"]
+    controller.close()
+
+
+def test_manager_rejects_msgpack_without_library(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    db_path = tmp_path / "root.db"
+    db_manager = manager.DBManager(CeleryRootConfig(database=DatabaseConfigSqlite(db_path=db_path)))
+    request = RpcRequestEnvelope(request_id="req", op="db.ping", codec="msgpack")
+    data = codec.encode_envelope(request, "msgpack")
+    monkeypatch.setattr(manager, "msgpack_available", lambda: False)
+    response = codec.decode_envelope(
+        db_manager._dispatch(data, SQLiteController(db_path), threading.Lock()),
+        RpcResponseEnvelope,
+    )
+    assert not response.ok
+    assert response.error is not None
+    assert response.error.code == "CODEC_UNSUPPORTED"
+
+
+class _ScriptedConnection:
+    def __init__(self, responses: list[bytes]) -> None:
+        self._responses = responses
+        self.sent: list[bytes] = []
+
+    def send_bytes(self, data: bytes) -> None:
+        self.sent.append(data)
+
+    def poll(self, _timeout: float) -> bool:
+        return True
+
+    def recv_bytes(self) -> bytes:
+        return self._responses.pop(0)
+
+    def close(self) -> None:
+        return None
+
+
+def test_transport_falls_back_to_json(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _FakeUuid:
+        hex = "req"
+
+    def _fake_uuid4() -> _FakeUuid:
+        return _FakeUuid()
+
+    monkeypatch.setattr(uuid, "uuid4", _fake_uuid4)
+    now = datetime.now(UTC)
+    rejected = RpcResponseEnvelope(
+        request_id="req",
+        ok=False,
+        error=RpcError(code="CODEC_UNSUPPORTED", message="no msgpack"),
+        timestamp=now,
+    )
+    accepted = RpcResponseEnvelope(request_id="req", ok=True, payload={}, timestamp=now)
+    connection = _ScriptedConnection(
+        [rejected.model_dump_json().encode("utf-8"), accepted.model_dump_json().encode("utf-8")],
+    )
+    settings = rpc_client._RpcSettings(
+        address="addr",
+        authkey=None,
+        timeout_seconds=0.1,
+        max_message_bytes=1024,
+        codec="msgpack",
+    )
+    transport = rpc_client._RpcTransport(settings, client_name="tests")
+    transport._connection = cast("Connection", connection)
+    assert transport.payload_mode == "python"
+    assert transport.request("db.ping", {}, max_retries=0).ok
+    assert [codec.detect_codec(frame) for frame in connection.sent] == ["msgpack", "json"]
+    assert transport.payload_mode == "json"
+
+
+def test_transport_keeps_msgpack_on_ordinary_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _FakeUuid:
+        hex = "req"
+
+    def _fake_uuid4() -> _FakeUuid:
+        return _FakeUuid()
+
+    monkeypatch.setattr(uuid, "uuid4", _fake_uuid4)
+    failed = RpcResponseEnvelope(
+        request_id="req",
+        ok=False,
+        error=RpcError(code="OP_NOT_FOUND", message="unknown op"),
+        timestamp=datetime.now(UTC),
+    )
+    connection = _ScriptedConnection([failed.model_dump_json().encode("utf-8")])
+    settings = rpc_client._RpcSettings(
+        address="addr",
+        authkey=None,
+        timeout_seconds=0.1,
+        max_message_bytes=1024,
+        codec="msgpack",
+    )
+    transport = rpc_client._RpcTransport(settings, client_name="tests")
+    transport._connection = cast("Connection", connection)
+    response = transport.request("db.ping", {}, max_retries=0)
+    assert response.error is not None
+    assert response.error.code == "OP_NOT_FOUND"
+    assert [codec.detect_codec(frame) for frame in connection.sent] == ["msgpack"]
+    assert transport.payload_mode == "python"
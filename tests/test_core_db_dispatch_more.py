@@ -6,23 +6,34 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
+from celery_root.core.db import retention
 from celery_root.core.db.adapters.sqlite import SQLiteController
 from celery_root.core.db.dispatch import RPC_OPERATIONS
 from celery_root.shared.schemas import (
     BrokerQueueSnapshotRequest,
     GetTaskRequest,
     IngestBrokerQueueEventRequest,
+    IngestTaskEventBatchRequest,
     IngestTaskEventRequest,
     IngestWorkerEventRequest,
     ListTaskNamesRequest,
     ListTasksPageRequest,
     ListTasksRequest,
+    RebuildRollupsRequest,
+    RetentionStatusRequest,
+    RollupCountsRequest,
+    RollupTaskStatsRequest,
+    RollupThroughputRequest,
     StoreTaskRelationRequest,
     WorkerEventSnapshotRequest,
 )
-from celery_root.shared.schemas.domain import BrokerQueueEvent, TaskEvent, TaskRelation, WorkerEvent
+from celery_root.shared.schemas.domain import BrokerQueueEvent, TaskEvent, TaskRelation, TimeRange, WorkerEvent
+
+if TYPE_CHECKING:
+    import pytest
 
 
 def test_dispatch_operations() -> None:
@@ -73,3 +84,87 @@ def test_dispatch_operations() -> None:
     assert worker_snapshot.event is not None
 
     controller.close()
+
+
+def test_dispatch_ingest_batch_stores_events_and_relations() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    controller.ensure_schema()
+
+    now = datetime.now(UTC)
+    events = [
+        TaskEvent(task_id="root", name="demo", state="SUCCESS", timestamp=now),
+        TaskEvent(task_id="child", name="demo", state="STARTED", timestamp=now, parent_id="root", root_id="root"),
+        TaskEvent(task_id="child", name="demo", state="SUCCESS", timestamp=now, parent_id="root", root_id="root"),
+    ]
+    response = RPC_OPERATIONS["events.task.ingest_batch"].handler(
+        controller,
+        IngestTaskEventBatchRequest(events=events),
+    )
+    assert response.stored == 3
+
+    child = controller.get_task("child")
+    assert child is not None
+    assert child.state == "SUCCESS"
+    relations = controller.get_task_relations("root")
+    assert {relation.child_id for relation in relations} == {"child"}
+
+    controller.close()
+
+
+def test_dispatch_rollup_operations() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    controller.ensure_schema()
+
+    now = datetime.now(UTC)
+    controller.store_task_events(
+        [
+            TaskEvent(task_id="t1", name="demo", state="SUCCESS", timestamp=now, worker="w1", runtime=0.3),
+            TaskEvent(task_id="t2", name="demo", state="FAILURE", timestamp=now, worker="w1", runtime=1.2),
+        ],
+    )
+    time_range = TimeRange(start=now - timedelta(hours=1), end=now)
+
+    counts = (
+        RPC_OPERATIONS["stats.rollup.counts"]
+        .handler(
+            controller,
+            RollupCountsRequest(time_range=time_range, group_by=["state"]),
+        )
+        .counts
+    )
+    assert {row.state: row.count for row in counts} == {"SUCCESS": 1, "FAILURE": 1}
+
+    buckets = (
+        RPC_OPERATIONS["stats.rollup.throughput"]
+        .handler(
+            controller,
+            RollupThroughputRequest(time_range=time_range, bucket_seconds=600),
+        )
+        .buckets
+    )
+    assert sum(bucket.count for bucket in buckets) == 2
+
+    stats = (
+        RPC_OPERATIONS["stats.rollup.task"]
+        .handler(
+            controller,
+            RollupTaskStatsRequest(task_name="demo", time_range=time_range),
+        )
+        .stats
+    )
+    assert stats.count == 2
+
+    rebuilt = RPC_OPERATIONS["stats.rollup.rebuild"].handler(controller, RebuildRollupsRequest())
+    assert rebuilt.tasks == 2
+
+    controller.close()
+
+
+def test_dispatch_retention_status_without_scheduler(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(retention, "_ACTIVE", [None])
+    controller = SQLiteController()
+    status = RPC_OPERATIONS["db.retention.status"].handler(controller, RetentionStatusRequest())
+    assert not status.enabled
+    assert status.runs == 0
@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from celery_root.config import CeleryRootConfig, DatabaseConfigSqlite
+from celery_root.core.db.adapters.sqlite import SQLiteController
+from celery_root.core.db.dispatch import RPC_OPERATIONS
+from celery_root.core.db.manager import DBManager
+from celery_root.shared.schemas import (
+    IngestTaskEventBatchRequest,
+    ListTasksRequest,
+    RpcRequestEnvelope,
+    RpcResponseEnvelope,
+)
+from celery_root.shared.schemas.domain import TaskEvent
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _events(prefix: str, count: int) -> list[TaskEvent]:
+    now = datetime.now(UTC)
+    return [
+        TaskEvent(task_id=f"{prefix}-{index}", name=f"demo.task_{index % 7}", state="SUCCESS", timestamp=now)
+        for index in range(count)
+    ]
+
+
+def _frame(op: str, payload: dict[str, object]) -> bytes:
+    return RpcRequestEnvelope(request_id=op, op=op, payload=payload).model_dump_json().encode("utf-8")
+
+
+def _ok(data: bytes) -> bool:
+    return RpcResponseEnvelope.model_validate_json(data).ok
+
+
+def _manager(db_path: Path) -> tuple[DBManager, SQLiteController]:
+    controller = SQLiteController(db_path)
+    controller.initialize()
+    manager = DBManager(CeleryRootConfig(database=DatabaseConfigSqlite(db_path=db_path)))
+    manager._reader = controller.open_reader(4)
+    return manager, controller
+
+
+def test_operations_declare_access() -> None:
+    assert RPC_OPERATIONS["tasks.list"].access == "read"
+    assert RPC_OPERATIONS["stats.rollup.counts"].access == "read"
+    assert RPC_OPERATIONS["tasks.get_many"].access == "read"
+    assert RPC_OPERATIONS["graph.build"].access == "read"
+    assert RPC_OPERATIONS["broker.queues.history"].access == "read"
+    assert RPC_OPERATIONS["events.task.ingest_batch"].access == "write"
+    assert RPC_OPERATIONS["events.worker.ingest_batch"].access == "write"
+    assert RPC_OPERATIONS["events.broker_queue.ingest_batch"].access == "write"
+    assert RPC_OPERATIONS["stats.rollup.rebuild"].access == "write"
+    assert RPC_OPERATIONS["schedules.store"].access == "write"
+
+
+def test_reader_is_read_only(tmp_path: Path) -> None:
+    assert SQLiteController().open_reader(4) is None
+    controller = SQLiteController(tmp_path / "root.db")
+    controller.initialize()
+    controller.store_task_events(_events("t", 3))
+    reader = controller.open_reader(2)
+    assert reader is not None
+    assert len(reader.get_tasks()) == 3
+    with pytest.raises(OperationalError):
+        reader.store_task_events(_events("r", 1))
+    reader.close()
+    controller.close()
+
+
+def test_reads_do_not_wait_for_the_writer_lock(tmp_path: Path) -> None:
+    manager, controller = _manager(tmp_path / "root.db")
+    controller.store_task_events(_events("seed", 5))
+    lock = threading.Lock()
+    results: dict[str, bytes] = {}
+
+    def _run(op: str, payload: dict[str, object]) -> None:
+        results[op] = manager._dispatch(_frame(op, payload), controller, lock)
+
+    ingest = IngestTaskEventBatchRequest(events=_events("new", 2)).model_dump(mode="json")
+    with lock:  # A long write holds the writer.
+        reader = threading.Thread(target=_run, args=("tasks.list", ListTasksRequest().model_dump(mode="json")))
+        writer = threading.Thread(target=_run, args=("events.task.ingest_batch", ingest))
+        reader.start()
+        writer.start()
+        reader.join(timeout=5)
+        assert not reader.is_alive()
+        assert _ok(results["tasks.list"])
+        assert writer.is_alive()
+    writer.join(timeout=5)
+    assert _ok(results["events.task.ingest_batch"])
+    assert manager._reader is not None
+    manager._reader.close()
+    controller.close()
+
+
+def test_ingest_keeps_up_under_heavy_list_queries(tmp_path: Path) -> None:
+    manager, controller = _manager(tmp_path / "root.db")
+    controller.store_task_events(_events("seed", 1_000))
+    lock = threading.Lock()
+    stop = threading.Event()
+    reads = [0] * 4
+    failures: list[bytes] = []
+    list_frame = _frame("tasks.list", ListTasksRequest().model_dump(mode="json"))
+
+    def _read_loop(slot: int) -> None:
+        while not stop.is_set():
+            response = manager._dispatch(list_frame, controller, lock)
+            if not _ok(response):
+                failures.append(response)
+            reads[slot] += 1
+
+    readers = [threading.Thread(target=_read_loop, args=(slot,)) for slot in range(len(reads))]
+    for reader in readers:
+        reader.start()
+    try:
+        began = time.monotonic()
+        for batch in range(10):
+            payload = IngestTaskEventBatchRequest(events=_events(f"b{batch}", 50)).model_dump(mode="json")
+            assert _ok(manager._dispatch(_frame("events.task.ingest_batch", payload), controller, lock))
+        ingest_seconds = time.monotonic() - began
+    finally:
+        stop.set()
+        for reader in readers:
+            reader.join(timeout=30)
+    assert not failures
+    assert sum(reads) > 0
+    assert len(controller.get_tasks()) == 1_500
+    # Generous bound: ingestion must not queue behind the full-table reads.
+    assert ingest_seconds < 30
+    assert manager._reader is not None
+    manager._reader.close()
+    controller.close()
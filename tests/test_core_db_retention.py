@@ -0,0 +1,205 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Self
+
+from sqlalchemy import func, select, text
+
+from celery_root.core.db import retention
+from celery_root.core.db.adapters.sqlite import SQLiteController
+from celery_root.core.db.archive import JsonlArchive
+from celery_root.core.db.models import BrokerQueueEvent, TaskEvent, TimeRange, WorkerEvent
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import TracebackType
+
+    import pytest
+
+
+def _populate(controller: SQLiteController, *, old: int, recent: int) -> None:
+    now = datetime.now(UTC)
+    past = now - timedelta(days=30)
+    controller.store_task_events(
+        [TaskEvent(task_id=f"old-{index}", name="demo", state="SUCCESS", timestamp=past) for index in range(old)]
+        + [TaskEvent(task_id=f"new-{index}", name="demo", state="SUCCESS", timestamp=now) for index in range(recent)],
+    )
+    for index in range(old):
+        controller.store_worker_event(WorkerEvent(hostname="w1", event="worker-heartbeat", timestamp=past))
+        controller.store_broker_queue_event(
+            BrokerQueueEvent(broker_url="redis://", queue=f"q{index}", messages=1, consumers=0, timestamp=past),
+        )
+
+
+def _count(controller: SQLiteController, table: str) -> int:
+    with controller._engine.begin() as conn:
+        return int(conn.execute(select(func.count()).select_from(text(table))).scalar_one())
+
+
+class _CountingLock:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.acquired = 0
+
+    def __enter__(self) -> Self:
+        self._lock.acquire()
+        self.acquired += 1
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc: BaseException | None,
+        _tb: TracebackType | None,
+    ) -> None:
+        self._lock.release()
+
+
+def test_purge_expired_deletes_in_bounded_chunks() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    _populate(controller, old=10, recent=3)
+    cutoff = datetime.now(UTC) - timedelta(days=7)
+    chunks: list[tuple[str, int]] = []
+    while (chunk := controller.purge_expired(cutoff, 4)) is not None:
+        chunks.append(chunk)
+    assert all(removed <= 4 for _table, removed in chunks)
+    assert [table for table, _removed in chunks][:3] == ["task_events", "task_events", "task_events"]
+    removed_by_table: dict[str, int] = {}
+    for table, removed in chunks:
+        removed_by_table[table] = removed_by_table.get(table, 0) + removed
+    assert removed_by_table["task_events"] == 10
+    assert removed_by_table["tasks"] == 10
+    assert removed_by_table["worker_events"] == 10
+    assert removed_by_table["broker_queue_events"] == 10
+    assert removed_by_table["workers"] == 1
+    assert _count(controller, "tasks") == 3
+    assert _count(controller, "task_events") == 3
+    assert [row.count for row in controller.get_rollup_counts(None)] == [3]
+    controller.close()
+
+
+def test_scheduler_yields_lock_between_chunks_and_reports_progress() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    _populate(controller, old=9, recent=2)
+    lock = _CountingLock()
+    scheduler = retention.RetentionScheduler(
+        controller,
+        lock,  # type: ignore[arg-type]
+        multiprocessing.Event(),
+        retention_days=7,
+        interval_seconds=60.0,
+        chunk_size=5,
+    )
+    removed = scheduler.run_once()
+    status = scheduler.status()
+    assert removed == status.last_removed == status.total_removed
+    assert status.removed_by_table["task_events"] == 9
+    # One lock acquisition per chunk plus the final probe that finds nothing left.
+    assert lock.acquired == status.chunks + 1
+    # Task events, tasks, worker events and queue events each hold nine expired rows: two chunks apiece.
+    assert status.chunks >= 4 * 2
+    assert status.runs == 1
+    assert not status.running
+    assert status.last_duration_seconds is not None
+    assert scheduler.run_once() == 0
+    assert scheduler.status().total_removed == removed
+    controller.close()
+
+
+def test_retention_status_reports_active_scheduler(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(retention, "_ACTIVE", [None])
+    assert not retention.retention_status().enabled
+    controller = SQLiteController()
+    controller.initialize()
+    stop_event = multiprocessing.Event()
+    scheduler = retention.RetentionScheduler(
+        controller,
+        threading.Lock(),
+        stop_event,
+        retention_days=3,
+        interval_seconds=60.0,
+        chunk_size=100,
+    )
+    thread = scheduler.start()
+    try:
+        status = retention.retention_status()
+        assert status.enabled
+        assert status.retention_days == 3
+    finally:
+        stop_event.set()
+        thread.join(timeout=5)
+        controller.close()
+
+
+def test_compact_reclaims_pages(tmp_path: Path) -> None:
+    controller = SQLiteController(tmp_path / "retention.db")
+    controller.initialize()
+    _populate(controller, old=300, recent=0)
+    controller.cleanup(7)
+    with controller._engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA auto_vacuum").scalar_one() == 2  # INCREMENTAL
+    controller.compact("wal_checkpoint")
+    with controller._engine.connect() as conn:
+        free_before = conn.exec_driver_sql("PRAGMA freelist_count").scalar_one()
+    assert free_before > 0
+    controller.compact("incremental_vacuum")
+    with controller._engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA freelist_count").scalar_one() == 0
+    controller.compact("none")
+    controller.close()
+
+
+def test_purge_expired_moves_rows_to_the_archive(tmp_path: Path) -> None:
+    controller = SQLiteController(tmp_path / "retention.db", archive_path=tmp_path / "archive")
+    controller.initialize()
+    _populate(controller, old=10, recent=3)
+    now = datetime.now(UTC)
+    cutoff = now - timedelta(days=7)
+    while controller.purge_expired(cutoff, 4) is not None:
+        pass
+    assert _count(controller, "tasks") == 3
+    assert _count(controller, "worker_events") == 0
+    archive = tmp_path / "archive"
+    day = f"date={(now - timedelta(days=30)).date().isoformat()}"
+    assert sorted(path.name for path in archive.iterdir()) == ["task_events", "tasks", "worker_events"]
+    assert (archive / "tasks" / day).is_dir()
+
+    task = controller.get_task("old-3")
+    assert task is not None
+    assert task.state == "SUCCESS"
+    assert task.finished is not None
+    assert controller.get_task("missing") is None
+
+    window = TimeRange(start=now - timedelta(days=31), end=now + timedelta(minutes=1))
+    assert controller.get_task_stats("demo", window).count == 13
+    assert sum(bucket.count for bucket in controller.get_throughput(window, 86_400)) == 13
+    assert sum(map(sum, controller.get_heatmap(window))) == 13
+    # Ranges inside the hot window do not open the archive.
+    assert controller.get_task_stats(None, TimeRange(start=now - timedelta(days=1), end=now)).count == 3
+
+    reader = controller.open_reader(1)
+    assert reader is not None
+    assert reader.get_task("old-0") is not None
+    reader.close()
+    controller.close()
+
+
+def test_cleanup_archives_instead_of_deleting(tmp_path: Path) -> None:
+    controller = SQLiteController(archive_path=tmp_path / "archive")
+    controller.initialize()
+    _populate(controller, old=5, recent=2)
+    assert controller.cleanup(7) > 0
+    assert _count(controller, "task_events") == 2
+    rows = list(JsonlArchive(tmp_path / "archive").iter_rows("task_events"))
+    assert sorted(str(row["task_id"]) for row in rows) == [f"old-{index}" for index in range(5)]
+    controller.close()
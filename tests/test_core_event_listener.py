@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
+import time
 from datetime import UTC, datetime
 from multiprocessing import Queue
 from typing import TYPE_CHECKING, cast
@@ -22,9 +24,10 @@ if TYPE_CHECKING:
 
 from pydantic import BaseModel
 
+from celery_root.components.metrics.batch import decode_events
 from celery_root.config import CeleryRootConfig, DatabaseConfigSqlite
 from celery_root.core import event_listener as listener
-from celery_root.core.db.models import TaskEvent, TaskRelation, WorkerEvent
+from celery_root.core.db.models import EventListenerStats, TaskEvent, TaskRelation, WorkerEvent
 from celery_root.core.db.rpc_client import DbRpcClient
 
 
@@ -33,6 +36,7 @@ class _DummyDb:
         self.task_events: list[TaskEvent] = []
         self.worker_events: list[WorkerEvent] = []
         self.task_relations: list[TaskRelation] = []
+        self.task_batches: list[list[TaskEvent]] = []
 
     def store_task_event(self, event: TaskEvent) -> None:
         self.task_events.append(event)
@@ -43,6 +47,12 @@ class _DummyDb:
     def store_task_relation(self, event: TaskRelation) -> None:
         self.task_relations.append(event)
 
+    def store_task_events(self, events: list[TaskEvent]) -> None:
+        self.task_batches.append(list(events))
+
+    def store_worker_events(self, events: list[WorkerEvent]) -> None:
+        self.worker_events.extend(events)
+
 
 class _DummyControl:
     def __init__(self) -> None:
@@ -152,7 +162,157 @@ def test_emit_handles_full_queue() -> None:
     listener_instance._db_client = cast("DbRpcClient", db)
 
     listener_instance._emit(TaskEvent(task_id="t1", name="demo", state="SUCCESS", timestamp=datetime.now(UTC)))
+    listener_instance._flush_metrics()
     assert db.task_events
+    assert listener_instance._write_stats(time.monotonic()).metrics_dropped == 1
+
+
+def test_metrics_fanout_puts_one_blob_per_queue() -> None:
+    queues: list[Queue[object]] = [Queue(), Queue()]
+    fanout = listener._MetricsFanout(queues, batch_size=3, flush_interval=60.0)
+    now = datetime.now(UTC)
+    events = [TaskEvent(task_id=f"t{index}", name="demo", state="SUCCESS", timestamp=now) for index in range(4)]
+    for event in events:
+        fanout.append(event)
+    assert len(fanout) == 1
+    fanout.maybe_flush(time.monotonic())
+    assert len(fanout) == 1
+    fanout.maybe_flush(time.monotonic() + 61.0)
+    assert len(fanout) == 0
+    for queue in queues:
+        blobs = [queue.get(timeout=5), queue.get(timeout=5)]
+        assert all(isinstance(blob, bytes) for blob in blobs)
+        assert [item for blob in blobs for item in decode_events(cast("bytes", blob))] == events
+    assert fanout.dropped == 0
+
+
+def test_task_events_are_batched_by_size_and_interval() -> None:
+    db = _DummyDb()
+    listener_instance = listener.EventListener("redis://", config=None)
+    listener_instance._db_client = cast("DbRpcClient", db)
+    listener_instance._task_buffer = listener._TaskEventBuffer(batch_size=2, flush_interval=60.0)
+
+    now = datetime.now(UTC)
+    listener_instance._emit(TaskEvent(task_id="t1", name="demo", state="STARTED", timestamp=now))
+    assert db.task_batches == []
+    listener_instance._emit(TaskEvent(task_id="t1", name="demo", state="SUCCESS", timestamp=now))
+    assert [len(batch) for batch in db.task_batches] == [2]
+    assert db.task_events == []
+
+    listener_instance._emit(TaskEvent(task_id="t2", name="demo", state="STARTED", timestamp=now))
+    listener_instance._maybe_flush_task_events(time.monotonic())
+    assert [len(batch) for batch in db.task_batches] == [2]
+    listener_instance._maybe_flush_task_events(time.monotonic() + 61.0)
+    assert [len(batch) for batch in db.task_batches] == [2, 1]
+
+    listener_instance._flush_task_events()
+    assert len(db.task_batches) == 2
+
+
+def _relation(child_id: str) -> TaskRelation:
+    return TaskRelation(root_id="root", parent_id="root", child_id=child_id, relation="parent")
+
+
+def test_write_queue_drop_oldest() -> None:
+    queue = listener._WriteQueue(2, "drop_oldest")
+    for child in ("a", "b", "c"):
+        queue.put(_relation(child))
+    assert queue.dropped == 1
+    assert queue.pending == 2
+    assert [cast("TaskRelation", item).child_id for item in queue.get_batch(10, 0.0)] == ["b", "c"]
+
+
+def test_write_queue_spills_in_arrival_order() -> None:
+    queue = listener._WriteQueue(2, "spill")
+    for child in "abcde":
+        queue.put(_relation(child))
+    assert queue.spilled == 3
+    assert queue.pending == 5
+    assert queue.lag_seconds(time.monotonic() + 10) >= 10
+    batches = [queue.get_batch(2, 0.0) for _ in range(4)]
+    assert [[cast("TaskRelation", item).child_id for item in batch] for batch in batches] == [
+        ["a", "b"],
+        ["c", "d"],
+        ["e"],
+        [],
+    ]
+    # The drained spill file is reset and new items go back to memory.
+    queue.put(_relation("f"))
+    assert queue.spilled == 3
+    assert queue.pending == 1
+    queue.release()
+
+
+def test_write_queue_block_waits_for_writer() -> None:
+    queue = listener._WriteQueue(1, "block")
+    queue.put(_relation("a"))
+    producer = threading.Thread(target=queue.put, args=(_relation("b"),))
+    producer.start()
+    producer.join(timeout=0.3)
+    assert producer.is_alive()
+    assert [cast("TaskRelation", item).child_id for item in queue.get_batch(10, 0.0)] == ["a"]
+    producer.join(timeout=5)
+    assert not producer.is_alive()
+    assert queue.dropped == 0
+    assert queue.pending == 1
+
+
+def test_writer_thread_drains_to_db(tmp_path: Path) -> None:
+    db = _DummyDb()
+    metrics: Queue[object] = Queue()
+    config = CeleryRootConfig(database=DatabaseConfigSqlite(db_path=tmp_path / "db.sqlite", batch_size=2))
+    instance = listener.EventListener("redis://", config=config, metrics_queues=[metrics])
+    instance._db_client = cast("DbRpcClient", db)
+    instance._task_buffer = listener._TaskEventBuffer(batch_size=2, flush_interval=60.0)
+    instance._start_writer(config)
+
+    instance._handle_event({"type": "task-started", "uuid": "t1", "name": "demo", "timestamp": 1})
+    instance._handle_event({"type": "worker-online", "hostname": "worker-1", "timestamp": 1})
+    instance._handle_event({"type": "task-succeeded", "uuid": "t1", "name": "demo", "timestamp": 2})
+    instance._maybe_report_stats(time.monotonic() + 60)
+    instance._stop_writer()
+
+    assert [[event.state for event in batch] for batch in db.task_batches] == [["STARTED", "SUCCESS"]]
+    assert [event.hostname for event in db.worker_events] == ["worker-1"]
+    # One batch carries the two task events and the worker event ahead of the stats.
+    stats = decode_events(cast("bytes", metrics.get(timeout=5)))[-1]
+    assert isinstance(stats, EventListenerStats)
+    assert (stats.broker_url, stats.dropped, stats.spilled) == ("redis://", 0, 0)
+
+
+def test_listener_run_leaves_db_to_stuck_writer(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    config = CeleryRootConfig(database=DatabaseConfigSqlite(db_path=tmp_path / "db.sqlite"))
+    instance = listener.EventListener("redis://", config=config)
+    release = threading.Event()
+    calls: list[str] = []
+
+    class _DummyClient:
+        def close(self) -> None:
+            calls.append("close")
+
+    def _stuck_write_loop(_self: listener.EventListener) -> None:
+        release.wait(timeout=5)
+
+    def _record_flush(_self: listener.EventListener) -> None:
+        calls.append("flush")
+
+    def _fake_listen(self: listener.EventListener, _app: object, last: float) -> float:
+        self.stop()
+        return last
+
+    monkeypatch.setattr(listener, "_WRITER_JOIN_SECONDS", 0.05)
+    monkeypatch.setattr(listener, "set_settings", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(DbRpcClient, "from_config", lambda *_args, **_kwargs: _DummyClient())
+    monkeypatch.setattr(listener, "_select_event_app", lambda *_args, **_kwargs: (_DummyApp(), ()))
+    monkeypatch.setattr(listener, "_configure_from_workers", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(listener.EventListener, "_write_loop", _stuck_write_loop)
+    monkeypatch.setattr(listener.EventListener, "_flush_task_events", _record_flush)
+    monkeypatch.setattr(listener.EventListener, "_listen", _fake_listen)
+    try:
+        instance.run()
+        assert calls == []
+    finally:
+        release.set()
 
 
 def test_configure_from_workers() -> None:
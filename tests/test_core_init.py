@@ -23,6 +23,7 @@ from celery_root.core.db.models import (
     TaskFilter,
     TaskRelation,
     TaskStats,
+    TaskSummary,
     ThroughputBucket,
     TimeRange,
     Worker,
@@ -62,7 +63,7 @@ class _DummyController(BaseDBController):
         sort_dir: str | None,
         limit: int,
         offset: int,
-    ) -> tuple[list[Task], int]:
+    ) -> tuple[list[TaskSummary], int]:
         _ = (filters, sort_key, sort_dir, limit, offset)
         return [], 0
 
@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING, Any, cast
 import pytest
 
 from celery_root.components.metrics.base import BaseMonitoringExporter
+from celery_root.components.metrics.batch import encode_events
 from celery_root.config import (
     CeleryRootConfig,
     DatabaseConfigSqlite,
@@ -145,9 +146,10 @@ def test_exporter_drain_events() -> None:
     queue.put(TaskEvent(task_id="t1", name="demo", state="SUCCESS", timestamp=datetime.now(UTC)))
     queue.put(WorkerEvent(hostname="w1", event="worker-online", timestamp=datetime.now(UTC)))
     queue.put(TaskStats(count=1))
+    queue.put(encode_events([TaskEvent(task_id="t2", name="demo", state="STARTED", timestamp=datetime.now(UTC))]))
 
     process._drain_events(exporter, logger)
-    assert exporter.task_events
+    assert [event.task_id for event in exporter.task_events] == ["t1", "t2"]
     assert exporter.worker_events
     assert exporter.stats
 
@@ -17,8 +17,10 @@ from celery_root.core import reconciler
 from celery_root.core.db.models import BrokerQueueEvent, Task, TaskEvent, TaskFilter, Worker, WorkerEvent
 from celery_root.core.db.rpc_client import DbRpcClient
 from celery_root.core.engine.brokers.base import QueueInfo
+from celery_root.core.registry import BrokerGroup
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
     from celery_root.core.registry import WorkerRegistry
@@ -27,8 +29,11 @@ if TYPE_CHECKING:
 class _DummyDb:
     def __init__(self) -> None:
         self.worker_events: list[WorkerEvent] = []
+        self.worker_batches: list[list[WorkerEvent]] = []
         self.task_events: list[TaskEvent] = []
+        self.task_batches: list[list[TaskEvent]] = []
         self.broker_events: list[BrokerQueueEvent] = []
+        self.broker_batches: list[list[BrokerQueueEvent]] = []
         self.tasks_by_state: dict[str, list[Task]] = {}
         self.workers: list[Worker] = []
 
@@ -38,18 +43,34 @@ class _DummyDb:
     def store_worker_event(self, event: WorkerEvent) -> None:
         self.worker_events.append(event)
 
+    def store_worker_events(self, events: list[WorkerEvent]) -> None:
+        self.worker_batches.append(list(events))
+        self.worker_events.extend(events)
+
     def store_task_event(self, event: TaskEvent) -> None:
         self.task_events.append(event)
 
+    def store_task_events(self, events: list[TaskEvent]) -> None:
+        self.task_batches.append(list(events))
+        self.task_events.extend(events)
+
     def store_broker_queue_event(self, event: BrokerQueueEvent) -> None:
         self.broker_events.append(event)
 
+    def store_broker_queue_events(self, events: list[BrokerQueueEvent]) -> None:
+        self.broker_batches.append(list(events))
+        self.broker_events.extend(events)
+
     def get_tasks(self, filters: TaskFilter | None = None) -> list[Task]:
         state = filters.state if filters is not None else None
         if state is None:
             return []
         return list(self.tasks_by_state.get(state, []))
 
+    def iter_tasks(self, filters: TaskFilter | None = None, *, chunk_size: int = 500) -> Iterator[Task]:
+        _ = chunk_size
+        yield from self.get_tasks(filters)
+
 
 class _DummyConf(dict[str, object]):
     def __getattr__(self, name: str) -> object | None:
@@ -84,11 +105,18 @@ class _DummyApp:
 
 
 class _DummyRegistry:
-    def __init__(self, app: _DummyApp) -> None:
-        self._app = app
+    def __init__(self, *apps: _DummyApp) -> None:
+        self._apps = apps
 
     def get_app(self, _name: str) -> _DummyApp:
-        return self._app
+        return self._apps[0]
+
+    def get_brokers(self) -> dict[str, BrokerGroup]:
+        brokers: dict[str, BrokerGroup] = {}
+        for app in self._apps:
+            url = str(app.conf.broker_url)
+            brokers.setdefault(url, BrokerGroup(broker_url=url, apps=[])).apps.append(cast("Any", app))
+        return brokers
 
 
 @pytest.fixture
@@ -111,25 +139,34 @@ def test_helpers_and_worker_info(recon_config: CeleryRootConfig) -> None:
     assert reconciler._final_state({"status": "SUCCESS"}) == "SUCCESS"
 
 
-def test_refresh_and_reconcile(recon_config: CeleryRootConfig) -> None:
+def test_reconcile_backfills_open_tasks_in_batches(
+    monkeypatch: pytest.MonkeyPatch,
+    recon_config: CeleryRootConfig,
+) -> None:
+    monkeypatch.setattr(reconciler, "_BACKFILL_BATCH_SIZE", 2)
+
+    class _Backend:
+        def get_task_meta(self, task_id: str) -> dict[str, object]:
+            if task_id == "s1":
+                return {"status": "STARTED"}
+            return {"status": "SUCCESS", "date_done": datetime.now(UTC), "runtime": 1.0}
+
     instance = reconciler.Reconciler(recon_config)
     db = _DummyDb()
-    task = Task(task_id="t1", name="demo", state="STARTED")
-    db.tasks_by_state["STARTED"] = [task]
+    db.tasks_by_state["RECEIVED"] = [Task(task_id="r0", name="demo", state="RECEIVED")]
+    db.tasks_by_state["STARTED"] = [Task(task_id=f"s{index}", name="demo", state="STARTED") for index in range(3)]
     instance._db_client = cast("DbRpcClient", db)
-    instance._refresh_tasks()
-    assert instance._task_queue
-
-    meta = {"status": "SUCCESS", "date_done": datetime.now(UTC), "runtime": 1.0}
-    app = _DummyApp("demo", "redis://", meta)
+    app = _DummyApp("demo", "redis://", {})
+    app.backend = cast("Any", _Backend())
     instance._apps = cast("tuple[Any, ...]", (app,))
 
-    _found_meta, status = instance._find_final_meta(task)
-    assert status == "SUCCESS"
+    for _ in range(3):
+        instance._reconcile_task_states()
 
-    instance._task_queue.append(task)
-    instance._reconcile_task_states()
-    assert db.task_events
+    # Each call writes one batch; the still-running task is skipped and the scan resumes after it.
+    assert [[event.task_id for event in batch] for batch in db.task_batches] == [["r0"], ["s0"], ["s2"]]
+    assert all(event.state == "SUCCESS" for event in db.task_events)
+    assert db.task_events[0].runtime == 1.0
 
 
 def test_poll_broker_stats(monkeypatch: pytest.MonkeyPatch, recon_config: CeleryRootConfig) -> None:
@@ -140,15 +177,45 @@ def test_poll_broker_stats(monkeypatch: pytest.MonkeyPatch, recon_config: Celery
     instance._apps = cast("tuple[Any, ...]", (app,))
     instance._app_names = ["demo"]
 
-    monkeypatch.setattr(reconciler, "list_queues", lambda _registry, _name: [QueueInfo("celery", 2, 1)])
+    monkeypatch.setattr(reconciler, "broker_queue_stats", lambda _apps: [QueueInfo("celery", 2, 1)])
 
     registry = _DummyRegistry(app)
     instance._poll_broker_stats(cast("WorkerRegistry", registry))
     assert db.broker_events
 
 
+def test_poll_broker_stats_once_per_broker(monkeypatch: pytest.MonkeyPatch, recon_config: CeleryRootConfig) -> None:
+    apps = {
+        "alpha": _DummyApp("alpha", "redis://:secret@redis/0", {}),
+        "beta": _DummyApp("beta", "redis://:secret@redis/0", {}),
+        "gamma": _DummyApp("gamma", "amqp://rabbit//", {}),
+    }
+    polled: list[list[str]] = []
+
+    def _broker_queue_stats(group_apps: list[_DummyApp]) -> list[QueueInfo]:
+        polled.append([app.main for app in group_apps])
+        return [QueueInfo(f"{group_apps[0].main}-queue", 1, 0)]
+
+    monkeypatch.setattr(reconciler, "broker_queue_stats", _broker_queue_stats)
+    instance = reconciler.Reconciler(recon_config)
+    db = _DummyDb()
+    instance._db_client = cast("DbRpcClient", db)
+    instance._app_names = list(apps)
+
+    instance._poll_broker_stats(cast("WorkerRegistry", _DummyRegistry(*apps.values())))
+
+    # Apps sharing a broker are polled together, in one call.
+    assert sorted(polled) == [["alpha", "beta"], ["gamma"]]
+    assert sorted((event.queue, event.broker_url) for event in db.broker_events) == [
+        ("alpha-queue", "redis://:***@redis/0"),
+        ("gamma-queue", "amqp://rabbit//"),
+    ]
+    assert len(db.broker_batches) == 2
+
+
 def test_poll_worker_stats(recon_config: CeleryRootConfig) -> None:
     hostname = "worker-1"
+    recon_config.reconciler_fleet_inspection = False
 
     class _Inspector:
         def stats(self) -> dict[str, object]:
@@ -180,6 +247,89 @@ def test_poll_worker_stats(recon_config: CeleryRootConfig) -> None:
 
     instance._poll_worker_stats()
     assert db.worker_events
+    assert not db.worker_batches
+
+
+def test_poll_fleet_stats_stores_one_batch(recon_config: CeleryRootConfig) -> None:
+    calls: list[str] = []
+
+    class _Inspector:
+        def __init__(self, hosts: list[str]) -> None:
+            self._hosts = hosts
+
+        def _reply(self, command: str, value: object) -> dict[str, object]:
+            calls.append(command)
+            return dict.fromkeys(self._hosts, value)
+
+        def stats(self) -> dict[str, object]:
+            return self._reply("stats", {"pool": {"max-concurrency": 4}})
+
+        def conf(self) -> dict[str, object]:
+            return self._reply("conf", {"task_default_queue": "celery"})
+
+        def active_queues(self) -> dict[str, object]:
+            return self._reply("active_queues", [{"name": "celery"}])
+
+        def active(self) -> dict[str, object]:
+            return self._reply("active", [1, 2])
+
+        def registered(self) -> dict[str, object]:
+            msg = "no reply"
+            raise RuntimeError(msg)
+
+    instance = reconciler.Reconciler(recon_config)
+    db = _DummyDb()
+    instance._db_client = cast("DbRpcClient", db)
+    instance._apps = cast(
+        "tuple[Any, ...]",
+        (
+            _DummyApp("alpha", "redis://", {}, inspector=_Inspector(["w1", "w2"])),
+            _DummyApp("beta", "amqp://", {}, inspector=_Inspector(["w2", "w3"])),
+            _DummyApp("gamma", "amqp://", {}),
+        ),
+    )
+
+    instance._poll_worker_stats()
+
+    assert len(db.worker_batches) == 1
+    assert all(event.event == "worker-snapshot" for event in db.worker_batches[0])
+    infos = {event.hostname: event.info or {} for event in db.worker_batches[0]}
+    assert sorted(infos) == ["w1", "w2", "w3"]
+    assert infos["w2"]["app"] == "alpha"
+    assert infos["w3"]["app"] == "beta"
+    assert infos["w1"]["active"] == 2
+    assert "registered" not in infos["w1"]
+    # Each command is broadcast once per app, not once per worker.
+    assert sorted(calls) == sorted(["stats", "conf", "active_queues", "active"] * 2)
+
+
+def test_poll_fleet_stats_waits_for_refresh_interval(recon_config: CeleryRootConfig) -> None:
+    calls: list[str] = []
+
+    class _Inspector:
+        def __getattr__(self, command: str) -> Callable[[], dict[str, object]]:
+            def _reply() -> dict[str, object]:
+                calls.append(command)
+                return {"w1": {"pool": {"max-concurrency": 4}}} if command == "stats" else {}
+
+            return _reply
+
+    instance = reconciler.Reconciler(recon_config)
+    db = _DummyDb()
+    instance._db_client = cast("DbRpcClient", db)
+    instance._apps = cast("tuple[Any, ...]", (_DummyApp("alpha", "redis://", {}, inspector=_Inspector()),))
+
+    instance._poll_worker_stats()
+    assert len(calls) == len(reconciler._INSPECT_COMMANDS)
+    instance._poll_worker_stats()
+    assert len(calls) == len(reconciler._INSPECT_COMMANDS)
+    assert len(db.worker_batches) == 1
+
+    assert instance._fleet_inspected_at is not None
+    instance._fleet_inspected_at -= reconciler._WORKER_REFRESH_SECONDS
+    instance._poll_worker_stats()
+    assert len(calls) == 2 * len(reconciler._INSPECT_COMMANDS)
+    assert len(db.worker_batches) == 2
 
 
 def test_refresh_workers(recon_config: CeleryRootConfig) -> None:
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, cast
 import pytest
 from sqlalchemy import text
 
+from celery_root.core.db.adapters.duckdb import DuckDBController
 from celery_root.core.db.adapters.sqlite import SQLiteController
 from celery_root.core.db.models import (
     BrokerQueueEvent,
@@ -30,9 +31,16 @@ if TYPE_CHECKING:
     from celery_root.core.db.adapters.base import BaseDBController
 
 
-@pytest.fixture(params=["memory", "sqlite"])
+@pytest.fixture(params=["memory", "sqlite", "duckdb"])
 def controller(request: pytest.FixtureRequest, tmp_path: Path) -> Generator[BaseDBController]:
-    ctrl = SQLiteController() if request.param == "memory" else SQLiteController(tmp_path / "sqlite3.db")
+    ctrl: SQLiteController
+    if request.param == "duckdb":
+        pytest.importorskip("duckdb")
+        ctrl = DuckDBController(tmp_path / "sqlite3.db")
+    elif request.param == "memory":
+        ctrl = SQLiteController()
+    else:
+        ctrl = SQLiteController(tmp_path / "sqlite3.db")
     ctrl.initialize()
     yield ctrl
     ctrl.close()
@@ -106,6 +114,33 @@ def test_retries_update_without_state_regression(controller: BaseDBController) -
     assert task.retries == 1
 
 
+def test_store_task_events_batch_matches_sequential(controller: BaseDBController, tmp_path: Path) -> None:
+    base = datetime(2024, 1, 1, 14, 0, 0, tzinfo=UTC)
+    events = [
+        _task_event("t1", "RECEIVED", base, worker="w1", args="[1]"),
+        _task_event("t2", "STARTED", base, retries=0),
+        _task_event("t1", "STARTED", base + timedelta(seconds=1)),
+        _task_event("t2", "PENDING", base + timedelta(seconds=1), retries=1),
+        _task_event("t1", "SUCCESS", base + timedelta(seconds=2), runtime=0.5, result="ok"),
+        _task_event("t1", "RECEIVED", base + timedelta(seconds=3)),
+    ]
+    controller.store_task_events(events)
+
+    reference = SQLiteController(tmp_path / "reference.db")
+    reference.initialize()
+    for event in events:
+        reference.store_task_event(event)
+
+    for task_id in ("t1", "t2"):
+        assert controller.get_task(task_id) == reference.get_task(task_id)
+    task = controller.get_task("t1")
+    assert task is not None
+    assert task.state == "SUCCESS"
+    assert task.args == "[1]"
+    assert task.received is not None
+    reference.close()
+
+
 def test_filters_and_search(controller: BaseDBController) -> None:
     base = datetime(2024, 1, 2, 9, 0, 0, tzinfo=UTC)
     controller.store_task_event(_task_event("t1", "SUCCESS", base, name="tests.add", args="1,2", worker="w1"))
@@ -129,6 +164,39 @@ def test_filters_and_search(controller: BaseDBController) -> None:
     assert {task.task_id for task in tasks} == {"t3"}
 
 
+def test_full_text_search(controller: BaseDBController) -> None:
+    base = datetime(2024, 1, 2, 9, 0, 0, tzinfo=UTC)
+    controller.store_task_events(
+        [
+            _task_event("a1", "STARTED", base, name="billing.invoices.send", kwargs_="{'customer': 'Ada Lovelace'}"),
+            _task_event("b2", "STARTED", base, name="billing.refunds.send", args="('Lovelace Ada',)"),
+            _task_event("c3", "STARTED", base, name="reports.build"),
+        ],
+    )
+    controller.store_task_event(_task_event("c3", "FAILURE", base, traceback="KeyError: 'quarter'"))
+
+    def _search(term: str) -> list[str]:
+        tasks, total = controller.get_tasks_page(
+            TaskFilter(search=term),
+            sort_key=None,
+            sort_dir=None,
+            limit=10,
+            offset=0,
+        )
+        assert total == len(tasks)
+        return sorted(task.task_id for task in tasks)
+
+    assert _search("billing.inv") == ["a1"]
+    assert _search("lovel") == ["a1", "b2"]
+    assert _search('"ada lovelace"') == ["a1"]
+    assert _search("send ada") == ["a1", "b2"]
+    assert _search("quarter") == ["c3"]
+    assert _search("b2") == ["b2"]
+    # Retention deletes drop the rows from the index as well.
+    assert controller.cleanup(0) > 0
+    assert _search("lovel") == []
+
+
 def test_relations(controller: BaseDBController) -> None:
     relation = TaskRelation(root_id="root", parent_id=None, child_id="child", relation="chain")
     controller.store_task_relation(relation)
@@ -156,6 +224,52 @@ def test_workers(controller: BaseDBController) -> None:
     assert worker.active_tasks == 3
 
 
+def test_heartbeat_history_is_downsampled() -> None:
+    controller = SQLiteController(heartbeat_history_seconds=10)
+    controller.initialize()
+    ts = datetime(2024, 1, 3, 8, 0, 0, tzinfo=UTC)
+    events = [WorkerEvent(hostname="worker1", event="worker-online", timestamp=ts)]
+    events.extend(
+        WorkerEvent(
+            hostname="worker1",
+            event="worker-heartbeat",
+            timestamp=ts + timedelta(seconds=2 * beat),
+            info={"active": beat},
+        )
+        for beat in range(1, 16)
+    )
+    events.append(WorkerEvent(hostname="worker1", event="worker-offline", timestamp=ts + timedelta(seconds=31)))
+    for event in events:
+        controller.store_worker_event(event)
+    # A late heartbeat neither replaces the newer snapshot nor lands in the history.
+    controller.store_worker_event(WorkerEvent(hostname="worker1", event="worker-heartbeat", timestamp=ts))
+    with controller._engine.connect() as conn:
+        history = conn.execute(text("SELECT event FROM worker_events ORDER BY id")).scalars().all()
+    # Online and offline are always kept; heartbeats only every 10 seconds (at 10s, 20s and 30s).
+    assert history.count("worker-online") == 1
+    assert history.count("worker-offline") == 1
+    assert history.count("worker-heartbeat") == 3
+    snapshot = controller.get_worker_event_snapshot("worker1")
+    assert snapshot is not None
+    assert snapshot.event == "worker-offline"
+    controller.close()
+
+
+def test_worker_event_batch(controller: BaseDBController) -> None:
+    ts = datetime(2024, 1, 3, 8, 30, 0, tzinfo=UTC)
+    controller.store_worker_events(
+        [
+            WorkerEvent(hostname=f"worker{index}", event="worker-snapshot", timestamp=ts, info={"active": index})
+            for index in range(3)
+        ],
+    )
+    controller.store_worker_events([])
+    assert sorted(worker.hostname for worker in controller.get_workers()) == ["worker0", "worker1", "worker2"]
+    snapshot = controller.get_worker_event_snapshot("worker2")
+    assert snapshot is not None
+    assert snapshot.info == {"active": 2}
+
+
 def test_broker_queue_events(controller: BaseDBController) -> None:
     ts = datetime(2024, 1, 3, 9, 0, 0, tzinfo=UTC)
     controller.store_broker_queue_event(
@@ -175,6 +289,59 @@ def test_broker_queue_events(controller: BaseDBController) -> None:
     assert len(snapshot) == 1
 
 
+def test_broker_queue_history_is_change_only(controller: BaseDBController) -> None:
+    broker_url = "redis://localhost:6379/0"
+    ts = datetime(2024, 1, 3, 9, 0, 0, tzinfo=UTC)
+    depths = [5, 5, 9, 2, 2, 2, 7]
+    controller.store_broker_queue_events(
+        [
+            BrokerQueueEvent(
+                broker_url=broker_url,
+                queue="celery",
+                messages=depth,
+                consumers=1,
+                timestamp=ts + timedelta(seconds=20 * index),
+            )
+            for index, depth in enumerate(depths)
+        ],
+    )
+    # A late poll neither replaces the newer snapshot nor lands in the history.
+    controller.store_broker_queue_event(
+        BrokerQueueEvent(broker_url=broker_url, queue="celery", messages=1, consumers=1, timestamp=ts),
+    )
+    sqlite_controller = cast("SQLiteController", controller)
+    with sqlite_controller._engine.begin() as conn:
+        raw = conn.execute(text("SELECT messages FROM broker_queue_events ORDER BY id")).scalars().all()
+    assert raw == [5, 9, 2, 7]
+    snapshot = controller.get_broker_queue_snapshot(broker_url)
+    assert [(event.messages, event.timestamp) for event in snapshot] == [(7, ts + timedelta(seconds=120))]
+
+    # The minute holding the oldest raw change comes from its rollup, later changes are served raw.
+    window = TimeRange(start=ts, end=ts + timedelta(hours=3))
+    history = controller.get_broker_queue_history(broker_url, "celery", window)
+    assert [(sample.timestamp, sample.messages, sample.min_messages, sample.max_messages) for sample in history] == [
+        (ts, 9, 5, 9),
+        (ts + timedelta(seconds=60), 2, 2, 2),
+        (ts + timedelta(seconds=120), 7, 7, 7),
+    ]
+
+    # Two hours later the raw changes are pruned and every minute is served from the rollups.
+    later = ts + timedelta(hours=2)
+    controller.store_broker_queue_event(
+        BrokerQueueEvent(broker_url=broker_url, queue="celery", messages=0, consumers=0, timestamp=later),
+    )
+    with sqlite_controller._engine.begin() as conn:
+        raw = conn.execute(text("SELECT messages FROM broker_queue_events ORDER BY id")).scalars().all()
+    assert raw == [0]
+    history = controller.get_broker_queue_history(broker_url, "celery", window)
+    assert [(sample.timestamp, sample.messages, sample.min_messages, sample.max_messages) for sample in history] == [
+        (ts, 9, 5, 9),
+        (ts + timedelta(minutes=1), 2, 2, 9),
+        (ts + timedelta(minutes=2), 7, 2, 7),
+        (later, 0, 0, 7),
+    ]
+
+
 def test_schedules(controller: BaseDBController) -> None:
     schedule = Schedule(
         schedule_id="sched1",
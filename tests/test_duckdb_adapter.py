@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import delete
+
+from celery_root.config import CeleryRootConfig, DatabaseConfigDuckdb
+from celery_root.core.db.adapters.duckdb import DuckDBController
+from celery_root.core.db.manager import _build_backend
+from celery_root.core.db.models import TaskEvent, TimeRange
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytest.importorskip("duckdb")
+
+_BASE = datetime(2024, 3, 4, 12, 0, 0, tzinfo=UTC)
+
+
+def _events(count: int, *, start: datetime = _BASE, prefix: str = "t") -> list[TaskEvent]:
+    return [
+        TaskEvent(
+            task_id=f"{prefix}-{index}",
+            name=f"tests.task_{index % 3}",
+            state="SUCCESS",
+            timestamp=start + timedelta(seconds=index),
+            worker="w1@host",
+            runtime=index / 10,
+        )
+        for index in range(count)
+    ]
+
+
+def test_column_store_survives_restart_and_resyncs(tmp_path: Path) -> None:
+    controller = DuckDBController(tmp_path / "root.db")
+    controller.initialize()
+    controller.store_task_events(_events(50))
+    controller.close()
+    assert (tmp_path / "root.duckdb").exists()
+
+    reopened = DuckDBController(tmp_path / "root.db")
+    reopened.initialize()
+    assert reopened.get_task_stats(None, None).count == 50
+    # Rows removed behind the column store's back are picked up by the next initialize.
+    with reopened._engine.begin() as conn:
+        conn.execute(delete(reopened._tasks).where(reopened._tasks.c.task_id == "t-0"))
+    reopened.close()
+    synced = DuckDBController(tmp_path / "root.db")
+    synced.initialize()
+    assert synced.get_task_stats(None, None).count == 49
+    assert synced.get_state_distribution() == {"SUCCESS": 49}
+    synced.close()
+
+
+def test_reader_shares_the_writer_column_store(tmp_path: Path) -> None:
+    controller = DuckDBController(tmp_path / "root.db", analytics_path=tmp_path / "facts" / "stats.duckdb")
+    controller.initialize()
+    reader = controller.open_reader(2)
+    assert isinstance(reader, DuckDBController)
+    controller.store_task_events(_events(10))
+    assert reader.get_worker_state_counts() == {"w1@host": {"SUCCESS": 10}}
+    reader.close()
+    assert controller.get_task_stats("tests.task_0", None).count == 4
+    controller.close()
+    assert (tmp_path / "facts" / "stats.duckdb").exists()
+    with pytest.raises(ValueError, match="column store"):
+        DuckDBController(tmp_path / "root.db", read_only=True)
+
+
+def test_purge_expired_drops_expired_facts() -> None:
+    controller = DuckDBController()
+    controller.initialize()
+    controller.store_task_events(_events(5, start=_BASE - timedelta(days=30), prefix="old"))
+    controller.store_task_events(_events(5, prefix="new"))
+    while controller.purge_expired(_BASE - timedelta(days=1), 2) is not None:
+        pass
+    assert controller.get_task_stats(None, None).count == 5
+    controller.close()
+
+
+def test_archived_tasks_count_towards_stats(tmp_path: Path) -> None:
+    controller = DuckDBController(archive_path=tmp_path / "archive")
+    controller.initialize()
+    controller.store_task_events(_events(5, start=_BASE - timedelta(days=30), prefix="old"))
+    controller.store_task_events(_events(5, prefix="new"))
+    while controller.purge_expired(_BASE - timedelta(days=1), 2) is not None:
+        pass
+    window = TimeRange(start=_BASE - timedelta(days=31), end=_BASE + timedelta(days=1))
+    assert controller.get_task_stats(None, window).count == 10
+    assert controller.get_task_stats(None, None).count == 5
+    assert sum(bucket.count for bucket in controller.get_throughput(window, 86_400)) == 10
+    assert controller.get_task("old-1") is not None
+    controller.close()
+
+
+def test_duckdb_config_builds_duckdb_controller(tmp_path: Path) -> None:
+    config = CeleryRootConfig(database={"engine": "duckdb", "db_path": tmp_path / "root.db"})
+    assert isinstance(config.database, DatabaseConfigDuckdb)
+    controller = _build_backend(config, None)
+    assert isinstance(controller, DuckDBController)
+    controller.close()
@@ -21,7 +21,7 @@ from celery_root.config import (
 from celery_root.core.db.models import Task
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable, MutableMapping
+    from collections.abc import Awaitable, Callable, Iterator, MutableMapping
     from pathlib import Path
 
     from celery_root.core.db.rpc_client import DbRpcClient
@@ -80,8 +80,8 @@ def test_fetch_task_stats() -> None:
     ]
 
     class _DummyDb:
-        def get_tasks(self) -> list[Task]:
-            return tasks
+        def iter_tasks(self) -> Iterator[Task]:
+            return iter(tasks)
 
     rows = mcp_server._fetch_task_stats(cast("DbRpcClient", _DummyDb()))
     assert rows[0]["count"] == 2
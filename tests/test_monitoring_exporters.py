@@ -6,7 +6,9 @@
 
 from __future__ import annotations
 
+import time
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
 from opentelemetry.sdk.metrics.export import (
     Gauge,
@@ -19,9 +21,13 @@ from opentelemetry.sdk.metrics.export import (
 )
 from prometheus_client import CollectorRegistry
 
+from celery_root.components.metrics.batch import decode_events, encode_events
 from celery_root.components.metrics.opentelemetry import OTelExporter
 from celery_root.components.metrics.prometheus import PrometheusExporter
-from celery_root.core.db.models import TaskEvent, TaskStats, WorkerEvent
+from celery_root.core.db.models import EventListenerStats, TaskEvent, TaskStats, WorkerEvent
+
+if TYPE_CHECKING:
+    import pytest
 
 
 def _find_metric(data: MetricsData, name: str) -> Metric:
@@ -224,6 +230,96 @@ def test_prometheus_exporter_flower_compatibility_prefix() -> None:
     assert total == 1
 
 
+def test_prometheus_exporter_records_listener_stats() -> None:
+    registry = CollectorRegistry()
+    exporter = PrometheusExporter(registry=registry)
+    broker = "redis://localhost:6379/0"
+
+    exporter.on_listener_stats(EventListenerStats(broker_url=broker, pending=7, lag_seconds=1.5, dropped=3))
+    exporter.on_listener_stats(EventListenerStats(broker_url=broker, pending=2, lag_seconds=0.5, dropped=5))
+    # A restarted listener reports its totals from zero again.
+    exporter.on_listener_stats(EventListenerStats(broker_url=broker, dropped=1))
+
+    labels = {"broker": broker}
+    assert registry.get_sample_value("celery_root_event_listener_pending_events", labels) == 0
+    assert registry.get_sample_value("celery_root_event_listener_lag_seconds", labels) == 0
+    assert registry.get_sample_value("celery_root_event_listener_dropped_events_total", labels) == 6
+
+
+def test_event_batches_round_trip_and_aggregate() -> None:
+    now = datetime.now(UTC)
+    items = [
+        WorkerEvent(hostname="w1", event="worker-online", timestamp=now, info={"active": []}),
+        TaskEvent(task_id="t1", name="demo.add", state="RECEIVED", timestamp=now, worker="w1"),
+        TaskEvent(task_id="t1", name="demo.add", state="STARTED", timestamp=now, worker="w1"),
+        TaskEvent(task_id="t1", name="demo.add", state="FAILURE", timestamp=now, worker="w1", runtime=0.2),
+        TaskEvent(task_id="t2", name="demo.add", state="FAILURE", timestamp=now, worker="w1", runtime=0.4),
+        EventListenerStats(broker_url="redis://", metrics_dropped=4),
+    ]
+    decoded = decode_events(encode_events(items))
+    assert decoded == items
+
+    batched_registry = CollectorRegistry()
+    PrometheusExporter(registry=batched_registry).on_events(decoded)
+    single_registry = CollectorRegistry()
+    single = PrometheusExporter(registry=single_registry)
+    for item in items:
+        single.on_events([item])
+    task_labels = {"task": "demo.add", "worker": "w1", "broker": "unknown", "backend": "unknown"}
+    for registry in (batched_registry, single_registry):
+        assert registry.get_sample_value("celery_root_task_failures_total", task_labels) == 2
+        assert registry.get_sample_value("celery_root_task_runtime_seconds_count", task_labels) == 2
+        assert registry.get_sample_value("celery_root_task_queue_latency_seconds_count", task_labels) == 1
+        assert registry.get_sample_value("celery_root_worker_prefetched_tasks", task_labels) == 0
+        assert (
+            registry.get_sample_value(
+                "celery_root_event_listener_metrics_dropped_events_total",
+                {"broker": "redis://"},
+            )
+            == 4
+        )
+
+
+def _task(task_id: str, state: str, worker: str = "w1") -> TaskEvent:
+    return TaskEvent(task_id=task_id, name="demo.add", state=state, timestamp=datetime.now(UTC), worker=worker)
+
+
+def test_prometheus_exporter_evicts_stale_trackers(monkeypatch: pytest.MonkeyPatch) -> None:
+    registry = CollectorRegistry()
+    exporter = PrometheusExporter(registry=registry, max_tracked_tasks=2, tracked_task_ttl_seconds=60.0)
+    task_labels = {"task": "demo.add", "worker": "w1", "broker": "unknown", "backend": "unknown"}
+    worker_labels = {"worker": "w1", "broker": "unknown", "backend": "unknown"}
+
+    for task_id in ("t1", "t2", "t3"):
+        exporter.on_task_event(_task(task_id, "RECEIVED"))
+    # t1 never finished; evicting it releases its prefetch slot.
+    assert registry.get_sample_value("celery_root_worker_prefetched_tasks", task_labels) == 2
+    exporter.on_task_event(_task("t3", "STARTED"))
+    assert registry.get_sample_value("celery_root_worker_number_of_currently_executing_tasks", worker_labels) == 1
+
+    later = time.monotonic() + 120.0
+    monkeypatch.setattr(time, "monotonic", lambda: later)
+    exporter.on_task_event(_task("t4", "PENDING"))
+    assert len(exporter._task_trackers) == 1
+    assert registry.get_sample_value("celery_root_worker_prefetched_tasks", task_labels) == 0
+    assert registry.get_sample_value("celery_root_worker_number_of_currently_executing_tasks", worker_labels) == 0
+
+
+def test_prometheus_exporter_refreshes_cached_labels_on_broker_change() -> None:
+    registry = CollectorRegistry()
+    exporter = PrometheusExporter(registry=registry)
+    exporter.on_task_event(_task("t1", "SUCCESS"))
+    exporter.on_task_event(_task("t2", "SUCCESS"))
+    exporter.on_worker_event(
+        WorkerEvent(hostname="w1", event="worker-online", timestamp=datetime.now(UTC), broker_url="redis://b"),
+    )
+    exporter.on_task_event(_task("t3", "SUCCESS"))
+
+    labels = {"task": "demo.add", "type": "task-succeeded", "worker": "w1", "backend": "unknown"}
+    assert registry.get_sample_value("celery_root_events_total", {**labels, "broker": "unknown"}) == 2
+    assert registry.get_sample_value("celery_root_events_total", {**labels, "broker": "redis://b"}) == 1
+
+
 def test_otel_exporter_records_metrics() -> None:
     reader = InMemoryMetricReader()
     exporter = OTelExporter(service_name="test-service", metric_reader=reader)
@@ -353,3 +449,32 @@ def test_otel_exporter_records_queue_latency_and_failures() -> None:
         },
     )
     assert retries == 1
+
+
+def test_otel_exporter_records_listener_stats() -> None:
+    reader = InMemoryMetricReader()
+    exporter = OTelExporter(service_name="test-service", metric_reader=reader)
+    broker = "amqp://rabbit//"
+
+    exporter.on_listener_stats(EventListenerStats(broker_url=broker, pending=4, lag_seconds=2.0, spilled=10))
+    exporter.on_listener_stats(EventListenerStats(broker_url=broker, pending=1, lag_seconds=0.25, spilled=12))
+    exporter.force_flush()
+
+    data = _require_metrics_data(reader)
+    attributes = {"broker": broker}
+    assert _get_number(_find_metric(data, "celery_root_event_listener_pending_events"), attributes) == 1
+    assert _get_number(_find_metric(data, "celery_root_event_listener_lag_seconds"), attributes) == 0.25
+    assert _get_number(_find_metric(data, "celery_root_event_listener_spilled_events_total"), attributes) == 12
+
+
+def test_otel_exporter_evicts_stale_trackers() -> None:
+    reader = InMemoryMetricReader()
+    exporter = OTelExporter(service_name="test-service", metric_reader=reader, max_tracked_tasks=1)
+    exporter.on_task_event(_task("t1", "RECEIVED"))
+    exporter.on_task_event(_task("t2", "RECEIVED"))
+    exporter.force_flush()
+
+    data = _require_metrics_data(reader)
+    labels = {"task": "demo.add", "worker": "w1", "broker": "unknown", "backend": "unknown"}
+    assert _get_number(_find_metric(data, "celery_root_worker_prefetched_tasks"), labels) == 1
+    assert len(exporter._task_trackers) == 1
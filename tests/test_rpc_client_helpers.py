@@ -6,17 +6,27 @@
 
 from __future__ import annotations
 
+import threading
 import uuid
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, ClassVar, cast
 
 import pytest
 
+from celery_root.config import CeleryRootConfig, DatabaseConfigSqlite
 from celery_root.core.db import rpc_client
-from celery_root.shared.schemas import RpcResponseEnvelope
+from celery_root.shared.schemas import (
+    IngestTaskEventBatchRequest,
+    IngestTaskEventBatchResponse,
+    RpcResponseEnvelope,
+    ScanTasksRequest,
+    ScanTasksResponse,
+)
+from celery_root.shared.schemas.domain import Task, TaskCursor, TaskEvent
 
 if TYPE_CHECKING:
     from multiprocessing.connection import Connection
+    from pathlib import Path
 
 
 class _DummyConnection:
@@ -67,3 +77,200 @@ def test_rpc_transport_timeout() -> None:
     transport = _DummyTransport(response.model_dump_json().encode("utf-8"), poll_ok=False)
     with pytest.raises(RuntimeError):
         transport.request("db.ping", {}, timeout_seconds=0.01, max_retries=0)
+
+
+def test_store_task_events_splits_oversized_batches() -> None:
+    client = rpc_client.DbRpcClient(
+        rpc_client._RpcSettings(address="addr", authkey=None, timeout_seconds=0.1, max_message_bytes=1024),
+    )
+    sent: list[int] = []
+
+    def _fake_call(_op: str, request: IngestTaskEventBatchRequest, _response_model: object) -> object:
+        if len(request.events) > 2:
+            msg = "too large"
+            raise rpc_client.RpcMessageTooLargeError(msg)
+        sent.append(len(request.events))
+        return IngestTaskEventBatchResponse(stored=len(request.events))
+
+    client._call = _fake_call  # type: ignore[method-assign,assignment]
+    now = datetime.now(UTC)
+    events = [TaskEvent(task_id=f"t{index}", name="demo", state="SUCCESS", timestamp=now) for index in range(5)]
+    client.store_task_events(events)
+    assert sum(sent) == 5
+    assert max(sent) <= 2
+
+
+def test_iter_tasks_follows_cursor_and_shrinks_oversized_chunks() -> None:
+    client = rpc_client.DbRpcClient(
+        rpc_client._RpcSettings(address="addr", authkey=None, timeout_seconds=0.1, max_message_bytes=1024),
+    )
+    tasks = [Task(task_id=f"t{index}", name="demo", state="SUCCESS") for index in range(7)]
+    limits: list[int] = []
+
+    def _fake_call(op: str, request: ScanTasksRequest, _response_model: object) -> ScanTasksResponse:
+        assert op == "tasks.scan"
+        limits.append(request.limit)
+        if request.limit > 2:
+            msg = "too large"
+            raise rpc_client.RpcMessageTooLargeError(msg)
+        start = 0 if request.cursor is None else int(request.cursor.task_id[1:]) + 1
+        chunk = tasks[start : start + request.limit]
+        last = TaskCursor(last_ts=None, task_id=chunk[-1].task_id) if len(chunk) == request.limit else None
+        return ScanTasksResponse(tasks=chunk, next_cursor=last)
+
+    client._call = _fake_call  # type: ignore[method-assign,assignment]
+    assert [task.task_id for task in client.iter_tasks(chunk_size=8)] == [task.task_id for task in tasks]
+    assert limits == [8, 4, 2, 2, 2, 2]
+
+
+class _EofConnection(_DummyConnection):
+    def recv_bytes(self) -> bytes:
+        raise EOFError
+
+
+class _ReconnectingTransport(rpc_client._RpcTransport):
+    def __init__(self, response: bytes) -> None:
+        settings = rpc_client._RpcSettings(address="addr", authkey=None, timeout_seconds=0.1, max_message_bytes=1024)
+        super().__init__(settings, client_name="tests")
+        self._response = response
+        self.connects = 0
+
+    def connect(self) -> None:
+        if self._connection is None:
+            self.connects += 1
+            self._connection = cast("Connection", _DummyConnection(self._response))
+
+
+def test_rpc_transport_reconnects_stale_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _FakeUuid:
+        hex = "req"
+
+    def _fake_uuid4() -> _FakeUuid:
+        return _FakeUuid()
+
+    monkeypatch.setattr(uuid, "uuid4", _fake_uuid4)
+    response = RpcResponseEnvelope(request_id="req", ok=True, payload={}, timestamp=datetime.now(UTC))
+    transport = _ReconnectingTransport(response.model_dump_json().encode("utf-8"))
+    # Simulate a kept-alive connection the DB manager has since dropped.
+    transport._connection = cast("Connection", _EofConnection(b""))
+    assert transport.request("db.ping", {}, max_retries=0).ok
+    assert transport.connects == 1
+
+
+def test_rpc_transport_does_not_reconnect_fresh_connection() -> None:
+    class _AlwaysEofTransport(_ReconnectingTransport):
+        def connect(self) -> None:
+            if self._connection is None:
+                self.connects += 1
+                self._connection = cast("Connection", _EofConnection(b""))
+
+    transport = _AlwaysEofTransport(b"")
+    with pytest.raises(RuntimeError):
+        transport.request("db.ping", {}, max_retries=0)
+    assert transport.connects == 1
+
+
+class _FakePooledTransport:
+    created: ClassVar[list[_FakePooledTransport]] = []
+
+    def __init__(self, _settings: object, _client_name: str | None) -> None:
+        self.connected = True
+        self.pings = 0
+        self.closed = False
+        self.fail_ping = False
+        _FakePooledTransport.created.append(self)
+
+    def request(self, op: str, _payload: object, **_kwargs: object) -> RpcResponseEnvelope:
+        assert op == "db.ping"
+        self.pings += 1
+        if self.fail_ping:
+            msg = "connection lost"
+            raise RuntimeError(msg)
+        return RpcResponseEnvelope(request_id="req", ok=True, payload={}, timestamp=datetime.now(UTC))
+
+    def close(self) -> None:
+        self.closed = True
+        self.connected = False
+
+
+def _pool(monkeypatch: pytest.MonkeyPatch, *, size: int, health_check_seconds: float) -> rpc_client.DbRpcClientPool:
+    _FakePooledTransport.created = []
+    monkeypatch.setattr(rpc_client, "_RpcTransport", _FakePooledTransport)
+    settings = rpc_client._RpcSettings(address="addr", authkey=None, timeout_seconds=0.05, max_message_bytes=1024)
+    return rpc_client.DbRpcClientPool(settings, size=size, health_check_seconds=health_check_seconds)
+
+
+def test_pool_shares_connections_across_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    pool = _pool(monkeypatch, size=3, health_check_seconds=60.0)
+    lock = threading.Lock()
+    borrowed: set[int] = set()
+    peak = [0]
+
+    def _worker() -> None:
+        for _ in range(50):
+            with pool.client() as client:
+                with lock:
+                    borrowed.add(id(client._transport))
+                    peak[0] = max(peak[0], len(borrowed))
+                with lock:
+                    borrowed.discard(id(client._transport))
+
+    threads = [threading.Thread(target=_worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert 1 <= len(_FakePooledTransport.created) <= 3
+    assert peak[0] <= 3
+    assert all(transport.pings == 0 for transport in _FakePooledTransport.created)
+
+
+def test_pool_health_checks_idle_connections(monkeypatch: pytest.MonkeyPatch) -> None:
+    pool = _pool(monkeypatch, size=1, health_check_seconds=0.0)
+    with pool.client() as client:
+        first = client._transport
+    with pool.client() as client:
+        assert client._transport is first
+    transport = _FakePooledTransport.created[0]
+    assert transport.pings == 1
+    transport.fail_ping = True
+    with pool.client():
+        pass
+    assert transport.closed
+
+
+def test_pool_exhausted(monkeypatch: pytest.MonkeyPatch) -> None:
+    pool = _pool(monkeypatch, size=1, health_check_seconds=60.0)
+    with pool.client(), pytest.raises(RuntimeError, match="exhausted"), pool.client():
+        pass
+    with pool.client():
+        pass
+
+
+def test_pool_close(monkeypatch: pytest.MonkeyPatch) -> None:
+    pool = _pool(monkeypatch, size=2, health_check_seconds=60.0)
+    with pool.client():
+        pass
+    pool.close()
+    assert _FakePooledTransport.created[0].closed
+    with pytest.raises(RuntimeError, match="closed"), pool.client():
+        pass
+
+
+def test_shared_pool_is_keyed_by_address_and_client_name(tmp_path: Path) -> None:
+    config = CeleryRootConfig(database=DatabaseConfigSqlite(db_path=tmp_path / "a.db", rpc_pool_size=4))
+    other = CeleryRootConfig(
+        database=DatabaseConfigSqlite(db_path=tmp_path / "b.db", rpc_socket_path=tmp_path / "other.sock"),
+    )
+    try:
+        pool = rpc_client.shared_pool(config, client_name="tests")
+        assert rpc_client.shared_pool(config, client_name="tests") is pool
+        assert pool.size == 4
+        assert rpc_client.shared_pool(other, client_name="tests") is not pool
+        named = rpc_client.shared_pool(config, client_name="web")
+        assert named is not pool
+        assert named._client_name == "web"
+    finally:
+        rpc_client.close_shared_pools()
+    assert rpc_client.shared_pool(config, client_name="tests") is not pool
+    rpc_client.close_shared_pools()
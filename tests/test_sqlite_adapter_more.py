@@ -6,11 +6,15 @@
 
 from __future__ import annotations
 
+import sqlite3
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
+from sqlalchemy import inspect, text
+
+from celery_root.core.db.adapters.base import BaseDBController
 from celery_root.core.db.adapters.sqlite import SQLiteController, _merge_retries
-from celery_root.core.db.models import TaskEvent, WorkerEvent
+from celery_root.core.db.models import BrokerQueueEvent, TaskEvent, TaskFilter, TaskRelation, WorkerEvent
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -40,3 +44,359 @@ def test_cleanup_removes_old_records(tmp_path: Path) -> None:
     removed = controller.cleanup(older_than_days=1)
     assert removed >= 1
     controller.close()
+
+
+def test_migrate_v5_adds_last_ts_and_indexes(tmp_path: Path) -> None:
+    db_path = tmp_path / "legacy.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE tasks (task_id VARCHAR PRIMARY KEY, name VARCHAR, state VARCHAR NOT NULL, "
+            "worker VARCHAR, received DATETIME, started DATETIME, finished DATETIME, runtime FLOAT, "
+            "args TEXT, kwargs TEXT, result TEXT, traceback TEXT, stamps TEXT, retries INTEGER, "
+            "parent_id VARCHAR, root_id VARCHAR, group_id VARCHAR, chord_id VARCHAR)",
+        )
+        conn.execute(
+            "INSERT INTO tasks (task_id, name, state, started) VALUES ('legacy', 'demo', 'STARTED', ?)",
+            ("2024-01-01 00:00:00.000000",),
+        )
+        conn.execute("CREATE TABLE schema_version (version INTEGER PRIMARY KEY)")
+        conn.execute("INSERT INTO schema_version (version) VALUES (5)")
+
+    controller = SQLiteController(db_path)
+    controller.initialize()
+    controller.ensure_schema()
+    assert controller.get_schema_version() == SQLiteController._SCHEMA_VERSION
+
+    inspector = inspect(controller._engine)
+    task_indexes = {index["name"] for index in inspector.get_indexes("tasks")}
+    assert {"ix_tasks_last_ts_task_id", "ix_tasks_state_last_ts", "ix_tasks_root_id_change_seq"} <= task_indexes
+    assert "ix_tasks_last_ts" not in task_indexes
+    assert "ix_tasks_root_id" not in task_indexes
+    relation_indexes = {index["name"] for index in inspector.get_indexes("task_relations")}
+    assert "ix_task_relations_root_id_change_seq" in relation_indexes
+
+    controller.store_task_event(
+        TaskEvent(task_id="t1", name="demo", state="SUCCESS", timestamp=datetime(2024, 1, 2, tzinfo=UTC)),
+    )
+    tasks = controller.get_tasks()
+    assert [task.task_id for task in tasks] == ["t1", "legacy"]
+    controller.close()
+
+
+def test_task_page_query_uses_last_ts_index() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    with controller._engine.connect() as conn:
+        plan = conn.execute(
+            text("EXPLAIN QUERY PLAN SELECT task_id FROM tasks WHERE state = 'SUCCESS' ORDER BY last_ts DESC LIMIT 10"),
+        ).all()
+    details = " ".join(str(row[-1]) for row in plan)
+    assert "ix_tasks_state_last_ts" in details
+    assert "TEMP B-TREE" not in details
+    controller.close()
+
+
+def test_task_graph_and_bulk_lookup() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    now = datetime.now(UTC)
+    controller.store_task_events(
+        [
+            TaskEvent(task_id="root", name="demo", state="SUCCESS", timestamp=now),
+            TaskEvent(task_id="child", name="demo", state="STARTED", timestamp=now, root_id="root", parent_id="root"),
+            TaskEvent(task_id="member", name="demo", state="SUCCESS", timestamp=now, root_id="root", chord_id="cb"),
+            TaskEvent(task_id="cb", name="demo.callback", state="PENDING", timestamp=now, root_id="other"),
+            *(TaskEvent(task_id=f"bulk-{index}", name="demo", state="SUCCESS", timestamp=now) for index in range(600)),
+        ],
+    )
+    controller.store_task_relations(
+        [TaskRelation(root_id="root", parent_id="root", child_id="linked", relation="link")],
+    )
+
+    ids = [f"bulk-{index}" for index in range(600)]
+    found = controller.get_tasks_by_id([*ids, "bulk-0", "unknown"])
+    assert sorted(task.task_id for task in found) == sorted(ids)
+    assert controller.get_tasks_by_id([]) == []
+
+    assert controller.get_task_graph("unknown") is None
+    graph = controller.get_task_graph("child")
+    assert graph is not None
+    assert graph.root_id == "root"
+    assert sorted(task.task_id for task in graph.tasks) == ["cb", "child", "member", "root"]
+    assert [relation.child_id for relation in graph.relations] == ["linked"]
+    fallback = BaseDBController.get_task_graph(controller, "child")
+    assert fallback is not None
+    assert sorted(task.task_id for task in fallback.tasks) == sorted(task.task_id for task in graph.tasks)
+    controller.close()
+
+
+def test_task_graph_changes_follow_the_cursor() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    now = datetime.now(UTC)
+    controller.store_task_events(
+        [
+            TaskEvent(task_id="root", name="demo", state="STARTED", timestamp=now),
+            TaskEvent(task_id="a", name="demo", state="RECEIVED", timestamp=now, root_id="root", parent_id="root"),
+            TaskEvent(task_id="b", name="demo", state="RECEIVED", timestamp=now, root_id="root", parent_id="root"),
+        ],
+    )
+    edge = TaskRelation(root_id="root", parent_id="root", child_id="a", relation="parent")
+    controller.store_task_relations([edge])
+    graph = controller.get_task_graph("root")
+    assert graph is not None
+    cursor = graph.cursor
+
+    controller.store_task_events(
+        [TaskEvent(task_id="a", name="demo", state="SUCCESS", timestamp=now, root_id="root", parent_id="root")],
+    )
+    controller.store_task_relations([edge])
+    changes = controller.get_task_graph_changes("a", cursor)
+    assert changes is not None
+    assert changes.root_id == "root"
+    assert [task.task_id for task in changes.tasks] == ["a"]
+    assert changes.tasks[0].state == "SUCCESS"
+    assert changes.relations == []
+    assert not changes.topology_changed
+    assert changes.cursor > cursor
+
+    idle = controller.get_task_graph_changes("root", changes.cursor)
+    assert idle is not None
+    assert idle.tasks == []
+    assert idle.cursor == changes.cursor
+
+    controller.store_task_events(
+        [TaskEvent(task_id="c", name="demo", state="RECEIVED", timestamp=now, root_id="root", parent_id="b")],
+    )
+    controller.store_task_relations([TaskRelation(root_id="root", parent_id="b", child_id="c", relation="parent")])
+    grown = controller.get_task_graph_changes("root", changes.cursor)
+    assert grown is not None
+    assert grown.topology_changed
+    assert [task.task_id for task in grown.tasks] == ["c"]
+    assert [relation.child_id for relation in grown.relations] == ["c"]
+    controller.close()
+
+
+def test_migrate_v10_backfills_worker_snapshots(tmp_path: Path) -> None:
+    controller = SQLiteController(tmp_path / "workers.db")
+    controller.initialize()
+    ts = datetime(2024, 1, 2, tzinfo=UTC)
+    for offset, event in enumerate(("worker-online", "worker-heartbeat")):
+        controller.store_worker_event(
+            WorkerEvent(hostname="w1", event=event, timestamp=ts + timedelta(seconds=offset), info={"n": offset}),
+        )
+    with controller._engine.begin() as conn:
+        conn.execute(text("DROP TABLE worker_snapshots"))
+        conn.execute(text("UPDATE schema_version SET version = 10"))
+    controller.ensure_schema()
+    snapshot = controller.get_worker_event_snapshot("w1")
+    assert snapshot is not None
+    assert snapshot.event == "worker-heartbeat"
+    assert snapshot.info == {"n": 1}
+    controller.close()
+
+
+def test_migrate_v11_backfills_broker_queue_snapshots(tmp_path: Path) -> None:
+    controller = SQLiteController(tmp_path / "queues.db")
+    controller.initialize()
+    ts = datetime(2024, 1, 2, tzinfo=UTC)
+    for offset, messages in enumerate((3, 8)):
+        controller.store_broker_queue_event(
+            BrokerQueueEvent(
+                broker_url="redis://",
+                queue="celery",
+                messages=messages,
+                consumers=1,
+                timestamp=ts + timedelta(seconds=offset),
+            ),
+        )
+    with controller._engine.begin() as conn:
+        conn.execute(text("DROP TABLE broker_queue_snapshots"))
+        conn.execute(text("DROP TABLE broker_queue_rollups_minute"))
+        conn.execute(text("UPDATE schema_version SET version = 11"))
+    controller.ensure_schema()
+    assert controller.get_schema_version() == SQLiteController._SCHEMA_VERSION
+    assert [event.messages for event in controller.get_broker_queue_snapshot("redis://")] == [8]
+    controller.close()
+
+
+def test_migrate_v12_backfills_task_search(tmp_path: Path) -> None:
+    controller = SQLiteController(tmp_path / "search.db")
+    controller.initialize()
+    ts = datetime(2024, 1, 2, tzinfo=UTC)
+    controller.store_task_event(TaskEvent(task_id="t1", name="mail.send", state="SUCCESS", timestamp=ts))
+    with controller._engine.begin() as conn:
+        conn.execute(text("DROP TABLE tasks_fts"))
+        for trigger in ("insert", "update", "delete"):
+            conn.execute(text(f"DROP TRIGGER tasks_fts_{trigger}"))
+        conn.execute(text("UPDATE schema_version SET version = 12"))
+    controller.ensure_schema()
+    assert controller.get_schema_version() == SQLiteController._SCHEMA_VERSION
+    assert [task.task_id for task in controller.get_tasks(TaskFilter(search="mail"))] == ["t1"]
+    controller.close()
+
+
+def test_large_payloads_are_stored_once_as_blobs() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    ts = datetime(2024, 1, 2, tzinfo=UTC)
+    payload = "[" + ", ".join(f"'row-{index}'" for index in range(400)) + ", 'needle']"
+    controller.store_task_events(
+        [
+            TaskEvent(task_id="t1", name="etl.load", state="RECEIVED", timestamp=ts, args=payload, kwargs="{}"),
+            TaskEvent(task_id="t1", name="etl.load", state="STARTED", timestamp=ts + timedelta(seconds=1)),
+            TaskEvent(task_id="t2", name="etl.load", state="RECEIVED", timestamp=ts, args=payload),
+        ],
+    )
+    controller.store_task_event(
+        TaskEvent(task_id="t1", name=None, state="SUCCESS", timestamp=ts + timedelta(seconds=2), args=payload),
+    )
+    with controller._engine.begin() as conn:
+        blobs = conn.execute(text("SELECT size, length(data) FROM payload_blobs")).all()
+        event_args = conn.execute(text("SELECT args FROM task_events WHERE args_ref IS NOT NULL")).scalars().all()
+    assert len(blobs) == 1
+    assert blobs[0][0] == len(payload)
+    assert blobs[0][1] < len(payload)
+    assert event_args == [None, None, None]
+
+    task = controller.get_task("t1")
+    assert task is not None
+    assert task.args == payload
+    assert task.kwargs_ == "{}"
+    listed = {task.task_id: task for task in controller.get_tasks()}
+    assert listed["t2"].args is not None
+    assert listed["t2"].args.endswith("...")
+    assert len(listed["t2"].args) < len(payload)
+    assert sorted(task.task_id for task in controller.get_tasks(TaskFilter(search="needle"))) == ["t1", "t2"]
+
+    controller.store_task_event(TaskEvent(task_id="t2", name=None, state="SUCCESS", timestamp=ts, args="[]"))
+    replaced = controller.get_task("t2")
+    assert replaced is not None
+    assert replaced.args == "[]"
+    assert [task.task_id for task in controller.get_tasks(TaskFilter(search="needle"))] == ["t1"]
+    controller.close()
+
+
+def test_plain_connections_can_edit_tasks_with_blob_payloads(tmp_path: Path) -> None:
+    path = tmp_path / "edits.db"
+    controller = SQLiteController(path)
+    controller.initialize()
+    ts = datetime(2024, 1, 2, tzinfo=UTC)
+    controller.store_task_events(
+        [
+            TaskEvent(task_id="a", name="etl.load", state="SUCCESS", timestamp=ts, args="x " * 300 + "needle"),
+            TaskEvent(task_id="b", name="etl.load", state="SUCCESS", timestamp=ts, args="y " * 300 + "needle"),
+        ],
+    )
+    assert sorted(task.task_id for task in controller.get_tasks(TaskFilter(search="needle"))) == ["a", "b"]
+    controller.close()
+
+    # No connection-local SQL function is needed to write to the tasks table.
+    with sqlite3.connect(path) as conn:
+        conn.execute("DELETE FROM tasks WHERE task_id = 'a'")
+        conn.execute("UPDATE tasks SET name = 'etl.reload' WHERE task_id = 'b'")
+        conn.execute("INSERT INTO tasks (task_id, name, state) VALUES ('c', 'etl.load', 'PENDING')")
+    conn.close()
+
+    reopened = SQLiteController(path)
+    reopened.initialize()
+    assert [task.task_id for task in reopened.get_tasks(TaskFilter(search="needle"))] == []
+    assert [task.task_id for task in reopened.get_tasks(TaskFilter(search="reload"))] == ["b"]
+    # The next write for a task restores the full text of its blob payloads to the index.
+    reopened.store_task_event(TaskEvent(task_id="b", name=None, state="SUCCESS", timestamp=ts))
+    assert [task.task_id for task in reopened.get_tasks(TaskFilter(search="reload needle"))] == ["b"]
+    reopened.close()
+
+
+def test_full_task_reads_inflate_blob_payloads() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    ts = datetime(2024, 1, 2, tzinfo=UTC)
+    payload = "p" * 1000
+    controller.store_task_events(
+        [
+            TaskEvent(task_id="root", name="flow.start", state="SUCCESS", timestamp=ts, root_id="root", args=payload),
+            TaskEvent(
+                task_id="child",
+                name="flow.step",
+                state="FAILURE",
+                timestamp=ts,
+                root_id="root",
+                parent_id="root",
+                traceback=payload,
+            ),
+        ],
+    )
+    by_id = {task.task_id: task for task in controller.get_tasks_by_id(["root", "child"])}
+    assert by_id["root"].args == payload
+    assert by_id["child"].traceback == payload
+    graph = controller.get_task_graph("child")
+    assert graph is not None
+    nodes = {task.task_id: task for task in graph.tasks}
+    assert nodes["root"].args == payload
+    assert nodes["child"].traceback == payload
+    changes = controller.get_task_graph_changes("root", 0)
+    assert changes is not None
+    assert {task.task_id: task.args for task in changes.tasks}["root"] == payload
+    summaries = {task.task_id: task for task in controller.get_tasks()}
+    assert summaries["root"].args == f"{payload[:200]}..."
+    controller.close()
+
+
+def test_purge_expired_drops_unreferenced_payload_blobs() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    now = datetime.now(UTC)
+    past = now - timedelta(days=30)
+    controller.store_task_events(
+        [
+            TaskEvent(task_id="old", name="etl.load", state="SUCCESS", timestamp=past, args="a" * 1000),
+            TaskEvent(task_id="slow", name="etl.load", state="RECEIVED", timestamp=past, args="b" * 1000),
+            TaskEvent(task_id="slow", name="etl.load", state="SUCCESS", timestamp=now),
+        ],
+    )
+    while controller.purge_expired(now - timedelta(days=7), 100) is not None:
+        pass
+    with controller._engine.begin() as conn:
+        assert conn.execute(text("SELECT count(*) FROM payload_blobs")).scalar_one() == 1
+    slow = controller.get_task("slow")
+    assert slow is not None
+    assert slow.args == "b" * 1000
+    assert controller.get_task("old") is None
+    controller.close()
+
+
+def test_migrate_v13_adds_payload_references(tmp_path: Path) -> None:
+    controller = SQLiteController(tmp_path / "payloads.db")
+    controller.initialize()
+    ts = datetime(2024, 1, 2, tzinfo=UTC)
+    inline = "x" * 1000
+    with controller._engine.begin() as conn:
+        for trigger in ("insert", "update", "delete"):
+            conn.execute(text(f"DROP TRIGGER tasks_fts_{trigger}"))
+        conn.execute(text("DROP TABLE payload_blobs"))
+        for name in ("args", "kwargs", "result", "traceback"):
+            conn.execute(text(f"DROP INDEX ix_tasks_{name}_ref"))
+            conn.execute(text(f"ALTER TABLE tasks DROP COLUMN {name}_ref"))
+            conn.execute(text(f"ALTER TABLE task_events DROP COLUMN {name}_ref"))
+        conn.execute(
+            text("INSERT INTO tasks (task_id, name, state, args) VALUES ('legacy', 'etl.load', 'SUCCESS', :a)"),
+            {"a": inline},
+        )
+        conn.execute(text("UPDATE schema_version SET version = 13"))
+    controller.close()
+
+    migrated = SQLiteController(tmp_path / "payloads.db")
+    migrated.initialize()
+    migrated.ensure_schema()
+    assert migrated.get_schema_version() == SQLiteController._SCHEMA_VERSION
+    columns = {column["name"] for column in inspect(migrated._engine).get_columns("task_events")}
+    assert {"args_ref", "kwargs_ref", "result_ref", "traceback_ref"} <= columns
+    legacy = migrated.get_task("legacy")
+    assert legacy is not None
+    assert legacy.args == inline
+    migrated.store_task_event(
+        TaskEvent(task_id="t1", name="etl.load", state="SUCCESS", timestamp=ts, result="needle " * 100),
+    )
+    assert [task.task_id for task in migrated.get_tasks(TaskFilter(search="needle"))] == ["t1"]
+    migrated.close()
@@ -6,10 +6,20 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
+from sqlalchemy import text
+
+from celery_root.core.db.adapters.base import BaseDBController
 from celery_root.core.db.adapters.sqlite import SQLiteController
-from celery_root.core.db.models import TaskEvent, TaskFilter, TimeRange
+from celery_root.core.db.models import Task, TaskEvent, TaskFilter, TimeRange
+from celery_root.shared.schemas import ListTasksPageResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from celery_root.core.db.models import TaskCursor, TaskSummary
 
 
 def test_get_tasks_page_and_names() -> None:
@@ -38,3 +48,96 @@ def test_get_tasks_page_and_names() -> None:
     assert len(heatmap) == 7
 
     controller.close()
+
+
+def test_list_queries_return_summaries_with_previews() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    now = datetime.now(UTC)
+    args = repr(list(range(120)))
+    controller.store_task_event(
+        TaskEvent(task_id="t1", name="demo.add", state="SUCCESS", timestamp=now, args=args, kwargs="{}", stamps="{}"),
+    )
+    page, _total = controller.get_tasks_page(None, sort_key=None, sort_dir=None, limit=10, offset=0)
+    scanned, _cursor = controller.scan_tasks(None, cursor=None, limit=10)
+    for summary in (*page, *scanned, *controller.get_tasks()):
+        assert not isinstance(summary, Task)
+        assert summary.args == f"{args[:200]}..."
+        assert summary.kwargs_ == "{}"
+    payload = ListTasksPageResponse(tasks=page, total=1).model_dump()
+    assert "stamps" not in payload["tasks"][0]
+    task = controller.get_task("t1")
+    assert task is not None
+    assert task.args == args
+    assert task.stamps == "{}"
+    graph = controller.get_task_graph("t1")
+    assert graph is not None
+    for full in (*controller.get_tasks_by_id(["t1"]), *graph.tasks):
+        assert isinstance(full, Task)
+        assert full.args == args
+        assert full.stamps == "{}"
+    controller.close()
+
+
+def _scan_all(
+    scan: Callable[..., tuple[list[TaskSummary], TaskCursor | None]],
+    filters: TaskFilter | None,
+    limit: int,
+) -> list[str]:
+    seen: list[str] = []
+    cursor: TaskCursor | None = None
+    while True:
+        tasks, cursor = scan(filters, cursor=cursor, limit=limit)
+        assert len(tasks) <= limit
+        seen.extend(task.task_id for task in tasks)
+        if cursor is None:
+            return seen
+
+
+def test_scan_tasks_walks_ties_and_untimed_tasks() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    now = datetime.now(UTC)
+    controller.store_task_events(
+        [
+            TaskEvent(
+                task_id=f"t{index:02d}",
+                name="demo",
+                state="FAILURE" if index % 4 == 0 else "SUCCESS",
+                # Groups of three tasks share a timestamp, so chunks end in the middle of ties.
+                timestamp=now - timedelta(seconds=index // 3),
+            )
+            for index in range(20)
+        ],
+    )
+    with controller._engine.begin() as conn:
+        conn.execute(text("INSERT INTO tasks (task_id, name, state) VALUES ('u1', 'demo', 'PENDING')"))
+
+    # Newest timestamp first, then task id descending within a timestamp; untimed tasks last.
+    ids = [f"t{index:02d}" for index in range(20)]
+    expected = [*sorted(sorted(ids, reverse=True), key=lambda task_id: int(task_id[1:]) // 3), "u1"]
+    for limit in (1, 4, 7, 50):
+        assert _scan_all(controller.scan_tasks, None, limit) == expected
+    failures = [task_id for task_id in expected[:-1] if int(task_id[1:]) % 4 == 0]
+    assert _scan_all(controller.scan_tasks, TaskFilter(state="FAILURE"), 2) == failures
+    assert [task.task_id for task in controller.iter_tasks(chunk_size=3)] == expected
+
+    def _fallback(
+        filters: TaskFilter | None,
+        *,
+        cursor: TaskCursor | None,
+        limit: int,
+    ) -> tuple[list[TaskSummary], TaskCursor | None]:
+        return BaseDBController.scan_tasks(controller, filters, cursor=cursor, limit=limit)
+
+    assert _scan_all(_fallback, None, 6) == expected
+
+    with controller._engine.connect() as conn:
+        plan = conn.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT task_id FROM tasks WHERE (last_ts, task_id) < ('2026-01-01', 't') "
+                "ORDER BY last_ts DESC, task_id DESC LIMIT 10",
+            ),
+        ).all()
+    assert "ix_tasks_last_ts_task_id" in " ".join(str(row[-1]) for row in plan)
+    controller.close()
@@ -0,0 +1,205 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import select, text
+
+from celery_root.core.db.adapters.sqlite import SQLiteController
+from celery_root.core.db.models import TaskEvent, TaskSummary, TimeRange
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+_BASE = datetime(2024, 3, 4, 0, 0, 0, tzinfo=UTC)
+_STATES = ("PENDING", "RECEIVED", "STARTED", "SUCCESS", "FAILURE", "RETRY")
+
+
+def _random_events(count: int, seed: int) -> list[TaskEvent]:
+    rng = random.Random(seed)  # noqa: S311 - deterministic test data
+    events: list[TaskEvent] = []
+    for _ in range(count):
+        state = rng.choice(_STATES)
+        events.append(
+            TaskEvent(
+                task_id=f"task-{rng.randrange(count // 4)}",
+                name=rng.choice((None, "tests.add", "tests.mul")),
+                state=state,
+                timestamp=_BASE + timedelta(seconds=rng.randrange(2 * 86_400), microseconds=rng.randrange(1_000_000)),
+                worker=rng.choice((None, "alpha", "beta")),
+                runtime=round(rng.random() * 20, 3) if state in {"SUCCESS", "FAILURE"} else None,
+            ),
+        )
+    return events
+
+
+def _store_in_random_batches(controller: SQLiteController, events: list[TaskEvent], seed: int) -> None:
+    rng = random.Random(seed)  # noqa: S311 - deterministic test data
+    offset = 0
+    while offset < len(events):
+        size = rng.randrange(1, 40)
+        controller.store_task_events(events[offset : offset + size])
+        offset += size
+
+
+def _rollup_rows(controller: SQLiteController) -> dict[str, list[tuple[object, ...]]]:
+    tables = (*controller._task_rollups.values(), *controller._runtime_rollups.values())
+    with controller._engine.begin() as conn:
+        rows = {table.name: conn.execute(select(table)).all() for table in tables}
+    # Runtime sums accumulate float deltas, so compare them rounded.
+    return {
+        name: sorted(
+            tuple(round(value, 6) if isinstance(value, float) else value for value in row) for row in table_rows
+        )
+        for name, table_rows in rows.items()
+    }
+
+
+def _timestamp(task: TaskSummary) -> datetime | None:
+    timestamp = task.finished or task.started or task.received
+    return timestamp.replace(tzinfo=None) if timestamp is not None else None
+
+
+@pytest.fixture(scope="module")
+def populated() -> Generator[SQLiteController]:
+    controller = SQLiteController()
+    controller.initialize()
+    _store_in_random_batches(controller, _random_events(2_000, seed=7), seed=8)
+    yield controller
+    controller.close()
+
+
+def test_incremental_rollups_match_rebuild(populated: SQLiteController) -> None:
+    incremental = _rollup_rows(populated)
+    assert all(incremental.values())
+    tasks = populated.rebuild_rollups()
+    assert tasks == sum(1 for task in populated.get_tasks() if _timestamp(task) is not None)
+    assert _rollup_rows(populated) == incremental
+
+
+@pytest.mark.parametrize("group_by", [(), ("state",), ("name", "worker"), ("name", "state", "worker")])
+@pytest.mark.parametrize(
+    "time_range",
+    [
+        None,
+        TimeRange(start=_BASE + timedelta(hours=5, minutes=13), end=_BASE + timedelta(days=1, hours=7, minutes=4)),
+        TimeRange(start=_BASE + timedelta(hours=5, minutes=13), end=_BASE + timedelta(hours=5, minutes=51)),
+    ],
+)
+def test_rollup_counts_match_tasks(
+    populated: SQLiteController,
+    group_by: tuple[str, ...],
+    time_range: TimeRange | None,
+) -> None:
+    expected: Counter[tuple[object, ...]] = Counter()
+    for task in populated.get_tasks():
+        timestamp = _timestamp(task)
+        if timestamp is None:
+            continue
+        # Rollups resolve ranges to whole minutes; the minute holding the range end is included.
+        if time_range is not None and not (
+            time_range.start.replace(tzinfo=None)
+            <= timestamp
+            < time_range.end.replace(tzinfo=None) + timedelta(minutes=1)
+        ):
+            continue
+        expected[tuple(getattr(task, dimension) for dimension in group_by)] += 1
+    counts = populated.get_rollup_counts(time_range, group_by)  # type: ignore[arg-type]
+    assert {tuple(getattr(row, dimension) for dimension in group_by): row.count for row in counts} == dict(expected)
+
+
+def test_rollup_throughput_matches_task_throughput(populated: SQLiteController) -> None:
+    time_range = TimeRange(start=_BASE + timedelta(hours=5), end=_BASE + timedelta(hours=9))
+    assert populated.get_rollup_throughput(time_range, 600) == populated.get_throughput(time_range, 600)
+
+
+def test_rollup_task_stats_estimate_runtimes(populated: SQLiteController) -> None:
+    time_range = TimeRange(start=_BASE + timedelta(hours=2), end=_BASE + timedelta(days=1, hours=2))
+    estimate = populated.get_rollup_task_stats("tests.add", time_range)
+    exact = populated.get_task_stats("tests.add", time_range)
+    assert estimate.count == exact.count
+    assert estimate.avg_runtime == pytest.approx(exact.avg_runtime)
+    assert exact.min_runtime is not None
+    assert exact.max_runtime is not None
+    assert estimate.min_runtime is not None
+    assert estimate.max_runtime is not None
+    assert estimate.min_runtime <= exact.min_runtime
+    assert estimate.max_runtime >= exact.max_runtime
+    for estimated, actual in ((estimate.p50, exact.p50), (estimate.p95, exact.p95)):
+        assert estimated is not None
+        assert actual is not None
+        # The 1-2-5 bins are at most 2.5x wide, which bounds the interpolation error.
+        assert actual / 2.5 <= estimated <= actual * 2.5
+
+
+def test_rollup_task_stats_without_data() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    assert controller.get_rollup_task_stats(None, None).count == 0
+    assert controller.get_rollup_counts(None, ("state",)) == []
+    controller.close()
+
+
+def test_rollups_follow_task_transitions() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    controller.store_task_event(TaskEvent(task_id="t1", name="demo", state="RECEIVED", timestamp=_BASE))
+    controller.store_task_event(
+        TaskEvent(task_id="t1", name="demo", state="STARTED", timestamp=_BASE + timedelta(hours=2), worker="alpha"),
+    )
+    controller.store_task_event(
+        TaskEvent(task_id="t1", name="demo", state="SUCCESS", timestamp=_BASE + timedelta(hours=2), runtime=1.5),
+    )
+    counts = controller.get_rollup_counts(None, ("name", "state", "worker"))
+    assert [(row.name, row.state, row.worker, row.count) for row in counts] == [("demo", "SUCCESS", "alpha", 1)]
+    # Buckets the task moved out of are pruned instead of left at zero.
+    with controller._engine.begin() as conn:
+        remaining = conn.execute(text("SELECT count(*) FROM task_rollups_minute")).scalar_one()
+    assert remaining == 1
+    stats = controller.get_rollup_task_stats("demo", None)
+    assert stats.count == 1
+    assert stats.avg_runtime == pytest.approx(1.5)
+    controller.close()
+
+
+def test_migrate_v6_backfills_rollups(tmp_path: Path) -> None:
+    db_path = tmp_path / "legacy.db"
+    controller = SQLiteController(db_path)
+    controller.initialize()
+    controller.store_task_events(_random_events(200, seed=3))
+    expected = _rollup_rows(controller)
+    with controller._engine.begin() as conn:
+        for table in (*controller._task_rollups.values(), *controller._runtime_rollups.values()):
+            conn.execute(text(f"DROP TABLE {table.name}"))
+        conn.execute(text("UPDATE schema_version SET version = 6"))
+    controller.close()
+
+    migrated = SQLiteController(db_path)
+    migrated.initialize()
+    migrated.ensure_schema()
+    assert migrated.get_schema_version() == SQLiteController._SCHEMA_VERSION
+    assert _rollup_rows(migrated) == expected
+    migrated.close()
+
+
+def test_cleanup_prunes_old_rollups() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    now = datetime.now(UTC)
+    controller.store_task_event(
+        TaskEvent(task_id="old", name="demo", state="SUCCESS", timestamp=now - timedelta(days=30)),
+    )
+    controller.store_task_event(TaskEvent(task_id="new", name="demo", state="SUCCESS", timestamp=now))
+    controller.cleanup(older_than_days=7)
+    assert [row.count for row in controller.get_rollup_counts(None)] == [1]
+    controller.close()
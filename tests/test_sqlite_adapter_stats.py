@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: 2026 Christian-Hauke Poensgen
+# SPDX-FileCopyrightText: 2026 Maximilian Dolling
+# SPDX-FileContributor: AUTHORS.md
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import text
+
+from celery_root.core.db.adapters.base import BaseDBController
+from celery_root.core.db.adapters.duckdb import DuckDBController
+from celery_root.core.db.adapters.sqlite import SQLiteController
+from celery_root.core.db.models import (
+    TaskEvent,
+    TaskFilter,
+    TaskStats,
+    TaskSummary,
+    ThroughputBucket,
+    TimeRange,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+_BASE = datetime(2024, 3, 4, 0, 0, 0, tzinfo=UTC)
+_STATES = ("RECEIVED", "STARTED", "SUCCESS", "FAILURE", "RETRY")
+
+
+# Reference implementations: the original Python aggregations over materialized tasks.
+
+
+def _task_timestamp(task: TaskSummary) -> datetime | None:
+    return task.finished or task.started or task.received
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    if pct <= 0:
+        return values[0]
+    if pct >= 1:
+        return values[-1]
+    index = (len(values) - 1) * pct
+    lower = int(index)
+    upper = min(lower + 1, len(values) - 1)
+    if lower == upper:
+        return values[lower]
+    weight = index - lower
+    return values[lower] + (values[upper] - values[lower]) * weight
+
+
+def _reference_tasks(
+    controller: SQLiteController,
+    task_name: str | None,
+    time_range: TimeRange | None,
+) -> list[TaskSummary]:
+    return controller.get_tasks(TaskFilter(task_name=task_name, time_range=time_range))
+
+
+def _reference_stats(tasks: list[TaskSummary]) -> TaskStats:
+    runtimes = sorted([task.runtime for task in tasks if task.runtime is not None])
+    if not runtimes:
+        return TaskStats(count=len(tasks))
+    return TaskStats(
+        count=len(tasks),
+        min_runtime=runtimes[0],
+        max_runtime=runtimes[-1],
+        avg_runtime=sum(runtimes) / len(runtimes),
+        p50=_percentile(runtimes, 0.5),
+        p95=_percentile(runtimes, 0.95),
+        p99=_percentile(runtimes, 0.99),
+    )
+
+
+def _reference_throughput(
+    tasks: list[TaskSummary],
+    time_range: TimeRange,
+    bucket_seconds: int,
+) -> list[ThroughputBucket]:
+    buckets: dict[datetime, int] = {}
+    cursor = time_range.start
+    while cursor <= time_range.end:
+        buckets[cursor] = 0
+        cursor += timedelta(seconds=bucket_seconds)
+    for task in tasks:
+        timestamp = _task_timestamp(task)
+        if timestamp is None:
+            continue
+        delta_seconds = int((timestamp - time_range.start).total_seconds())
+        bucket_start = time_range.start + timedelta(seconds=max(delta_seconds // bucket_seconds, 0) * bucket_seconds)
+        if bucket_start in buckets:
+            buckets[bucket_start] += 1
+    return [ThroughputBucket(bucket_start=key, count=value) for key, value in buckets.items()]
+
+
+def _reference_heatmap(tasks: list[TaskSummary]) -> list[list[int]]:
+    heatmap = [[0 for _ in range(24)] for _ in range(7)]
+    for task in tasks:
+        timestamp = _task_timestamp(task)
+        if timestamp is not None:
+            heatmap[timestamp.weekday()][timestamp.hour] += 1
+    return heatmap
+
+
+@pytest.fixture(scope="module", params=["sqlite", "duckdb"])
+def populated(request: pytest.FixtureRequest) -> Generator[SQLiteController]:
+    if request.param == "duckdb":
+        pytest.importorskip("duckdb")
+    controller = DuckDBController() if request.param == "duckdb" else SQLiteController()
+    controller.initialize()
+    rng = random.Random(42)  # noqa: S311 - deterministic test data
+    events: list[TaskEvent] = []
+    for index in range(600):
+        timestamp = _BASE + timedelta(seconds=rng.randrange(9 * 24 * 3600), microseconds=rng.randrange(1_000_000))
+        state = rng.choice(_STATES)
+        runtime = round(rng.random() * 10, 3) if state in {"SUCCESS", "FAILURE"} and rng.random() > 0.1 else None
+        events.append(
+            TaskEvent(
+                task_id=f"task-{index}",
+                name=rng.choice(("tests.add", "tests.mul", "tests.sleep")),
+                state=state,
+                timestamp=timestamp,
+                runtime=runtime,
+            ),
+        )
+    controller.store_task_events(events)
+    yield controller
+    controller.close()
+
+
+@pytest.mark.parametrize("task_name", [None, "tests.add", "tests.missing"])
+@pytest.mark.parametrize("days", [None, 1, 3])
+def test_task_stats_match_reference(populated: SQLiteController, task_name: str | None, days: int | None) -> None:
+    time_range = None
+    if days is not None:
+        time_range = TimeRange(start=_BASE + timedelta(days=2, seconds=17), end=_BASE + timedelta(days=2 + days))
+    stats = populated.get_task_stats(task_name, time_range)
+    expected = _reference_stats(_reference_tasks(populated, task_name, time_range))
+    assert stats.count == expected.count
+    assert stats.min_runtime == expected.min_runtime
+    assert stats.max_runtime == expected.max_runtime
+    assert stats.avg_runtime == pytest.approx(expected.avg_runtime)
+    assert stats.p50 == pytest.approx(expected.p50)
+    assert stats.p95 == pytest.approx(expected.p95)
+    assert stats.p99 == pytest.approx(expected.p99)
+
+
+@pytest.mark.parametrize("bucket_seconds", [60, 600, 3600, 86_400])
+def test_throughput_matches_reference(populated: SQLiteController, bucket_seconds: int) -> None:
+    start = _BASE + timedelta(days=1, seconds=7, microseconds=250_000)
+    time_range = TimeRange(start=start, end=start + timedelta(days=2))
+    buckets = populated.get_throughput(time_range, bucket_seconds)
+    expected = _reference_throughput(_reference_tasks(populated, None, time_range), time_range, bucket_seconds)
+    assert buckets == expected
+    assert sum(bucket.count for bucket in buckets) > 0
+
+
+@pytest.mark.parametrize("days", [None, 1, 7])
+def test_heatmap_matches_reference(populated: SQLiteController, days: int | None) -> None:
+    time_range = None
+    if days is not None:
+        time_range = TimeRange(start=_BASE + timedelta(hours=5), end=_BASE + timedelta(days=days, hours=5))
+    heatmap = populated.get_heatmap(time_range)
+    assert heatmap == _reference_heatmap(_reference_tasks(populated, None, time_range))
+
+
+def test_stats_without_runtimes() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    controller.store_task_event(TaskEvent(task_id="t1", name="demo", state="STARTED", timestamp=_BASE))
+    stats = controller.get_task_stats(None, None)
+    assert stats == TaskStats(count=1)
+    controller.close()
+
+
+def test_worker_state_counts_use_covering_index() -> None:
+    controller = SQLiteController()
+    controller.initialize()
+    rng = random.Random(7)  # noqa: S311 - deterministic test data
+    controller.store_task_events(
+        [
+            TaskEvent(
+                task_id=f"task-{index}",
+                name="tests.add",
+                state=rng.choice(_STATES),
+                timestamp=_BASE + timedelta(seconds=index),
+                worker=rng.choice(("w1@host", "w2@host", None)),
+            )
+            for index in range(200)
+        ],
+    )
+    counts = controller.get_worker_state_counts()
+    assert counts == BaseDBController.get_worker_state_counts(controller)
+    assert set(counts) == {"w1@host", "w2@host"}
+    with controller._engine.connect() as conn:
+        plan = conn.execute(
+            text("EXPLAIN QUERY PLAN SELECT worker, state, count(*) FROM tasks WHERE worker IS NOT NULL GROUP BY 1, 2"),
+        ).all()
+    assert "COVERING INDEX ix_tasks_worker_state" in " ".join(str(row[-1]) for row in plan)
+    controller.close()
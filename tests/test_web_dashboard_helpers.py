@@ -19,6 +19,7 @@ from celery_root.core.db.models import (
     BrokerQueueEvent,
     Task,
     TaskFilter,
+    TaskRollupCount,
     TaskStats,
     ThroughputBucket,
     Worker,
@@ -56,6 +57,18 @@ class _DummyDb:
     def get_tasks(self, _filters: TaskFilter | None = None) -> list[Task]:
         return list(self._tasks)
 
+    def get_worker_state_counts(self) -> dict[str, dict[str, int]]:
+        counts: dict[str, dict[str, int]] = {}
+        for task in self._tasks:
+            if task.worker is not None:
+                states = counts.setdefault(task.worker, {})
+                states[task.state] = states.get(task.state, 0) + 1
+        return counts
+
+    def scan_tasks(self, filters: TaskFilter | None, *, cursor: object, limit: int) -> tuple[list[Task], None]:
+        _ = cursor
+        return self.get_tasks(filters)[:limit], None
+
     def get_task_stats(self, _task_name: str | None, _time_range: object | None) -> TaskStats:
         return self._stats
 
@@ -69,6 +82,22 @@ class _DummyDb:
         _ = bucket_seconds
         return list(self._buckets)
 
+    def get_rollup_counts(self, _time_range: object, group_by: tuple[str, ...] = ()) -> list[TaskRollupCount]:
+        counts: dict[tuple[str | None, ...], int] = {}
+        for task in self._tasks:
+            key = tuple(getattr(task, dimension) for dimension in group_by)
+            counts[key] = counts.get(key, 0) + 1
+        return [
+            TaskRollupCount.model_validate({"count": count, **dict(zip(group_by, key, strict=True))})
+            for key, count in counts.items()
+        ]
+
+    def get_rollup_throughput(self, time_range: object, bucket_seconds: int) -> list[ThroughputBucket]:
+        return self.get_throughput(time_range, bucket_seconds)
+
+    def get_rollup_task_stats(self, task_name: str | None, time_range: object | None) -> TaskStats:
+        return self.get_task_stats(task_name, time_range)
+
 
 class _DummyRegistry:
     def get_brokers(self) -> dict[str, object]:
@@ -124,10 +153,21 @@ def test_compute_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
     assert cards
 
     state_cards = dashboard_views._state_cards(now)
-    assert state_cards
+    # Current counts follow get_state_distribution; deltas come from the rollups.
+    assert {card["state"]: card["count"] for card in state_cards} == {
+        "SUCCESS": 2,
+        "FAILURE": 1,
+        "STARTED": 1,
+        "PENDING": 0,
+    }
 
     series = dashboard_views._throughput_series(now)
     assert series
 
     feed = dashboard_views._activity_feed(now)
     assert feed
+
+    summary = dashboard_views._worker_summary(now)
+    assert [row["hostname"] for row in summary] == ["alpha"]
+    assert {cell["state"]: cell["count"] for cell in summary[0]["state_cells"]}["STARTED"] == 1
+    assert summary[0]["processed"] == 1
@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+import json
 import os
 from contextlib import contextmanager
 from datetime import UTC, datetime
@@ -13,11 +14,11 @@ from typing import TYPE_CHECKING, cast
 
 import django
 import pytest
-from django.http import HttpResponse
+from django.http import Http404, HttpResponse
 from django.test import RequestFactory
 
 from celery_root.components.web.views import graphs as graph_views
-from celery_root.core.db.models import Task, TaskFilter, TaskRelation
+from celery_root.core.db.models import Task, TaskGraph, TaskGraphChanges, TaskRelation
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -37,14 +38,19 @@ class _DummyDb:
         self._tasks = {task.task_id: task for task in tasks}
         self._relations = relations
 
-    def get_task(self, task_id: str) -> Task | None:
-        return self._tasks.get(task_id)
+        self.graph_calls = 0
 
-    def get_task_relations(self, _root_id: str) -> list[TaskRelation]:
-        return list(self._relations)
+    def get_task_graph(self, task_id: str) -> TaskGraph | None:
+        self.graph_calls += 1
+        task = self._tasks.get(task_id)
+        if task is None:
+            return None
+        root_id = task.root_id or task.task_id
+        return TaskGraph(root_id=root_id, tasks=list(self._tasks.values()), relations=list(self._relations), cursor=7)
 
-    def get_tasks(self, _filters: TaskFilter | None = None) -> list[Task]:
-        return list(self._tasks.values())
+    def get_task_graph_changes(self, _task_id: str, since: int) -> TaskGraphChanges | None:
+        changed = [task for task in self._tasks.values() if task.state == "FAILURE"]
+        return TaskGraphChanges(root_id="root", cursor=since + 1, tasks=changed, relations=[], topology_changed=False)
 
 
 @contextmanager
@@ -85,8 +91,12 @@ def test_build_graph_payload(monkeypatch: pytest.MonkeyPatch) -> None:
     db = _DummyDb(tasks, relations)
 
     payload = graph_views._build_graph_payload("root", cast("DbClient", db))
-    assert payload["nodes"]
-    assert payload["edges"]
+    assert [node["id"] for node in payload["nodes"]] == ["child", "root"]
+    assert [edge["id"] for edge in payload["edges"]] == ["root->child:chain"]
+    assert payload["meta"]["counts"]["failure"] == 1
+    assert db.graph_calls == 1
+    with pytest.raises(Http404):
+        graph_views._build_graph_payload("missing", cast("DbClient", db))
 
     monkeypatch.setattr(graph_views, "open_db", lambda: _open_db(db))
     monkeypatch.setattr(graph_views, "render", _fake_render)
@@ -95,3 +105,27 @@ def test_build_graph_payload(monkeypatch: pytest.MonkeyPatch) -> None:
     factory = RequestFactory()
     response = graph_views.task_graph(factory.get("/graph/"), "root")
     assert response.status_code == 200
+
+
+def test_graph_updates_follow_the_cursor(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = datetime.now(UTC)
+    tasks = [
+        Task(task_id="root", name="demo", state="SUCCESS", root_id="root", finished=now),
+        Task(task_id="child", name="demo", state="FAILURE", parent_id="root", root_id="root", finished=now),
+    ]
+    relations = [TaskRelation(root_id="root", parent_id="root", child_id="child", relation="parent")]
+    db = _DummyDb(tasks, relations)
+    monkeypatch.setattr(graph_views, "open_db", lambda: _open_db(db))
+    factory = RequestFactory()
+
+    full = json.loads(graph_views.task_graph_updates_api(factory.get("/updates/"), "root").content)
+    assert full["cursor"] == 7
+    assert full["node_count"] == 2
+    assert len(full["node_updates"]) == 2
+
+    delta = json.loads(graph_views.task_graph_updates_api(factory.get("/updates/", {"since": "7"}), "root").content)
+    assert delta["cursor"] == 8
+    assert [update["id"] for update in delta["node_updates"]] == ["child"]
+    assert delta["topology_changed"] is False
+    assert "node_count" not in delta
+    assert db.graph_calls == 1
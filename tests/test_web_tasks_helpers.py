@@ -24,8 +24,6 @@ from celery_root.core.engine import tasks as task_control
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
-    from celery_root.core.db import DbClient
-
 
 @pytest.fixture(scope="module", autouse=True)
 def _django_setup() -> None:
@@ -63,12 +61,18 @@ class _DummyDb:
     def get_tasks(self, _filters: TaskFilter | None = None) -> list[Task]:
         return list(self._tasks)
 
+    def iter_tasks(self, filters: TaskFilter | None = None) -> Iterator[Task]:
+        return iter(self.get_tasks(filters))
+
     def get_task(self, task_id: str) -> Task | None:
         for task in self._tasks:
             if task.task_id == task_id:
                 return task
         return None
 
+    def get_tasks_by_id(self, task_ids: list[str]) -> list[Task]:
+        return [task for task in self._tasks if task.task_id in task_ids]
+
     def get_task_relations(self, _root_id: str) -> list[TaskRelation]:
         return list(self._relations)
 
@@ -297,10 +301,8 @@ def test_relation_helpers(monkeypatch: pytest.MonkeyPatch) -> None:
         def get_task_relations(self, _root_id: str) -> list[TaskRelation]:
             return relations
 
-        def get_task(self, task_id: str) -> Task | None:
-            if task_id == "root":
-                return task
-            return None
+        def get_tasks_by_id(self, task_ids: list[str]) -> list[Task]:
+            return [task] if "root" in task_ids else []
 
     @contextmanager
     def _db_ctx() -> Iterator[_Db]:
@@ -312,10 +314,10 @@ def test_relation_helpers(monkeypatch: pytest.MonkeyPatch) -> None:
     task_views._attach_child_counts(tasks)
     assert tasks[0]["child_count"] == 3
 
-    link = task_views._build_task_link(cast("DbClient", _Db()), "root")
+    link = task_views._build_task_link("root", {"root": task})
     assert link["exists"]
 
-    missing = task_views._build_task_link(cast("DbClient", _Db()), "missing")
+    missing = task_views._build_task_link("missing", {"root": task})
     assert not missing["exists"]
 
 